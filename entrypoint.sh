@@ -12,5 +12,9 @@ python manage.py migrate --noinput
 echo "Starting consumer in background..."
 python manage.py startconsumer &
 
+# Start outbox relay in background
+echo "Starting outbox relay in background..."
+python manage.py relayoutbox &
+
 # Execute the command passed to the container (runserver)
 exec "$@"
@@ -1,2 +1,5 @@
 DEFAULT_PAGE_SIZE = 2
-TMP_BUCKET = "/tmp/codeflix-storage"
\ No newline at end of file
+BULK_BATCH_SIZE = 1000
+BULK_CREATE_MAX_ITEMS = 1000
+MAX_UPLOAD_SIZE = 50 * 1024**3  # 50 GiB
+TMP_BUCKET = "/tmp/codeflix-storage"
@@ -66,6 +66,15 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.unit)
 
 
+@pytest.fixture(autouse=True)
+def clear_entity_caches():
+    """Entity caches outlive the per-test database rollback; reset them."""
+    yield
+    from django_project.adapters.composition.container import get_container
+
+    get_container().clear_caches()
+
+
 @pytest.fixture(autouse=True)
 def mock_jwt_auth(request):
     """
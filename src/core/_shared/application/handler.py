@@ -6,3 +6,10 @@ from core._shared.events.event import Event
 class Handler(ABC):
     @abstractmethod
     def handle(self, event: Event) -> None: ...
+
+
+class BatchHandler(Handler):
+    """A handler that can process several events of its type at once."""
+
+    @abstractmethod
+    def handle_batch(self, events: list[Event]) -> None: ...
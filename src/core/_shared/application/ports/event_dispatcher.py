@@ -7,3 +7,7 @@ class EventDispatcher(ABC):
     @abstractmethod
     def dispatch(self, event: Event) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def dispatch_batch(self, events: list[Event]) -> None:
+        raise NotImplementedError
@@ -1,4 +1,44 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO, Iterable, Iterator
+
+# Whole payloads, open binary files (Django's UploadedFile included) or any
+# iterable of byte chunks.
+ContentSource = bytes | BinaryIO | Iterable[bytes]
+
+
+def iter_chunks(content: ContentSource, chunk_size: int) -> Iterator[bytes]:
+    """Yields content in pieces of at most chunk_size bytes without reading
+    a file-like source into memory."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+    elif hasattr(content, "read"):
+        yield from iter(lambda: content.read(chunk_size), b"")
+    else:
+        for chunk in content:
+            for start in range(0, len(chunk), chunk_size):
+                yield chunk[start : start + chunk_size]
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    checksum: str  # sha256 hex digest
+    size: int
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    path: str
+    modified_at: datetime
+    size: int
+
+
+@dataclass(frozen=True)
+class OpenedFile(StoredObject):
+    content: BinaryIO
 
 
 class StorageService(ABC):
@@ -6,7 +46,47 @@ class StorageService(ABC):
     def store(
         self,
         file_path: str,
-        content: bytes,
+        content: ContentSource,
         content_type: str,
-    ) -> None:
+    ) -> StoredFile:
+        raise NotImplementedError
+
+    @abstractmethod
+    def allocate(self, file_path: str, size: int) -> None:
+        """Creates a file of the given size to be filled by write_at. Raises
+        ValueError when the storage cannot hold a file that large."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_at(
+        self, file_path: str, offset: int, content: ContentSource, size: int
+    ) -> StoredFile:
+        """Writes at most size bytes of content starting at offset into an
+        existing file. Raises FileNotFoundError when there is no such file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def move(self, source_path: str, target_path: str) -> None:
+        """Raises FileNotFoundError when there is no file at source_path."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(self, file_path: str) -> OpenedFile | None:
+        """The file opened for reading, or None when there is no such file.
+        Its metadata describes the opened file even if the path is replaced
+        afterwards. The caller closes content."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stat(self, file_path: str) -> StoredObject | None:
+        """The file's metadata, or None when there is no such file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, file_path: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_files(self, prefix: str) -> Iterator[StoredObject]:
+        """Every file under the prefix directory, in no particular order."""
         raise NotImplementedError
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+
+
+class UnitOfWork(ABC):
+    @abstractmethod
+    def atomic(self) -> AbstractContextManager[None]:
+        raise NotImplementedError
+
+
+class NullUnitOfWork(UnitOfWork):
+    """For adapters without transactions, such as the in-memory ones."""
+
+    def atomic(self) -> AbstractContextManager[None]:
+        return nullcontext()
@@ -1,6 +1,8 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Generic, List, Type, TypeVar
 
+from core._shared.domain.pagination import Cursor, InvalidCursor, Page
+
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -15,12 +17,14 @@ class ListUseCase(Generic[T, R]):
         order_by: str = "name"
         current_page: int = 1
         page_size: int = 10
+        cursor: str | None = None
 
     @dataclass
     class OutputMeta:
         current_page: int
         per_page: int
-        total: int
+        total: int | None
+        next_cursor: str | None = None
 
     @dataclass
     class ListOutput(Generic[R]):
@@ -30,30 +34,58 @@ class ListUseCase(Generic[T, R]):
     def execute(
         self, input: "ListUseCase.Input", output_cls: Type[R]
     ) -> "ListUseCase.ListOutput":
-        items: List[T] = self.repository.list()
-
-        valid_fields = {
-            field.name for field in output_cls.__dataclass_fields__.values()
-        }
-
-        sorted_items: List[R] = sorted(
-            [
-                output_cls(
-                    **{k: v for k, v in asdict(item).items() if k in valid_fields}
-                )
-                for item in items
-            ],
-            key=lambda obj: getattr(obj, input.order_by),
-        )
+        if input.cursor:
+            items, total, has_more = self._seek_page(input)
+        else:
+            items, total, has_more = self._offset_page(input)
+
+        valid_fields = output_cls.__dataclass_fields__.keys()
 
-        page_offset = (input.current_page - 1) * input.page_size
-        items_page = sorted_items[page_offset : page_offset + input.page_size]
+        items_page: List[R] = [
+            output_cls(**{name: getattr(item, name) for name in valid_fields})
+            for item in items
+        ]
+
+        next_cursor: str | None = None
+        if has_more and items:
+            last_item: T = items[-1]
+            next_cursor = Cursor(
+                order_by=input.order_by,
+                value=getattr(last_item, input.order_by),
+                id=last_item.id,
+            ).encode()
 
         return self.ListOutput(
             data=items_page,
             meta=self.OutputMeta(
                 current_page=input.current_page,
                 per_page=input.page_size,
-                total=len(sorted_items),
+                total=total,
+                next_cursor=next_cursor,
             ),
         )
+
+    def _offset_page(self, input: "ListUseCase.Input") -> tuple[List[T], int, bool]:
+        offset: int = max(input.current_page - 1, 0) * input.page_size
+        page: Page[T] = self.repository.paginate(
+            order_by=input.order_by,
+            offset=offset,
+            limit=input.page_size,
+        )
+        return page.items, page.total, offset + len(page.items) < page.total
+
+    def _seek_page(self, input: "ListUseCase.Input") -> tuple[List[T], None, bool]:
+        cursor: Cursor = Cursor.decode(input.cursor)
+        if cursor.order_by != input.order_by:
+            raise InvalidCursor(
+                f"Cursor was issued for order_by={cursor.order_by}, "
+                f"not {input.order_by}"
+            )
+
+        # One extra row tells whether another page exists without a COUNT.
+        items: List[T] = self.repository.list_after(
+            order_by=input.order_by,
+            after=cursor,
+            limit=input.page_size + 1,
+        )
+        return items[: input.page_size], None, len(items) > input.page_size
@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class InvalidCursor(Exception): ...
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    total: int = 0
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of the last row of a page, ordered by (order_by, id)."""
+
+    order_by: str
+    value: Any
+    id: UUID
+
+    def encode(self) -> str:
+        payload: str = json.dumps(
+            [self.order_by, self.value, str(self.id)], default=str
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            order_by, value, raw_id = json.loads(base64.urlsafe_b64decode(token))
+            id: UUID = UUID(raw_id)
+        except (AttributeError, binascii.Error, TypeError, ValueError) as error:
+            raise InvalidCursor(f"Invalid cursor: {token}") from error
+
+        if order_by == "id":
+            value = id
+
+        return cls(order_by=order_by, value=value, id=id)
@@ -0,0 +1,24 @@
+from uuid import uuid4
+
+import pytest
+
+from core._shared.domain.pagination import Cursor, InvalidCursor
+
+
+class TestCursor:
+
+    def test_encode_and_decode_round_trip(self):
+        cursor: Cursor = Cursor(order_by="name", value="Movie", id=uuid4())
+
+        assert Cursor.decode(cursor.encode()) == cursor
+
+    def test_decode_restores_uuid_value_when_ordering_by_id(self):
+        id = uuid4()
+        cursor: Cursor = Cursor(order_by="id", value=id, id=id)
+
+        assert Cursor.decode(cursor.encode()).value == id
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "W10="])
+    def test_decode_invalid_token_raises_invalid_cursor(self, token: str):
+        with pytest.raises(InvalidCursor):
+            Cursor.decode(token)
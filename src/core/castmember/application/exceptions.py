@@ -5,3 +5,10 @@ class CastMemberNotFound(Exception): ...
 
 
 class InvalidCastMember(Exception): ...
+
+
+class InvalidCastMemberBatch(Exception):
+    def __init__(self, errors: dict[int, str]) -> None:
+        super().__init__(f"Invalid items: {sorted(errors)}")
+        # Error message by item index.
+        self.errors: dict[int, str] = errors
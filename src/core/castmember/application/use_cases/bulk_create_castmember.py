@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from core.castmember.application.exceptions import InvalidCastMemberBatch
+from core.castmember.application.use_cases.create_castmember import CreateCastMember
+from core.castmember.domain.castmember import CastMember
+from core.castmember.domain.castmember_repository import CastMemberRepository
+
+
+class BulkCreateCastMember:
+    def __init__(self, castmember_repository: CastMemberRepository) -> None:
+        self.castmember_repository = castmember_repository
+
+    @dataclass
+    class Input:
+        items: List[CreateCastMember.Input] = field(default_factory=list)
+
+    @dataclass
+    class Output:
+        ids: List[UUID]
+
+    def execute(self, input: Input) -> Output:
+        castmembers: List[CastMember] = []
+        errors: dict[int, str] = {}
+        for index, item in enumerate(input.items):
+            try:
+                castmembers.append(CastMember(name=item.name, type=item.type))
+            except ValueError as error:
+                errors[index] = str(error)
+
+        if errors:
+            raise InvalidCastMemberBatch(errors)
+
+        self.castmember_repository.save_many(castmembers)
+
+        return self.Output(ids=[castmember.id for castmember in castmembers])
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
 from core.castmember.domain.castmember import CastMember
 
 
@@ -10,6 +11,10 @@ class CastMemberRepository(ABC):
     def save(self, castmember: CastMember) -> CastMember:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, castmembers: List[CastMember]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, castmember: CastMember) -> CastMember:
         raise NotImplementedError
@@ -18,6 +23,14 @@ class CastMemberRepository(ABC):
     def list(self) -> List[CastMember]:
         raise NotImplementedError
 
+    @abstractmethod
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[CastMember]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[CastMember]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> CastMember:
         raise NotImplementedError
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import create_autospec
+from core.castmember.application.exceptions import InvalidCastMemberBatch
+from core.castmember.application.use_cases.bulk_create_castmember import (
+    BulkCreateCastMember,
+)
+from core.castmember.application.use_cases.create_castmember import (
+    CreateCastMember,
+)
+from core.castmember.domain.castmember_repository import CastMemberRepository
+from core.castmember.domain.value_objects import CastMemberType
+
+
+@pytest.fixture
+def mock_castmember_repository() -> CastMemberRepository:
+    return create_autospec(CastMemberRepository)
+
+
+@pytest.fixture
+def bulk_create_castmember_use_case(
+    mock_castmember_repository: CastMemberRepository,
+) -> BulkCreateCastMember:
+    return BulkCreateCastMember(castmember_repository=mock_castmember_repository)
+
+
+class TestBulkCreateCastMember:
+
+    def test_bulk_create_castmembers(
+        self,
+        bulk_create_castmember_use_case: BulkCreateCastMember,
+        mock_castmember_repository: CastMemberRepository,
+    ) -> None:
+        output = bulk_create_castmember_use_case.execute(
+            BulkCreateCastMember.Input(
+                items=[
+                    CreateCastMember.Input(name="Jim", type=CastMemberType.ACTOR),
+                    CreateCastMember.Input(name="Nolan", type=CastMemberType.DIRECTOR),
+                ]
+            )
+        )
+
+        mock_castmember_repository.save_many.assert_called_once()
+        saved = mock_castmember_repository.save_many.call_args.args[0]
+        assert [castmember.name for castmember in saved] == ["Jim", "Nolan"]
+        assert output.ids == [castmember.id for castmember in saved]
+
+    def test_bulk_create_reports_invalid_items_by_index(
+        self,
+        bulk_create_castmember_use_case: BulkCreateCastMember,
+        mock_castmember_repository: CastMemberRepository,
+    ) -> None:
+        with pytest.raises(InvalidCastMemberBatch) as exc_info:
+            bulk_create_castmember_use_case.execute(
+                BulkCreateCastMember.Input(
+                    items=[
+                        CreateCastMember.Input(name="", type=CastMemberType.ACTOR),
+                        CreateCastMember.Input(name="Jim", type=CastMemberType.ACTOR),
+                        CreateCastMember.Input(name="Nolan", type="INVALID"),
+                    ]
+                )
+            )
+
+        assert exc_info.value.errors == {
+            0: "name cannot be empty",
+            2: "invalid type",
+        }
+        mock_castmember_repository.save_many.assert_not_called()
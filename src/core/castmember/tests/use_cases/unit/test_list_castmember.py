@@ -1,6 +1,7 @@
 from unittest.mock import create_autospec
 from uuid import uuid4
 import pytest
+from core._shared.domain.pagination import Page
 from core.castmember.application.use_cases.list_castmember import ListCastMember
 from core.castmember.domain.castmember import CastMember
 from core.castmember.domain.castmember_repository import CastMemberRepository
@@ -38,10 +39,10 @@ class TestListCastMember:
         jhon_castmember: CastMember,
         jane_castmember: CastMember,
     ) -> None:
-        mock_castmember_repository.list.return_value = [
-            jhon_castmember,
-            jane_castmember,
-        ]
+        mock_castmember_repository.paginate.return_value = Page(
+            items=[jane_castmember, jhon_castmember],
+            total=2,
+        )
         use_case: ListCastMember = ListCastMember(
             repository=mock_castmember_repository
         )
@@ -65,13 +66,15 @@ class TestListCastMember:
             per_page=10,
             total=2,
         )
-        mock_castmember_repository.list.assert_called_once()
+        mock_castmember_repository.paginate.assert_called_once_with(
+            order_by="name", offset=0, limit=10
+        )
 
     def test_list_castmember_with_empty_list(
         self,
         mock_castmember_repository: CastMemberRepository,
     ) -> None:
-        mock_castmember_repository.list.return_value = []
+        mock_castmember_repository.paginate.return_value = Page(items=[], total=0)
         use_case: ListCastMember = ListCastMember(
             repository=mock_castmember_repository
         )
@@ -84,4 +87,6 @@ class TestListCastMember:
             per_page=10,
             total=0,
         )
-        mock_castmember_repository.list.assert_called_once()
+        mock_castmember_repository.paginate.assert_called_once_with(
+            order_by="name", offset=0, limit=10
+        )
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from core.category.application.use_cases.create_category import CreateCategoryRequest
+from core.category.application.use_cases.exceptions import InvalidCategoryBatch
+from core.category.domain.category import Category
+from core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class BulkCreateCategoryRequest:
+    items: List[CreateCategoryRequest] = field(default_factory=list)
+
+
+@dataclass
+class BulkCreateCategoryResponse:
+    ids: List[UUID]
+
+
+class BulkCreateCategory:
+    def __init__(self, repository: CategoryRepository) -> None:
+        self.repository: CategoryRepository = repository
+
+    def execute(self, request: BulkCreateCategoryRequest) -> BulkCreateCategoryResponse:
+        categories: List[Category] = []
+        errors: dict[int, str] = {}
+        for index, item in enumerate(request.items):
+            try:
+                categories.append(
+                    Category(
+                        name=item.name,
+                        description=item.description,
+                        is_active=item.is_active,
+                    )
+                )
+            except ValueError as error:
+                errors[index] = str(error)
+
+        # All or nothing: a single invalid row rejects the whole batch.
+        if errors:
+            raise InvalidCategoryBatch(errors)
+
+        self.repository.save_many(categories)
+
+        return BulkCreateCategoryResponse(ids=[category.id for category in categories])
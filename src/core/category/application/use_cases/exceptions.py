@@ -2,3 +2,10 @@ class InvalidCategoryData(Exception): ...
 
 
 class CategoryNotFound(Exception): ...
+
+
+class InvalidCategoryBatch(Exception):
+    def __init__(self, errors: dict[int, str]) -> None:
+        super().__init__(f"Invalid items: {sorted(errors)}")
+        # Error message by item index.
+        self.errors: dict[int, str] = errors
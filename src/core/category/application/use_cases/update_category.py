@@ -51,4 +51,4 @@ class UpdateCategory:
             description=current_description,
         )
 
-        self.repository.update(category=category)
+        self.repository.update(category)
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import List
 from uuid import UUID
+
+from core._shared.domain.pagination import Cursor, Page
 from core.category.domain.category import Category
 
 
@@ -8,6 +11,10 @@ class CategoryRepository(ABC):
     def save(self, category: Category) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, categories: List[Category]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Category | None:
         raise NotImplementedError
@@ -24,6 +31,14 @@ class CategoryRepository(ABC):
     def list(self) -> list[Category]:
         raise NotImplementedError
 
+    @abstractmethod
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Category]:
+        raise NotImplementedError
+
     @abstractmethod
     def exists_by_ids(self, ids: set[UUID]) -> bool:
         raise NotImplementedError
@@ -1,3 +1,6 @@
+import pytest
+
+from core._shared.domain.pagination import InvalidCursor
 from core.category.application.use_cases.list_category import ListCategory
 from core.category.domain.category import Category
 from django_project.adapters.persistence.in_memory.category_repository import InMemoryCategoryRepository
@@ -49,3 +52,40 @@ class TestListCategory:
             ],
             meta=default_meta,
         )
+
+    def test_walk_every_page_with_cursor(self) -> None:
+        categories = [
+            Category(name=name, description=f"{name} description")
+            for name in ["Series", "Movies", "Documentary", "Anime", "Kids"]
+        ]
+        repository: InMemoryCategoryRepository = InMemoryCategoryRepository(
+            categories=categories
+        )
+        use_case: ListCategory = ListCategory(repository=repository)
+
+        response: ListCategory.ListOutput = use_case.execute(
+            ListCategory.Input(page_size=2)
+        )
+        names = [output.name for output in response.data]
+        while response.meta.next_cursor:
+            response = use_case.execute(
+                ListCategory.Input(page_size=2, cursor=response.meta.next_cursor)
+            )
+            names.extend(output.name for output in response.data)
+
+        assert names == ["Anime", "Documentary", "Kids", "Movies", "Series"]
+        assert response.meta.total is None
+
+    def test_cursor_issued_for_another_order_by_is_rejected(self) -> None:
+        repository: InMemoryCategoryRepository = InMemoryCategoryRepository(
+            categories=[Category(name="Movies"), Category(name="Series")]
+        )
+        use_case: ListCategory = ListCategory(repository=repository)
+        response = use_case.execute(ListCategory.Input(page_size=1))
+
+        with pytest.raises(InvalidCursor):
+            use_case.execute(
+                ListCategory.Input(
+                    order_by="description", cursor=response.meta.next_cursor
+                )
+            )
@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.category.application.use_cases.bulk_create_category import (
+    BulkCreateCategory,
+    BulkCreateCategoryRequest,
+    BulkCreateCategoryResponse,
+)
+from core.category.application.use_cases.create_category import CreateCategoryRequest
+from core.category.application.use_cases.exceptions import InvalidCategoryBatch
+from core.category.domain.category_repository import CategoryRepository
+
+
+class TestBulkCreateCategory:
+
+    def test_bulk_create_saves_all_categories_at_once(self) -> None:
+        mock_repository: MagicMock = MagicMock(CategoryRepository)
+        use_case: BulkCreateCategory = BulkCreateCategory(repository=mock_repository)
+
+        response: BulkCreateCategoryResponse = use_case.execute(
+            BulkCreateCategoryRequest(
+                items=[
+                    CreateCategoryRequest(name="Movie"),
+                    CreateCategoryRequest(name="Series", is_active=False),
+                ]
+            )
+        )
+
+        mock_repository.save_many.assert_called_once()
+        mock_repository.save.assert_not_called()
+        saved = mock_repository.save_many.call_args.args[0]
+        assert [category.name for category in saved] == ["Movie", "Series"]
+        assert response.ids == [category.id for category in saved]
+
+    def test_bulk_create_rejects_batch_with_invalid_item(self) -> None:
+        mock_repository: MagicMock = MagicMock(CategoryRepository)
+        use_case: BulkCreateCategory = BulkCreateCategory(repository=mock_repository)
+
+        with pytest.raises(InvalidCategoryBatch) as exc_info:
+            use_case.execute(
+                BulkCreateCategoryRequest(
+                    items=[
+                        CreateCategoryRequest(name="Movie"),
+                        CreateCategoryRequest(name=""),
+                    ]
+                )
+            )
+
+        assert exc_info.value.errors == {1: "name cannot be empty"}
+        mock_repository.save_many.assert_not_called()
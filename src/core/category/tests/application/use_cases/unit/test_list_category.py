@@ -1,4 +1,5 @@
 from unittest.mock import create_autospec
+from core._shared.domain.pagination import Page
 from core.category.domain.category_repository import CategoryRepository
 from core.category.application.use_cases.list_category import ListCategory
 from core.category.domain.category import Category
@@ -8,7 +9,7 @@ class TestListCategory:
 
     def test_when_no_categories_in_repository_then_return_empty_list(self) -> None:
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = []
+        mock_repository.paginate.return_value = Page(items=[], total=0)
 
         use_case = ListCategory(repository=mock_repository)
         request = ListCategory.Input()
@@ -25,13 +26,14 @@ class TestListCategory:
             name="Series", description="Series description", is_active=True
         )
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = [category_movies, category_series]
+        mock_repository.paginate.return_value = Page(
+            items=[category_movies, category_series], total=2
+        )
 
         use_case = ListCategory(repository=mock_repository)
         request = ListCategory.Input()
         response = use_case.execute(request)
-        total = len(mock_repository.list())
-        meta = ListCategory.OutputMeta(current_page=1, per_page=10, total=total)
+        meta = ListCategory.OutputMeta(current_page=1, per_page=10, total=2)
 
         assert response == ListCategory.ListOutput(
             data=[
@@ -50,3 +52,19 @@ class TestListCategory:
             ],
             meta=meta,
         )
+
+    def test_requests_only_the_current_page_from_repository(self) -> None:
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.paginate.return_value = Page(items=[], total=25)
+
+        use_case = ListCategory(repository=mock_repository)
+        response = use_case.execute(
+            ListCategory.Input(order_by="description", current_page=3, page_size=10)
+        )
+
+        mock_repository.paginate.assert_called_once_with(
+            order_by="description", offset=20, limit=10
+        )
+        assert response.meta == ListCategory.OutputMeta(
+            current_page=3, per_page=10, total=25
+        )
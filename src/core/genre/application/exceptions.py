@@ -1,3 +1,6 @@
+from uuid import UUID
+
+
 class RelatedCategoriesNotFound(Exception): pass
 
 
@@ -5,3 +8,16 @@ class GenreNotFound(Exception): ...
 
 
 class InvalidGenre(Exception): ...
+
+
+class InvalidGenreBatch(Exception):
+    def __init__(
+        self,
+        errors: dict[int, str] | None = None,
+        missing_categories: dict[int, set[UUID]] | None = None,
+    ) -> None:
+        self.errors: dict[int, str] = errors or {}
+        self.missing_categories: dict[int, set[UUID]] = missing_categories or {}
+        super().__init__(
+            f"Invalid items: {sorted(self.errors.keys() | self.missing_categories)}"
+        )
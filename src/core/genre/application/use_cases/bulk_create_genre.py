@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from typing import List, Set
+from uuid import UUID
+
+from core.category.domain.category_repository import CategoryRepository
+from core.genre.application.exceptions import InvalidGenreBatch
+from core.genre.application.use_cases.create_genre import CreateGenre
+from core.genre.domain.genre import Genre
+from core.genre.domain.genre_repository import GenreRepository
+
+
+class BulkCreateGenre:
+    def __init__(
+        self, genre_repository: GenreRepository, category_repository: CategoryRepository
+    ) -> None:
+        self.genre_repository = genre_repository
+        self.category_repository = category_repository
+
+    @dataclass
+    class Input:
+        items: List[CreateGenre.Input] = field(default_factory=list)
+
+    @dataclass
+    class Output:
+        ids: List[UUID]
+
+    def execute(self, input: Input) -> Output:
+        # One lookup covers the categories referenced by every item.
+        missing_categories: Set[UUID] = self.category_repository.find_missing_ids(
+            set().union(*(item.categories for item in input.items))
+        )
+
+        genres: List[Genre] = []
+        errors: dict[int, str] = {}
+        for index, item in enumerate(input.items):
+            try:
+                genres.append(
+                    Genre(
+                        name=item.name,
+                        is_active=item.is_active,
+                        categories=item.categories,
+                    )
+                )
+            except ValueError as error:
+                errors[index] = str(error)
+
+        # Both kinds of problem are reported per item in one go.
+        if errors or missing_categories:
+            raise InvalidGenreBatch(
+                errors=errors,
+                missing_categories={
+                    index: item.categories & missing_categories
+                    for index, item in enumerate(input.items)
+                    if item.categories & missing_categories
+                },
+            )
+
+        self.genre_repository.save_many(genres)
+
+        return self.Output(ids=[genre.id for genre in genres])
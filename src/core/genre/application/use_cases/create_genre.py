@@ -26,12 +26,12 @@ class CreateGenre:
         id: UUID
 
     def execute(self, input: Input) -> Output:
-        if input.categories and not self.category_repository.exists_by_ids(
-            input.categories
-        ):
-            missing_categories = self.category_repository.find_missing_ids(
-                input.categories
-            )
+        missing_categories: Set[UUID] = (
+            self.category_repository.find_missing_ids(input.categories)
+            if input.categories
+            else set()
+        )
+        if missing_categories:
             raise RelatedCategoriesNotFound(
                 f"Categories with provided IDs not found: {', '.join(str(category_id) for category_id in missing_categories)}"
             )
@@ -50,14 +50,14 @@ class UpdateGenre:
         if input.is_active is False:
             genre_to_update.deactivate()
 
-        if input.categories and not self.category_repository.exists_by_ids(
-            input.categories
-        ):
-            missing_categories = self.category_repository.find_missing_ids(
-                input.categories
-            )
+        missing_categories: Set[UUID] = (
+            self.category_repository.find_missing_ids(input.categories)
+            if input.categories
+            else set()
+        )
+        if missing_categories:
             raise RelatedCategoriesNotFound(
-                f"Categories with provided IDs not found: {', '.join(str(missing_category_id) for missing_category_id in missing_categories)}"
+                f"Categories with provided IDs not found: {', '.join(str(category_id) for category_id in missing_categories)}"
             )
 
         # categories_to_remove = list(genre_to_update.categories - input.categories)
@@ -69,4 +69,4 @@ class UpdateGenre:
         for category_id in input.categories:
             genre_to_update.add_category(category_id=category_id)
 
-        self.genre_repository.update(genre=genre_to_update)
+        self.genre_repository.update(genre_to_update)
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
 from core.genre.domain.genre import Genre
 
 
@@ -10,6 +11,10 @@ class GenreRepository(ABC):
     def save(self, genre: Genre) -> Genre:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, genres: List[Genre]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, genre: Genre) -> Genre:
         raise NotImplementedError
@@ -18,6 +23,14 @@ class GenreRepository(ABC):
     def list(self) -> List[Genre]:
         raise NotImplementedError
 
+    @abstractmethod
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Genre]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Genre:
         raise NotImplementedError
@@ -0,0 +1,112 @@
+from uuid import uuid4
+from unittest.mock import create_autospec
+
+import pytest
+
+from core.category.domain.category_repository import CategoryRepository
+from core.genre.application.exceptions import InvalidGenreBatch
+from core.genre.application.use_cases.bulk_create_genre import BulkCreateGenre
+from core.genre.application.use_cases.create_genre import CreateGenre
+from core.genre.domain.genre_repository import GenreRepository
+
+
+@pytest.fixture
+def mock_genre_repository() -> GenreRepository:
+    return create_autospec(GenreRepository)
+
+
+@pytest.fixture
+def mock_category_repository() -> CategoryRepository:
+    repository = create_autospec(CategoryRepository)
+    repository.find_missing_ids.return_value = set()
+    return repository
+
+
+@pytest.fixture
+def use_case(mock_genre_repository, mock_category_repository) -> BulkCreateGenre:
+    return BulkCreateGenre(
+        genre_repository=mock_genre_repository,
+        category_repository=mock_category_repository,
+    )
+
+
+class TestBulkCreateGenre:
+    def test_checks_all_categories_in_one_call_and_saves_once(
+        self, use_case, mock_genre_repository, mock_category_repository
+    ):
+        movie_id, series_id = uuid4(), uuid4()
+
+        output = use_case.execute(
+            BulkCreateGenre.Input(
+                items=[
+                    CreateGenre.Input(name="Action", categories={movie_id}),
+                    CreateGenre.Input(name="Drama", categories={series_id}),
+                    CreateGenre.Input(name="Romance"),
+                ]
+            )
+        )
+
+        mock_category_repository.find_missing_ids.assert_called_once_with(
+            {movie_id, series_id}
+        )
+        saved = mock_genre_repository.save_many.call_args.args[0]
+        assert [genre.name for genre in saved] == ["Action", "Drama", "Romance"]
+        assert saved[0].categories == {movie_id}
+        assert output.ids == [genre.id for genre in saved]
+
+    def test_reports_missing_categories_per_item(
+        self, use_case, mock_genre_repository, mock_category_repository
+    ):
+        existing_id, missing_id = uuid4(), uuid4()
+        mock_category_repository.find_missing_ids.return_value = {missing_id}
+
+        with pytest.raises(InvalidGenreBatch) as exc_info:
+            use_case.execute(
+                BulkCreateGenre.Input(
+                    items=[
+                        CreateGenre.Input(name="Action", categories={existing_id}),
+                        CreateGenre.Input(
+                            name="Drama", categories={existing_id, missing_id}
+                        ),
+                    ]
+                )
+            )
+
+        assert exc_info.value.missing_categories == {1: {missing_id}}
+        mock_genre_repository.save_many.assert_not_called()
+
+    def test_rejects_batch_with_invalid_genre(
+        self, use_case, mock_genre_repository
+    ):
+        with pytest.raises(InvalidGenreBatch) as exc_info:
+            use_case.execute(
+                BulkCreateGenre.Input(
+                    items=[CreateGenre.Input(name="Action"), CreateGenre.Input(name="")]
+                )
+            )
+
+        assert list(exc_info.value.errors) == [1]
+        mock_genre_repository.save_many.assert_not_called()
+
+    def test_reports_invalid_items_and_missing_categories_together(
+        self, use_case, mock_category_repository
+    ):
+        missing_id = uuid4()
+        mock_category_repository.find_missing_ids.return_value = {missing_id}
+
+        with pytest.raises(InvalidGenreBatch) as exc_info:
+            use_case.execute(
+                BulkCreateGenre.Input(
+                    items=[
+                        CreateGenre.Input(name="Action", categories={missing_id}),
+                        CreateGenre.Input(name="Drama"),
+                        CreateGenre.Input(name="", categories={missing_id}),
+                    ]
+                )
+            )
+
+        assert list(exc_info.value.errors) == [2]
+        assert exc_info.value.missing_categories == {
+            0: {missing_id},
+            2: {missing_id},
+        }
@@ -1,5 +1,7 @@
 from unittest.mock import create_autospec
 
+from core._shared.domain.pagination import Page
+
 from core.category.domain.category import Category
 from core.genre.domain.genre import Genre
 from core.genre.domain.genre_repository import GenreRepository
@@ -13,7 +15,7 @@ class TestListGenre:
 
     def test_when_no_genres_in_repository_then_return_empty_list(self) -> None:
         mock_repository: GenreRepository = create_autospec(GenreRepository)
-        mock_repository.list.return_value = []
+        mock_repository.paginate.return_value = Page(items=[], total=0)
 
         use_case: ListGenre = ListGenre(repository=mock_repository)
         request: ListGenre.Input = ListGenre.Input()
@@ -46,7 +48,9 @@ class TestListGenre:
             is_active=True,
         )
         mock_repository: GenreRepository = create_autospec(GenreRepository)
-        mock_repository.list.return_value = [sports_genre, romance_genre, special_genre]
+        mock_repository.paginate.return_value = Page(
+            items=[romance_genre, special_genre, sports_genre], total=3
+        )
 
         use_case: ListGenre = ListGenre(repository=mock_repository)
         input: ListGenre.Input = ListGenre.Input()
@@ -6,4 +6,24 @@ class InvalidVideo(Exception): ...
 
 class VideoNotFound(Exception): ...
 
-class AudioVideoMediaNotFound(Exception): ...
\ No newline at end of file
+class AudioVideoMediaNotFound(Exception): ...
+
+class MediaUploadNotFound(Exception): ...
+
+
+class InvalidMediaUpload(Exception): ...
+
+
+class MediaUploadClosed(Exception): ...
+
+
+class MediaUploadBusy(Exception): ...
+
+
+class IncompleteMediaUpload(Exception):
+    def __init__(self, missing: list[int]) -> None:
+        super().__init__(f"Missing chunks: {missing}")
+        self.missing: list[int] = missing
+
+
+class MediaFileNotFound(Exception): ...
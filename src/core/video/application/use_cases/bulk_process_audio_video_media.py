@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.application.ports.unit_of_work import NullUnitOfWork, UnitOfWork
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+from core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
+from core.video.domain.video_repository import VideoRepository
+
+
+class BulkProcessAudioVideoMedia:
+    """ProcessAudioVideoMedia for many encoder results at once.
+
+    Media are read in one query and written in one transaction. Items for
+    the same media are applied in order, so only the last state is written.
+    """
+
+    @dataclass
+    class Input:
+        items: List[ProcessAudioVideoMedia.Input] = field(default_factory=list)
+
+    @dataclass
+    class Output:
+        # Indexes of items whose video or media does not exist.
+        not_found: List[int] = field(default_factory=list)
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        event_publisher: EventPublisher,
+        unit_of_work: UnitOfWork | None = None,
+    ) -> None:
+        self.video_repository: VideoRepository = video_repository
+        self.event_publisher: EventPublisher = event_publisher
+        self.unit_of_work: UnitOfWork = unit_of_work or NullUnitOfWork()
+
+    def execute(self, input: Input) -> Output:
+        current: dict[tuple[UUID, MediaType], AudioVideoMedia] = (
+            self.video_repository.get_media_many(
+                {(item.video_id, item.media_type) for item in input.items}
+            )
+        )
+        processed: dict[tuple[UUID, MediaType], AudioVideoMedia] = {}
+        published: set[UUID] = set()
+        events: List[AudioVideoMediaUpdatedIntegrationEvent] = []
+        output = self.Output()
+
+        for index, item in enumerate(input.items):
+            key = (item.video_id, item.media_type)
+            media: AudioVideoMedia | None = processed.get(key) or current.get(key)
+            if media is None:
+                output.not_found.append(index)
+                continue
+
+            media = media.process(
+                status=item.status, encoded_location=item.encoded_location
+            )
+            processed[key] = media
+            if media.status == MediaStatus.COMPLETED:
+                if item.media_type == MediaType.VIDEO:
+                    published.add(item.video_id)
+                events.append(
+                    AudioVideoMediaUpdatedIntegrationEvent(
+                        resource_id=f"{item.video_id}.{item.media_type}",
+                        file_path=media.encoded_location,
+                    )
+                )
+
+        if not processed:
+            return output
+
+        by_video: dict[UUID, List[AudioVideoMedia]] = {}
+        for (video_id, _), media in processed.items():
+            by_video.setdefault(video_id, []).append(media)
+        with self.unit_of_work.atomic():
+            self.video_repository.update_media_many(by_video, published=published)
+            if events:
+                self.event_publisher.publish(events)
+        return output
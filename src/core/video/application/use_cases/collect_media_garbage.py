@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import batched
+from pathlib import PurePosixPath
+from typing import List
+from uuid import UUID
+
+from core._shared.application.ports.storage_service import (
+    StorageService,
+    StoredObject,
+)
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.media_upload_repository import MediaUploadRepository
+from core.video.domain.video_repository import VideoRepository
+
+
+class CollectMediaGarbage:
+    """Deletes content-addressed blobs that no video's media references, and
+    chunked uploads started before uploads_started_before with their staged
+    data.
+
+    Blobs modified after modified_before are kept even when unreferenced:
+    the upload that wrote or relinked them may not have committed yet.
+    Blobs are moved to trash/ and checked again before being deleted, so
+    an upload relinking one meanwhile either recreates it or keeps it.
+    """
+
+    BATCH_SIZE = 500
+
+    @dataclass
+    class Input:
+        modified_before: datetime
+        uploads_started_before: datetime
+
+    @dataclass
+    class Output:
+        scanned: int = 0
+        deleted: List[str] = field(default_factory=list)
+        expired_uploads: List[UUID] = field(default_factory=list)
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        upload_repository: MediaUploadRepository,
+        storage_service: StorageService,
+    ) -> None:
+        self.video_repository: VideoRepository = video_repository
+        self.upload_repository: MediaUploadRepository = upload_repository
+        self.storage_service: StorageService = storage_service
+
+    def execute(self, input: Input) -> Output:
+        output = self.Output()
+        self._collect_blobs(input, output)
+        self._expire_uploads(input, output)
+        return output
+
+    def _collect_blobs(self, input: Input, output: Output) -> None:
+        # Left behind by an interrupted run, and checked again below.
+        for trashed in list(self.storage_service.list_files("trash")):
+            self._restore(
+                trashed.path, UploadVideo.blob_path(PurePosixPath(trashed.path).name)
+            )
+
+        for batch in batched(self.storage_service.list_files("blobs"), self.BATCH_SIZE):
+            output.scanned += len(batch)
+            candidates: dict[str, StoredObject] = {
+                blob.path: blob
+                for blob in batch
+                if blob.modified_at < input.modified_before
+            }
+            if not candidates:
+                continue
+            references: dict[str, int] = self.video_repository.count_media_references(
+                set(candidates)
+            )
+            for path, count in references.items():
+                if count == 0 and self._collect_blob(path, input.modified_before):
+                    output.deleted.append(path)
+
+    def _collect_blob(self, path: str, modified_before: datetime) -> bool:
+        trash_path: str = str(PurePosixPath("trash") / PurePosixPath(path).name)
+        try:
+            self.storage_service.move(path, trash_path)
+        except FileNotFoundError:
+            return False
+        # Moved aside, the blob can no longer be relinked, only replaced by a
+        # new copy; what was moved is deleted only if still old and unused.
+        trashed: StoredObject | None = self.storage_service.stat(trash_path)
+        if (
+            trashed is not None
+            and trashed.modified_at < modified_before
+            and self.video_repository.count_media_references({path})[path] == 0
+        ):
+            self.storage_service.delete(trash_path)
+            return True
+        self._restore(trash_path, path)
+        return False
+
+    def _restore(self, trash_path: str, path: str) -> None:
+        if self.storage_service.stat(path) is None:
+            self.storage_service.move(trash_path, path)
+        else:
+            self.storage_service.delete(trash_path)
+
+    def _expire_uploads(self, input: Input, output: Output) -> None:
+        output.expired_uploads = self.upload_repository.delete_created_before(
+            input.uploads_started_before
+        )
+        for upload_id in output.expired_uploads:
+            self.storage_service.delete(InitiateMediaUpload.staging_path(upload_id))
+
+        # Staged data left behind without a row: uploads removed along with
+        # their video, and interrupted single-request uploads. Live uploads
+        # were allocated after the cutoff, save for one racing it.
+        for staged in self.storage_service.list_files("uploads"):
+            if staged.modified_at >= input.uploads_started_before:
+                continue
+            if not self._has_upload(staged.path):
+                self.storage_service.delete(staged.path)
+                output.deleted.append(staged.path)
+
+    def _has_upload(self, staging_path: str) -> bool:
+        try:
+            upload_id = UUID(PurePosixPath(staging_path).name.removesuffix(".part"))
+        except ValueError:
+            return False
+        return self.upload_repository.get_by_id(upload_id) is not None
@@ -0,0 +1,138 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from core._shared.application.ports.storage_service import (
+    OpenedFile,
+    StorageService,
+)
+from core._shared.application.ports.unit_of_work import NullUnitOfWork, UnitOfWork
+from core.video.application.exceptions import (
+    IncompleteMediaUpload,
+    MediaUploadBusy,
+    MediaUploadNotFound,
+)
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.media_upload import MediaUpload, UploadStatus
+from core.video.domain.media_upload_repository import MediaUploadRepository
+
+
+class CompleteMediaUpload:
+    @dataclass
+    class Input:
+        video_id: UUID
+        upload_id: UUID
+
+    @dataclass
+    class Output:
+        checksum: str
+
+    def __init__(
+        self,
+        upload_repository: MediaUploadRepository,
+        upload_video: UploadVideo,
+        storage_service: StorageService,
+        unit_of_work: UnitOfWork | None = None,
+        lease_timeout: timedelta = timedelta(minutes=30),
+    ) -> None:
+        self.upload_repository: MediaUploadRepository = upload_repository
+        self.upload_video: UploadVideo = upload_video
+        self.storage_service: StorageService = storage_service
+        self.unit_of_work: UnitOfWork = unit_of_work or NullUnitOfWork()
+        self.lease_timeout: timedelta = lease_timeout
+
+    def execute(self, input: Input) -> Output:
+        # Each step is recorded once done, so a retried complete resumes
+        # where the last attempt stopped instead of moving the file again.
+        # Only the steps that change state lock the upload; the checksum
+        # read, which takes minutes for a large file, runs without it.
+        with self.unit_of_work.atomic():
+            upload: MediaUpload = self._get_for_update(input)
+            if upload.status == UploadStatus.UPLOADING:
+                self._close(upload)
+            if upload.status == UploadStatus.PLACING:
+                self._ensure_idle(upload, "is already being completed")
+                lease_id: UUID = self.upload_repository.acquire_lease(upload.id)
+        if upload.status == UploadStatus.PLACING:
+            try:
+                checksum: str = self._checksum(upload)
+                with self.unit_of_work.atomic():
+                    upload = self._get_for_update(input)
+                    if upload.status == UploadStatus.PLACING:
+                        self._place(upload, checksum)
+            finally:
+                self.upload_repository.release_lease(lease_id)
+        with self.unit_of_work.atomic():
+            upload = self._get_for_update(input)
+            if upload.status == UploadStatus.PLACED:
+                self._attach(upload)
+
+        return self.Output(checksum=upload.checksum)
+
+    def _get_for_update(self, input: Input) -> MediaUpload:
+        upload: MediaUpload | None = self.upload_repository.get_for_update(
+            input.upload_id
+        )
+        if upload is None or upload.video_id != input.video_id:
+            raise MediaUploadNotFound(f"Upload with id '{input.upload_id}' not found.")
+        return upload
+
+    def _ensure_idle(self, upload: MediaUpload, reason: str) -> None:
+        # Leases older than the timeout are presumed dead, e.g. their worker
+        # was killed, and no longer hold complete off.
+        if self.upload_repository.count_leases(
+            upload.id, datetime.now(timezone.utc) - self.lease_timeout
+        ):
+            raise MediaUploadBusy(f"Upload with id '{upload.id}' {reason}.")
+
+    def _close(self, upload: MediaUpload) -> None:
+        self._ensure_idle(upload, "has chunks still being written")
+        chunk_checksums: dict[int, str] = self.upload_repository.get_chunk_checksums(
+            upload.id
+        )
+        missing: list[int] = upload.missing_chunks(set(chunk_checksums))
+        if missing:
+            raise IncompleteMediaUpload(missing)
+        upload.close()
+        self.upload_repository.save(upload)
+
+    def _checksum(self, upload: MediaUpload) -> str:
+        # Read back once: chunks land out of order, and the checksum must be
+        # the file's sha256 like that of any other upload.
+        staged: OpenedFile | None = self.storage_service.open(
+            InitiateMediaUpload.staging_path(upload.id)
+        )
+        if staged is None:
+            raise MediaUploadNotFound(f"Upload with id '{upload.id}' has no data.")
+        with staged.content as content:
+            return hashlib.file_digest(content, "sha256").hexdigest()
+
+    def _place(self, upload: MediaUpload, checksum: str) -> None:
+        try:
+            file_path: str = self.upload_video.place(
+                InitiateMediaUpload.staging_path(upload.id),
+                checksum,
+                upload.video_id,
+                upload.file_name,
+            )
+        except FileNotFoundError:
+            raise MediaUploadNotFound(f"Upload with id '{upload.id}' has no data.")
+        upload.place(file_path, checksum)
+        self.upload_repository.save(upload)
+
+    def _attach(self, upload: MediaUpload) -> None:
+        self.upload_video.attach(
+            UploadVideo.StoredMedia(
+                video_id=upload.video_id,
+                file_name=upload.file_name,
+                file_path=upload.file_path,
+                checksum=upload.checksum,
+                media_type=upload.media_type,
+            )
+        )
+        upload.complete()
+        self.upload_repository.save(upload)
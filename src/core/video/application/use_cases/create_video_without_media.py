@@ -4,9 +4,6 @@ from typing import Set
 from uuid import UUID
 
 from core._shared.domain.notification import Notification
-from core.castmember.domain.castmember_repository import CastMemberRepository
-from core.category.domain.category_repository import CategoryRepository
-from core.genre.domain.genre_repository import GenreRepository
 from core.video.application.exceptions import InvalidVideo, RelatedEntitiesNotFound
 from core.video.domain.value_objects import Rating
 from core.video.domain.video import Video
@@ -14,17 +11,8 @@ from core.video.domain.video_repository import VideoRepository
 
 
 class CreateVideoWithoutMedia:
-    def __init__(
-        self,
-        video_repository: VideoRepository,
-        category_repository: CategoryRepository,
-        genre_repository: GenreRepository,
-        cast_member_repository: CastMemberRepository,
-    ):
+    def __init__(self, video_repository: VideoRepository):
         self.video_repository = video_repository
-        self.category_repository = category_repository
-        self.genre_repository = genre_repository
-        self.cast_member_repository = cast_member_repository
 
     @dataclass
     class Input:
@@ -43,12 +31,7 @@ class CreateVideoWithoutMedia:
         id: UUID
 
     def execute(self, input: Input) -> Output:
-        notification: Notification = Notification()
-
-        self.validate_categories(input, notification)
-        self.validate_genres(input, notification)
-        self.validate_cast_members(input, notification)
-
+        notification: Notification = self.validate_related_ids(input)
         if notification.has_errors:
             raise RelatedEntitiesNotFound(notification.messages)
 
@@ -70,33 +53,23 @@ class CreateVideoWithoutMedia:
 
         return self.Output(id=video.id)
 
-    def validate_categories(self, input: Input, notification: Notification) -> None:
-        if not input.categories:
-            return
-        if not self.category_repository.exists_by_ids(input.categories):
-            missing_categories = self.category_repository.find_missing_ids(
-                input.categories
-            )
-            notification.add_error(
-                f"Categories with provided IDs not found: {', '.join(str(missing_category_id) for missing_category_id in missing_categories)}"
-            )
-
-    def validate_genres(self, input: Input, notification: Notification) -> None:
-        if not input.genres:
-            return
-        if not self.genre_repository.exists_by_ids(input.genres):
-            missing_genres = self.genre_repository.find_missing_ids(input.genres)
-            notification.add_error(
-                f"Genres with provided IDs not found: {', '.join(str(missing_genre_id) for missing_genre_id in missing_genres)}"
-            )
+    def validate_related_ids(self, input: Input) -> Notification:
+        notification: Notification = Notification()
+        if not (input.categories or input.genres or input.cast_members):
+            return notification
 
-    def validate_cast_members(self, input: Input, notification: Notification) -> None:
-        if not input.cast_members:
-            return
-        if not self.cast_member_repository.exists_by_ids(input.cast_members):
-            missing_cast_members = self.cast_member_repository.find_missing_ids(
-                input.cast_members
-            )
-            notification.add_error(
-                f"Cast members with provided IDs not found: {', '.join(str(missing_cast_member_id) for missing_cast_member_id in missing_cast_members)}"
-            )
+        missing: dict[str, set[UUID]] = self.video_repository.find_missing_related_ids(
+            categories=input.categories,
+            genres=input.genres,
+            cast_members=input.cast_members,
+        )
+        for relation, label in (
+            ("categories", "Categories"),
+            ("genres", "Genres"),
+            ("cast_members", "Cast members"),
+        ):
+            if missing[relation]:
+                notification.add_error(
+                    f"{label} with provided IDs not found: {', '.join(str(missing_id) for missing_id in missing[relation])}"
+                )
+        return notification
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from uuid import UUID
+
+from core._shared.application.ports.storage_service import OpenedFile, StorageService
+from core.video.application.exceptions import MediaFileNotFound
+from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.value_objects import AudioVideoMedia, MediaType
+from core.video.domain.video_repository import VideoRepository
+
+
+class GetMediaFile:
+    @dataclass
+    class Input:
+        video_id: UUID
+        media_type: MediaType = MediaType.VIDEO
+        encoded: bool = False
+        # A file inside the encoded folder, e.g. a playlist or segment.
+        file_name: str = ""
+
+    @dataclass
+    class Output:
+        file: OpenedFile
+        name: str
+        # Changes whenever the served bytes do.
+        etag: str
+
+    def __init__(
+        self, video_repository: VideoRepository, storage_service: StorageService
+    ) -> None:
+        self.video_repository: VideoRepository = video_repository
+        self.storage_service: StorageService = storage_service
+
+    def execute(self, input: Input) -> Output:
+        media: AudioVideoMedia | None = self.video_repository.get_media(
+            video_id=input.video_id, media_type=input.media_type
+        )
+        if media is None:
+            raise MediaFileNotFound(
+                f"Video '{input.video_id}' has no {input.media_type} media."
+            )
+
+        if input.encoded:
+            file_path: PurePosixPath = self._encoded_path(media, input.file_name)
+        else:
+            file_path = PurePosixPath(media.raw_location)
+
+        file: OpenedFile | None = self.storage_service.open(str(file_path))
+        if file is None:
+            raise MediaFileNotFound(f"Media file '{file_path}' not found.")
+
+        if input.encoded:
+            # Encoder output carries no checksum; size and mtime identify it.
+            return self.Output(
+                file=file, name=file_path.name, etag=self._file_etag(file)
+            )
+        if media.raw_location == UploadVideo.blob_path(media.checksum):
+            return self.Output(file=file, name=media.name, etag=media.checksum)
+        # A re-upload overwrites this path in place, possibly after the
+        # checksum above was read, so the opened file's own size and mtime
+        # are folded in to keep the ETag tied to the bytes being served.
+        return self.Output(
+            file=file,
+            name=media.name,
+            etag=f"{media.checksum}-{self._file_etag(file)}",
+        )
+
+    @staticmethod
+    def _file_etag(file: OpenedFile) -> str:
+        modified: int = int(file.modified_at.timestamp() * 1_000_000)
+        return f"{file.size:x}-{modified:x}"
+
+    def _encoded_path(self, media: AudioVideoMedia, file_name: str) -> PurePosixPath:
+        if not media.encoded_location:
+            raise MediaFileNotFound(f"Media '{media.name}' is not encoded yet.")
+        relative = PurePosixPath(file_name)
+        if relative.is_absolute() or ".." in relative.parts:
+            raise MediaFileNotFound(f"Media file '{file_name}' not found.")
+        return PurePosixPath(media.encoded_location) / relative
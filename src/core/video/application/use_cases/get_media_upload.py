@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+from core.video.application.exceptions import MediaUploadNotFound
+from core.video.domain.media_upload import MediaUpload, UploadStatus
+from core.video.domain.media_upload_repository import MediaUploadRepository
+
+
+class GetMediaUpload:
+    @dataclass
+    class Input:
+        video_id: UUID
+        upload_id: UUID
+
+    @dataclass
+    class Output:
+        upload_id: UUID
+        status: UploadStatus
+        file_name: str
+        size: int
+        chunk_size: int
+        chunk_count: int
+        received_chunks: List[int]
+        missing_chunks: List[int]
+        received_bytes: int
+
+    def __init__(self, upload_repository: MediaUploadRepository) -> None:
+        self.upload_repository: MediaUploadRepository = upload_repository
+
+    def execute(self, input: Input) -> Output:
+        upload: MediaUpload | None = self.upload_repository.get_by_id(input.upload_id)
+        if upload is None or upload.video_id != input.video_id:
+            raise MediaUploadNotFound(f"Upload with id '{input.upload_id}' not found.")
+
+        received: set[int] = set(self.upload_repository.get_chunk_checksums(upload.id))
+        return self.Output(
+            upload_id=upload.id,
+            status=upload.status,
+            file_name=upload.file_name,
+            size=upload.size,
+            chunk_size=upload.chunk_size,
+            chunk_count=upload.chunk_count,
+            received_chunks=sorted(received),
+            missing_chunks=upload.missing_chunks(received),
+            received_bytes=sum(upload.chunk_length(index) for index in received),
+        )
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from core._shared.application.ports.storage_service import StorageService
+from core.video.application.exceptions import InvalidMediaUpload, VideoNotFound
+from core.video.domain.media_upload import MediaUpload
+from core.video.domain.media_upload_repository import MediaUploadRepository
+from core.video.domain.value_objects import MediaType
+from core.video.domain.video_repository import VideoRepository
+
+
+class InitiateMediaUpload:
+    @dataclass
+    class Input:
+        video_id: UUID
+        file_name: str
+        content_type: str
+        size: int
+        media_type: MediaType = MediaType.VIDEO
+
+    @dataclass
+    class Output:
+        upload_id: UUID
+        chunk_size: int
+        chunk_count: int
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        upload_repository: MediaUploadRepository,
+        storage_service: StorageService,
+        chunk_size: int,
+    ) -> None:
+        self.video_repository: VideoRepository = video_repository
+        self.upload_repository: MediaUploadRepository = upload_repository
+        self.storage_service: StorageService = storage_service
+        self.chunk_size: int = chunk_size
+
+    @staticmethod
+    def staging_path(upload_id: UUID) -> str:
+        return f"uploads/{upload_id}.part"
+
+    def execute(self, input: Input) -> Output:
+        if not self.video_repository.exists(id=input.video_id):
+            raise VideoNotFound(f"Video with id '{input.video_id}' not found.")
+
+        try:
+            upload = MediaUpload(
+                video_id=input.video_id,
+                file_name=input.file_name,
+                content_type=input.content_type,
+                media_type=input.media_type,
+                size=input.size,
+                chunk_size=self.chunk_size,
+            )
+        except ValueError as error:
+            raise InvalidMediaUpload(error)
+
+        # Chunks are written straight to their offsets in this file.
+        try:
+            self.storage_service.allocate(self.staging_path(upload.id), upload.size)
+        except ValueError as error:
+            raise InvalidMediaUpload(error)
+        self.upload_repository.save(upload)
+
+        return self.Output(
+            upload_id=upload.id,
+            chunk_size=upload.chunk_size,
+            chunk_count=upload.chunk_count,
+        )
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+from core._shared.application.use_cases.list_use_case import ListUseCase
+from core.video.domain.value_objects import AudioVideoMedia, ImageMedia, Rating
+from core.video.domain.video import Video
+
+
+class ListVideo(ListUseCase["Video", "ListVideo.Output"]):
+
+    @dataclass
+    class Input(ListUseCase.Input):
+        order_by: str = "title"
+
+    @dataclass
+    class Output:
+        id: UUID
+        title: str
+        description: str
+        launch_year: int
+        duration: Decimal
+        published: bool
+        rating: Rating
+
+        categories: set[UUID]
+        genres: set[UUID]
+        cast_members: set[UUID]
+
+        banner: ImageMedia | None
+        thumbnail: ImageMedia | None
+        thumbnail_half: ImageMedia | None
+        trailer: AudioVideoMedia | None
+        video: AudioVideoMedia | None
+
+    def execute(self, input: "ListVideo.Input") -> "ListUseCase.ListOutput":
+        return super().execute(input, self.Output)
@@ -2,13 +2,12 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.application.ports.unit_of_work import NullUnitOfWork, UnitOfWork
 from core.video.application.exceptions import AudioVideoMediaNotFound, VideoNotFound
 from core.video.application.events.integrations_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
-from core.video.domain.events.event import AudioVideoMediaUpdated
-from core.video.domain.value_objects import MediaStatus, MediaType
-from core.video.domain.video import Video
+from core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
 from core.video.domain.video_repository import VideoRepository
 
 
@@ -24,52 +23,45 @@ class ProcessAudioVideoMedia:
         self,
         video_repository: VideoRepository,
         event_publisher: EventPublisher,
+        unit_of_work: UnitOfWork | None = None,
     ) -> None:
         self.video_repository: VideoRepository = video_repository
         self.event_publisher: EventPublisher = event_publisher
+        self.unit_of_work: UnitOfWork = unit_of_work or NullUnitOfWork()
 
     def execute(self, request: Input) -> None:
-        video: Video = self.video_repository.get_by_id(id=request.video_id)
-        if video is None:
-            raise VideoNotFound(f"Video with id {request.video_id} not found")
-
-        if request.media_type == MediaType.VIDEO:
-            if not video.video:
-                raise AudioVideoMediaNotFound(
-                    f"Video media not found for video id {request.video_id}"
-                )
-            video.process(
-                status=request.status,
-                encoded_location=request.encoded_location,
-                media_type=request.media_type,
+        media: AudioVideoMedia | None = self.video_repository.get_media(
+            video_id=request.video_id, media_type=request.media_type
+        )
+        if media is None:
+            if not self.video_repository.exists(id=request.video_id):
+                raise VideoNotFound(f"Video with id {request.video_id} not found")
+            label: str = "Video" if request.media_type == MediaType.VIDEO else "Trailer"
+            raise AudioVideoMediaNotFound(
+                f"{label} media not found for video id {request.video_id}"
             )
-            self.video_repository.update(video)
 
-        elif request.media_type == MediaType.TRAILER:
-            if not video.trailer:
-                raise AudioVideoMediaNotFound(
-                    f"Trailer media not found for video id {request.video_id}"
-                )
-            video.process_trailer(
-                status=request.status,
-                encoded_location=request.encoded_location,
+        processed: AudioVideoMedia = media.process(
+            status=request.status,
+            encoded_location=request.encoded_location,
+        )
+        completed: bool = processed.status == MediaStatus.COMPLETED
+        with self.unit_of_work.atomic():
+            # A completed main video is what makes the video publishable.
+            self.video_repository.update_media(
+                video_id=request.video_id,
+                media=processed,
+                published=True
+                if completed and request.media_type == MediaType.VIDEO
+                else None,
             )
-            self.video_repository.update(video)
-
-        integration_events = self._map_domain_events(video.pull_events())
-        if integration_events:
-            self.event_publisher.publish(integration_events)
 
-    def _map_domain_events(
-        self, events: list
-    ) -> list[AudioVideoMediaUpdatedIntegrationEvent]:
-        integration_events: list[AudioVideoMediaUpdatedIntegrationEvent] = []
-        for event in events:
-            if isinstance(event, AudioVideoMediaUpdated):
-                integration_events.append(
-                    AudioVideoMediaUpdatedIntegrationEvent(
-                        resource_id=f"{event.aggregate_id}.{event.media_type}",
-                        file_path=event.file_path,
-                    )
+            if completed:
+                self.event_publisher.publish(
+                    [
+                        AudioVideoMediaUpdatedIntegrationEvent(
+                            resource_id=f"{request.video_id}.{request.media_type}",
+                            file_path=processed.encoded_location,
+                        )
+                    ]
                 )
-        return integration_events
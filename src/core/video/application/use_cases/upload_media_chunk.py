@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from core._shared.application.ports.storage_service import (
+    ContentSource,
+    StorageService,
+    StoredFile,
+)
+from core._shared.application.ports.unit_of_work import NullUnitOfWork, UnitOfWork
+from core.video.application.exceptions import (
+    InvalidMediaUpload,
+    MediaUploadClosed,
+    MediaUploadNotFound,
+)
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.domain.media_upload import MediaUpload, UploadStatus
+from core.video.domain.media_upload_repository import MediaUploadRepository
+
+
+class UploadMediaChunk:
+    @dataclass
+    class Input:
+        video_id: UUID
+        upload_id: UUID
+        index: int
+        content: ContentSource
+        # Declared length, when known up front (e.g. Content-Length).
+        size: int | None = None
+
+    def __init__(
+        self,
+        upload_repository: MediaUploadRepository,
+        storage_service: StorageService,
+        unit_of_work: UnitOfWork | None = None,
+    ) -> None:
+        self.upload_repository: MediaUploadRepository = upload_repository
+        self.storage_service: StorageService = storage_service
+        self.unit_of_work: UnitOfWork = unit_of_work or NullUnitOfWork()
+
+    def execute(self, input: Input) -> None:
+        # Only the bookkeeping runs under the upload's lock. The bytes are
+        # streamed outside it, so chunks of one upload are written in
+        # parallel and no transaction stays open on a slow link; the lease
+        # keeps complete from moving the file while they are.
+        upload, lease_id = self._acquire(input)
+        try:
+            checksum: str = self._write(upload, input)
+            with self.unit_of_work.atomic():
+                if self._lock(upload.id) is None:
+                    raise MediaUploadNotFound(
+                        f"Upload with id '{upload.id}' not found."
+                    )
+                self.upload_repository.save_chunk(upload.id, input.index, checksum)
+        finally:
+            self.upload_repository.release_lease(lease_id)
+
+    def _acquire(self, input: Input) -> tuple[MediaUpload, UUID]:
+        with self.unit_of_work.atomic():
+            upload: MediaUpload | None = self._lock(input.upload_id)
+            if upload is None or upload.video_id != input.video_id:
+                raise MediaUploadNotFound(
+                    f"Upload with id '{input.upload_id}' not found."
+                )
+            if upload.status != UploadStatus.UPLOADING:
+                raise MediaUploadClosed(
+                    f"Upload with id '{upload.id}' no longer accepts chunks."
+                )
+            self._validate(upload, input)
+            return upload, self.upload_repository.acquire_lease(upload.id)
+
+    def _lock(self, upload_id: UUID) -> MediaUpload | None:
+        return self.upload_repository.get_for_update(upload_id)
+
+    def _validate(self, upload: MediaUpload, input: Input) -> None:
+        if not 0 <= input.index < upload.chunk_count:
+            raise InvalidMediaUpload(
+                f"Chunk index must be between 0 and {upload.chunk_count - 1}."
+            )
+        expected: int = upload.chunk_length(input.index)
+        if input.size is not None and input.size != expected:
+            raise InvalidMediaUpload(
+                f"Chunk {input.index} must be {expected} bytes, got {input.size}."
+            )
+
+    def _write(self, upload: MediaUpload, input: Input) -> str:
+        expected: int = upload.chunk_length(input.index)
+        # Bounded by the chunk length so a long body cannot spill into the
+        # next chunk. Re-sending a chunk simply overwrites it.
+        try:
+            stored: StoredFile = self.storage_service.write_at(
+                InitiateMediaUpload.staging_path(upload.id),
+                offset=upload.chunk_offset(input.index),
+                content=input.content,
+                size=expected,
+            )
+        except FileNotFoundError:
+            raise MediaUploadNotFound(f"Upload with id '{upload.id}' has no data.")
+        if stored.size != expected:
+            raise InvalidMediaUpload(
+                f"Chunk {input.index} must be {expected} bytes, got {stored.size}."
+            )
+        return stored.checksum
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from core._shared.application.ports.checksum_service import ChecksumService
 from core._shared.application.ports.event_publisher import EventPublisher
-from core._shared.application.ports.storage_service import StorageService
+from core._shared.application.ports.storage_service import (
+    ContentSource,
+    StorageService,
+    StoredFile,
+)
+from core._shared.application.ports.unit_of_work import NullUnitOfWork, UnitOfWork
 from core.video.application.events.integrations_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
@@ -21,56 +25,118 @@ class UploadVideo:
         video_repository: VideoRepository,
         storage_service: StorageService,
         event_publisher: EventPublisher,
-        checksum_service: ChecksumService,
-        storage_base_path: str,
+        unit_of_work: UnitOfWork | None = None,
+        content_addressed: bool = False,
     ) -> None:
         self.repository: VideoRepository = video_repository
         self.storage_service: StorageService = storage_service
         self.event_publisher: EventPublisher = event_publisher
-        self.checksum_service: ChecksumService = checksum_service
-        self.storage_base_path: str = storage_base_path
+        self.unit_of_work: UnitOfWork = unit_of_work or NullUnitOfWork()
+        # Store media once per distinct content under blobs/, shared by every
+        # video that uploads it, instead of a copy per video.
+        self.content_addressed: bool = content_addressed
 
     @dataclass
     class Input:
         video_id: UUID
         file_name: str
-        content: bytes
+        content: ContentSource
         content_type: str
         media_type: MediaType = MediaType.VIDEO
 
-    def execute(self, input: Input) -> None:
-        video: Video = self.repository.get_by_id(input.video_id)
+    @dataclass
+    class StoredMedia:
+        """A file already in storage, such as an assembled chunked upload."""
 
-        if not isinstance(video, Video):
-            raise VideoNotFound(f"Video with id '{input.video_id}' not found.")
+        video_id: UUID
+        file_name: str
+        file_path: str
+        checksum: str
+        media_type: MediaType = MediaType.VIDEO
+
+    @staticmethod
+    def media_path(video_id: UUID, file_name: str) -> str:
+        return str(Path("videos") / str(video_id) / file_name)
+
+    @staticmethod
+    def blob_path(checksum: str) -> str:
+        return str(Path("blobs") / checksum[:2] / checksum)
 
-        file_path = str(Path("videos") / str(input.video_id) / input.file_name)
+    def execute(self, input: Input) -> None:
+        video: Video = self._get_video(input.video_id)
+        # The blob path is only known once the content has been hashed.
+        staging_path: str = (
+            f"uploads/{uuid4().hex}.part"
+            if self.content_addressed
+            else self.media_path(input.video_id, input.file_name)
+        )
 
-        self.storage_service.store(
-            file_path=file_path,
+        stored: StoredFile = self.storage_service.store(
+            file_path=staging_path,
             content=input.content,
             content_type=input.content_type,
         )
+        file_path: str = self.place(
+            staging_path, stored.checksum, input.video_id, input.file_name
+        )
+
+        self._attach(
+            video,
+            self.StoredMedia(
+                video_id=input.video_id,
+                file_name=input.file_name,
+                file_path=file_path,
+                checksum=stored.checksum,
+                media_type=input.media_type,
+            ),
+        )
+
+    def place(
+        self, staging_path: str, checksum: str, video_id: UUID, file_name: str
+    ) -> str:
+        """Moves a fully written file to its final location and returns it."""
+        file_path: str = (
+            self.blob_path(checksum)
+            if self.content_addressed
+            else self.media_path(video_id, file_name)
+        )
+        if file_path != staging_path:
+            # An existing blob is replaced by its identical copy: a rename,
+            # which also refreshes its age so garbage collection leaves it
+            # alone until the media row linking it has committed.
+            self.storage_service.move(staging_path, file_path)
+        return file_path
 
+    def attach(self, media: StoredMedia) -> None:
+        self._attach(self._get_video(media.video_id), media)
+
+    def _get_video(self, video_id: UUID) -> Video:
+        video: Video = self.repository.get_by_id(video_id)
+
+        if not isinstance(video, Video):
+            raise VideoNotFound(f"Video with id '{video_id}' not found.")
+        return video
+
+    def _attach(self, video: Video, media: StoredMedia) -> None:
         audio_video_media: AudioVideoMedia = AudioVideoMedia(
-            name=input.file_name,
-            checksum=self.checksum_service.compute(file_path, self.storage_base_path),
-            raw_location=file_path,
+            name=media.file_name,
+            checksum=media.checksum,
+            raw_location=media.file_path,
             encoded_location="",
             status=MediaStatus.PENDING,
-            media_type=input.media_type,
+            media_type=media.media_type,
         )
 
-        if input.media_type == MediaType.VIDEO:
+        if media.media_type == MediaType.VIDEO:
             video.update_video(video=audio_video_media)
         else:
             video.update_trailer(trailer=audio_video_media)
 
-        self.repository.update(video)
-
         integration_events = self._map_domain_events(video.pull_events())
-        if integration_events:
-            self.event_publisher.publish(integration_events)
+        with self.unit_of_work.atomic():
+            self.repository.update(video)
+            if integration_events:
+                self.event_publisher.publish(integration_events)
 
     def _map_domain_events(
         self, events: list
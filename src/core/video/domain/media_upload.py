@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from enum import StrEnum, unique
+from uuid import UUID
+
+from core._shared.domain.entity import Entity
+from core.video.domain.value_objects import MediaType
+
+
+@unique
+class UploadStatus(StrEnum):
+    UPLOADING = "UPLOADING"
+    # Closed to chunks while the assembled file is checksummed.
+    PLACING = "PLACING"
+    # Moved to its final location, not yet linked to the video.
+    PLACED = "PLACED"
+    COMPLETED = "COMPLETED"
+
+
+@dataclass(kw_only=True)
+class MediaUpload(Entity):
+    """A media file sent in fixed-size chunks over several requests.
+
+    Chunk i covers bytes [i * chunk_size, (i + 1) * chunk_size) of the file;
+    only the last one may be shorter.
+    """
+
+    video_id: UUID
+    file_name: str
+    content_type: str
+    media_type: MediaType
+    size: int
+    chunk_size: int
+    status: UploadStatus = UploadStatus.UPLOADING
+    # Known once placed.
+    file_path: str = ""
+    checksum: str = ""
+
+    def __post_init__(self) -> None:
+        self.validate()
+
+    def validate(self) -> None:
+        if not self.file_name:
+            self.notification.add_error("file_name cannot be empty")
+        if "/" in self.file_name or self.file_name in (".", ".."):
+            self.notification.add_error("file_name cannot be a path")
+        if self.size <= 0:
+            self.notification.add_error("size must be positive")
+        if self.chunk_size <= 0:
+            self.notification.add_error("chunk_size must be positive")
+
+        if self.notification.has_errors:
+            raise ValueError(self.notification.messages)
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-self.size // self.chunk_size)
+
+    def chunk_offset(self, index: int) -> int:
+        return index * self.chunk_size
+
+    def chunk_length(self, index: int) -> int:
+        return min(self.chunk_size, self.size - self.chunk_offset(index))
+
+    def missing_chunks(self, received: set[int]) -> list[int]:
+        return [index for index in range(self.chunk_count) if index not in received]
+
+    def close(self) -> None:
+        self.status = UploadStatus.PLACING
+
+    def place(self, file_path: str, checksum: str) -> None:
+        self.status = UploadStatus.PLACED
+        self.file_path = file_path
+        self.checksum = checksum
+
+    def complete(self) -> None:
+        self.status = UploadStatus.COMPLETED
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from core.video.domain.media_upload import MediaUpload
+
+
+class MediaUploadRepository(ABC):
+    @abstractmethod
+    def save(self, upload: MediaUpload) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, id: UUID) -> MediaUpload | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_for_update(self, id: UUID) -> MediaUpload | None:
+        """Like get_by_id, but locks the upload until the surrounding unit of
+        work ends."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_created_before(self, created_before: datetime) -> list[UUID]:
+        """Deletes uploads started before created_before, returning their ids."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_chunk(self, upload_id: UUID, index: int, checksum: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_chunk_checksums(self, upload_id: UUID) -> dict[int, str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def acquire_lease(self, upload_id: UUID) -> UUID:
+        """Records work under way on the staged file, a chunk write or the
+        checksum read of complete, and returns its id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_lease(self, lease_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_leases(self, upload_id: UUID, acquired_after: datetime) -> int:
+        """Leases of the upload still held and acquired after acquired_after."""
+        raise NotImplementedError
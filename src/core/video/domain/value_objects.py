@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import StrEnum, unique
 
 
@@ -42,3 +42,10 @@ class AudioVideoMedia:
     encoded_location: str
     status: MediaStatus
     media_type: MediaType
+
+    def process(self, status: MediaStatus, encoded_location: str) -> "AudioVideoMedia":
+        if status == MediaStatus.COMPLETED:
+            return replace(
+                self, encoded_location=encoded_location, status=MediaStatus.COMPLETED
+            )
+        return replace(self, encoded_location="", status=MediaStatus.ERROR)
@@ -153,15 +153,8 @@ class Video(Entity):
 
     def process(self, status: MediaStatus, encoded_location: str, media_type: MediaType) -> None:
         if media_type == MediaType.VIDEO:
-            if status == MediaStatus.COMPLETED:
-                self.video: AudioVideoMedia = AudioVideoMedia(
-                    name=self.video.name,
-                    checksum=self.video.checksum,
-                    raw_location=self.video.raw_location,
-                    media_type=MediaType.VIDEO,
-                    encoded_location=encoded_location,
-                    status=MediaStatus.COMPLETED,
-                )
+            self.video: AudioVideoMedia = self.video.process(status, encoded_location)
+            if self.video.status == MediaStatus.COMPLETED:
                 self.publish()
                 self.record_event(
                     AudioVideoMediaUpdated(
@@ -170,53 +163,14 @@ class Video(Entity):
                         media_type=MediaType.VIDEO,
                     )
                 )
-            else:
-                self.video: AudioVideoMedia = AudioVideoMedia(
-                    name=self.video.name,
-                    checksum=self.video.checksum,
-                    raw_location=self.video.raw_location,
-                    media_type=MediaType.VIDEO,
-                    encoded_location="",
-                    status=MediaStatus.ERROR,
-                )
         elif media_type == MediaType.TRAILER:
-            if status == MediaStatus.COMPLETED:
-                self.trailer: AudioVideoMedia = AudioVideoMedia(
-                    name=self.trailer.name,
-                    checksum=self.trailer.checksum,
-                    raw_location=self.trailer.raw_location,
-                    media_type=MediaType.TRAILER,
-                    encoded_location=encoded_location,
-                    status=MediaStatus.COMPLETED,
-                )
-                self.record_event(
-                    AudioVideoMediaUpdated(
-                        aggregate_id=self.id,
-                        file_path=encoded_location,
-                        media_type=MediaType.TRAILER,
-                    )
-                )
-            else:
-                self.trailer: AudioVideoMedia = AudioVideoMedia(
-                    name=self.trailer.name,
-                    checksum=self.trailer.checksum,
-                    raw_location=self.trailer.raw_location,
-                    media_type=MediaType.TRAILER,
-                    encoded_location="",
-                    status=MediaStatus.ERROR,
-                )
+            self.process_trailer(status=status, encoded_location=encoded_location)
+            return
         self.validate()
 
     def process_trailer(self, status: MediaStatus, encoded_location: str) -> None:
-        if status == MediaStatus.COMPLETED:
-            self.trailer: AudioVideoMedia = AudioVideoMedia(
-                name=self.trailer.name,
-                checksum=self.trailer.checksum,
-                raw_location=self.trailer.raw_location,
-                media_type=MediaType.TRAILER,
-                encoded_location=encoded_location,
-                status=MediaStatus.COMPLETED,
-            )
+        self.trailer: AudioVideoMedia = self.trailer.process(status, encoded_location)
+        if self.trailer.status == MediaStatus.COMPLETED:
             self.record_event(
                 AudioVideoMediaUpdated(
                     aggregate_id=self.id,
@@ -224,13 +178,4 @@ class Video(Entity):
                     media_type=MediaType.TRAILER,
                 )
             )
-        else:
-            self.trailer: AudioVideoMedia = AudioVideoMedia(
-                name=self.trailer.name,
-                checksum=self.trailer.checksum,
-                raw_location=self.trailer.raw_location,
-                media_type=MediaType.TRAILER,
-                encoded_location="",
-                status=MediaStatus.ERROR,
-            )
-        self.validate()
\ No newline at end of file
+        self.validate()
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
+from core.video.domain.value_objects import AudioVideoMedia, MediaType
 from core.video.domain.video import Video
 
 
@@ -10,6 +12,10 @@ class VideoRepository(ABC):
     def save(self, video: Video) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, videos: List[Video]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, video: Video) -> None:
         raise NotImplementedError
@@ -18,6 +24,14 @@ class VideoRepository(ABC):
     def list(self) -> List[Video]:
         raise NotImplementedError
 
+    @abstractmethod
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Video]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Video]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Video | None:
         raise NotImplementedError
@@ -25,3 +39,42 @@ class VideoRepository(ABC):
     @abstractmethod
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, id: UUID) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_media(
+        self, video_id: UUID, media_type: MediaType
+    ) -> AudioVideoMedia | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_media(
+        self, video_id: UUID, media: AudioVideoMedia, published: bool | None = None
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_media_many(
+        self, keys: set[tuple[UUID, MediaType]]
+    ) -> dict[tuple[UUID, MediaType], AudioVideoMedia]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_media_many(
+        self, media: dict[UUID, List[AudioVideoMedia]], published: set[UUID]
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_media_references(self, raw_locations: set[str]) -> dict[str, int]:
+        """How many videos' audio/video media point at each raw location."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_missing_related_ids(
+        self, categories: set[UUID], genres: set[UUID], cast_members: set[UUID]
+    ) -> dict[str, set[UUID]]:
+        raise NotImplementedError
@@ -1,9 +1,9 @@
 from decimal import Decimal
-from unittest.mock import create_autospec, patch
+import hashlib
+from unittest.mock import create_autospec
 import pytest
-from core._shared.application.ports.checksum_service import ChecksumService
 from core._shared.application.ports.event_publisher import EventPublisher
-from core._shared.application.ports.storage_service import StorageService
+from core._shared.application.ports.storage_service import StorageService, StoredFile
 from core.video.application.use_cases.upload_video import UploadVideo
 from core.video.application.exceptions import VideoNotFound
 from core.video.domain.value_objects import (
@@ -16,7 +16,7 @@ from core.video.domain.video import Video
 from django_project.adapters.persistence.in_memory.video_repository import (
     InMemoryVideoRepository,
 )
-from django_project.adapters.storage.file_checksum_service import FileChecksumService
+from django_project.adapters.storage.local_storage import LocalStorage
 from core.video.application.events.integrations_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
@@ -44,7 +44,9 @@ def video_repository(video: Video) -> InMemoryVideoRepository:
 
 @pytest.fixture
 def mock_storage_service() -> StorageService:
-    return create_autospec(StorageService)
+    storage_service = create_autospec(StorageService)
+    storage_service.store.return_value = StoredFile(checksum="test_checksum", size=12)
+    return storage_service
 
 
 @pytest.fixture
@@ -52,16 +54,6 @@ def mock_event_publisher() -> EventPublisher:
     return create_autospec(EventPublisher)
 
 
-@pytest.fixture
-def mock_checksum_service() -> ChecksumService:
-    return create_autospec(ChecksumService)
-
-
-@pytest.fixture
-def storage_base_path(tmp_path) -> str:
-    return str(tmp_path)
-
-
 class TestUploadVideo:
     def test_upload_video_media_to_video(
         self,
@@ -69,17 +61,11 @@ class TestUploadVideo:
         video_repository: InMemoryVideoRepository,
         mock_storage_service: StorageService,
         mock_event_publisher: EventPublisher,
-        mock_checksum_service: ChecksumService,
-        storage_base_path: str,
     ) -> None:
-        mock_checksum_service.compute.return_value = "test_checksum"
-
         upload_video: UploadVideo = UploadVideo(
             video_repository=video_repository,
             storage_service=mock_storage_service,
             event_publisher=mock_event_publisher,
-            checksum_service=mock_checksum_service,
-            storage_base_path=storage_base_path,
         )
 
         input: UploadVideo.Input = UploadVideo.Input(
@@ -116,15 +102,11 @@ class TestUploadVideo:
         video_repository: InMemoryVideoRepository,
         mock_storage_service: StorageService,
         mock_event_publisher: EventPublisher,
-        mock_checksum_service: ChecksumService,
-        storage_base_path: str,
     ) -> None:
         upload_video: UploadVideo = UploadVideo(
             video_repository=video_repository,
             storage_service=mock_storage_service,
             event_publisher=mock_event_publisher,
-            checksum_service=mock_checksum_service,
-            storage_base_path=storage_base_path,
         )
 
         input: UploadVideo.Input = UploadVideo.Input(
@@ -145,17 +127,11 @@ class TestUploadVideo:
         video_repository: InMemoryVideoRepository,
         mock_storage_service: StorageService,
         mock_event_publisher: EventPublisher,
-        mock_checksum_service: ChecksumService,
-        storage_base_path: str,
     ) -> None:
-        mock_checksum_service.compute.return_value = "checksum123"
-
         upload_video: UploadVideo = UploadVideo(
             video_repository=video_repository,
             storage_service=mock_storage_service,
             event_publisher=mock_event_publisher,
-            checksum_service=mock_checksum_service,
-            storage_base_path=storage_base_path,
         )
 
         input: UploadVideo.Input = UploadVideo.Input(
@@ -178,17 +154,11 @@ class TestUploadVideo:
         video_repository: InMemoryVideoRepository,
         mock_storage_service: StorageService,
         mock_event_publisher: EventPublisher,
-        mock_checksum_service: ChecksumService,
-        storage_base_path: str,
     ) -> None:
-        mock_checksum_service.compute.return_value = "checksum456"
-
         upload_video: UploadVideo = UploadVideo(
             video_repository=video_repository,
             storage_service=mock_storage_service,
             event_publisher=mock_event_publisher,
-            checksum_service=mock_checksum_service,
-            storage_base_path=storage_base_path,
         )
 
         input: UploadVideo.Input = UploadVideo.Input(
@@ -207,22 +177,17 @@ class TestUploadVideo:
         assert call_args[0].resource_id == f"{video.id}.{MediaType.VIDEO}"
         assert call_args[0].file_path == f"videos/{video.id}/upload.mp4"
 
-    def test_upload_video_calculates_real_checksum(
+    def test_upload_video_uses_the_checksum_computed_while_storing(
         self,
         video: Video,
         video_repository: InMemoryVideoRepository,
-        mock_storage_service: StorageService,
         mock_event_publisher: EventPublisher,
         tmp_path,
     ) -> None:
-        storage_base_path = str(tmp_path)
-        checksum_service = FileChecksumService()
         upload_video: UploadVideo = UploadVideo(
             video_repository=video_repository,
-            storage_service=mock_storage_service,
+            storage_service=LocalStorage(bucket=str(tmp_path)),
             event_publisher=mock_event_publisher,
-            checksum_service=checksum_service,
-            storage_base_path=storage_base_path,
         )
 
         test_content = b"test_video_content_for_checksum"
@@ -232,23 +197,11 @@ class TestUploadVideo:
             content=test_content,
             content_type="video/mp4",
         )
-
-        file_path = tmp_path / "videos" / str(video.id) / "checksum_test.mp4"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(test_content)
-
-        with patch("core.video.application.use_cases.upload_video.Path") as mock_path:
-            mock_path.return_value.__truediv__.return_value.__truediv__.return_value = (
-                str(file_path.relative_to(tmp_path))
-            )
-            upload_video.execute(input=input)
+        upload_video.execute(input=input)
 
         updated_video = video_repository.get_by_id(video.id)
-        assert updated_video.video is not None
-        assert updated_video.video.checksum is not None
-        assert len(updated_video.video.checksum) > 0
-
-        expected_checksum = checksum_service.compute(
-            f"videos/{video.id}/checksum_test.mp4", storage_base_path
+        assert (
+            updated_video.video.checksum == hashlib.sha256(test_content).hexdigest()
         )
-        assert updated_video.video.checksum == expected_checksum
+        stored = tmp_path / "videos" / str(video.id) / "checksum_test.mp4"
+        assert stored.read_bytes() == test_content
@@ -18,9 +18,6 @@ from core.castmember.domain.castmember import CastMember
 from core.castmember.domain.value_objects import CastMemberType
 
 
-@pytest.fixture
-def video_repository() -> InMemoryVideoRepository:
-    return InMemoryVideoRepository()
 
 
 @pytest.fixture
@@ -77,20 +74,23 @@ def cast_member_repository(
 
 
 @pytest.fixture
-def use_case(
-    video_repository: InMemoryVideoRepository,
+def video_repository(
     category_repository: InMemoryCategoryRepository,
     genre_repository: InMemoryGenreRepository,
     cast_member_repository: InMemoryCastMemberRepository,
-) -> CreateVideoWithoutMedia:
-    return CreateVideoWithoutMedia(
-        video_repository=video_repository,
+) -> InMemoryVideoRepository:
+    return InMemoryVideoRepository(
         category_repository=category_repository,
         genre_repository=genre_repository,
         cast_member_repository=cast_member_repository,
     )
 
 
+@pytest.fixture
+def use_case(video_repository: InMemoryVideoRepository) -> CreateVideoWithoutMedia:
+    return CreateVideoWithoutMedia(video_repository=video_repository)
+
+
 @pytest.fixture
 def valid_categories_ids(categories: list[Category]) -> set[UUID]:
     return {category.id for category in categories}
@@ -0,0 +1,186 @@
+from unittest.mock import MagicMock, create_autospec
+from uuid import UUID, uuid4
+
+import pytest
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.application.ports.unit_of_work import UnitOfWork
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from core.video.application.use_cases.bulk_process_audio_video_media import (
+    BulkProcessAudioVideoMedia,
+)
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+from core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
+from core.video.domain.video_repository import VideoRepository
+
+
+def pending_media(media_type: MediaType) -> AudioVideoMedia:
+    return AudioVideoMedia(
+        name=f"{media_type}.mp4",
+        checksum="abc123",
+        raw_location=f"/videos/raw/{media_type}.mp4",
+        encoded_location="",
+        status=MediaStatus.PENDING,
+        media_type=media_type,
+    )
+
+
+def item(
+    video_id: UUID,
+    media_type: MediaType = MediaType.VIDEO,
+    status: MediaStatus = MediaStatus.COMPLETED,
+    encoded_location: str = "/videos/encoded",
+) -> ProcessAudioVideoMedia.Input:
+    return ProcessAudioVideoMedia.Input(
+        video_id=video_id,
+        media_type=media_type,
+        encoded_location=encoded_location,
+        status=status,
+    )
+
+
+@pytest.fixture
+def video_repository() -> MagicMock:
+    return create_autospec(VideoRepository)
+
+
+@pytest.fixture
+def event_publisher() -> MagicMock:
+    return create_autospec(EventPublisher)
+
+
+@pytest.fixture
+def use_case(
+    video_repository: MagicMock, event_publisher: MagicMock
+) -> BulkProcessAudioVideoMedia:
+    return BulkProcessAudioVideoMedia(
+        video_repository=video_repository,
+        event_publisher=event_publisher,
+    )
+
+
+class TestBulkProcessAudioVideoMedia:
+    def test_reads_and_writes_every_item_at_once(
+        self,
+        use_case: BulkProcessAudioVideoMedia,
+        video_repository: MagicMock,
+        event_publisher: MagicMock,
+    ) -> None:
+        first, second = uuid4(), uuid4()
+        video_repository.get_media_many.return_value = {
+            (first, MediaType.VIDEO): pending_media(MediaType.VIDEO),
+            (first, MediaType.TRAILER): pending_media(MediaType.TRAILER),
+            (second, MediaType.VIDEO): pending_media(MediaType.VIDEO),
+        }
+
+        output = use_case.execute(
+            BulkProcessAudioVideoMedia.Input(
+                items=[
+                    item(first),
+                    item(first, MediaType.TRAILER),
+                    item(second, status=MediaStatus.ERROR),
+                ]
+            )
+        )
+
+        assert output.not_found == []
+        video_repository.get_media_many.assert_called_once_with(
+            {
+                (first, MediaType.VIDEO),
+                (first, MediaType.TRAILER),
+                (second, MediaType.VIDEO),
+            }
+        )
+        media, published = (
+            video_repository.update_media_many.call_args.args[0],
+            video_repository.update_media_many.call_args.kwargs["published"],
+        )
+        assert [m.status for m in media[first]] == [MediaStatus.COMPLETED] * 2
+        assert [m.status for m in media[second]] == [MediaStatus.ERROR]
+        assert published == {first}
+        event_publisher.publish.assert_called_once_with(
+            [
+                AudioVideoMediaUpdatedIntegrationEvent(
+                    resource_id=f"{first}.{MediaType.VIDEO}",
+                    file_path="/videos/encoded",
+                ),
+                AudioVideoMediaUpdatedIntegrationEvent(
+                    resource_id=f"{first}.{MediaType.TRAILER}",
+                    file_path="/videos/encoded",
+                ),
+            ]
+        )
+
+    def test_items_for_the_same_media_are_applied_in_order(
+        self, use_case: BulkProcessAudioVideoMedia, video_repository: MagicMock
+    ) -> None:
+        video_id = uuid4()
+        video_repository.get_media_many.return_value = {
+            (video_id, MediaType.VIDEO): pending_media(MediaType.VIDEO)
+        }
+
+        use_case.execute(
+            BulkProcessAudioVideoMedia.Input(
+                items=[
+                    item(video_id, status=MediaStatus.ERROR),
+                    item(video_id, encoded_location="/videos/retry"),
+                ]
+            )
+        )
+
+        [media] = video_repository.update_media_many.call_args.args[0][video_id]
+        assert media.status == MediaStatus.COMPLETED
+        assert media.encoded_location == "/videos/retry"
+
+    def test_missing_media_are_reported_by_index(
+        self,
+        use_case: BulkProcessAudioVideoMedia,
+        video_repository: MagicMock,
+        event_publisher: MagicMock,
+    ) -> None:
+        video_repository.get_media_many.return_value = {}
+
+        output = use_case.execute(
+            BulkProcessAudioVideoMedia.Input(items=[item(uuid4()), item(uuid4())])
+        )
+
+        assert output.not_found == [0, 1]
+        video_repository.update_media_many.assert_not_called()
+        event_publisher.publish.assert_not_called()
+
+    def test_writes_and_publishes_in_one_unit_of_work(
+        self, video_repository: MagicMock, event_publisher: MagicMock
+    ) -> None:
+        video_id = uuid4()
+        video_repository.get_media_many.return_value = {
+            (video_id, MediaType.VIDEO): pending_media(MediaType.VIDEO)
+        }
+        unit_of_work = create_autospec(UnitOfWork)
+        calls = MagicMock()
+        unit_of_work.atomic.return_value.__enter__.side_effect = (
+            lambda: calls.begin()
+        )
+        unit_of_work.atomic.return_value.__exit__.side_effect = (
+            lambda *args: calls.commit()
+        )
+        video_repository.update_media_many.side_effect = (
+            lambda *args, **kwargs: calls.update()
+        )
+        event_publisher.publish.side_effect = lambda events: calls.publish()
+
+        BulkProcessAudioVideoMedia(
+            video_repository=video_repository,
+            event_publisher=event_publisher,
+            unit_of_work=unit_of_work,
+        ).execute(BulkProcessAudioVideoMedia.Input(items=[item(video_id)]))
+
+        assert [call[0] for call in calls.mock_calls] == [
+            "begin",
+            "update",
+            "publish",
+            "commit",
+        ]
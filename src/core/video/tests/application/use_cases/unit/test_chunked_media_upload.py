@@ -0,0 +1,553 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import create_autospec, patch
+from uuid import uuid4
+
+import pytest
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core.video.application.exceptions import (
+    IncompleteMediaUpload,
+    InvalidMediaUpload,
+    MediaUploadBusy,
+    MediaUploadClosed,
+    MediaUploadNotFound,
+    VideoNotFound,
+)
+from core.video.application.use_cases.complete_media_upload import (
+    CompleteMediaUpload,
+)
+from core.video.application.use_cases.get_media_upload import GetMediaUpload
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.upload_media_chunk import UploadMediaChunk
+from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.media_upload import UploadStatus
+from core.video.domain.value_objects import MediaStatus, MediaType, Rating
+from core.video.domain.video import Video
+from django_project.adapters.persistence.in_memory.media_upload_repository import (
+    InMemoryMediaUploadRepository,
+)
+from django_project.adapters.persistence.in_memory.video_repository import (
+    InMemoryVideoRepository,
+)
+from django_project.adapters.storage.local_storage import LocalStorage
+
+CONTENT = bytes(range(256)) * 4  # 1 KiB
+CHUNK_SIZE = 300
+
+
+@pytest.fixture
+def video() -> Video:
+    return Video(
+        title="Test Video",
+        description="Test Description",
+        launch_year=2021,
+        duration=Decimal("120.5"),
+        published=True,
+        rating=Rating.L,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+
+
+@pytest.fixture
+def video_repository(video: Video) -> InMemoryVideoRepository:
+    return InMemoryVideoRepository(videos=[video])
+
+
+@pytest.fixture
+def upload_repository() -> InMemoryMediaUploadRepository:
+    return InMemoryMediaUploadRepository()
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorage:
+    return LocalStorage(bucket=str(tmp_path))
+
+
+@pytest.fixture
+def initiate(
+    video_repository: InMemoryVideoRepository,
+    upload_repository: InMemoryMediaUploadRepository,
+    storage: LocalStorage,
+) -> InitiateMediaUpload:
+    return InitiateMediaUpload(
+        video_repository=video_repository,
+        upload_repository=upload_repository,
+        storage_service=storage,
+        chunk_size=CHUNK_SIZE,
+    )
+
+
+@pytest.fixture
+def upload_chunk(
+    upload_repository: InMemoryMediaUploadRepository, storage: LocalStorage
+) -> UploadMediaChunk:
+    return UploadMediaChunk(upload_repository=upload_repository, storage_service=storage)
+
+
+@pytest.fixture
+def complete(
+    video_repository: InMemoryVideoRepository,
+    upload_repository: InMemoryMediaUploadRepository,
+    storage: LocalStorage,
+) -> CompleteMediaUpload:
+    return CompleteMediaUpload(
+        upload_repository=upload_repository,
+        upload_video=UploadVideo(
+            video_repository=video_repository,
+            storage_service=storage,
+            event_publisher=create_autospec(EventPublisher),
+        ),
+        storage_service=storage,
+    )
+
+
+def start(initiate: InitiateMediaUpload, video: Video) -> InitiateMediaUpload.Output:
+    return initiate.execute(
+        InitiateMediaUpload.Input(
+            video_id=video.id,
+            file_name="movie.mp4",
+            content_type="video/mp4",
+            size=len(CONTENT),
+        )
+    )
+
+
+def chunk(index: int) -> bytes:
+    return CONTENT[index * CHUNK_SIZE : (index + 1) * CHUNK_SIZE]
+
+
+def send_all(
+    upload_chunk: UploadMediaChunk, video: Video, started: InitiateMediaUpload.Output
+) -> None:
+    for index in range(started.chunk_count):
+        upload_chunk.execute(
+            UploadMediaChunk.Input(
+                video_id=video.id,
+                upload_id=started.upload_id,
+                index=index,
+                content=chunk(index),
+            )
+        )
+
+
+class TestChunkedMediaUpload:
+    def test_chunks_in_any_order_assemble_the_file(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        started = start(initiate, video)
+        assert started.chunk_count == 4
+
+        for index in (3, 1, 0, 2):
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=video.id,
+                    upload_id=started.upload_id,
+                    index=index,
+                    content=chunk(index),
+                )
+            )
+        output = complete.execute(
+            CompleteMediaUpload.Input(video_id=video.id, upload_id=started.upload_id)
+        )
+
+        stored = tmp_path / "videos" / str(video.id) / "movie.mp4"
+        assert stored.read_bytes() == CONTENT
+        assert not (tmp_path / "uploads" / f"{started.upload_id}.part").exists()
+        assert output.checksum == hashlib.sha256(CONTENT).hexdigest()
+        assert video.video.checksum == output.checksum
+        assert video.video.raw_location == f"videos/{video.id}/movie.mp4"
+        assert video.video.status == MediaStatus.PENDING
+        assert video.video.media_type == MediaType.VIDEO
+        upload = upload_repository.get_by_id(started.upload_id)
+        assert upload.status == UploadStatus.COMPLETED
+
+    def test_retried_complete_resumes_after_failed_attach(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+        tmp_path: Path,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        request = CompleteMediaUpload.Input(
+            video_id=video.id, upload_id=started.upload_id
+        )
+
+        with patch.object(
+            complete.upload_video, "attach", side_effect=ConnectionError
+        ), pytest.raises(ConnectionError):
+            complete.execute(request)
+        assert upload_repository.get_by_id(started.upload_id).status == (
+            UploadStatus.PLACED
+        )
+        assert video.video is None
+
+        first = complete.execute(request)
+        again = complete.execute(request)
+
+        assert first == again
+        assert video.video.checksum == first.checksum
+        stored = tmp_path / "videos" / str(video.id) / "movie.mp4"
+        assert stored.read_bytes() == CONTENT
+
+    def test_retried_complete_is_refused_while_checksumming(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        request = CompleteMediaUpload.Input(
+            video_id=video.id, upload_id=started.upload_id
+        )
+        checksum = complete._checksum
+
+        def checksum_while_retried(upload):
+            with pytest.raises(MediaUploadBusy):
+                complete.execute(request)
+            with pytest.raises(MediaUploadClosed):
+                upload_chunk.execute(
+                    UploadMediaChunk.Input(
+                        video_id=video.id,
+                        upload_id=started.upload_id,
+                        index=0,
+                        content=chunk(0),
+                    )
+                )
+            return checksum(upload)
+
+        with patch.object(complete, "_checksum", side_effect=checksum_while_retried):
+            output = complete.execute(request)
+
+        assert output.checksum == hashlib.sha256(CONTENT).hexdigest()
+        assert upload_repository.leases == {}
+
+    def test_retried_complete_resumes_after_failed_checksum(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        request = CompleteMediaUpload.Input(
+            video_id=video.id, upload_id=started.upload_id
+        )
+
+        with patch.object(complete, "_checksum", side_effect=OSError), pytest.raises(
+            OSError
+        ):
+            complete.execute(request)
+        assert upload_repository.get_by_id(started.upload_id).status == (
+            UploadStatus.PLACING
+        )
+
+        output = complete.execute(request)
+
+        assert output.checksum == hashlib.sha256(CONTENT).hexdigest()
+        assert video.video.checksum == output.checksum
+
+    def test_chunks_are_refused_once_complete(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        tmp_path: Path,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        complete.execute(
+            CompleteMediaUpload.Input(video_id=video.id, upload_id=started.upload_id)
+        )
+
+        with pytest.raises(MediaUploadClosed):
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=video.id,
+                    upload_id=started.upload_id,
+                    index=0,
+                    content=b"x" * CHUNK_SIZE,
+                )
+            )
+        stored = tmp_path / "videos" / str(video.id) / "movie.mp4"
+        assert stored.read_bytes() == CONTENT
+
+    def test_complete_waits_for_chunks_being_written(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        request = CompleteMediaUpload.Input(
+            video_id=video.id, upload_id=started.upload_id
+        )
+        attempts: list[Exception] = []
+
+        def resent_chunk():
+            # Complete arrives while this chunk is still on the wire.
+            try:
+                complete.execute(request)
+            except MediaUploadBusy as error:
+                attempts.append(error)
+            yield chunk(0)
+
+        upload_chunk.execute(
+            UploadMediaChunk.Input(
+                video_id=video.id,
+                upload_id=started.upload_id,
+                index=0,
+                content=resent_chunk(),
+            )
+        )
+
+        assert len(attempts) == 1
+        assert upload_repository.leases == {}
+        assert complete.execute(request).checksum == hashlib.sha256(
+            CONTENT
+        ).hexdigest()
+
+    def test_stale_chunk_writes_do_not_hold_complete_off(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        upload_repository: InMemoryMediaUploadRepository,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        # Left behind by a worker killed mid-write.
+        lease_id = upload_repository.acquire_lease(started.upload_id)
+        upload_repository.leases[lease_id] = (
+            started.upload_id,
+            datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+
+        output = complete.execute(
+            CompleteMediaUpload.Input(video_id=video.id, upload_id=started.upload_id)
+        )
+
+        assert output.checksum == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_complete_without_staged_data_is_not_found(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        tmp_path: Path,
+    ) -> None:
+        started = start(initiate, video)
+        send_all(upload_chunk, video, started)
+        (tmp_path / "uploads" / f"{started.upload_id}.part").unlink()
+
+        with pytest.raises(MediaUploadNotFound):
+            complete.execute(
+                CompleteMediaUpload.Input(
+                    video_id=video.id, upload_id=started.upload_id
+                )
+            )
+
+    def test_resent_chunk_overwrites_previous_one(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+        tmp_path: Path,
+    ) -> None:
+        started = start(initiate, video)
+
+        for index, content in [(0, b"x" * CHUNK_SIZE), (0, chunk(0)), (1, chunk(1))]:
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=video.id,
+                    upload_id=started.upload_id,
+                    index=index,
+                    content=content,
+                )
+            )
+        for index in (2, 3):
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=video.id,
+                    upload_id=started.upload_id,
+                    index=index,
+                    content=chunk(index),
+                )
+            )
+        complete.execute(
+            CompleteMediaUpload.Input(video_id=video.id, upload_id=started.upload_id)
+        )
+
+        stored = tmp_path / "videos" / str(video.id) / "movie.mp4"
+        assert stored.read_bytes() == CONTENT
+
+    def test_reports_progress(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        upload_repository: InMemoryMediaUploadRepository,
+    ) -> None:
+        started = start(initiate, video)
+        upload_chunk.execute(
+            UploadMediaChunk.Input(
+                video_id=video.id,
+                upload_id=started.upload_id,
+                index=3,
+                content=chunk(3),
+            )
+        )
+
+        output = GetMediaUpload(upload_repository=upload_repository).execute(
+            GetMediaUpload.Input(video_id=video.id, upload_id=started.upload_id)
+        )
+
+        assert output.received_chunks == [3]
+        assert output.missing_chunks == [0, 1, 2]
+        assert output.received_bytes == len(CONTENT) - 3 * CHUNK_SIZE
+
+    def test_complete_with_missing_chunks_fails(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        complete: CompleteMediaUpload,
+    ) -> None:
+        started = start(initiate, video)
+        upload_chunk.execute(
+            UploadMediaChunk.Input(
+                video_id=video.id,
+                upload_id=started.upload_id,
+                index=1,
+                content=chunk(1),
+            )
+        )
+
+        with pytest.raises(IncompleteMediaUpload) as error:
+            complete.execute(
+                CompleteMediaUpload.Input(
+                    video_id=video.id, upload_id=started.upload_id
+                )
+            )
+
+        assert error.value.missing == [0, 2, 3]
+        assert video.video is None
+
+    @pytest.mark.parametrize(
+        "index,content,size",
+        [
+            (4, b"x", None),
+            (0, b"x" * (CHUNK_SIZE - 1), None),
+            (0, b"x" * CHUNK_SIZE, CHUNK_SIZE + 1),
+        ],
+    )
+    def test_rejects_chunks_that_do_not_fit(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+        upload_repository: InMemoryMediaUploadRepository,
+        index: int,
+        content: bytes,
+        size: int | None,
+    ) -> None:
+        started = start(initiate, video)
+
+        with pytest.raises(InvalidMediaUpload):
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=video.id,
+                    upload_id=started.upload_id,
+                    index=index,
+                    content=content,
+                    size=size,
+                )
+            )
+        assert upload_repository.get_chunk_checksums(started.upload_id) == {}
+        assert upload_repository.leases == {}
+
+    def test_upload_belongs_to_its_video(
+        self,
+        video: Video,
+        initiate: InitiateMediaUpload,
+        upload_chunk: UploadMediaChunk,
+    ) -> None:
+        started = start(initiate, video)
+
+        with pytest.raises(MediaUploadNotFound):
+            upload_chunk.execute(
+                UploadMediaChunk.Input(
+                    video_id=uuid4(),
+                    upload_id=started.upload_id,
+                    index=0,
+                    content=chunk(0),
+                )
+            )
+
+    def test_initiate_requires_existing_video(
+        self, initiate: InitiateMediaUpload
+    ) -> None:
+        with pytest.raises(VideoNotFound):
+            initiate.execute(
+                InitiateMediaUpload.Input(
+                    video_id=uuid4(),
+                    file_name="movie.mp4",
+                    content_type="video/mp4",
+                    size=10,
+                )
+            )
+
+    def test_initiate_rejects_invalid_upload(
+        self, video: Video, initiate: InitiateMediaUpload
+    ) -> None:
+        with pytest.raises(InvalidMediaUpload):
+            initiate.execute(
+                InitiateMediaUpload.Input(
+                    video_id=video.id,
+                    file_name="../movie.mp4",
+                    content_type="video/mp4",
+                    size=10,
+                )
+            )
+
+    def test_initiate_rejects_upload_storage_cannot_hold(
+        self, video: Video, initiate: InitiateMediaUpload
+    ) -> None:
+        with pytest.raises(InvalidMediaUpload):
+            initiate.execute(
+                InitiateMediaUpload.Input(
+                    video_id=video.id,
+                    file_name="movie.mp4",
+                    content_type="video/mp4",
+                    size=10**19,
+                )
+            )
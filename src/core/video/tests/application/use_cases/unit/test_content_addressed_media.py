@@ -0,0 +1,299 @@
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core.video.application.use_cases.collect_media_garbage import (
+    CollectMediaGarbage,
+)
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.value_objects import MediaType, Rating
+from core.video.domain.video import Video
+from django_project.adapters.persistence.in_memory.media_upload_repository import (
+    InMemoryMediaUploadRepository,
+)
+from django_project.adapters.persistence.in_memory.video_repository import (
+    InMemoryVideoRepository,
+)
+from django_project.adapters.storage.local_storage import LocalStorage
+
+MASTER = b"master file" * 100
+CHECKSUM = hashlib.sha256(MASTER).hexdigest()
+
+
+def make_video(title: str) -> Video:
+    return Video(
+        title=title,
+        description="Test Description",
+        launch_year=2021,
+        duration=Decimal("120.5"),
+        published=False,
+        rating=Rating.L,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+
+
+@pytest.fixture
+def videos() -> list[Video]:
+    return [make_video("First"), make_video("Second")]
+
+
+@pytest.fixture
+def video_repository(videos: list[Video]) -> InMemoryVideoRepository:
+    return InMemoryVideoRepository(videos=list(videos))
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorage:
+    return LocalStorage(bucket=str(tmp_path))
+
+
+@pytest.fixture
+def upload_video(
+    video_repository: InMemoryVideoRepository, storage: LocalStorage
+) -> UploadVideo:
+    return UploadVideo(
+        video_repository=video_repository,
+        storage_service=storage,
+        event_publisher=create_autospec(EventPublisher),
+        content_addressed=True,
+    )
+
+
+def upload(
+    upload_video: UploadVideo,
+    video: Video,
+    content: bytes,
+    media_type: MediaType = MediaType.VIDEO,
+) -> None:
+    upload_video.execute(
+        UploadVideo.Input(
+            video_id=video.id,
+            file_name="master.mp4",
+            content=content,
+            content_type="video/mp4",
+            media_type=media_type,
+        )
+    )
+
+
+def age(path: Path, hours: float) -> None:
+    modified = time.time() - hours * 3600
+    os.utime(path, (modified, modified))
+
+
+def collect(
+    video_repository: InMemoryVideoRepository,
+    upload_repository: InMemoryMediaUploadRepository,
+    storage: LocalStorage,
+) -> CollectMediaGarbage.Output:
+    an_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+    return CollectMediaGarbage(
+        video_repository=video_repository,
+        upload_repository=upload_repository,
+        storage_service=storage,
+    ).execute(
+        CollectMediaGarbage.Input(
+            modified_before=an_hour_ago, uploads_started_before=an_hour_ago
+        )
+    )
+
+
+def blobs(root: Path) -> list[str]:
+    return sorted(
+        path.relative_to(root).as_posix()
+        for path in (root / "blobs").rglob("*")
+        if path.is_file()
+    )
+
+
+class TestContentAddressedUpload:
+    def test_same_content_is_stored_once(
+        self,
+        videos: list[Video],
+        upload_video: UploadVideo,
+        tmp_path: Path,
+    ) -> None:
+        for video in videos:
+            upload(upload_video, video, MASTER)
+        upload(upload_video, videos[0], MASTER, MediaType.TRAILER)
+
+        blob = f"blobs/{CHECKSUM[:2]}/{CHECKSUM}"
+        assert blobs(tmp_path) == [blob]
+        assert (tmp_path / blob).read_bytes() == MASTER
+        assert {video.video.raw_location for video in videos} == {blob}
+        assert videos[0].trailer.raw_location == blob
+        assert not list((tmp_path / "uploads").iterdir())
+        assert not (tmp_path / "videos").exists()
+
+    def test_per_video_layout_is_the_default(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload_video = UploadVideo(
+            video_repository=video_repository,
+            storage_service=storage,
+            event_publisher=create_autospec(EventPublisher),
+        )
+
+        upload(upload_video, videos[0], MASTER)
+
+        assert videos[0].video.raw_location == f"videos/{videos[0].id}/master.mp4"
+        assert not (tmp_path / "blobs").exists()
+
+
+class TestCollectMediaGarbage:
+    def test_deletes_only_unreferenced_blobs(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        upload_video: UploadVideo,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload(upload_video, videos[0], b"first cut")
+        upload(upload_video, videos[1], MASTER)
+        upload(upload_video, videos[0], MASTER)  # replaces the first cut
+        for path in (tmp_path / "blobs").rglob("*"):
+            age(path, hours=2)
+
+        output = collect(video_repository, InMemoryMediaUploadRepository(), storage)
+
+        first_cut = hashlib.sha256(b"first cut").hexdigest()
+        assert output.scanned == 2
+        assert output.deleted == [f"blobs/{first_cut[:2]}/{first_cut}"]
+        assert blobs(tmp_path) == [f"blobs/{CHECKSUM[:2]}/{CHECKSUM}"]
+
+    def test_keeps_recent_blobs(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        upload_video: UploadVideo,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload(upload_video, videos[0], b"first cut")
+        upload(upload_video, videos[0], MASTER)
+
+        output = collect(video_repository, InMemoryMediaUploadRepository(), storage)
+
+        assert output.deleted == []
+        assert len(blobs(tmp_path)) == 2
+
+    def test_relinking_a_blob_refreshes_its_age(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        upload_video: UploadVideo,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload(upload_video, videos[0], MASTER)
+        blob = tmp_path / "blobs" / CHECKSUM[:2] / CHECKSUM
+        age(blob, hours=2)
+
+        upload(upload_video, videos[1], MASTER)
+
+        assert time.time() - blob.stat().st_mtime < 3600
+
+    def test_keeps_blob_relinked_while_collecting(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        upload_video: UploadVideo,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload(upload_video, videos[0], MASTER)
+        upload(upload_video, videos[0], b"second cut")
+        blob = tmp_path / "blobs" / CHECKSUM[:2] / CHECKSUM
+        age(blob, hours=2)
+        count_media_references = video_repository.count_media_references
+
+        def relink_after_counting(paths: set[str]) -> dict[str, int]:
+            references = count_media_references(paths)
+            if videos[1].video is None:
+                upload(upload_video, videos[1], MASTER)
+            return references
+
+        with patch.object(
+            video_repository, "count_media_references", relink_after_counting
+        ):
+            output = collect(video_repository, InMemoryMediaUploadRepository(), storage)
+
+        assert output.deleted == []
+        assert blob.read_bytes() == MASTER
+        assert videos[1].video.raw_location == f"blobs/{CHECKSUM[:2]}/{CHECKSUM}"
+        assert not list((tmp_path / "trash").iterdir())
+
+    def test_restores_blobs_left_in_trash(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        upload_video: UploadVideo,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload(upload_video, videos[0], MASTER)
+        storage.move(f"blobs/{CHECKSUM[:2]}/{CHECKSUM}", f"trash/{CHECKSUM}")
+
+        output = collect(video_repository, InMemoryMediaUploadRepository(), storage)
+
+        assert output.deleted == []
+        assert blobs(tmp_path) == [f"blobs/{CHECKSUM[:2]}/{CHECKSUM}"]
+
+    def test_expires_abandoned_uploads(
+        self,
+        videos: list[Video],
+        video_repository: InMemoryVideoRepository,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        upload_repository = InMemoryMediaUploadRepository()
+        initiate = InitiateMediaUpload(
+            video_repository=video_repository,
+            upload_repository=upload_repository,
+            storage_service=storage,
+            chunk_size=100,
+        )
+        abandoned, live = (
+            initiate.execute(
+                InitiateMediaUpload.Input(
+                    video_id=video.id,
+                    file_name="movie.mp4",
+                    content_type="video/mp4",
+                    size=1000,
+                )
+            ).upload_id
+            for video in videos
+        )
+        upload_repository.created_at[abandoned] -= timedelta(days=2)
+        for path in (tmp_path / "uploads").iterdir():
+            age(path, hours=2)
+        orphan = tmp_path / "uploads" / "orphan.part"
+        orphan.write_bytes(b"left behind")
+        age(orphan, hours=2)
+
+        output = collect(video_repository, upload_repository, storage)
+
+        assert output.expired_uploads == [abandoned]
+        assert upload_repository.get_by_id(abandoned) is None
+        assert upload_repository.get_by_id(live) is not None
+        assert sorted(path.name for path in (tmp_path / "uploads").iterdir()) == [
+            f"{live}.part"
+        ]
+        assert "uploads/orphan.part" in output.deleted
@@ -6,9 +6,6 @@ from core.video.application.exceptions import InvalidVideo, RelatedEntitiesNotFo
 from core.video.application.use_cases.create_video_without_media import CreateVideoWithoutMedia
 from core.video.domain.value_objects import Rating
 from core.video.domain.video_repository import VideoRepository
-from core.category.domain.category_repository import CategoryRepository
-from core.genre.domain.genre_repository import GenreRepository
-from core.castmember.domain.castmember_repository import CastMemberRepository
 
 @pytest.fixture
 def video_repository() -> MagicMock:
@@ -16,33 +13,8 @@ def video_repository() -> MagicMock:
 
 
 @pytest.fixture
-def category_repository() -> MagicMock:
-    return MagicMock(spec=CategoryRepository)
-
-
-@pytest.fixture
-def genre_repository() -> MagicMock:
-    return MagicMock(spec=GenreRepository)
-
-
-@pytest.fixture
-def cast_member_repository() -> MagicMock:
-    return MagicMock(spec=CastMemberRepository)
-
-
-@pytest.fixture
-def use_case(
-    video_repository: MagicMock,
-    category_repository: MagicMock,
-    genre_repository: MagicMock,
-    cast_member_repository: MagicMock,
-) -> CreateVideoWithoutMedia:
-    return CreateVideoWithoutMedia(
-        video_repository=video_repository,
-        category_repository=category_repository,
-        genre_repository=genre_repository,
-        cast_member_repository=cast_member_repository,
-    )
+def use_case(video_repository: MagicMock) -> CreateVideoWithoutMedia:
+    return CreateVideoWithoutMedia(video_repository=video_repository)
 
 
 @pytest.fixture
@@ -78,94 +50,90 @@ def valid_input(
     )
 
 
+def missing_ids(
+    categories: set[UUID] = frozenset(),
+    genres: set[UUID] = frozenset(),
+    cast_members: set[UUID] = frozenset(),
+) -> dict[str, set[UUID]]:
+    return {
+        "categories": set(categories),
+        "genres": set(genres),
+        "cast_members": set(cast_members),
+    }
+
+
 class TestCreateVideoWithoutMedia:
     def test_execute_with_valid_data(
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
         video_repository: MagicMock,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
-        valid_categories_ids: set[UUID],
-        valid_genres_ids: set[UUID],
-        valid_cast_members_ids: set[UUID],
     ) -> None:
-        # Mock the repositories to return valid entities
-        category_repository.exists_by_ids.return_value = True
-        genre_repository.exists_by_ids.return_value = True
-        cast_member_repository.exists_by_ids.return_value = True
-        category_repository.list.return_value = [
-            MagicMock(id=category_id) for category_id in valid_categories_ids
-        ]
-        genre_repository.list.return_value = [
-            MagicMock(id=genre_id) for genre_id in valid_genres_ids
-        ]
-        cast_member_repository.list.return_value = [
-            MagicMock(id=cast_member_id) for cast_member_id in valid_cast_members_ids
-        ]
-
-        # Call the use case
+        video_repository.find_missing_related_ids.return_value = missing_ids()
+
         output: CreateVideoWithoutMedia.Output = use_case.execute(valid_input)
 
-        # Assert the result
         assert isinstance(output, CreateVideoWithoutMedia.Output)
         assert isinstance(output.id, UUID)
         video_repository.save.assert_called_once()
 
+    def test_checks_all_relations_in_a_single_call(
+        self,
+        use_case: CreateVideoWithoutMedia,
+        valid_input: CreateVideoWithoutMedia.Input,
+        video_repository: MagicMock,
+    ) -> None:
+        video_repository.find_missing_related_ids.return_value = missing_ids()
+
+        use_case.execute(valid_input)
+
+        video_repository.find_missing_related_ids.assert_called_once_with(
+            categories=valid_input.categories,
+            genres=valid_input.genres,
+            cast_members=valid_input.cast_members,
+        )
+
+    def test_skips_relation_check_without_related_ids(
+        self,
+        use_case: CreateVideoWithoutMedia,
+        valid_input: CreateVideoWithoutMedia.Input,
+        video_repository: MagicMock,
+    ) -> None:
+        valid_input.categories = set()
+        valid_input.genres = set()
+        valid_input.cast_members = set()
+
+        use_case.execute(valid_input)
+
+        video_repository.find_missing_related_ids.assert_not_called()
+        video_repository.save.assert_called_once()
+
     def test_execute_with_invalid_categories(
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
-        valid_genres_ids: set[UUID],
-        valid_cast_members_ids: set[UUID],
+        video_repository: MagicMock,
     ) -> None:
-        # Mock repositories with missing categories
-        category_repository.exists_by_ids.return_value = False
-        category_repository.find_missing_ids.return_value = valid_input.categories
-        genre_repository.exists_by_ids.return_value = True
-        cast_member_repository.exists_by_ids.return_value = True
-        category_repository.list.return_value = []
-        genre_repository.list.return_value = [
-            MagicMock(id=genre_id) for genre_id in valid_genres_ids
-        ]
-        cast_member_repository.list.return_value = [
-            MagicMock(id=cast_member_id) for cast_member_id in valid_cast_members_ids
-        ]
-
-        # Assert that the use case raises the expected exception
+        video_repository.find_missing_related_ids.return_value = missing_ids(
+            categories=valid_input.categories
+        )
+
         with pytest.raises(RelatedEntitiesNotFound) as exc_info:
             use_case.execute(valid_input)
 
         assert "Categories with provided IDs not found" in str(exc_info.value)
+        video_repository.save.assert_not_called()
 
     def test_execute_with_invalid_genres(
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
-        valid_categories_ids: set[UUID],
-        valid_cast_members_ids: set[UUID],
+        video_repository: MagicMock,
     ) -> None:
-        # Mock repositories with missing genres
-        category_repository.exists_by_ids.return_value = True
-        genre_repository.exists_by_ids.return_value = False
-        genre_repository.find_missing_ids.return_value = valid_input.genres
-        cast_member_repository.exists_by_ids.return_value = True
-        category_repository.list.return_value = [
-            MagicMock(id=category_id) for category_id in valid_categories_ids
-        ]
-        genre_repository.list.return_value = []
-        cast_member_repository.list.return_value = [
-            MagicMock(id=cast_member_id) for cast_member_id in valid_cast_members_ids
-        ]
-
-        # Assert that the use case raises the expected exception
+        video_repository.find_missing_related_ids.return_value = missing_ids(
+            genres=valid_input.genres
+        )
+
         with pytest.raises(RelatedEntitiesNotFound) as exc_info:
             use_case.execute(valid_input)
 
@@ -175,26 +143,12 @@ class TestCreateVideoWithoutMedia:
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
-        valid_categories_ids: set[UUID],
-        valid_genres_ids: set[UUID],
+        video_repository: MagicMock,
     ) -> None:
-        # Mock repositories with missing cast members
-        category_repository.exists_by_ids.return_value = True
-        genre_repository.exists_by_ids.return_value = True
-        cast_member_repository.exists_by_ids.return_value = False
-        cast_member_repository.find_missing_ids.return_value = valid_input.cast_members
-        category_repository.list.return_value = [
-            MagicMock(id=category_id) for category_id in valid_categories_ids
-        ]
-        genre_repository.list.return_value = [
-            MagicMock(id=genre_id) for genre_id in valid_genres_ids
-        ]
-        cast_member_repository.list.return_value = []
-
-        # Assert that the use case raises the expected exception
+        video_repository.find_missing_related_ids.return_value = missing_ids(
+            cast_members=valid_input.cast_members
+        )
+
         with pytest.raises(RelatedEntitiesNotFound) as exc_info:
             use_case.execute(valid_input)
 
@@ -204,26 +158,9 @@ class TestCreateVideoWithoutMedia:
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
-        valid_categories_ids: set[UUID],
-        valid_genres_ids: set[UUID],
-        valid_cast_members_ids: set[UUID],
+        video_repository: MagicMock,
     ) -> None:
-        # Mock the repositories to return valid entities
-        category_repository.exists_by_ids.return_value = True
-        genre_repository.exists_by_ids.return_value = True
-        cast_member_repository.exists_by_ids.return_value = True
-        category_repository.list.return_value = [
-            MagicMock(id=category_id) for category_id in valid_categories_ids
-        ]
-        genre_repository.list.return_value = [
-            MagicMock(id=genre_id) for genre_id in valid_genres_ids
-        ]
-        cast_member_repository.list.return_value = [
-            MagicMock(id=cast_member_id) for cast_member_id in valid_cast_members_ids
-        ]
+        video_repository.find_missing_related_ids.return_value = missing_ids()
 
         # Create an invalid input (empty title)
         invalid_input = CreateVideoWithoutMedia.Input(
@@ -237,7 +174,6 @@ class TestCreateVideoWithoutMedia:
             cast_members=valid_input.cast_members,
         )
 
-        # Assert that the use case raises the expected exception
         with pytest.raises(InvalidVideo):
             use_case.execute(invalid_input)
 
@@ -245,22 +181,14 @@ class TestCreateVideoWithoutMedia:
         self,
         use_case: CreateVideoWithoutMedia,
         valid_input: CreateVideoWithoutMedia.Input,
-        category_repository: MagicMock,
-        genre_repository: MagicMock,
-        cast_member_repository: MagicMock,
+        video_repository: MagicMock,
     ) -> None:
-        # Mock all repositories to return empty lists
-        category_repository.exists_by_ids.return_value = False
-        genre_repository.exists_by_ids.return_value = False
-        cast_member_repository.exists_by_ids.return_value = False
-        category_repository.find_missing_ids.return_value = valid_input.categories
-        genre_repository.find_missing_ids.return_value = valid_input.genres
-        cast_member_repository.find_missing_ids.return_value = valid_input.cast_members
-        category_repository.list.return_value = []
-        genre_repository.list.return_value = []
-        cast_member_repository.list.return_value = []
-
-        # Assert that the use case raises the expected exception
+        video_repository.find_missing_related_ids.return_value = missing_ids(
+            categories=valid_input.categories,
+            genres=valid_input.genres,
+            cast_members=valid_input.cast_members,
+        )
+
         with pytest.raises(RelatedEntitiesNotFound) as exc_info:
             use_case.execute(valid_input)
 
@@ -268,4 +196,4 @@ class TestCreateVideoWithoutMedia:
         error_message = str(exc_info.value)
         assert "Categories with provided IDs not found" in error_message
         assert "Genres with provided IDs not found" in error_message
-        assert "Cast members with provided IDs not found" in error_message
\ No newline at end of file
+        assert "Cast members with provided IDs not found" in error_message
@@ -0,0 +1,119 @@
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from core.video.application.exceptions import MediaFileNotFound
+from core.video.application.use_cases.get_media_file import GetMediaFile
+from core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from core.video.domain.video import Video
+from django_project.adapters.persistence.in_memory.video_repository import (
+    InMemoryVideoRepository,
+)
+from django_project.adapters.storage.local_storage import LocalStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorage:
+    storage = LocalStorage(bucket=str(tmp_path))
+    storage.store("blobs/ab/abc", b"raw bytes", "video/mp4")
+    storage.store("encoded/1/index.m3u8", b"#EXTM3U", "application/x-mpegURL")
+    return storage
+
+
+@pytest.fixture
+def video() -> Video:
+    video = Video(
+        title="Test Video",
+        description="Test Description",
+        launch_year=2021,
+        duration=Decimal("120.5"),
+        published=True,
+        rating=Rating.L,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+    video.update_video(
+        AudioVideoMedia(
+            name="master.mp4",
+            checksum="abc",
+            raw_location="blobs/ab/abc",
+            encoded_location="encoded/1",
+            status=MediaStatus.COMPLETED,
+            media_type=MediaType.VIDEO,
+        )
+    )
+    return video
+
+
+@pytest.fixture
+def use_case(video: Video, storage: LocalStorage) -> GetMediaFile:
+    return GetMediaFile(
+        video_repository=InMemoryVideoRepository(videos=[video]),
+        storage_service=storage,
+    )
+
+
+class TestGetMediaFile:
+    def test_raw_file_is_named_and_tagged_after_the_upload(
+        self, video: Video, use_case: GetMediaFile
+    ) -> None:
+        output = use_case.execute(GetMediaFile.Input(video_id=video.id))
+
+        with output.file.content as content:
+            assert content.read() == b"raw bytes"
+        assert output.name == "master.mp4"
+        assert output.etag == "abc"
+        assert output.file.size == 9
+
+    def test_file_overwritten_in_place_gets_a_new_etag(
+        self, video: Video, storage: LocalStorage
+    ) -> None:
+        storage.store("videos/1/master.mp4", b"first", "video/mp4")
+        video.update_video(replace(video.video, raw_location="videos/1/master.mp4"))
+        use_case = GetMediaFile(
+            video_repository=InMemoryVideoRepository(videos=[video]),
+            storage_service=storage,
+        )
+        first = use_case.execute(GetMediaFile.Input(video_id=video.id))
+        first.file.content.close()
+
+        # A re-upload under the same name, checksum not yet updated.
+        storage.store("videos/1/master.mp4", b"second upload", "video/mp4")
+        second = use_case.execute(GetMediaFile.Input(video_id=video.id))
+        second.file.content.close()
+
+        assert first.etag.startswith("abc-5-")
+        assert second.etag.startswith("abc-d-")
+
+    def test_encoded_file(self, video: Video, use_case: GetMediaFile) -> None:
+        output = use_case.execute(
+            GetMediaFile.Input(video_id=video.id, encoded=True, file_name="index.m3u8")
+        )
+
+        with output.file.content as content:
+            assert content.read() == b"#EXTM3U"
+        assert output.name == "index.m3u8"
+        assert output.etag.startswith("7-")
+
+    @pytest.mark.parametrize(
+        "input_kwargs",
+        [
+            {"media_type": MediaType.TRAILER},
+            {"encoded": True, "file_name": "../../blobs/ab/abc"},
+            {"encoded": True, "file_name": "/etc/passwd"},
+            {"encoded": True, "file_name": "missing.ts"},
+        ],
+    )
+    def test_not_found(
+        self, video: Video, use_case: GetMediaFile, input_kwargs: dict
+    ) -> None:
+        with pytest.raises(MediaFileNotFound):
+            use_case.execute(GetMediaFile.Input(video_id=video.id, **input_kwargs))
@@ -0,0 +1,54 @@
+from decimal import Decimal
+from unittest.mock import create_autospec
+
+from core._shared.domain.pagination import Page
+from core.video.application.use_cases.list_video import ListVideo
+from core.video.domain.value_objects import Rating
+from core.video.domain.video import Video
+from core.video.domain.video_repository import VideoRepository
+
+
+class TestListVideo:
+
+    def test_list_videos_ordered_by_title_by_default(self) -> None:
+        video: Video = Video(
+            title="Video",
+            description="Video description",
+            launch_year=2023,
+            duration=Decimal("90.5"),
+            rating=Rating.L,
+            categories=set(),
+            genres=set(),
+            cast_members=set(),
+        )
+        mock_repository = create_autospec(VideoRepository)
+        mock_repository.paginate.return_value = Page(items=[video], total=1)
+
+        use_case: ListVideo = ListVideo(repository=mock_repository)
+        output: ListVideo.ListOutput = use_case.execute(ListVideo.Input())
+
+        mock_repository.paginate.assert_called_once_with(
+            order_by="title", offset=0, limit=10
+        )
+        assert output.data == [
+            ListVideo.Output(
+                id=video.id,
+                title=video.title,
+                description=video.description,
+                launch_year=video.launch_year,
+                duration=video.duration,
+                published=video.published,
+                rating=video.rating,
+                categories=set(),
+                genres=set(),
+                cast_members=set(),
+                banner=None,
+                thumbnail=None,
+                thumbnail_half=None,
+                trailer=None,
+                video=None,
+            )
+        ]
+        assert output.meta == ListVideo.OutputMeta(
+            current_page=1, per_page=10, total=1
+        )
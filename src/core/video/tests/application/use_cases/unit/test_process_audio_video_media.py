@@ -1,125 +1,55 @@
-from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec
 from uuid import uuid4, UUID
 import pytest
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.application.ports.unit_of_work import UnitOfWork
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
 from core.video.application.exceptions import VideoNotFound, AudioVideoMediaNotFound
 from core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
 from core.video.domain.value_objects import (
-    Rating,
     MediaStatus,
     MediaType,
     AudioVideoMedia,
 )
-from core.video.domain.video import Video
 from core.video.domain.video_repository import VideoRepository
 
 
 @pytest.fixture
 def video_repository() -> MagicMock:
-    return MagicMock(spec=VideoRepository)
-
-
-@pytest.fixture
-def video_with_media() -> Video:
-    video = Video(
-        title="Test Video",
-        description="Test Description",
-        launch_year=2023,
-        duration=Decimal("120.5"),
-        published=True,
-        rating=Rating.L,
-        categories=set(),
-        genres=set(),
-        cast_members=set(),
-    )
-    # Add video media to the video
-    video.update_video(
-        AudioVideoMedia(
-            name="test_video.mp4",
-            checksum="abc123",
-            raw_location="/videos/raw/test.mp4",
-            encoded_location="",
-            status=MediaStatus.PENDING,
-            media_type=MediaType.VIDEO,
-        )
-    )
-    return video
-
-
-@pytest.fixture
-def video_with_trailer() -> Video:
-    video = Video(
-        title="Test Video",
-        description="Test Description",
-        launch_year=2023,
-        duration=Decimal("120.5"),
-        published=False,
-        rating=Rating.L,
-        categories=set(),
-        genres=set(),
-        cast_members=set(),
-    )
-    # Add trailer media to the video
-    video.update_trailer(
-        AudioVideoMedia(
-            name="test_trailer.mp4",
-            checksum="xyz789",
-            raw_location="/videos/raw/test_trailer.mp4",
-            encoded_location="",
-            status=MediaStatus.PENDING,
-            media_type=MediaType.TRAILER,
-        )
-    )
-    return video
+    return create_autospec(VideoRepository)
 
 
 @pytest.fixture
-def video_without_media() -> Video:
-    return Video(
-        title="Test Video Without Media",
-        description="Test Description",
-        launch_year=2023,
-        duration=Decimal("90.5"),
-        published=False,
-        rating=Rating.AGE_12,
-        categories=set(),
-        genres=set(),
-        cast_members=set(),
+def video_media() -> AudioVideoMedia:
+    return AudioVideoMedia(
+        name="test_video.mp4",
+        checksum="abc123",
+        raw_location="/videos/raw/test.mp4",
+        encoded_location="",
+        status=MediaStatus.PENDING,
+        media_type=MediaType.VIDEO,
     )
 
 
 @pytest.fixture
-def video_with_trailer() -> Video:
-    video = Video(
-        title="Test Video with Trailer",
-        description="Test Description",
-        launch_year=2023,
-        duration=Decimal("105.0"),
-        published=False,
-        rating=Rating.AGE_10,
-        categories=set(),
-        genres=set(),
-        cast_members=set(),
-    )
-    # Add trailer media to the video
-    video.update_trailer(
-        AudioVideoMedia(
-            name="test_trailer.mp4",
-            checksum="def456",
-            raw_location="/videos/raw/trailer.mp4",
-            encoded_location="",
-            status=MediaStatus.PENDING,
-            media_type=MediaType.TRAILER,
-        )
+def trailer_media() -> AudioVideoMedia:
+    return AudioVideoMedia(
+        name="test_trailer.mp4",
+        checksum="def456",
+        raw_location="/videos/raw/trailer.mp4",
+        encoded_location="",
+        status=MediaStatus.PENDING,
+        media_type=MediaType.TRAILER,
     )
-    return video
 
 
 @pytest.fixture
 def event_publisher() -> MagicMock:
-    return MagicMock()
+    return create_autospec(EventPublisher)
 
 
 @pytest.fixture
@@ -137,421 +67,279 @@ class TestProcessAudioVideoMedia:
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_media: Video,
+        event_publisher: MagicMock,
+        video_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_media.id
-        video_repository.get_by_id.return_value = video_with_media
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="/videos/encoded/test.mp4",
-            status=MediaStatus.COMPLETED,
-        )
-
-        use_case.execute(input_data)
-
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_called_once_with(video_with_media)
-        assert video_with_media.video.status == MediaStatus.COMPLETED
-        assert video_with_media.video.encoded_location == "/videos/encoded/test.mp4"
-        assert video_with_media.published is True
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = video_media
 
-    def test_process_video_with_error_status(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_with_media: Video,
-    ) -> None:
-        video_id = video_with_media.id
-        video_repository.get_by_id.return_value = video_with_media
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="",
-            status=MediaStatus.ERROR,
-        )
-
-        use_case.execute(input_data)
-
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_called_once_with(video_with_media)
-        assert video_with_media.video.status == MediaStatus.ERROR
-        assert video_with_media.video.encoded_location == ""
-
-    def test_process_video_not_found(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-    ) -> None:
-        video_id = uuid4()
-        video_repository.get_by_id.return_value = None
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="/videos/encoded/test.mp4",
-            status=MediaStatus.COMPLETED,
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=video_id,
+                media_type=MediaType.VIDEO,
+                encoded_location="/videos/encoded/test.mp4",
+                status=MediaStatus.COMPLETED,
+            )
         )
 
-        with pytest.raises(VideoNotFound) as exc_info:
-            use_case.execute(input_data)
-
-        assert f"Video with id {video_id} not found" in str(exc_info.value)
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_not_called()
-
-    def test_process_video_media_not_found(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_without_media: Video,
-    ) -> None:
-        video_id = video_without_media.id
-        video_repository.get_by_id.return_value = video_without_media
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="/videos/encoded/test.mp4",
-            status=MediaStatus.COMPLETED,
+        video_repository.get_media.assert_called_once_with(
+            video_id=video_id, media_type=MediaType.VIDEO
         )
-
-        with pytest.raises(AudioVideoMediaNotFound) as exc_info:
-            use_case.execute(input_data)
-
-        assert f"Video media not found for video id {video_id}" in str(exc_info.value)
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_not_called()
-
-    def test_process_calls_video_process_method(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_with_media: Video,
-    ) -> None:
-        video_id = video_with_media.id
-        video_repository.get_by_id.return_value = video_with_media
-        encoded_location = "/videos/encoded/output.mp4"
-
-        input_data = ProcessAudioVideoMedia.Input(
+        video_repository.update_media.assert_called_once_with(
             video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location=encoded_location,
-            status=MediaStatus.COMPLETED,
-        )
-
-        with patch.object(video_with_media, "process") as mock_process:
-            use_case.execute(input_data)
-            mock_process.assert_called_once_with(
+            media=AudioVideoMedia(
+                name="test_video.mp4",
+                checksum="abc123",
+                raw_location="/videos/raw/test.mp4",
+                encoded_location="/videos/encoded/test.mp4",
                 status=MediaStatus.COMPLETED,
-                encoded_location=encoded_location,
                 media_type=MediaType.VIDEO,
-            )
-
-    def test_process_updates_repository(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_with_media: Video,
-    ) -> None:
-        video_id = video_with_media.id
-        video_repository.get_by_id.return_value = video_with_media
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="/videos/encoded/test.mp4",
-            status=MediaStatus.COMPLETED,
+            ),
+            published=True,
         )
-
-        use_case.execute(input_data)
-
-        video_repository.update.assert_called_once()
-        call_args = video_repository.update.call_args[0][0]
-        assert isinstance(call_args, Video)
-        assert call_args.id == video_id
-
-    # Trailer Processing Tests
-    def test_process_trailer_with_completed_status(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_with_trailer: Video,
-    ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/trailer.mp4",
-            status=MediaStatus.COMPLETED,
+        event_publisher.publish.assert_called_once_with(
+            [
+                AudioVideoMediaUpdatedIntegrationEvent(
+                    resource_id=f"{video_id}.VIDEO",
+                    file_path="/videos/encoded/test.mp4",
+                )
+            ]
         )
 
-        use_case.execute(input_data)
-
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_called_once_with(video_with_trailer)
-        assert video_with_trailer.trailer.status == MediaStatus.COMPLETED
-        assert video_with_trailer.trailer.encoded_location == "/videos/encoded/trailer.mp4"
-
-    def test_process_trailer_with_error_status(
+    def test_process_video_with_error_status(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        event_publisher: MagicMock,
+        video_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = video_media
 
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="",
-            status=MediaStatus.ERROR,
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=video_id,
+                media_type=MediaType.VIDEO,
+                encoded_location="/videos/encoded/test.mp4",
+                status=MediaStatus.ERROR,
+            )
         )
 
-        use_case.execute(input_data)
+        video_repository.update_media.assert_called_once()
+        call_kwargs = video_repository.update_media.call_args.kwargs
+        assert call_kwargs["media"].status == MediaStatus.ERROR
+        assert call_kwargs["media"].encoded_location == ""
+        assert call_kwargs["published"] is None
+        event_publisher.publish.assert_not_called()
 
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
-        video_repository.update.assert_called_once_with(video_with_trailer)
-        assert video_with_trailer.trailer.status == MediaStatus.ERROR
-        assert video_with_trailer.trailer.encoded_location == ""
-
-    def test_process_trailer_media_not_found(
+    def test_process_does_not_load_or_rewrite_the_aggregate(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_without_media: Video,
+        video_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_without_media.id
-        video_repository.get_by_id.return_value = video_without_media
+        video_repository.get_media.return_value = video_media
 
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/trailer.mp4",
-            status=MediaStatus.COMPLETED,
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=uuid4(),
+                media_type=MediaType.VIDEO,
+                encoded_location="/videos/encoded/test.mp4",
+                status=MediaStatus.COMPLETED,
+            )
         )
 
-        with pytest.raises(AudioVideoMediaNotFound) as exc_info:
-            use_case.execute(input_data)
-
-        assert f"Trailer media not found for video id {video_id}" in str(exc_info.value)
-        video_repository.get_by_id.assert_called_once_with(id=video_id)
+        video_repository.get_by_id.assert_not_called()
         video_repository.update.assert_not_called()
+        video_repository.exists.assert_not_called()
 
-    def test_process_calls_trailer_process_method(
+    def test_update_and_publish_share_one_unit_of_work(
         self,
-        use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        event_publisher: MagicMock,
+        video_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
-        encoded_location = "/videos/encoded/trailer_output.mp4"
-
-        input_data: ProcessAudioVideoMedia.Input = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location=encoded_location,
-            status=MediaStatus.COMPLETED,
+        unit_of_work = create_autospec(UnitOfWork)
+        calls = MagicMock()
+        unit_of_work.atomic.return_value.__enter__.side_effect = (
+            lambda: calls.begin()
         )
-
-        with patch.object(video_with_trailer, "process_trailer") as mock_process_trailer:
-            use_case.execute(input_data)
-            mock_process_trailer.assert_called_once_with(
+        unit_of_work.atomic.return_value.__exit__.side_effect = (
+            lambda *args: calls.commit()
+        )
+        video_repository.update_media.side_effect = lambda **kwargs: calls.update()
+        event_publisher.publish.side_effect = lambda events: calls.publish()
+        video_repository.get_media.return_value = video_media
+
+        ProcessAudioVideoMedia(
+            video_repository=video_repository,
+            event_publisher=event_publisher,
+            unit_of_work=unit_of_work,
+        ).execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=uuid4(),
+                media_type=MediaType.VIDEO,
+                encoded_location="/videos/encoded/test.mp4",
                 status=MediaStatus.COMPLETED,
-                encoded_location=encoded_location,
             )
-
-    def test_process_trailer_updates_repository(
-        self,
-        use_case: ProcessAudioVideoMedia,
-        video_repository: MagicMock,
-        video_with_trailer: Video,
-    ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/trailer.mp4",
-            status=MediaStatus.COMPLETED,
         )
 
-        use_case.execute(input_data)
+        assert [call[0] for call in calls.mock_calls] == [
+            "begin",
+            "update",
+            "publish",
+            "commit",
+        ]
 
-        video_repository.update.assert_called_once()
-        call_args = video_repository.update.call_args[0][0]
-        assert isinstance(call_args, Video)
-        assert call_args.id == video_id
-
-    def test_process_trailer_preserves_video_properties(
+    def test_process_video_not_found(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        event_publisher: MagicMock,
     ) -> None:
-        video_id = video_with_trailer.id
-        original_title = video_with_trailer.title
-        original_description = video_with_trailer.description
-        original_checksum = video_with_trailer.trailer.checksum
-        original_name = video_with_trailer.trailer.name
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = None
+        video_repository.exists.return_value = False
 
-        video_repository.get_by_id.return_value = video_with_trailer
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/trailer.mp4",
-            status=MediaStatus.COMPLETED,
-        )
-
-        use_case.execute(input_data)
+        with pytest.raises(VideoNotFound) as exc_info:
+            use_case.execute(
+                ProcessAudioVideoMedia.Input(
+                    video_id=video_id,
+                    media_type=MediaType.VIDEO,
+                    encoded_location="/videos/encoded/test.mp4",
+                    status=MediaStatus.COMPLETED,
+                )
+            )
 
-        # Verify video properties are preserved
-        assert video_with_trailer.title == original_title
-        assert video_with_trailer.description == original_description
-        assert video_with_trailer.trailer.checksum == original_checksum
-        assert video_with_trailer.trailer.name == original_name
+        assert f"Video with id {video_id} not found" in str(exc_info.value)
+        video_repository.exists.assert_called_once_with(id=video_id)
+        video_repository.update_media.assert_not_called()
+        event_publisher.publish.assert_not_called()
 
-    def test_process_preserves_video_properties(
+    def test_process_video_media_not_found(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_media: Video,
     ) -> None:
-        video_id = video_with_media.id
-        original_title = video_with_media.title
-        original_description = video_with_media.description
-        original_checksum = video_with_media.video.checksum
-        original_name = video_with_media.video.name
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = None
+        video_repository.exists.return_value = True
 
-        video_repository.get_by_id.return_value = video_with_media
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.VIDEO,
-            encoded_location="/videos/encoded/test.mp4",
-            status=MediaStatus.COMPLETED,
-        )
-
-        use_case.execute(input_data)
+        with pytest.raises(AudioVideoMediaNotFound) as exc_info:
+            use_case.execute(
+                ProcessAudioVideoMedia.Input(
+                    video_id=video_id,
+                    media_type=MediaType.VIDEO,
+                    encoded_location="/videos/encoded/test.mp4",
+                    status=MediaStatus.COMPLETED,
+                )
+            )
 
-        # Verify video properties are preserved
-        assert video_with_media.title == original_title
-        assert video_with_media.description == original_description
-        assert video_with_media.video.checksum == original_checksum
-        assert video_with_media.video.name == original_name
+        assert f"Video media not found for video id {video_id}" in str(exc_info.value)
+        video_repository.update_media.assert_not_called()
 
+    # Trailer Processing Tests
     def test_process_trailer_with_completed_status(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        event_publisher: MagicMock,
+        trailer_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/test_trailer.mp4",
-            status=MediaStatus.COMPLETED,
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = trailer_media
+
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=video_id,
+                media_type=MediaType.TRAILER,
+                encoded_location="/videos/encoded/trailer.mp4",
+                status=MediaStatus.COMPLETED,
+            )
         )
 
-        use_case.execute(input_data)
-
-        assert video_with_trailer.trailer.status == MediaStatus.COMPLETED
-        assert video_with_trailer.trailer.encoded_location == "/videos/encoded/test_trailer.mp4"
-        video_repository.update.assert_called_once_with(video_with_trailer)
+        video_repository.get_media.assert_called_once_with(
+            video_id=video_id, media_type=MediaType.TRAILER
+        )
+        call_kwargs = video_repository.update_media.call_args.kwargs
+        assert call_kwargs["media"].status == MediaStatus.COMPLETED
+        assert call_kwargs["media"].encoded_location == "/videos/encoded/trailer.mp4"
+        assert call_kwargs["published"] is None
+        event_publisher.publish.assert_called_once_with(
+            [
+                AudioVideoMediaUpdatedIntegrationEvent(
+                    resource_id=f"{video_id}.TRAILER",
+                    file_path="/videos/encoded/trailer.mp4",
+                )
+            ]
+        )
 
     def test_process_trailer_with_error_status(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        event_publisher: MagicMock,
+        trailer_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_trailer.id
-        video_repository.get_by_id.return_value = video_with_trailer
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="",
-            status=MediaStatus.ERROR,
+        video_repository.get_media.return_value = trailer_media
+
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=uuid4(),
+                media_type=MediaType.TRAILER,
+                encoded_location="",
+                status=MediaStatus.ERROR,
+            )
         )
 
-        use_case.execute(input_data)
-
-        assert video_with_trailer.trailer.status == MediaStatus.ERROR
-        assert video_with_trailer.trailer.encoded_location == ""
-        video_repository.update.assert_called_once_with(video_with_trailer)
+        call_kwargs = video_repository.update_media.call_args.kwargs
+        assert call_kwargs["media"].status == MediaStatus.ERROR
+        assert call_kwargs["media"].encoded_location == ""
+        event_publisher.publish.assert_not_called()
 
     def test_process_trailer_media_not_found(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
     ) -> None:
-        # Create a video without trailer
-        video = Video(
-            title="Test Video",
-            description="Test Description",
-            launch_year=2023,
-            duration=Decimal("120.5"),
-            published=False,
-            rating=Rating.L,
-            categories=set(),
-            genres=set(),
-            cast_members=set(),
-        )
-        video_id = video.id
-        video_repository.get_by_id.return_value = video
-
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/test_trailer.mp4",
-            status=MediaStatus.COMPLETED,
-        )
+        video_id: UUID = uuid4()
+        video_repository.get_media.return_value = None
+        video_repository.exists.return_value = True
 
         with pytest.raises(
             AudioVideoMediaNotFound,
             match=f"Trailer media not found for video id {video_id}",
         ):
-            use_case.execute(input_data)
+            use_case.execute(
+                ProcessAudioVideoMedia.Input(
+                    video_id=video_id,
+                    media_type=MediaType.TRAILER,
+                    encoded_location="/videos/encoded/trailer.mp4",
+                    status=MediaStatus.COMPLETED,
+                )
+            )
 
-        video_repository.update.assert_not_called()
+        video_repository.update_media.assert_not_called()
 
-    def test_process_trailer_preserves_video_properties(
+    def test_process_preserves_media_properties(
         self,
         use_case: ProcessAudioVideoMedia,
         video_repository: MagicMock,
-        video_with_trailer: Video,
+        trailer_media: AudioVideoMedia,
     ) -> None:
-        video_id = video_with_trailer.id
-        original_title = video_with_trailer.title
-        original_description = video_with_trailer.description
-        original_checksum = video_with_trailer.trailer.checksum
-        original_name = video_with_trailer.trailer.name
-
-        video_repository.get_by_id.return_value = video_with_trailer
+        video_repository.get_media.return_value = trailer_media
 
-        input_data = ProcessAudioVideoMedia.Input(
-            video_id=video_id,
-            media_type=MediaType.TRAILER,
-            encoded_location="/videos/encoded/test_trailer.mp4",
-            status=MediaStatus.COMPLETED,
+        use_case.execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=uuid4(),
+                media_type=MediaType.TRAILER,
+                encoded_location="/videos/encoded/trailer.mp4",
+                status=MediaStatus.COMPLETED,
+            )
         )
 
-        use_case.execute(input_data)
-
-        # Verify video properties are preserved
-        assert video_with_trailer.title == original_title
-        assert video_with_trailer.description == original_description
-        assert video_with_trailer.trailer.checksum == original_checksum
-        assert video_with_trailer.trailer.name == original_name
+        media: AudioVideoMedia = video_repository.update_media.call_args.kwargs["media"]
+        assert media.name == trailer_media.name
+        assert media.checksum == trailer_media.checksum
+        assert media.raw_location == trailer_media.raw_location
+        assert media.media_type == MediaType.TRAILER
@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import pytest
+
+from core.video.domain.media_upload import MediaUpload, UploadStatus
+from core.video.domain.value_objects import MediaType
+
+
+def make_upload(**kwargs) -> MediaUpload:
+    return MediaUpload(
+        **{
+            "video_id": uuid4(),
+            "file_name": "movie.mp4",
+            "content_type": "video/mp4",
+            "media_type": MediaType.VIDEO,
+            "size": 10,
+            "chunk_size": 4,
+            **kwargs,
+        }
+    )
+
+
+class TestMediaUpload:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"file_name": ""},
+            {"file_name": "../movie.mp4"},
+            {"file_name": ".."},
+            {"size": 0},
+            {"chunk_size": 0},
+        ],
+    )
+    def test_rejects_invalid_uploads(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            make_upload(**kwargs)
+
+    def test_splits_file_into_chunks(self) -> None:
+        upload = make_upload(size=10, chunk_size=4)
+
+        assert upload.chunk_count == 3
+        assert [upload.chunk_offset(index) for index in range(3)] == [0, 4, 8]
+        assert [upload.chunk_length(index) for index in range(3)] == [4, 4, 2]
+
+    def test_missing_chunks(self) -> None:
+        upload = make_upload(size=10, chunk_size=4)
+
+        assert upload.missing_chunks({2}) == [0, 1]
+        assert upload.missing_chunks({0, 1, 2}) == []
+
+    def test_is_placed_then_completed(self) -> None:
+        upload = make_upload()
+        assert upload.status == UploadStatus.UPLOADING
+
+        upload.place("videos/1/movie.mp4", "abc")
+        assert upload.status == UploadStatus.PLACED
+        assert (upload.file_path, upload.checksum) == ("videos/1/movie.mp4", "abc")
+
+        upload.complete()
+        assert upload.status == UploadStatus.COMPLETED
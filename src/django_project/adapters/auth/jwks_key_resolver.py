@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+import urllib.request
+from typing import Callable
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+
+
+class JwksKeyResolver:
+    """Signing keys from a JWKS document, indexed by kid.
+
+    The source is a file path or a URL. Keys are loaded on first use and
+    reloaded only when a token names an unknown kid, at most once per
+    min_refresh_interval, so known keys never trigger I/O.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        min_refresh_interval: float = 60.0,
+        timeout: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source: str = source
+        self.min_refresh_interval: float = min_refresh_interval
+        self.timeout: float = timeout
+        self.clock: Callable[[], float] = clock
+        self.keys: dict[str | None, PublicKeyTypes] = {}
+        self.last_refresh: float | None = None
+        self.lock = threading.Lock()
+
+    def get_key(self, kid: str | None) -> PublicKeyTypes | None:
+        key: PublicKeyTypes | None = self._lookup(kid)
+        if key is not None:
+            return key
+
+        with self.lock:
+            key = self._lookup(kid)
+            if key is None and self._may_refresh():
+                self.refresh()
+                key = self._lookup(kid)
+        return key
+
+    def refresh(self) -> None:
+        self.last_refresh = self.clock()
+        try:
+            document: dict = json.loads(self._read())
+            jwk_set = jwt.PyJWKSet.from_dict(document)
+        except (OSError, ValueError, jwt.PyJWTError):
+            # Keep serving the keys we already have until the source recovers.
+            return
+
+        self.keys = {
+            jwk.key_id: jwk.key
+            for jwk in jwk_set.keys
+            if jwk.public_key_use in (None, "sig")
+        }
+
+    def _lookup(self, kid: str | None) -> PublicKeyTypes | None:
+        keys = self.keys
+        if kid is None and len(keys) == 1:
+            return next(iter(keys.values()))
+        return keys.get(kid)
+
+    def _may_refresh(self) -> bool:
+        return (
+            self.last_refresh is None
+            or self.clock() - self.last_refresh >= self.min_refresh_interval
+        )
+
+    def _read(self) -> bytes:
+        if "://" in self.source:
+            with urllib.request.urlopen(self.source, timeout=self.timeout) as response:
+                return response.read()
+        with open(self.source, "rb") as file:
+            return file.read()
@@ -1,29 +1,93 @@
+import functools
+import hashlib
 import os
+import time
+from typing import Callable
 
 import dotenv
 import jwt
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 
 from core._shared.application.ports.auth_service import AuthService
+from core._shared.application.ports.cache import Cache
+from django_project.adapters.auth.jwks_key_resolver import JwksKeyResolver
 
 dotenv.load_dotenv()
 
 
+def load_public_key(raw_public_key: str) -> PublicKeyTypes | None:
+    pem: str = (
+        f"-----BEGIN PUBLIC KEY-----\n{raw_public_key}\n-----END PUBLIC KEY-----"
+    )
+    try:
+        return load_pem_public_key(pem.encode("ascii"))
+    except ValueError:
+        return None
+
+
+@functools.cache
+def default_public_key() -> PublicKeyTypes | None:
+    return load_public_key(os.getenv("AUTH_PUBLIC_KEY", ""))
+
+
 class JwtAuthService(AuthService):
-    def __init__(self, token: str = "") -> None:
-        raw_public_key = os.getenv("AUTH_PUBLIC_KEY", "")
-        self.public_key: str = (
-            f"-----BEGIN PUBLIC KEY-----\n{raw_public_key}\n-----END PUBLIC KEY-----"
-        )
+    def __init__(
+        self,
+        token: str = "",
+        public_key: PublicKeyTypes | None = None,
+        claims_cache: Cache | None = None,
+        key_resolver: JwksKeyResolver | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.public_key: PublicKeyTypes | None = public_key or default_public_key()
         self.token: str = token.replace("Bearer ", "", 1)
+        self.claims_cache: Cache | None = claims_cache
+        self.key_resolver: JwksKeyResolver | None = key_resolver
+        self.clock: Callable[[], float] = clock
+        self._claims: dict | None = None
 
     def _decode_token(self) -> dict:
+        if self._claims is None:
+            self._claims = self._verified_claims()
+        return self._claims
+
+    def _verified_claims(self) -> dict:
+        if not self.token:
+            return {}
+
+        key: str = hashlib.sha256(self.token.encode("utf-8")).hexdigest()
+        if self.claims_cache is not None:
+            claims: dict | None = self.claims_cache.get(key)
+            if claims is not None and not self._expired(claims):
+                return claims
+
         try:
-            return jwt.decode(
-                self.token, self.public_key, algorithms=["RS256"], audience="account"
+            signing_key: PublicKeyTypes | None = self._signing_key()
+            if signing_key is None:
+                return {}
+            claims = jwt.decode(
+                self.token, signing_key, algorithms=["RS256"], audience="account"
             )
         except jwt.PyJWTError:
             return {}
 
+        if self.claims_cache is not None and not self._expired(claims):
+            ttl: float | None = (
+                claims["exp"] - self.clock() if "exp" in claims else None
+            )
+            self.claims_cache.set(key, claims, ttl=ttl)
+        return claims
+
+    def _signing_key(self) -> PublicKeyTypes | None:
+        if self.key_resolver is None:
+            return self.public_key
+        kid: str | None = jwt.get_unverified_header(self.token).get("kid")
+        return self.key_resolver.get_key(kid)
+
+    def _expired(self, claims: dict) -> bool:
+        return "exp" in claims and claims["exp"] <= self.clock()
+
     def is_authenticated(self) -> bool:
         return bool(self._decode_token())
 
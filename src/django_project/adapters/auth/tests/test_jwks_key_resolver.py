@@ -0,0 +1,154 @@
+import json
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from django_project.adapters.auth.jwks_key_resolver import JwksKeyResolver
+from django_project.adapters.auth.jwt_auth_service import JwtAuthService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def generate_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def write_jwks(path: Path, keys: dict[str, rsa.RSAPrivateKey]) -> None:
+    jwks = []
+    for kid, private_key in keys.items():
+        jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        jwks.append({**jwk, "kid": kid, "use": "sig", "alg": "RS256"})
+    path.write_text(json.dumps({"keys": jwks}))
+
+
+@pytest.fixture(scope="module")
+def old_key() -> rsa.RSAPrivateKey:
+    return generate_key()
+
+
+@pytest.fixture(scope="module")
+def new_key() -> rsa.RSAPrivateKey:
+    return generate_key()
+
+
+@pytest.fixture
+def jwks_path(tmp_path: Path, old_key: rsa.RSAPrivateKey) -> Path:
+    path = tmp_path / "jwks.json"
+    write_jwks(path, {"old": old_key})
+    return path
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def resolver(jwks_path: Path, clock: FakeClock) -> JwksKeyResolver:
+    return JwksKeyResolver(
+        source=str(jwks_path), min_refresh_interval=60, clock=clock
+    )
+
+
+class TestJwksKeyResolver:
+
+    def test_resolves_key_by_kid(self, resolver, old_key) -> None:
+        key = resolver.get_key("old")
+
+        assert key.public_numbers() == old_key.public_key().public_numbers()
+
+    def test_known_kid_does_not_read_the_source(self, resolver) -> None:
+        resolver.get_key("old")
+
+        with patch.object(resolver, "_read") as read:
+            resolver.get_key("old")
+
+        read.assert_not_called()
+
+    def test_unknown_kid_refreshes_after_rotation(
+        self, resolver, jwks_path, clock, old_key, new_key
+    ) -> None:
+        resolver.get_key("old")
+        write_jwks(jwks_path, {"old": old_key, "new": new_key})
+
+        clock.now = 61
+        key = resolver.get_key("new")
+
+        assert key.public_numbers() == new_key.public_key().public_numbers()
+
+    def test_refresh_is_throttled_by_min_interval(
+        self, resolver, jwks_path, clock
+    ) -> None:
+        resolver.get_key("old")
+
+        clock.now = 30
+        with patch.object(resolver, "_read", wraps=resolver._read) as read:
+            assert resolver.get_key("unknown") is None
+            assert resolver.get_key("unknown") is None
+
+        read.assert_not_called()
+
+    def test_failed_refresh_keeps_known_keys(
+        self, resolver, jwks_path, clock
+    ) -> None:
+        resolver.get_key("old")
+        jwks_path.write_text("not json")
+
+        clock.now = 61
+        assert resolver.get_key("unknown") is None
+        assert resolver.get_key("old") is not None
+
+    def test_loads_from_url(self, jwks_path, old_key) -> None:
+        resolver = JwksKeyResolver(source=jwks_path.as_uri())
+
+        assert resolver.get_key("old") is not None
+
+    def test_missing_source_resolves_nothing(self, tmp_path: Path) -> None:
+        resolver = JwksKeyResolver(source=str(tmp_path / "missing.json"))
+
+        assert resolver.get_key("old") is None
+
+
+class TestJwtAuthServiceWithResolver:
+
+    def make_token(self, private_key: rsa.RSAPrivateKey, kid: str) -> str:
+        claims = {"aud": "account", "exp": int(time.time()) + 300}
+        return jwt.encode(
+            claims, private_key, algorithm="RS256", headers={"kid": kid}
+        )
+
+    def test_token_is_verified_with_the_key_named_by_kid(
+        self, resolver, old_key
+    ) -> None:
+        service = JwtAuthService(
+            token=self.make_token(old_key, "old"), key_resolver=resolver
+        )
+
+        assert service.is_authenticated() is True
+
+    def test_token_with_unknown_kid_is_rejected(self, resolver, new_key) -> None:
+        service = JwtAuthService(
+            token=self.make_token(new_key, "new"), key_resolver=resolver
+        )
+
+        assert service.is_authenticated() is False
+
+    def test_token_signed_with_another_key_is_rejected(
+        self, resolver, new_key
+    ) -> None:
+        service = JwtAuthService(
+            token=self.make_token(new_key, "old"), key_resolver=resolver
+        )
+
+        assert service.is_authenticated() is False
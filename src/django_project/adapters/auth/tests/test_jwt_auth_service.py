@@ -0,0 +1,152 @@
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+
+from django_project.adapters.auth.jwt_auth_service import (
+    JwtAuthService,
+    load_public_key,
+)
+from django_project.adapters.cache.lru_cache import LRUCache
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def public_key(private_key: rsa.RSAPrivateKey) -> PublicKeyTypes:
+    return private_key.public_key()
+
+
+@pytest.fixture
+def make_token(private_key: rsa.RSAPrivateKey):
+    def make(expires_in: int = 300, roles: list[str] | None = None) -> str:
+        claims = {
+            "aud": "account",
+            "exp": int(time.time()) + expires_in,
+            "realm_access": {"roles": roles or ["admin"]},
+        }
+        return jwt.encode(claims, private_key, algorithm="RS256")
+
+    return make
+
+
+class TestJwtAuthService:
+
+    def test_valid_token_is_authenticated(self, public_key, make_token) -> None:
+        service = JwtAuthService(
+            token=f"Bearer {make_token()}", public_key=public_key
+        )
+
+        assert service.is_authenticated() is True
+        assert service.has_role("admin") is True
+        assert service.has_role("other") is False
+
+    def test_token_signed_with_another_key_is_rejected(self, make_token) -> None:
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        service = JwtAuthService(token=make_token(), public_key=other_key.public_key())
+
+        assert service.is_authenticated() is False
+
+    def test_expired_token_is_rejected(self, public_key, make_token) -> None:
+        service = JwtAuthService(
+            token=make_token(expires_in=-10), public_key=public_key
+        )
+
+        assert service.is_authenticated() is False
+
+    def test_token_is_verified_once_per_service(self, public_key, make_token) -> None:
+        service = JwtAuthService(token=make_token(), public_key=public_key)
+
+        with patch("jwt.decode", wraps=jwt.decode) as decode:
+            service.is_authenticated()
+            service.has_role("admin")
+
+        decode.assert_called_once()
+
+
+class TestClaimsCache:
+
+    def test_claims_are_shared_across_services(self, public_key, make_token) -> None:
+        cache = LRUCache()
+        token = make_token()
+
+        with patch("jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(3):
+                service = JwtAuthService(
+                    token=token, public_key=public_key, claims_cache=cache
+                )
+                assert service.has_role("admin") is True
+
+        decode.assert_called_once()
+
+    def test_cache_key_is_not_the_raw_token(self, public_key, make_token) -> None:
+        cache = LRUCache()
+        token = make_token()
+
+        JwtAuthService(
+            token=token, public_key=public_key, claims_cache=cache
+        ).is_authenticated()
+
+        assert token not in cache.entries
+        assert len(cache.entries) == 1
+
+    def test_cached_claims_expire_with_the_token(
+        self, public_key, make_token
+    ) -> None:
+        cache = LRUCache(ttl=3600, clock=lambda: 0)
+        token = make_token(expires_in=60)
+        now = time.time()
+
+        JwtAuthService(
+            token=token, public_key=public_key, claims_cache=cache, clock=lambda: now
+        ).is_authenticated()
+
+        [(expires_at, claims)] = cache.entries.values()
+        assert expires_at == pytest.approx(claims["exp"] - now)
+
+    def test_expired_cached_claims_are_not_served(
+        self, public_key, make_token
+    ) -> None:
+        cache = LRUCache()
+        token = make_token(expires_in=60)
+        service = JwtAuthService(token=token, public_key=public_key, claims_cache=cache)
+        service.is_authenticated()
+        [(_, claims)] = cache.entries.values()
+
+        later = JwtAuthService(
+            token=token,
+            public_key=public_key,
+            claims_cache=cache,
+            clock=lambda: claims["exp"] + 1,
+        )
+
+        with patch("jwt.decode", side_effect=jwt.ExpiredSignatureError) as decode:
+            assert later.is_authenticated() is False
+        decode.assert_called_once()
+
+    def test_invalid_tokens_are_not_cached(self, public_key) -> None:
+        cache = LRUCache()
+
+        JwtAuthService(
+            token="not-a-token", public_key=public_key, claims_cache=cache
+        ).is_authenticated()
+
+        assert len(cache.entries) == 0
+
+
+class TestLoadPublicKey:
+
+    def test_invalid_key_returns_none(self) -> None:
+        assert load_public_key("") is None
+
+    def test_service_without_key_rejects_tokens(self, make_token) -> None:
+        service = JwtAuthService(token=make_token())
+        service.public_key = None
+
+        assert service.is_authenticated() is False
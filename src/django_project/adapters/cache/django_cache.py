@@ -0,0 +1,57 @@
+import time
+from typing import Any
+
+from django.core.cache import caches
+
+from core._shared.application.ports.cache import Cache
+
+
+class DjangoCache(Cache):
+    """Cache stored in a Django cache alias.
+
+    Shared across workers when the alias points at a networked backend such
+    as Redis or Memcached in settings.CACHES.
+
+    Keys are versioned with a generation number stored under the prefix, so
+    clear() only retires this cache's entries, not the whole shared alias.
+    """
+
+    def __init__(self, alias: str = "default", prefix: str = "", ttl: float = 60.0):
+        self.alias: str = alias
+        self.prefix: str = prefix
+        self.ttl: float = ttl
+
+    def get(self, key: str) -> Any | None:
+        return caches[self.alias].get(self.prefix + key, version=self._generation())
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        caches[self.alias].set(
+            self.prefix + key,
+            value,
+            timeout=self.ttl if ttl is None else ttl,
+            version=self._generation(),
+        )
+
+    def delete(self, key: str) -> None:
+        caches[self.alias].delete(self.prefix + key, version=self._generation())
+
+    def clear(self) -> None:
+        try:
+            caches[self.alias].incr(self._generation_key)
+        except ValueError:
+            # Evicted: the next generation starts afresh from the clock.
+            self._generation()
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.prefix}generation"
+
+    def _generation(self) -> int:
+        cache = caches[self.alias]
+        generation: int | None = cache.get(self._generation_key)
+        if generation is None:
+            # Seeded from the clock so a generation lost to eviction is never
+            # reused, which would bring back entries cleared since.
+            cache.add(self._generation_key, time.time_ns(), timeout=None)
+            generation = cache.get(self._generation_key, time.time_ns())
+        return generation
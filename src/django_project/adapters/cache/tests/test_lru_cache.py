@@ -0,0 +1,92 @@
+from django.core.cache import caches
+
+from django_project.adapters.cache.django_cache import DjangoCache
+from django_project.adapters.cache.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+
+    def test_get_returns_stored_value(self) -> None:
+        cache = LRUCache()
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.set("key", "value")
+
+        clock.now = 9.9
+        assert cache.get("key") == "value"
+        clock.now = 10
+        assert cache.get("key") is None
+        assert "key" not in cache.entries
+
+    def test_delete_and_clear(self) -> None:
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert cache.get("b") is None
+
+
+class TestDjangoCache:
+
+    def test_round_trip_through_django_cache(self) -> None:
+        cache = DjangoCache(prefix="test:")
+        cache.set("key", {"name": "Movie"})
+
+        assert cache.get("key") == {"name": "Movie"}
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_clear_only_drops_its_own_entries(self) -> None:
+        categories = DjangoCache(prefix="test:category:")
+        genres = DjangoCache(prefix="test:genre:")
+        categories.set("key", "category")
+        genres.set("key", "genre")
+        caches["default"].set("unrelated", "kept")
+
+        categories.clear()
+
+        assert categories.get("key") is None
+        assert genres.get("key") == "genre"
+        assert caches["default"].get("unrelated") == "kept"
+        categories.set("key", "again")
+        assert categories.get("key") == "again"
+
+    def test_clear_survives_an_evicted_generation(self) -> None:
+        cache = DjangoCache(prefix="test:evicted:")
+        cache.set("key", "value")
+        caches["default"].delete("test:evicted:generation")
+
+        cache.clear()
+
+        assert cache.get("key") is None
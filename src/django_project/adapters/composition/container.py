@@ -1,43 +1,109 @@
+import functools
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from enum import Enum
+from typing import Any, Callable, Iterator, TypeVar
 
 from config import TMP_BUCKET
 
 from core._shared.application.ports.auth_service import AuthService
-from core._shared.application.ports.checksum_service import ChecksumService
+from core._shared.application.ports.cache import Cache
 from core._shared.application.ports.event_publisher import EventPublisher
 from core._shared.application.ports.storage_service import StorageService
+from core._shared.application.ports.unit_of_work import UnitOfWork
 from core.castmember.domain.castmember_repository import CastMemberRepository
+from core.category.application.use_cases.bulk_create_category import (
+    BulkCreateCategory,
+)
 from core.category.application.use_cases.create_category import CreateCategory
 from core.category.application.use_cases.delete_category import DeleteCategory
 from core.category.application.use_cases.get_category import GetCategory
 from core.category.application.use_cases.list_category import ListCategory
 from core.category.application.use_cases.update_category import UpdateCategory
 from core.category.domain.category_repository import CategoryRepository
+from core.castmember.application.use_cases.bulk_create_castmember import (
+    BulkCreateCastMember,
+)
 from core.castmember.application.use_cases.create_castmember import CreateCastMember
 from core.castmember.application.use_cases.delete_castmember import DeleteCastMember
 from core.castmember.application.use_cases.get_castmember import GetCastMember
 from core.castmember.application.use_cases.list_castmember import ListCastMember
 from core.castmember.application.use_cases.update_castmember import UpdateCastMember
+from core.genre.application.use_cases.bulk_create_genre import BulkCreateGenre
 from core.genre.application.use_cases.create_genre import CreateGenre
 from core.genre.application.use_cases.delete_genre import DeleteGenre
 from core.genre.application.use_cases.get_genre import GetGenre
 from core.genre.application.use_cases.list_genre import ListGenre
 from core.genre.application.use_cases.update_genre import UpdateGenre
 from core.genre.domain.genre_repository import GenreRepository
+from core.video.application.use_cases.bulk_process_audio_video_media import (
+    BulkProcessAudioVideoMedia,
+)
+from core.video.application.use_cases.collect_media_garbage import (
+    CollectMediaGarbage,
+)
+from core.video.application.use_cases.complete_media_upload import (
+    CompleteMediaUpload,
+)
 from core.video.application.use_cases.create_video_without_media import (
     CreateVideoWithoutMedia,
 )
+from core.video.application.use_cases.get_media_file import GetMediaFile
+from core.video.application.use_cases.get_media_upload import GetMediaUpload
 from core.video.application.use_cases.get_video import GetVideo
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.list_video import ListVideo
 from core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
+from core.video.application.use_cases.upload_media_chunk import UploadMediaChunk
 from core.video.application.use_cases.upload_video import UploadVideo
+from core.video.domain.media_upload_repository import MediaUploadRepository
 from core.video.domain.video_repository import VideoRepository
+from django_project.adapters.auth.jwks_key_resolver import JwksKeyResolver
 from django_project.adapters.auth.jwt_auth_service import JwtAuthService
+from django_project.adapters.cache.django_cache import DjangoCache
+from django_project.adapters.cache.lru_cache import LRUCache
+from django_project.adapters.messaging.async_message_bus import AsyncMessageBus
+from django_project.adapters.messaging.deduplication_store import (
+    DeduplicationStore,
+    NullDeduplicationStore,
+)
+from django_project.adapters.messaging.django_deduplication_store import (
+    DjangoDeduplicationStore,
+)
+from django_project.adapters.messaging.in_memory_deduplication_store import (
+    InMemoryDeduplicationStore,
+)
+from django_project.adapters.messaging.in_memory_publisher import InMemoryPublisher
 from django_project.adapters.messaging.message_bus import MessageBus
+from django_project.adapters.messaging.message_publisher import MessagePublisher
+from django_project.adapters.messaging.on_commit_event_publisher import (
+    OnCommitEventPublisher,
+)
+from django_project.adapters.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from django_project.adapters.messaging.outbox_relay import OutboxRelay
+from django_project.adapters.messaging.rabbitmq_dispatcher import (
+    RabbitMQEventDispatcher,
+)
+from django_project.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
+from django_project.adapters.messaging.video_converted_batch_consumer import (
+    VideoConvertedBatchConsumer,
+)
 from django_project.adapters.messaging.video_converted_consumer import (
     VideoConvertedRabbitMQConsumer,
 )
+from django_project.adapters.persistence.cached.cached_repository import (
+    CachedRepository,
+    CacheStats,
+)
 from django_project.adapters.persistence.django.castmember_repository import (
     DjangoORMCastMemberRepository,
 )
@@ -47,128 +113,464 @@ from django_project.adapters.persistence.django.category_repository import (
 from django_project.adapters.persistence.django.genre_repository import (
     DjangoORMGenreRepository,
 )
+from django_project.adapters.persistence.django.media_upload_repository import (
+    DjangoORMMediaUploadRepository,
+)
+from django_project.adapters.persistence.django.unit_of_work import DjangoUnitOfWork
 from django_project.adapters.persistence.django.video_repository import (
     DjangoORMVideoRepository,
 )
-from django_project.adapters.storage.file_checksum_service import FileChecksumService
 from django_project.adapters.storage.local_storage import LocalStorage
 
 
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class Lifetime(Enum):
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
+
+
+_request_scope: ContextVar[dict[str, Any] | None] = ContextVar(
+    "container_request_scope", default=None
+)
+
+
+def provide(lifetime: Lifetime) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Cache a Container factory method according to its lifetime.
+
+    REQUEST instances live until the enclosing request_scope() exits and
+    are built fresh for every call outside of one.
+    """
+
+    def decorator(factory: Callable[["Container"], T]) -> Callable[..., T]:
+        name: str = factory.__name__
+
+        @functools.wraps(factory)
+        def provider(self: "Container") -> T:
+            if lifetime is Lifetime.SINGLETON:
+                return self.singleton(name, lambda: factory(self))
+            scope: dict[str, Any] | None = _request_scope.get()
+            if lifetime is Lifetime.TRANSIENT or scope is None:
+                return factory(self)
+            if name not in scope:
+                scope[name] = factory(self)
+            return scope[name]
+
+        provider.lifetime = lifetime
+        return provider
+
+    return decorator
+
+
 class Container:
+    def __init__(self) -> None:
+        self.singletons: dict[str, Any] = {}
+        # Reentrant: singleton factories resolve the singletons they depend on.
+        self.lock = threading.RLock()
+        self.entity_caches: dict[str, Cache] = {}
+        self.cache_stats: dict[str, CacheStats] = {}
+        self.token_claims_cache: Cache = LRUCache(
+            maxsize=int(os.getenv("JWT_CLAIMS_CACHE_MAXSIZE", "4096")),
+            ttl=float(os.getenv("JWT_CLAIMS_CACHE_TTL", "300")),
+        )
+        jwks_source: str = os.getenv("AUTH_JWKS_SOURCE", "")
+        self.jwks_key_resolver: JwksKeyResolver | None = (
+            JwksKeyResolver(
+                source=jwks_source,
+                min_refresh_interval=float(
+                    os.getenv("AUTH_JWKS_MIN_REFRESH_INTERVAL", "60")
+                ),
+            )
+            if jwks_source
+            else None
+        )
+
+    def singleton(self, name: str, factory: Callable[[], T]) -> T:
+        instance: Any = self.singletons.get(name, _MISSING)
+        if instance is _MISSING:
+            with self.lock:
+                instance = self.singletons.get(name, _MISSING)
+                if instance is _MISSING:
+                    instance = self.singletons[name] = factory()
+        return instance
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        token = _request_scope.set({})
+        try:
+            yield
+        finally:
+            _request_scope.reset(token)
+
+    def entity_cache(self, namespace: str) -> Cache:
+        with self.lock:
+            if namespace not in self.entity_caches:
+                self.entity_caches[namespace] = self._build_entity_cache(namespace)
+            return self.entity_caches[namespace]
+
+    def _build_entity_cache(self, namespace: str) -> Cache:
+        ttl: float = float(os.getenv("ENTITY_CACHE_TTL", "60"))
+        if os.getenv("ENTITY_CACHE_BACKEND", "memory") == "django":
+            return DjangoCache(
+                alias=os.getenv("ENTITY_CACHE_ALIAS", "default"),
+                prefix=f"entities:{namespace}:",
+                ttl=ttl,
+            )
+        return LRUCache(
+            maxsize=int(os.getenv("ENTITY_CACHE_MAXSIZE", "1024")), ttl=ttl
+        )
+
+    def clear_caches(self) -> None:
+        for cache in self.entity_caches.values():
+            cache.clear()
+        self.token_claims_cache.clear()
+
+    @provide(Lifetime.SINGLETON)
     def category_repository(self) -> CategoryRepository:
-        return DjangoORMCategoryRepository()
+        return CachedRepository(
+            repository=DjangoORMCategoryRepository(),
+            cache=self.entity_cache("category"),
+            namespace="category",
+            stats=self.cache_stats.setdefault("category", CacheStats()),
+            # Genres keep the ids of their categories.
+            dependents=(self.entity_cache("genre"),),
+        )
 
+    @provide(Lifetime.SINGLETON)
     def genre_repository(self) -> GenreRepository:
-        return DjangoORMGenreRepository()
+        return CachedRepository(
+            repository=DjangoORMGenreRepository(),
+            cache=self.entity_cache("genre"),
+            namespace="genre",
+            stats=self.cache_stats.setdefault("genre", CacheStats()),
+        )
 
+    @provide(Lifetime.SINGLETON)
     def castmember_repository(self) -> CastMemberRepository:
-        return DjangoORMCastMemberRepository()
+        return CachedRepository(
+            repository=DjangoORMCastMemberRepository(),
+            cache=self.entity_cache("castmember"),
+            namespace="castmember",
+            stats=self.cache_stats.setdefault("castmember", CacheStats()),
+        )
 
+    @provide(Lifetime.REQUEST)
     def video_repository(self) -> VideoRepository:
         return DjangoORMVideoRepository()
 
+    @provide(Lifetime.SINGLETON)
+    def media_upload_repository(self) -> MediaUploadRepository:
+        return DjangoORMMediaUploadRepository()
+
+    @provide(Lifetime.SINGLETON)
     def storage_service(self) -> StorageService:
         return LocalStorage(bucket=TMP_BUCKET)
 
-    def checksum_service(self) -> ChecksumService:
-        return FileChecksumService()
+    @provide(Lifetime.SINGLETON)
+    def message_publisher(self) -> MessagePublisher:
+        if os.getenv("MESSAGE_PUBLISHER", "rabbitmq") == "memory":
+            return InMemoryPublisher()
+        return RabbitMQPublisher(
+            host=os.getenv("RABBITMQ_HOST", "localhost"),
+            pool_size=int(os.getenv("RABBITMQ_PUBLISHER_POOL_SIZE", "4")),
+            confirm_delivery=os.getenv("RABBITMQ_CONFIRM_DELIVERY", "true") == "true",
+        )
+
+    @provide(Lifetime.SINGLETON)
+    def batch_message_publisher(self) -> MessagePublisher:
+        """Settles a whole batch with one broker round trip where
+        message_publisher waits for each message's confirm."""
+        confirm: bool = os.getenv("RABBITMQ_CONFIRM_DELIVERY", "true") == "true"
+        if os.getenv("MESSAGE_PUBLISHER", "rabbitmq") == "memory" or not confirm:
+            return self.message_publisher()
+        return RabbitMQPublisher(
+            host=os.getenv("RABBITMQ_HOST", "localhost"),
+            pool_size=int(os.getenv("RABBITMQ_PUBLISHER_POOL_SIZE", "4")),
+            transactional=True,
+        )
 
+    @provide(Lifetime.SINGLETON)
+    def message_bus(self) -> MessageBus:
+        return MessageBus(
+            event_dispatcher=RabbitMQEventDispatcher(
+                queue="videos.new", publisher=self.message_publisher()
+            )
+        )
+
+    @provide(Lifetime.SINGLETON)
+    def batch_message_bus(self) -> MessageBus:
+        return MessageBus(
+            event_dispatcher=RabbitMQEventDispatcher(
+                queue="videos.new", publisher=self.batch_message_publisher()
+            )
+        )
+
+    @provide(Lifetime.SINGLETON)
     def event_publisher(self) -> EventPublisher:
-        return MessageBus()
+        mode: str = os.getenv("EVENT_PUBLISHER", "outbox")
+        if mode == "direct":
+            return OnCommitEventPublisher(self.message_bus())
+        if mode == "async":
+            return OnCommitEventPublisher(
+                AsyncMessageBus(
+                    message_bus=self.batch_message_bus(),
+                    maxsize=int(os.getenv("EVENT_QUEUE_MAXSIZE", "10000")),
+                    max_batch=int(os.getenv("EVENT_QUEUE_MAX_BATCH", "100")),
+                )
+            )
+        return OutboxEventPublisher()
+
+    @provide(Lifetime.SINGLETON)
+    def unit_of_work(self) -> UnitOfWork:
+        return DjangoUnitOfWork()
+
+    @provide(Lifetime.TRANSIENT)
+    def outbox_relay(self) -> OutboxRelay:
+        return OutboxRelay(
+            publisher=RabbitMQPublisher(
+                host=os.getenv("RABBITMQ_HOST", "localhost"),
+                pool_size=1,
+                transactional=True,
+            ),
+            batch_size=int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "100")),
+        )
 
     def auth_service(self, token: str = "") -> AuthService:
-        return JwtAuthService(token=token)
+        return JwtAuthService(
+            token=token,
+            claims_cache=self.token_claims_cache,
+            key_resolver=self.jwks_key_resolver,
+        )
 
+    @provide(Lifetime.SINGLETON)
     def list_category(self) -> ListCategory:
         return ListCategory(repository=self.category_repository())
 
+    @provide(Lifetime.SINGLETON)
     def create_category(self) -> CreateCategory:
         return CreateCategory(repository=self.category_repository())
 
+    @provide(Lifetime.SINGLETON)
+    def bulk_create_category(self) -> BulkCreateCategory:
+        return BulkCreateCategory(repository=self.category_repository())
+
+    @provide(Lifetime.SINGLETON)
     def get_category(self) -> GetCategory:
         return GetCategory(repository=self.category_repository())
 
+    @provide(Lifetime.SINGLETON)
     def update_category(self) -> UpdateCategory:
         return UpdateCategory(repository=self.category_repository())
 
+    @provide(Lifetime.SINGLETON)
     def delete_category(self) -> DeleteCategory:
         return DeleteCategory(repository=self.category_repository())
 
+    @provide(Lifetime.SINGLETON)
     def list_genre(self) -> ListGenre:
         return ListGenre(repository=self.genre_repository())
 
+    @provide(Lifetime.SINGLETON)
     def create_genre(self) -> CreateGenre:
         return CreateGenre(
             genre_repository=self.genre_repository(),
             category_repository=self.category_repository(),
         )
 
+    @provide(Lifetime.SINGLETON)
+    def bulk_create_genre(self) -> BulkCreateGenre:
+        return BulkCreateGenre(
+            genre_repository=self.genre_repository(),
+            category_repository=self.category_repository(),
+        )
+
+    @provide(Lifetime.SINGLETON)
     def get_genre(self) -> GetGenre:
         return GetGenre(repository=self.genre_repository())
 
+    @provide(Lifetime.SINGLETON)
     def update_genre(self) -> UpdateGenre:
         return UpdateGenre(
             genre_repository=self.genre_repository(),
             category_repository=self.category_repository(),
         )
 
+    @provide(Lifetime.SINGLETON)
     def delete_genre(self) -> DeleteGenre:
         return DeleteGenre(repository=self.genre_repository())
 
+    @provide(Lifetime.SINGLETON)
     def list_castmember(self) -> ListCastMember:
         return ListCastMember(repository=self.castmember_repository())
 
+    @provide(Lifetime.SINGLETON)
     def create_castmember(self) -> CreateCastMember:
         return CreateCastMember(castmember_repository=self.castmember_repository())
 
+    @provide(Lifetime.SINGLETON)
+    def bulk_create_castmember(self) -> BulkCreateCastMember:
+        return BulkCreateCastMember(
+            castmember_repository=self.castmember_repository()
+        )
+
+    @provide(Lifetime.SINGLETON)
     def get_castmember(self) -> GetCastMember:
         return GetCastMember(castmember_repository=self.castmember_repository())
 
+    @provide(Lifetime.SINGLETON)
     def update_castmember(self) -> UpdateCastMember:
         return UpdateCastMember(castmember_repository=self.castmember_repository())
 
+    @provide(Lifetime.SINGLETON)
     def delete_castmember(self) -> DeleteCastMember:
         return DeleteCastMember(castmember_repository=self.castmember_repository())
 
+    @provide(Lifetime.REQUEST)
     def create_video_without_media(self) -> CreateVideoWithoutMedia:
-        return CreateVideoWithoutMedia(
-            video_repository=self.video_repository(),
-            category_repository=self.category_repository(),
-            genre_repository=self.genre_repository(),
-            cast_member_repository=self.castmember_repository(),
-        )
+        return CreateVideoWithoutMedia(video_repository=self.video_repository())
 
+    @provide(Lifetime.REQUEST)
     def get_video(self) -> GetVideo:
         return GetVideo(video_repository=self.video_repository())
 
+    @provide(Lifetime.REQUEST)
+    def get_media_file(self) -> GetMediaFile:
+        return GetMediaFile(
+            video_repository=self.video_repository(),
+            storage_service=self.storage_service(),
+        )
+
+    @provide(Lifetime.REQUEST)
+    def list_video(self) -> ListVideo:
+        return ListVideo(repository=self.video_repository())
+
+    @provide(Lifetime.REQUEST)
     def upload_video(self) -> UploadVideo:
         return UploadVideo(
             video_repository=self.video_repository(),
             storage_service=self.storage_service(),
             event_publisher=self.event_publisher(),
-            checksum_service=self.checksum_service(),
-            storage_base_path=TMP_BUCKET,
+            unit_of_work=self.unit_of_work(),
+            content_addressed=os.getenv("MEDIA_CONTENT_ADDRESSED", "false") == "true",
         )
 
+    @provide(Lifetime.REQUEST)
+    def collect_media_garbage(self) -> CollectMediaGarbage:
+        return CollectMediaGarbage(
+            video_repository=self.video_repository(),
+            upload_repository=self.media_upload_repository(),
+            storage_service=self.storage_service(),
+        )
+
+    @provide(Lifetime.REQUEST)
+    def initiate_media_upload(self) -> InitiateMediaUpload:
+        return InitiateMediaUpload(
+            video_repository=self.video_repository(),
+            upload_repository=self.media_upload_repository(),
+            storage_service=self.storage_service(),
+            chunk_size=int(os.getenv("UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024))),
+        )
+
+    @provide(Lifetime.SINGLETON)
+    def upload_media_chunk(self) -> UploadMediaChunk:
+        return UploadMediaChunk(
+            upload_repository=self.media_upload_repository(),
+            storage_service=self.storage_service(),
+            unit_of_work=self.unit_of_work(),
+        )
+
+    @provide(Lifetime.SINGLETON)
+    def get_media_upload(self) -> GetMediaUpload:
+        return GetMediaUpload(upload_repository=self.media_upload_repository())
+
+    @provide(Lifetime.REQUEST)
+    def complete_media_upload(self) -> CompleteMediaUpload:
+        return CompleteMediaUpload(
+            upload_repository=self.media_upload_repository(),
+            upload_video=self.upload_video(),
+            storage_service=self.storage_service(),
+            unit_of_work=self.unit_of_work(),
+        )
+
+    @provide(Lifetime.REQUEST)
     def process_audio_video_media(self) -> ProcessAudioVideoMedia:
         return ProcessAudioVideoMedia(
             video_repository=self.video_repository(),
             event_publisher=self.event_publisher(),
+            unit_of_work=self.unit_of_work(),
         )
 
-    def video_converted_consumer(self) -> VideoConvertedRabbitMQConsumer:
+    @provide(Lifetime.REQUEST)
+    def bulk_process_audio_video_media(self) -> BulkProcessAudioVideoMedia:
+        return BulkProcessAudioVideoMedia(
+            video_repository=self.video_repository(),
+            event_publisher=self.event_publisher(),
+            unit_of_work=self.unit_of_work(),
+        )
+
+    @provide(Lifetime.SINGLETON)
+    def deduplication_store(self) -> DeduplicationStore:
+        backend: str = os.getenv("CONSUMER_DEDUP_BACKEND", "django")
+        if backend == "none":
+            return NullDeduplicationStore()
+        ttl = timedelta(hours=float(os.getenv("CONSUMER_DEDUP_TTL_HOURS", "24")))
+        cache: Cache = LRUCache(
+            maxsize=int(os.getenv("CONSUMER_DEDUP_CACHE_MAXSIZE", "10000")),
+            ttl=ttl.total_seconds(),
+        )
+        if backend == "memory":
+            return InMemoryDeduplicationStore(cache=cache)
+        return DjangoDeduplicationStore(ttl=ttl, cache=cache)
+
+    @provide(Lifetime.TRANSIENT)
+    def video_converted_consumer(
+        self,
+    ) -> VideoConvertedRabbitMQConsumer | VideoConvertedBatchConsumer:
+        host: str = os.getenv("RABBITMQ_HOST", "localhost")
+        queue: str = os.getenv("VIDEOS_CONVERTED_QUEUE", "videos.converted")
+        batch_size: int = int(os.getenv("CONSUMER_BATCH_SIZE", "0"))
+        max_retries: int = int(os.getenv("CONSUMER_MAX_RETRIES", "5"))
+        retry_delay: float = int(os.getenv("CONSUMER_RETRY_DELAY_MS", "5000")) / 1000
+        purge_interval: float = 60 * float(
+            os.getenv("CONSUMER_DEDUP_PURGE_MINUTES", "60")
+        )
+        if batch_size > 0:
+            return VideoConvertedBatchConsumer(
+                use_case=self.bulk_process_audio_video_media(),
+                host=host,
+                queue=queue,
+                batch_size=batch_size,
+                max_wait=int(os.getenv("CONSUMER_BATCH_MAX_WAIT_MS", "200")) / 1000,
+                deduplication_store=self.deduplication_store(),
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                purge_interval=purge_interval,
+            )
         return VideoConvertedRabbitMQConsumer(
             use_case=self.process_audio_video_media(),
-            host=os.getenv("RABBITMQ_HOST", "localhost"),
-            queue=os.getenv("VIDEOS_CONVERTED_QUEUE", "videos.converted"),
+            host=host,
+            queue=queue,
+            prefetch_count=int(os.getenv("CONSUMER_PREFETCH_COUNT", "16")),
+            workers=int(os.getenv("CONSUMER_WORKERS", "4")),
+            deduplication_store=self.deduplication_store(),
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            purge_interval=purge_interval,
         )
 
 
 _container: Container | None = None
+_container_lock = threading.Lock()
 
 
 def get_container() -> Container:
     global _container
     if _container is None:
-        _container = Container()
+        with _container_lock:
+            if _container is None:
+                _container = Container()
     return _container
@@ -0,0 +1,16 @@
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from django_project.adapters.composition.container import get_container
+
+
+class ContainerRequestScopeMiddleware:
+    """Opens the container's request scope around every request."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with get_container().request_scope():
+            return self.get_response(request)
@@ -0,0 +1,151 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_project.adapters.composition.container import (
+    Container,
+    Lifetime,
+    provide,
+)
+from django_project.adapters.composition.middleware import (
+    ContainerRequestScopeMiddleware,
+)
+from django_project.adapters.messaging.video_converted_batch_consumer import (
+    VideoConvertedBatchConsumer,
+)
+from django_project.adapters.messaging.video_converted_consumer import (
+    VideoConvertedRabbitMQConsumer,
+)
+
+
+class TestSingletonLifetime:
+
+    def test_returns_the_same_instance(self) -> None:
+        container = Container()
+
+        assert container.list_category() is container.list_category()
+        assert container.category_repository() is container.category_repository()
+
+    def test_concurrent_first_calls_build_one_instance(self) -> None:
+        built: list[object] = []
+        barrier = threading.Barrier(8)
+
+        class SlowContainer(Container):
+            @provide(Lifetime.SINGLETON)
+            def resource(self) -> object:
+                built.append(object())
+                return built[-1]
+
+        container = SlowContainer()
+
+        def resolve(_: int) -> object:
+            barrier.wait()
+            return container.resource()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = set(map(id, executor.map(resolve, range(8))))
+
+        assert len(built) == 1
+        assert len(instances) == 1
+
+
+class TestRequestLifetime:
+
+    def test_shared_within_a_request_scope(self) -> None:
+        container = Container()
+
+        with container.request_scope():
+            first = container.video_repository()
+            assert container.video_repository() is first
+            assert container.get_video().repository is first
+
+        with container.request_scope():
+            assert container.video_repository() is not first
+
+    def test_built_per_call_outside_a_request_scope(self) -> None:
+        container = Container()
+
+        assert container.video_repository() is not container.video_repository()
+
+
+class TestTransientLifetime:
+
+    def test_built_per_call_inside_a_request_scope(self) -> None:
+        container = Container()
+
+        with container.request_scope():
+            assert (
+                container.video_converted_consumer()
+                is not container.video_converted_consumer()
+            )
+
+
+class TestContainerRequestScopeMiddleware:
+
+    def test_each_request_gets_its_own_scope(self) -> None:
+        container = Container()
+        seen: list[object] = []
+
+        def view(request) -> HttpResponse:
+            seen.append(container.video_repository())
+            seen.append(container.video_repository())
+            return HttpResponse()
+
+        middleware = ContainerRequestScopeMiddleware(view)
+        middleware(RequestFactory().get("/"))
+        middleware(RequestFactory().get("/"))
+
+        assert seen[0] is seen[1]
+        assert seen[1] is not seen[2]
+
+
+class TestVideoConvertedConsumer:
+
+    def test_processes_messages_one_by_one_by_default(self, monkeypatch) -> None:
+        monkeypatch.delenv("CONSUMER_BATCH_SIZE", raising=False)
+
+        consumer = Container().video_converted_consumer()
+
+        assert isinstance(consumer, VideoConvertedRabbitMQConsumer)
+
+    def test_batches_messages_when_a_batch_size_is_set(self, monkeypatch) -> None:
+        monkeypatch.setenv("CONSUMER_BATCH_SIZE", "250")
+        monkeypatch.setenv("CONSUMER_BATCH_MAX_WAIT_MS", "50")
+
+        consumer = Container().video_converted_consumer()
+
+        assert isinstance(consumer, VideoConvertedBatchConsumer)
+        assert consumer.batch_size == 250
+        assert consumer.max_wait == 0.05
+
+
+class TestEventPublisher:
+
+    def test_async_bus_sends_batches_in_one_transaction(self, monkeypatch) -> None:
+        monkeypatch.setenv("EVENT_PUBLISHER", "async")
+        monkeypatch.setenv("MESSAGE_PUBLISHER", "rabbitmq")
+        monkeypatch.delenv("RABBITMQ_CONFIRM_DELIVERY", raising=False)
+        container = Container()
+
+        async_bus = container.event_publisher().publisher
+
+        assert async_bus.message_bus is container.batch_message_bus()
+        assert all(
+            channel.transactional
+            for channel in container.batch_message_publisher().pool.queue
+        )
+        assert not any(
+            channel.transactional
+            for channel in container.message_publisher().pool.queue
+        )
+
+    def test_batches_stay_unconfirmed_when_delivery_is_not_confirmed(
+        self, monkeypatch
+    ) -> None:
+        monkeypatch.setenv("MESSAGE_PUBLISHER", "rabbitmq")
+        monkeypatch.setenv("RABBITMQ_CONFIRM_DELIVERY", "false")
+        container = Container()
+
+        assert container.batch_message_publisher() is container.message_publisher()
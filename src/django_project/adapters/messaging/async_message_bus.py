@@ -0,0 +1,210 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from enum import Enum
+from queue import Empty, Full, Queue
+from typing import Callable
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.events.event import Event
+from django_project.adapters.messaging.message_bus import MessageBus
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class QueueFullFallback(Enum):
+    PUBLISH_INLINE = "inline"
+    DROP = "drop"
+
+
+@dataclass
+class PublishMetrics:
+    queue_depth: int = 0
+    enqueued: int = 0
+    published: int = 0
+    failed: int = 0
+    published_inline: int = 0
+    dropped: int = 0
+    batches: int = 0
+    publish_seconds_total: float = 0.0
+    publish_seconds_max: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+
+
+class AsyncMessageBus(EventPublisher):
+    """Publishes events from a background thread, off the caller's thread.
+
+    publish() only enqueues. The worker drains up to max_batch events, or
+    whatever arrived within max_wait, and delivers them through the wrapped
+    MessageBus in one call. When the queue is full, callers wait up to
+    put_timeout (backpressure) and then apply the fallback.
+    """
+
+    def __init__(
+        self,
+        message_bus: MessageBus,
+        maxsize: int = 10_000,
+        max_batch: int = 100,
+        max_wait: float = 0.05,
+        put_timeout: float = 0.1,
+        fallback: QueueFullFallback = QueueFullFallback.PUBLISH_INLINE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.message_bus: MessageBus = message_bus
+        self.max_batch: int = max_batch
+        self.max_wait: float = max_wait
+        self.put_timeout: float = put_timeout
+        self.fallback: QueueFullFallback = fallback
+        self.clock: Callable[[], float] = clock
+        self.queue: Queue = Queue(maxsize=maxsize)
+        self.metrics: PublishMetrics = PublishMetrics()
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+        self.pending: int = 0
+        self.closed: bool = False
+        self.worker: threading.Thread | None = None
+        self.worker_pid: int | None = None
+        self.exit_hook_registered: bool = False
+
+    def publish(self, events: list[Event]) -> None:
+        if self.closed:
+            self._publish_inline(events)
+            return
+
+        self._ensure_worker()
+        for index, event in enumerate(events):
+            with self.lock:
+                self.pending += 1
+            try:
+                self.queue.put((self.clock(), event), timeout=self.put_timeout)
+            except Full:
+                self._settle(1)
+                self._on_full(events[index:])
+                return
+            with self.lock:
+                self.metrics.enqueued += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until every enqueued event was handled; False on timeout."""
+        with self.idle:
+            return self.idle.wait_for(lambda: self.pending == 0, timeout=timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stops accepting events and delivers everything already enqueued,
+        waiting at most timeout for the worker."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+        if self.worker is None or not self.worker.is_alive():
+            return
+        started: float = time.monotonic()
+        try:
+            # A full queue behind a stuck broker must not hang shutdown.
+            self.queue.put(_STOP, timeout=timeout)
+        except Full:
+            logger.warning(
+                "Event queue still full on close, %d events undelivered",
+                self.queue.qsize(),
+            )
+            return
+        self.worker.join(
+            None if timeout is None else max(timeout - (time.monotonic() - started), 0)
+        )
+
+    def snapshot(self) -> PublishMetrics:
+        with self.lock:
+            return replace(self.metrics, queue_depth=self.queue.qsize())
+
+    def _ensure_worker(self) -> None:
+        # Threads do not survive fork(); pre-forking servers need a new worker.
+        if self.worker is not None and self.worker_pid == os.getpid():
+            return
+        with self.lock:
+            if self.worker is not None and self.worker_pid == os.getpid():
+                return
+            self.worker = threading.Thread(
+                target=self._run, name="async-message-bus", daemon=True
+            )
+            self.worker_pid = os.getpid()
+            self.worker.start()
+            # Forked children inherit the hook, so once is enough.
+            if not self.exit_hook_registered:
+                atexit.register(self.close)
+                self.exit_hook_registered = True
+
+    def _run(self) -> None:
+        stopping: bool = False
+        while not stopping:
+            batch: list[tuple[float, Event]] = []
+            item = self.queue.get()
+            deadline: float = self.clock() + self.max_wait
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(deadline - self.clock(), 0))
+                except Empty:
+                    break
+            if batch:
+                self._deliver(batch)
+
+        # Events that raced with close() are still delivered, on this thread.
+        leftovers: list[tuple[float, Event]] = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except Empty:
+                break
+            if item is not _STOP:
+                leftovers.append(item)
+        if leftovers:
+            self._deliver(leftovers)
+
+    def _deliver(self, batch: list[tuple[float, Event]]) -> None:
+        started: float = self.clock()
+        failed: int = self.message_bus.deliver([event for _, event in batch])
+        elapsed: float = self.clock() - started
+
+        with self.lock:
+            self.metrics.batches += 1
+            self.metrics.published += len(batch) - failed
+            self.metrics.failed += failed
+            self.metrics.publish_seconds_total += elapsed
+            self.metrics.publish_seconds_max = max(
+                self.metrics.publish_seconds_max, elapsed
+            )
+            self.metrics.queue_wait_seconds_max = max(
+                self.metrics.queue_wait_seconds_max,
+                started - min(enqueued_at for enqueued_at, _ in batch),
+            )
+        self._settle(len(batch))
+
+    def _on_full(self, events: list[Event]) -> None:
+        if self.fallback is QueueFullFallback.DROP:
+            logger.warning("Event queue full, dropping %d events", len(events))
+            with self.lock:
+                self.metrics.dropped += len(events)
+            return
+        self._publish_inline(events)
+
+    def _publish_inline(self, events: list[Event]) -> None:
+        failed: int = self.message_bus.deliver(events)
+        with self.lock:
+            self.metrics.published_inline += len(events) - failed
+            self.metrics.failed += failed
+
+    def _settle(self, count: int) -> None:
+        with self.idle:
+            self.pending -= count
+            if self.pending == 0:
+                self.idle.notify_all()
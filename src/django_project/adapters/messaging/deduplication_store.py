@@ -0,0 +1,43 @@
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+
+
+def message_key(item: ProcessAudioVideoMedia.Input) -> str:
+    """Identifies an encoder result by (resource_id, status, encoded_location)."""
+    identity: str = "\x1f".join(
+        (
+            f"{item.video_id}.{item.media_type}",
+            str(item.status),
+            item.encoded_location,
+        )
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class DeduplicationStore(ABC):
+    @abstractmethod
+    def seen(self, keys: Iterable[str]) -> set[str]:
+        """The subset of keys already processed."""
+
+    @abstractmethod
+    def mark(self, keys: Iterable[str]) -> None: ...
+
+    def purge_expired(self) -> int:
+        """Deletes the keys past their TTL and returns how many. Stores whose
+        keys expire on their own have nothing to do."""
+        return 0
+
+
+class NullDeduplicationStore(DeduplicationStore):
+    """Treats every message as new."""
+
+    def seen(self, keys: Iterable[str]) -> set[str]:
+        return set()
+
+    def mark(self, keys: Iterable[str]) -> None:
+        pass
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from django.utils import timezone
+
+from config import BULK_BATCH_SIZE
+from core._shared.application.ports.cache import Cache
+from django_project.adapters.messaging.deduplication_store import DeduplicationStore
+from django_project.inbox_app.models import ProcessedMessage
+
+
+class DjangoDeduplicationStore(DeduplicationStore):
+    """Processed keys in the inbox_processed_message table, kept for ttl.
+
+    An optional cache in front answers repeated keys without a query; the
+    table covers restarts and the other consumer processes.
+    """
+
+    def __init__(self, ttl: timedelta, cache: Cache | None = None) -> None:
+        self.ttl: timedelta = ttl
+        self.cache: Cache | None = cache
+
+    def seen(self, keys: Iterable[str]) -> set[str]:
+        keys = set(keys)
+        found: set[str] = (
+            {key for key in keys if self.cache.get(key) is not None}
+            if self.cache is not None
+            else set()
+        )
+        missing: set[str] = keys - found
+        if missing:
+            now: datetime = timezone.now()
+            for key, processed_at in ProcessedMessage.objects.filter(
+                key__in=missing, processed_at__gt=now - self.ttl
+            ).values_list("key", "processed_at"):
+                self._remember(key, processed_at + self.ttl - now)
+                found.add(key)
+        return found
+
+    def mark(self, keys: Iterable[str]) -> None:
+        keys = set(keys)
+        if not keys:
+            return
+        now: datetime = timezone.now()
+        # Refreshes processed_at for keys whose earlier row already expired.
+        ProcessedMessage.objects.bulk_create(
+            [ProcessedMessage(key=key, processed_at=now) for key in keys],
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["key"],
+            update_fields=["processed_at"],
+        )
+        for key in keys:
+            self._remember(key, self.ttl)
+
+    def purge_expired(self) -> int:
+        deleted, _ = ProcessedMessage.objects.filter(
+            processed_at__lte=timezone.now() - self.ttl
+        ).delete()
+        return deleted
+
+    def _remember(self, key: str, ttl: timedelta) -> None:
+        if self.cache is not None:
+            self.cache.set(key, True, ttl=ttl.total_seconds())
@@ -0,0 +1,216 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from queue import Empty, SimpleQueue
+from typing import Callable
+
+from pika import BasicProperties
+
+
+@dataclass(frozen=True)
+class Delivery:
+    delivery_tag: int
+    redelivered: bool = False
+
+
+class InMemoryBroker:
+    """Local stand-in for RabbitMQ, covering the subset of pika's blocking
+    API the consumers use: QoS, manual acks, publishing with headers, timers,
+    add_callback_threadsafe, and queues declared with a message TTL that
+    dead-letter to another queue.
+
+    With stop_when_drained, start_consuming returns once the queues are
+    empty and every delivery was settled, which is what benchmarks need.
+    """
+
+    def __init__(self, stop_when_drained: bool = False) -> None:
+        self.stop_when_drained: bool = stop_when_drained
+        self.queues: dict[str, deque[tuple[bytes, bool, BasicProperties]]] = {}
+        self.acked: list[bytes] = []
+        self.rejected: list[bytes] = []
+        # Queue to (TTL in seconds, queue its expired messages move to).
+        self.dead_letter_routes: dict[str, tuple[float, str]] = {}
+        self.expiries: dict[str, deque[float]] = {}
+        self.lock = threading.Lock()
+
+    def publish(
+        self, queue: str, body: bytes, properties: BasicProperties | None = None
+    ) -> None:
+        with self.lock:
+            self.queues.setdefault(queue, deque()).append(
+                (body, False, properties or BasicProperties())
+            )
+            if queue in self.dead_letter_routes:
+                ttl, _ = self.dead_letter_routes[queue]
+                self.expiries[queue].append(time.monotonic() + ttl)
+
+    def expire(self) -> bool:
+        """Dead-letters the messages whose TTL ran out and returns whether
+        any are still waiting for theirs."""
+        now: float = time.monotonic()
+        with self.lock:
+            for queue, (_, target) in self.dead_letter_routes.items():
+                expiries: deque[float] = self.expiries[queue]
+                while expiries and expiries[0] <= now:
+                    expiries.popleft()
+                    body, _, properties = self.queues[queue].popleft()
+                    self.queues.setdefault(target, deque()).append(
+                        (body, False, properties)
+                    )
+            return any(self.expiries.values())
+
+    def messages(self, queue: str) -> list[bytes]:
+        with self.lock:
+            return [body for body, _, _ in self.queues.get(queue, ())]
+
+    def connect(self) -> "InMemoryConnection":
+        return InMemoryConnection(self)
+
+
+class InMemoryConnection:
+    def __init__(self, broker: InMemoryBroker) -> None:
+        self.broker: InMemoryBroker = broker
+        self.callbacks: SimpleQueue[Callable[[], None]] = SimpleQueue()
+        self.timers: list[tuple[float, int, Callable[[], None]]] = []
+        self.timer_ids = itertools.count()
+        self.is_open: bool = True
+
+    def channel(self) -> "InMemoryChannel":
+        return InMemoryChannel(self)
+
+    def add_callback_threadsafe(self, callback: Callable[[], None]) -> None:
+        self.callbacks.put(callback)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> int:
+        timer_id: int = next(self.timer_ids)
+        heapq.heappush(self.timers, (time.monotonic() + delay, timer_id, callback))
+        return timer_id
+
+    def remove_timeout(self, timer_id: int) -> None:
+        self.timers = [timer for timer in self.timers if timer[1] != timer_id]
+        heapq.heapify(self.timers)
+
+    def process_data_events(self, time_limit: float = 0) -> None:
+        """Runs queued callbacks, waiting up to time_limit for the first one,
+        then any timers that are due."""
+        try:
+            callback: Callable[[], None] | None = (
+                self.callbacks.get(timeout=time_limit)
+                if time_limit
+                else self.callbacks.get_nowait()
+            )
+        except Empty:
+            callback = None
+        while callback is not None:
+            callback()
+            try:
+                callback = self.callbacks.get_nowait()
+            except Empty:
+                callback = None
+        while self.timers and self.timers[0][0] <= time.monotonic():
+            _, _, callback = heapq.heappop(self.timers)
+            callback()
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class InMemoryChannel:
+    def __init__(self, connection: InMemoryConnection) -> None:
+        self.connection: InMemoryConnection = connection
+        self.broker: InMemoryBroker = connection.broker
+        self.prefetch_count: int = 0
+        self.consumers: dict[str, Callable] = {}
+        self.unacked: dict[int, tuple[str, bytes, BasicProperties]] = {}
+        self.next_tag: int = 1
+        self.consuming: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.connection.is_open
+
+    def basic_qos(self, prefetch_count: int = 0) -> None:
+        self.prefetch_count = prefetch_count
+
+    def confirm_delivery(self) -> None:
+        # Publishing is synchronous here, so every publish is confirmed.
+        pass
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: BasicProperties | None = None,
+    ) -> None:
+        self.broker.publish(routing_key, body, properties)
+
+    def queue_declare(self, queue: str, arguments: dict | None = None) -> None:
+        with self.broker.lock:
+            self.broker.queues.setdefault(queue, deque())
+            if arguments and "x-message-ttl" in arguments:
+                self.broker.dead_letter_routes[queue] = (
+                    arguments["x-message-ttl"] / 1000,
+                    arguments["x-dead-letter-routing-key"],
+                )
+                self.broker.expiries.setdefault(
+                    queue, deque([0.0] * len(self.broker.queues[queue]))
+                )
+
+    def basic_consume(
+        self, queue: str, on_message_callback: Callable, auto_ack: bool = False
+    ) -> None:
+        self.consumers[queue] = on_message_callback
+
+    def start_consuming(self) -> None:
+        self.consuming = True
+        while self.consuming:
+            delaying: bool = self.broker.expire()
+            delivered: bool = self._deliver()
+            if (
+                self.broker.stop_when_drained
+                and not delivered
+                and not delaying
+                and not self.unacked
+            ):
+                return
+            self.connection.process_data_events(time_limit=0 if delivered else 0.01)
+
+    def stop_consuming(self) -> None:
+        self.consuming = False
+
+    def basic_ack(self, delivery_tag: int, multiple: bool = False) -> None:
+        tags: list[int] = (
+            [tag for tag in self.unacked if tag <= delivery_tag]
+            if multiple
+            else [delivery_tag]
+        )
+        for tag in tags:
+            _, body, _ = self.unacked.pop(tag)
+            self.broker.acked.append(body)
+
+    def basic_nack(self, delivery_tag: int, requeue: bool = True) -> None:
+        queue, body, properties = self.unacked.pop(delivery_tag)
+        if requeue:
+            with self.broker.lock:
+                self.broker.queues[queue].appendleft((body, True, properties))
+        else:
+            self.broker.rejected.append(body)
+
+    def _deliver(self) -> bool:
+        delivered: bool = False
+        for queue, callback in self.consumers.items():
+            while not self.prefetch_count or len(self.unacked) < self.prefetch_count:
+                with self.broker.lock:
+                    if not self.broker.queues.get(queue):
+                        break
+                    body, redelivered, properties = self.broker.queues[queue].popleft()
+                tag: int = self.next_tag
+                self.next_tag += 1
+                self.unacked[tag] = (queue, body, properties)
+                callback(self, Delivery(tag, redelivered), properties, body)
+                delivered = True
+        return delivered
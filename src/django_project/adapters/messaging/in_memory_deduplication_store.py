@@ -0,0 +1,20 @@
+from typing import Iterable
+
+from core._shared.application.ports.cache import Cache
+from django_project.adapters.cache.lru_cache import LRUCache
+from django_project.adapters.messaging.deduplication_store import DeduplicationStore
+
+
+class InMemoryDeduplicationStore(DeduplicationStore):
+    """Remembers processed keys in a cache only, so it forgets them on
+    restart or eviction."""
+
+    def __init__(self, cache: Cache | None = None) -> None:
+        self.cache: Cache = cache or LRUCache(maxsize=10_000, ttl=24 * 3600)
+
+    def seen(self, keys: Iterable[str]) -> set[str]:
+        return {key for key in keys if self.cache.get(key) is not None}
+
+    def mark(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.cache.set(key, True)
@@ -0,0 +1,22 @@
+import threading
+
+from django_project.adapters.messaging.message_publisher import MessagePublisher
+
+
+class InMemoryPublisher(MessagePublisher):
+    """Stands in for the broker: keeps every published body per queue."""
+
+    def __init__(self) -> None:
+        self.messages: dict[str, list[bytes]] = {}
+        self.lock = threading.Lock()
+
+    def publish(self, queue: str, body: bytes) -> None:
+        with self.lock:
+            self.messages.setdefault(queue, []).append(body)
+
+    def publish_batch(self, queue: str, bodies: list[bytes]) -> None:
+        with self.lock:
+            self.messages.setdefault(queue, []).extend(bodies)
+
+    def close(self) -> None:
+        pass
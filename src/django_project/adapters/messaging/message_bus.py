@@ -1,6 +1,7 @@
-from typing import Type
+from typing import Any, Callable, Type
 
-from core._shared.application.handler import Handler
+from core._shared.application.handler import BatchHandler, Handler
+from core._shared.application.ports.event_dispatcher import EventDispatcher
 from core._shared.application.ports.event_publisher import EventPublisher
 from core._shared.events.event import Event
 from core.video.application.events.integrations_events import (
@@ -15,20 +16,44 @@ from django_project.adapters.messaging.rabbitmq_dispatcher import (
 
 
 class MessageBus(EventPublisher):
-    def __init__(self) -> None:
+    def __init__(self, event_dispatcher: EventDispatcher | None = None) -> None:
         self.handlers: dict[Type[Event], list[Handler]] = {
             AudioVideoMediaUpdatedIntegrationEvent: [
                 PublishAudioVideoMediaUpdatedHandler(
-                    event_dispatcher=RabbitMQEventDispatcher(queue="videos.new")
+                    event_dispatcher=event_dispatcher
+                    or RabbitMQEventDispatcher(queue="videos.new")
                 )
             ],
         }
 
     def publish(self, events: list[Event]) -> None:
+        self.deliver(events)
+
+    def deliver(self, events: list[Event]) -> int:
+        """Hands events to their handlers and returns how many of them failed.
+
+        Batch handlers receive all events of their type in one call.
+        """
+        by_type: dict[Type[Event], list[Event]] = {}
         for event in events:
-            handlers: list[Handler] = self.handlers.get(type(event), [])
-            for handler in handlers:
-                try:
-                    handler.handle(event)
-                except Exception as e:
-                    print(f"Error handling event {event}: {e}")
+            by_type.setdefault(type(event), []).append(event)
+
+        failed: int = 0
+        for event_type, typed_events in by_type.items():
+            for handler in self.handlers.get(event_type, []):
+                if isinstance(handler, BatchHandler):
+                    failed += self._handle(handler.handle_batch, typed_events)
+                    continue
+                for event in typed_events:
+                    failed += self._handle(handler.handle, event)
+        return failed
+
+    def _handle(
+        self, handle: Callable[[Any], None], payload: Event | list[Event]
+    ) -> int:
+        try:
+            handle(payload)
+        except Exception as e:
+            print(f"Error handling event {payload}: {e}")
+            return len(payload) if isinstance(payload, list) else 1
+        return 0
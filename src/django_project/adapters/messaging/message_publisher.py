@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class PublisherUnavailable(Exception): ...
+
+
+class MessagePublisher(ABC):
+    @abstractmethod
+    def publish(self, queue: str, body: bytes) -> None: ...
+
+    @abstractmethod
+    def publish_batch(self, queue: str, bodies: list[bytes]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
@@ -0,0 +1,21 @@
+from django.db import transaction
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.events.event import Event
+
+
+class OnCommitEventPublisher(EventPublisher):
+    """Hands events to another publisher once the caller's transaction
+    commits, and drops them if it rolls back.
+
+    For publishers that send straight to the broker, so consumers never see
+    an event for a change that was not saved, or not saved yet. Outside a
+    transaction the events go out right away.
+    """
+
+    def __init__(self, publisher: EventPublisher) -> None:
+        self.publisher: EventPublisher = publisher
+
+    def publish(self, events: list[Event]) -> None:
+        pending: list[Event] = list(events)
+        transaction.on_commit(lambda: self.publisher.publish(pending), robust=True)
@@ -0,0 +1,36 @@
+import json
+from dataclasses import asdict
+from typing import Type
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.events.event import Event
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from django_project.outbox_app.models import OutboxMessage
+
+
+class OutboxEventPublisher(EventPublisher):
+    """Stores events in the outbox table for the relay to deliver.
+
+    The rows join the caller's transaction, so an event is recorded if and
+    only if the aggregate change that raised it is committed.
+    """
+
+    def __init__(self, routes: dict[Type[Event], str] | None = None) -> None:
+        self.routes: dict[Type[Event], str] = routes or {
+            AudioVideoMediaUpdatedIntegrationEvent: "videos.new",
+        }
+
+    def publish(self, events: list[Event]) -> None:
+        messages: list[OutboxMessage] = [
+            OutboxMessage(
+                queue=self.routes[type(event)],
+                event_type=type(event).__name__,
+                body=json.dumps(asdict(event)),
+            )
+            for event in events
+            if type(event) in self.routes
+        ]
+        if messages:
+            OutboxMessage.objects.bulk_create(messages)
@@ -0,0 +1,87 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from django_project.adapters.messaging.message_publisher import MessagePublisher
+from django_project.outbox_app.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Drains the outbox into the broker, at least once and in insertion order.
+
+    Rows are locked while a batch is published and marked sent in the same
+    transaction, so concurrent relays skip each other's batches and a crash
+    before commit only causes redelivery. So does a failed publish_batch,
+    for whatever part of it reached the broker.
+    """
+
+    def __init__(self, publisher: MessagePublisher, batch_size: int = 100) -> None:
+        self.publisher: MessagePublisher = publisher
+        self.batch_size: int = batch_size
+
+    def relay_batch(self) -> int:
+        with transaction.atomic():
+            pending: list[OutboxMessage] = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True)
+                .filter(sent_at__isnull=True)
+                .order_by("id")[: self.batch_size]
+            )
+            sent_ids: list = []
+            # One publish_batch per run of messages to the same queue, which
+            # waits for the broker once rather than once per message.
+            for queue, run in groupby(pending, key=lambda message: message.queue):
+                messages: list[OutboxMessage] = list(run)
+                try:
+                    self.publisher.publish_batch(
+                        queue, [message.body.encode("utf-8") for message in messages]
+                    )
+                except Exception:
+                    logger.exception(
+                        "Failed to relay %d outbox messages from %s",
+                        len(messages),
+                        messages[0].id,
+                    )
+                    OutboxMessage.objects.filter(
+                        id__in=[message.id for message in messages]
+                    ).update(attempts=F("attempts") + 1)
+                    break
+                sent_ids.extend(message.id for message in messages)
+
+            if sent_ids:
+                OutboxMessage.objects.filter(id__in=sent_ids).update(
+                    sent_at=timezone.now(), attempts=F("attempts") + 1
+                )
+        return len(sent_ids)
+
+    def purge_sent(self, before: datetime) -> int:
+        deleted, _ = OutboxMessage.objects.filter(sent_at__lt=before).delete()
+        return deleted
+
+    def run(
+        self,
+        poll_interval: float = 1.0,
+        stop: threading.Event | None = None,
+        retention: timedelta | None = None,
+        purge_interval: float = 3600.0,
+    ) -> None:
+        """Relays until stopped, deleting messages sent longer ago than
+        retention every purge_interval seconds."""
+        stop = stop or threading.Event()
+        next_purge: float = time.monotonic()
+        while not stop.is_set():
+            if retention is not None and time.monotonic() >= next_purge:
+                purged: int = self.purge_sent(before=timezone.now() - retention)
+                if purged:
+                    logger.info("Purged %d sent outbox messages", purged)
+                next_purge = time.monotonic() + purge_interval
+            # A short batch means the outbox is drained or the broker failed.
+            if self.relay_batch() < self.batch_size:
+                stop.wait(poll_interval)
@@ -1,14 +1,20 @@
-from core._shared.application.handler import Handler
+from core._shared.application.handler import BatchHandler
 from core._shared.application.ports.event_dispatcher import EventDispatcher
 from core.video.application.events.integrations_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
 
 
-class PublishAudioVideoMediaUpdatedHandler(Handler):
+class PublishAudioVideoMediaUpdatedHandler(BatchHandler):
     def __init__(self, event_dispatcher: EventDispatcher) -> None:
         self.event_dispatcher: EventDispatcher = event_dispatcher
 
     def handle(self, event: AudioVideoMediaUpdatedIntegrationEvent) -> None:
         print(f"Publishing event {event}")
         self.event_dispatcher.dispatch(event)
+
+    def handle_batch(
+        self, events: list[AudioVideoMediaUpdatedIntegrationEvent]
+    ) -> None:
+        print(f"Publishing {len(events)} events")
+        self.event_dispatcher.dispatch_batch(events)
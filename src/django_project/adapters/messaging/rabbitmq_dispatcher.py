@@ -1,12 +1,10 @@
 from dataclasses import asdict
 import json
-import os
-
-from pika import BlockingConnection, ConnectionParameters
-from pika.adapters.blocking_connection import BlockingChannel
 
 from core._shared.application.ports.event_dispatcher import EventDispatcher
 from core._shared.events.event import Event
+from django_project.adapters.messaging.message_publisher import MessagePublisher
+from django_project.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
 
 
 class RabbitMQEventDispatcher(EventDispatcher):
@@ -14,22 +12,19 @@ class RabbitMQEventDispatcher(EventDispatcher):
         self,
         host: str | None = None,
         queue: str = "videos.new",
+        publisher: MessagePublisher | None = None,
     ) -> None:
-        self.host: str = host or os.getenv("RABBITMQ_HOST", "localhost")
         self.queue: str = queue
-        self.connection: BlockingConnection | None = None
-        self.channel: BlockingChannel | None = None
+        self.publisher: MessagePublisher = publisher or RabbitMQPublisher(host=host)
 
     def dispatch(self, event: Event) -> None:
-        if not self.connection:
-            self.connection = BlockingConnection(
-                ConnectionParameters(host=self.host)
-            )
-            self.channel = self.connection.channel()
-            self.channel.queue_declare(queue=self.queue)
-        self.channel.basic_publish(
-            exchange="",
-            routing_key=self.queue,
-            body=json.dumps(asdict(event)),
-        )
+        self.publisher.publish(self.queue, self._body(event))
         print(f"Dispatching event {event} to RabbitMQ on queue {self.queue}")
+
+    def dispatch_batch(self, events: list[Event]) -> None:
+        bodies: list[bytes] = [self._body(event) for event in events]
+        self.publisher.publish_batch(self.queue, bodies)
+        print(f"Dispatching {len(events)} events to RabbitMQ on queue {self.queue}")
+
+    def _body(self, event: Event) -> bytes:
+        return json.dumps(asdict(event)).encode("utf-8")
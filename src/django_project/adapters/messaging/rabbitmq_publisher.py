@@ -0,0 +1,146 @@
+import os
+from collections import deque
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Callable, Iterator
+
+from pika import BlockingConnection, ConnectionParameters
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPError
+
+from django_project.adapters.messaging.message_publisher import (
+    MessagePublisher,
+    PublisherUnavailable,
+)
+
+
+class PooledChannel:
+    """A channel on its own connection, since pika connections are not
+    thread-safe. Connects lazily and declares each queue once per connection.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], BlockingConnection],
+        confirm_delivery: bool = False,
+        transactional: bool = False,
+    ) -> None:
+        self.connection_factory = connection_factory
+        self.confirm_delivery: bool = confirm_delivery
+        self.transactional: bool = transactional
+        self.connection: BlockingConnection | None = None
+        self.channel: BlockingChannel | None = None
+        self.declared_queues: set[str] = set()
+
+    def publish(self, queue: str, pending: deque[bytes]) -> None:
+        """Publishes pending bodies in order, removing each one once sent."""
+        if self.channel is None or not self.channel.is_open:
+            self.reset()
+            self.connection = self.connection_factory()
+            self.channel = self.connection.channel()
+            if self.confirm_delivery:
+                # basic_publish now blocks until the broker acks, and raises
+                # NackError or UnroutableError when it does not.
+                self.channel.confirm_delivery()
+            if self.transactional:
+                self.channel.tx_select()
+        else:
+            # Services heartbeats of an idle connection and surfaces a dead one.
+            self.connection.process_data_events(time_limit=0)
+
+        if queue not in self.declared_queues:
+            self.channel.queue_declare(queue=queue)
+            self.declared_queues.add(queue)
+        if self.transactional:
+            # Publishes the whole batch, then waits once: tx_commit returns
+            # when the broker has taken every body, and none survive a failure.
+            for body in pending:
+                self.channel.basic_publish(exchange="", routing_key=queue, body=body)
+            self.channel.tx_commit()
+            pending.clear()
+            return
+        while pending:
+            self.channel.basic_publish(exchange="", routing_key=queue, body=pending[0])
+            pending.popleft()
+
+    def reset(self) -> None:
+        if self.connection is not None and self.connection.is_open:
+            try:
+                self.connection.close()
+            except AMQPError:
+                pass
+        self.connection = None
+        self.channel = None
+        self.declared_queues.clear()
+
+
+class RabbitMQPublisher(MessagePublisher):
+    """Process-wide publisher over a pool of long-lived channels.
+
+    Threads check a channel out for the duration of one publish or batch.
+    Messages that fail on a broken connection are retried once on a fresh one.
+
+    confirm_delivery waits for the broker's ack of each message;
+    transactional waits once per batch, for all of it. pika's blocking
+    channel offers no way to wait for a batch of confirms, and a channel
+    cannot use both modes.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        pool_size: int = 4,
+        checkout_timeout: float = 5.0,
+        confirm_delivery: bool = False,
+        connection_factory: Callable[[], BlockingConnection] | None = None,
+        transactional: bool = False,
+    ) -> None:
+        if confirm_delivery and transactional:
+            raise ValueError("confirm_delivery and transactional are exclusive")
+        self.host: str = host or os.getenv("RABBITMQ_HOST", "localhost")
+        self.pool_size: int = pool_size
+        self.checkout_timeout: float = checkout_timeout
+        self.connection_factory: Callable[[], BlockingConnection] = (
+            connection_factory or self._connect
+        )
+        self.pool: LifoQueue[PooledChannel] = LifoQueue()
+        for _ in range(pool_size):
+            self.pool.put(
+                PooledChannel(self.connection_factory, confirm_delivery, transactional)
+            )
+
+    def publish(self, queue: str, body: bytes) -> None:
+        self.publish_batch(queue, [body])
+
+    def publish_batch(self, queue: str, bodies: list[bytes]) -> None:
+        pending: deque[bytes] = deque(bodies)
+        with self.checkout() as channel:
+            try:
+                channel.publish(queue, pending)
+            except AMQPError:
+                channel.reset()
+                channel.publish(queue, pending)
+
+    @contextmanager
+    def checkout(self) -> Iterator[PooledChannel]:
+        try:
+            channel: PooledChannel = self.pool.get(timeout=self.checkout_timeout)
+        except Empty:
+            raise PublisherUnavailable(
+                f"No RabbitMQ channel available after {self.checkout_timeout}s"
+            )
+        try:
+            yield channel
+        finally:
+            self.pool.put(channel)
+
+    def close(self) -> None:
+        channels: list[PooledChannel] = [
+            self.pool.get(timeout=self.checkout_timeout) for _ in range(self.pool_size)
+        ]
+        for channel in channels:
+            channel.reset()
+            self.pool.put(channel)
+
+    def _connect(self) -> BlockingConnection:
+        return BlockingConnection(ConnectionParameters(host=self.host))
@@ -0,0 +1,211 @@
+import threading
+import time
+from dataclasses import dataclass
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+from core._shared.application.handler import BatchHandler
+from core._shared.events.event import Event
+from django_project.adapters.messaging.async_message_bus import (
+    AsyncMessageBus,
+    QueueFullFallback,
+)
+from django_project.adapters.messaging.message_bus import MessageBus
+
+
+@dataclass(frozen=True)
+class NumberedEvent(Event):
+    number: int
+
+
+class RecordingBus(MessageBus):
+    def __init__(self, failing: set[int] | None = None) -> None:
+        super().__init__()
+        self.batches: list[list[int]] = []
+        self.threads: list[str] = []
+        self.failing: set[int] = failing or set()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.delivering = threading.Event()
+
+    def deliver(self, events: list[Event]) -> int:
+        if threading.current_thread().name == "async-message-bus":
+            self.delivering.set()
+            self.gate.wait(timeout=5)
+        self.batches.append([event.number for event in events])
+        self.threads.append(threading.current_thread().name)
+        return len([event for event in events if event.number in self.failing])
+
+
+def events(*numbers: int) -> list[NumberedEvent]:
+    return [NumberedEvent(number) for number in numbers]
+
+
+@pytest.fixture
+def bus() -> RecordingBus:
+    return RecordingBus()
+
+
+@pytest.fixture
+def async_bus(bus: RecordingBus):
+    async_bus = AsyncMessageBus(message_bus=bus, max_wait=0.01)
+    yield async_bus
+    async_bus.close()
+
+
+class TestAsyncMessageBus:
+
+    def test_delivers_on_the_background_thread(self, async_bus, bus) -> None:
+        async_bus.publish(events(1))
+
+        assert async_bus.flush(timeout=5)
+        assert bus.batches == [[1]]
+        assert bus.threads == ["async-message-bus"]
+
+    def test_publish_does_not_wait_for_delivery(self, async_bus, bus) -> None:
+        bus.gate.clear()
+
+        async_bus.publish(events(1))
+        assert bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2, 3))
+
+        assert bus.batches == []
+        bus.gate.set()
+        assert async_bus.flush(timeout=5)
+
+    def test_batches_events_that_queue_up_during_delivery(
+        self, async_bus, bus
+    ) -> None:
+        bus.gate.clear()
+        async_bus.publish(events(1))
+        bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2, 3, 4))
+
+        bus.gate.set()
+        assert async_bus.flush(timeout=5)
+
+        assert bus.batches == [[1], [2, 3, 4]]
+
+    def test_batches_are_capped_at_max_batch(self, bus) -> None:
+        async_bus = AsyncMessageBus(message_bus=bus, max_batch=2, max_wait=0.01)
+        bus.gate.clear()
+        async_bus.publish(events(1))
+        bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2, 3, 4, 5))
+
+        bus.gate.set()
+        async_bus.close()
+
+        assert bus.batches == [[1], [2, 3], [4, 5]]
+
+    def test_full_queue_publishes_inline(self, bus) -> None:
+        async_bus = AsyncMessageBus(message_bus=bus, maxsize=1, put_timeout=0.01)
+        bus.gate.clear()
+        async_bus.publish(events(1))
+        bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2))
+
+        async_bus.publish(events(3, 4))
+        bus.gate.set()
+        async_bus.close()
+
+        assert [3, 4] in bus.batches
+        assert bus.threads[bus.batches.index([3, 4])] == "MainThread"
+        assert async_bus.snapshot().published_inline == 2
+
+    def test_full_queue_can_drop_events(self, bus) -> None:
+        async_bus = AsyncMessageBus(
+            message_bus=bus,
+            maxsize=1,
+            put_timeout=0.01,
+            fallback=QueueFullFallback.DROP,
+        )
+        bus.gate.clear()
+        async_bus.publish(events(1))
+        bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2, 3, 4))
+
+        assert async_bus.snapshot().dropped == 2
+        assert async_bus.snapshot().queue_depth == 1
+        bus.gate.set()
+        async_bus.close()
+        assert bus.batches == [[1], [2]]
+
+    def test_close_flushes_enqueued_events(self, bus) -> None:
+        async_bus = AsyncMessageBus(message_bus=bus)
+        bus.gate.clear()
+        async_bus.publish(events(1, 2, 3))
+
+        bus.gate.set()
+        async_bus.close()
+
+        assert sum(bus.batches, []) == [1, 2, 3]
+        assert async_bus.flush(timeout=0)
+
+    def test_close_gives_up_on_a_stuck_full_queue(self, bus) -> None:
+        async_bus = AsyncMessageBus(message_bus=bus, maxsize=1, put_timeout=0.01)
+        bus.gate.clear()
+        async_bus.publish(events(1))
+        bus.delivering.wait(timeout=5)
+        async_bus.publish(events(2))
+
+        started = time.monotonic()
+        async_bus.close(timeout=0.05)
+
+        assert time.monotonic() - started < 1
+        bus.gate.set()
+
+    def test_exit_hook_is_registered_once(self, bus) -> None:
+        async_bus = AsyncMessageBus(message_bus=bus)
+
+        with patch("atexit.register") as register:
+            async_bus.publish(events(1))
+            async_bus.worker_pid = -1  # as after a fork
+            async_bus.publish(events(2))
+            async_bus.close(timeout=0)
+
+        register.assert_called_once_with(async_bus.close)
+
+    def test_publish_after_close_is_delivered_inline(self, async_bus, bus) -> None:
+        async_bus.close()
+
+        async_bus.publish(events(1))
+
+        assert bus.batches == [[1]]
+        assert bus.threads == ["MainThread"]
+
+    def test_metrics(self) -> None:
+        bus = RecordingBus(failing={2})
+        async_bus = AsyncMessageBus(message_bus=bus)
+        async_bus.publish(events(1, 2, 3))
+        async_bus.close()
+
+        metrics = async_bus.snapshot()
+        assert metrics.enqueued == 3
+        assert metrics.published == 2
+        assert metrics.failed == 1
+        assert metrics.batches == len(bus.batches)
+        assert metrics.queue_depth == 0
+        assert metrics.publish_seconds_max >= 0
+
+
+class TestMessageBusDeliver:
+
+    def test_batch_handlers_receive_all_events_of_their_type(self) -> None:
+        handler = create_autospec(BatchHandler)
+        bus = MessageBus()
+        bus.handlers = {NumberedEvent: [handler]}
+
+        assert bus.deliver(events(1, 2)) == 0
+
+        handler.handle_batch.assert_called_once_with(events(1, 2))
+        handler.handle.assert_not_called()
+
+    def test_counts_failed_events(self) -> None:
+        handler = create_autospec(BatchHandler)
+        handler.handle_batch.side_effect = ConnectionError
+        bus = MessageBus()
+        bus.handlers = {NumberedEvent: [handler]}
+
+        assert bus.deliver(events(1, 2)) == 2
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from unittest.mock import create_autospec
+
+import pytest
+from django.db import transaction
+
+from core._shared.application.ports.event_publisher import EventPublisher
+from core._shared.events.event import Event
+from django_project.adapters.messaging.on_commit_event_publisher import (
+    OnCommitEventPublisher,
+)
+
+
+@dataclass(frozen=True)
+class NumberedEvent(Event):
+    number: int
+
+
+@pytest.mark.django_db(transaction=True)
+class TestOnCommitEventPublisher:
+
+    def test_publishes_once_the_transaction_commits(self) -> None:
+        inner = create_autospec(EventPublisher)
+        publisher = OnCommitEventPublisher(inner)
+
+        with transaction.atomic():
+            publisher.publish([NumberedEvent(1)])
+            inner.publish.assert_not_called()
+
+        inner.publish.assert_called_once_with([NumberedEvent(1)])
+
+    def test_drops_events_of_a_rolled_back_transaction(self) -> None:
+        inner = create_autospec(EventPublisher)
+        publisher = OnCommitEventPublisher(inner)
+
+        with pytest.raises(RuntimeError), transaction.atomic():
+            publisher.publish([NumberedEvent(1)])
+            raise RuntimeError
+
+        inner.publish.assert_not_called()
+
+    def test_publishes_right_away_outside_a_transaction(self) -> None:
+        inner = create_autospec(EventPublisher)
+
+        OnCommitEventPublisher(inner).publish([NumberedEvent(1)])
+
+        inner.publish.assert_called_once_with([NumberedEvent(1)])
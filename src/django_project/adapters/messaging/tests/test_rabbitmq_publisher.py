@@ -0,0 +1,307 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pika.exceptions import AMQPConnectionError, StreamLostError
+
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from django_project.adapters.messaging.in_memory_publisher import InMemoryPublisher
+from django_project.adapters.messaging.message_publisher import PublisherUnavailable
+from django_project.adapters.messaging.rabbitmq_dispatcher import (
+    RabbitMQEventDispatcher,
+)
+from django_project.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
+
+
+class FakeChannel:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.declared: list[str] = []
+        self.published: list[tuple[str, bytes]] = []
+        self.fail_next_publish: bool = False
+        self.confirming: bool = False
+        # Published but not yet committed, in transactional mode.
+        self.uncommitted: list[tuple[str, bytes]] | None = None
+        self.commits: int = 0
+
+    def confirm_delivery(self) -> None:
+        self.confirming = True
+
+    def tx_select(self) -> None:
+        self.uncommitted = []
+
+    def tx_commit(self) -> None:
+        self.published.extend(self.uncommitted)
+        self.uncommitted.clear()
+        self.commits += 1
+
+    @property
+    def is_open(self) -> bool:
+        return self.connection.is_open
+
+    def queue_declare(self, queue: str) -> None:
+        self.declared.append(queue)
+
+    def basic_publish(self, exchange: str, routing_key: str, body: bytes) -> None:
+        if self.fail_next_publish:
+            self.fail_next_publish = False
+            self.connection.is_open = False
+            raise StreamLostError("connection lost")
+        with self.connection.broker.lock:
+            self.connection.broker.in_flight += 1
+            self.connection.broker.max_in_flight = max(
+                self.connection.broker.max_in_flight, self.connection.broker.in_flight
+            )
+        time.sleep(self.connection.broker.publish_delay)
+        if self.uncommitted is not None:
+            self.uncommitted.append((routing_key, body))
+        else:
+            self.published.append((routing_key, body))
+        with self.connection.broker.lock:
+            self.connection.broker.in_flight -= 1
+
+
+class FakeConnection:
+    def __init__(self, broker: "FakeBroker") -> None:
+        self.broker = broker
+        self.is_open: bool = True
+        self.fake_channel = FakeChannel(self)
+
+    def channel(self) -> FakeChannel:
+        return self.fake_channel
+
+    def process_data_events(self, time_limit: float) -> None:
+        if not self.is_open:
+            raise StreamLostError("connection lost")
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class FakeBroker:
+    def __init__(self, publish_delay: float = 0.0) -> None:
+        self.connections: list[FakeConnection] = []
+        self.publish_delay: float = publish_delay
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.lock = threading.Lock()
+        self.down: bool = False
+
+    def connect(self) -> FakeConnection:
+        if self.down:
+            raise AMQPConnectionError("broker down")
+        connection = FakeConnection(self)
+        with self.lock:
+            self.connections.append(connection)
+        return connection
+
+    @property
+    def published(self) -> list[tuple[str, bytes]]:
+        return [
+            message
+            for connection in self.connections
+            for message in connection.fake_channel.published
+        ]
+
+
+class TestRabbitMQPublisher:
+
+    def test_reuses_the_connection_across_publishes(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+
+        for index in range(3):
+            publisher.publish("videos.new", f"{index}".encode())
+
+        assert len(broker.connections) == 1
+        assert broker.published == [
+            ("videos.new", b"0"),
+            ("videos.new", b"1"),
+            ("videos.new", b"2"),
+        ]
+
+    def test_declares_each_queue_once_per_connection(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+
+        publisher.publish("videos.new", b"1")
+        publisher.publish("videos.new", b"2")
+        publisher.publish("videos.other", b"3")
+
+        assert broker.connections[0].fake_channel.declared == [
+            "videos.new",
+            "videos.other",
+        ]
+
+    def test_reconnects_and_retries_after_a_lost_connection(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+        publisher.publish("videos.new", b"1")
+        broker.connections[0].fake_channel.fail_next_publish = True
+
+        publisher.publish("videos.new", b"2")
+
+        assert len(broker.connections) == 2
+        assert broker.connections[1].fake_channel.declared == ["videos.new"]
+        assert broker.published == [("videos.new", b"1"), ("videos.new", b"2")]
+
+    def test_reconnects_when_an_idle_connection_was_closed(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+        publisher.publish("videos.new", b"1")
+        broker.connections[0].is_open = False
+
+        publisher.publish("videos.new", b"2")
+
+        assert len(broker.connections) == 2
+
+    def test_connects_lazily_after_the_broker_recovers(self) -> None:
+        broker = FakeBroker()
+        broker.down = True
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+
+        with pytest.raises(AMQPConnectionError):
+            publisher.publish("videos.new", b"1")
+
+        broker.down = False
+        publisher.publish("videos.new", b"2")
+        assert broker.published == [("videos.new", b"2")]
+
+    def test_enables_publisher_confirms_on_new_channels(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(
+            pool_size=1, confirm_delivery=True, connection_factory=broker.connect
+        )
+
+        publisher.publish("videos.new", b"1")
+
+        assert broker.connections[0].fake_channel.confirming is True
+
+    def test_transactional_batches_are_committed_once(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(
+            pool_size=1, transactional=True, connection_factory=broker.connect
+        )
+
+        publisher.publish_batch("videos.new", [b"1", b"2", b"3"])
+
+        assert broker.published == [
+            ("videos.new", b"1"),
+            ("videos.new", b"2"),
+            ("videos.new", b"3"),
+        ]
+        assert broker.connections[0].fake_channel.commits == 1
+
+    def test_transactional_batch_is_resent_whole_after_a_lost_connection(
+        self,
+    ) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(
+            pool_size=1, transactional=True, connection_factory=broker.connect
+        )
+        publisher.publish("videos.new", b"0")
+        channel = broker.connections[0].fake_channel
+        original_publish = channel.basic_publish
+        published: list[bytes] = []
+
+        def fail_on_second(exchange: str, routing_key: str, body: bytes) -> None:
+            published.append(body)
+            channel.fail_next_publish = len(published) == 2
+            original_publish(exchange, routing_key, body)
+
+        channel.basic_publish = fail_on_second
+
+        publisher.publish_batch("videos.new", [b"1", b"2"])
+
+        assert broker.published == [
+            ("videos.new", b"0"),
+            ("videos.new", b"1"),
+            ("videos.new", b"2"),
+        ]
+
+    def test_confirms_and_transactions_are_exclusive(self) -> None:
+        with pytest.raises(ValueError):
+            RabbitMQPublisher(confirm_delivery=True, transactional=True)
+
+    def test_concurrent_publishes_never_share_a_channel(self) -> None:
+        broker = FakeBroker(publish_delay=0.01)
+        publisher = RabbitMQPublisher(pool_size=2, connection_factory=broker.connect)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda index: publisher.publish("videos.new", b"%d" % index),
+                    range(16),
+                )
+            )
+
+        assert len(broker.published) == 16
+        assert len(broker.connections) <= 2
+        assert broker.max_in_flight <= 2
+
+    def test_checkout_times_out_when_the_pool_is_exhausted(self) -> None:
+        publisher = RabbitMQPublisher(
+            pool_size=1, checkout_timeout=0.01, connection_factory=FakeBroker().connect
+        )
+
+        with publisher.checkout():
+            with pytest.raises(PublisherUnavailable):
+                publisher.publish("videos.new", b"1")
+
+    def test_close_closes_every_open_connection(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=2, connection_factory=broker.connect)
+        publisher.publish("videos.new", b"1")
+
+        publisher.close()
+
+        assert all(not connection.is_open for connection in broker.connections)
+
+
+class TestRabbitMQEventDispatcher:
+
+    def test_publishes_event_as_json_through_the_publisher(self) -> None:
+        publisher = InMemoryPublisher()
+        dispatcher = RabbitMQEventDispatcher(queue="videos.new", publisher=publisher)
+        event = AudioVideoMediaUpdatedIntegrationEvent(
+            resource_id="123.VIDEO", file_path="/videos/encoded/123"
+        )
+
+        dispatcher.dispatch(event)
+
+        [body] = publisher.messages["videos.new"]
+        assert json.loads(body)["resource_id"] == "123.VIDEO"
+
+
+class TestPublishBatch:
+
+    def test_publishes_a_batch_over_one_channel(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=2, connection_factory=broker.connect)
+
+        publisher.publish_batch("videos.new", [b"1", b"2", b"3"])
+
+        assert len(broker.connections) == 1
+        assert [body for _, body in broker.published] == [b"1", b"2", b"3"]
+
+    def test_retries_only_the_unsent_remainder(self) -> None:
+        broker = FakeBroker()
+        publisher = RabbitMQPublisher(pool_size=1, connection_factory=broker.connect)
+        publisher.publish("videos.new", b"0")
+        channel = broker.connections[0].fake_channel
+        original = channel.basic_publish
+
+        def fail_on_second(exchange: str, routing_key: str, body: bytes) -> None:
+            if body == b"2":
+                channel.fail_next_publish = True
+            original(exchange=exchange, routing_key=routing_key, body=body)
+
+        channel.basic_publish = fail_on_second
+
+        publisher.publish_batch("videos.new", [b"1", b"2", b"3"])
+
+        assert [body for _, body in broker.published] == [b"0", b"1", b"2", b"3"]
@@ -0,0 +1,263 @@
+import json
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from core.video.application.use_cases.bulk_process_audio_video_media import (
+    BulkProcessAudioVideoMedia,
+)
+from django_project.adapters.messaging.in_memory_broker import InMemoryBroker
+from django_project.adapters.messaging.in_memory_deduplication_store import (
+    InMemoryDeduplicationStore,
+)
+from django_project.adapters.messaging.video_converted_batch_consumer import (
+    VideoConvertedBatchConsumer,
+)
+from django_project.adapters.messaging.video_converted_consumer import Outcome
+
+
+def completed_message(
+    video_id: UUID | None = None,
+    encoded_location: str = "/encoded/videos/output.mp4",
+) -> bytes:
+    return json.dumps(
+        {
+            "error": "",
+            "video": {
+                "resource_id": f"{video_id or uuid4()}.VIDEO",
+                "encoded_video_folder": encoded_location,
+            },
+            "status": "COMPLETED",
+        }
+    ).encode("utf-8")
+
+
+@pytest.fixture
+def use_case() -> MagicMock:
+    use_case = MagicMock(spec=BulkProcessAudioVideoMedia)
+    use_case.execute.return_value = BulkProcessAudioVideoMedia.Output()
+    return use_case
+
+
+@pytest.fixture
+def broker() -> InMemoryBroker:
+    return InMemoryBroker(stop_when_drained=True)
+
+
+def consume(
+    broker: InMemoryBroker,
+    use_case: MagicMock,
+    batch_size: int = 5,
+    max_wait: float = 0.01,
+    max_retries: int = 5,
+) -> None:
+    VideoConvertedBatchConsumer(
+        use_case=use_case,
+        queue="videos.converted",
+        batch_size=batch_size,
+        max_wait=max_wait,
+        connection_factory=broker.connect,
+        max_retries=max_retries,
+        retry_delay=0,
+    ).start()
+
+
+class TestVideoConvertedBatchConsumerOnBatch:
+    def test_parses_every_message_into_one_use_case_call(
+        self, use_case: MagicMock
+    ) -> None:
+        consumer = VideoConvertedBatchConsumer(use_case=use_case)
+
+        outcomes = consumer.on_batch([completed_message() for _ in range(3)])
+
+        assert outcomes == [Outcome.ACK] * 3
+        [request] = use_case.execute.call_args.args
+        assert len(request.items) == 3
+
+    def test_malformed_and_missing_messages_are_rejected(
+        self, use_case: MagicMock
+    ) -> None:
+        use_case.execute.return_value = BulkProcessAudioVideoMedia.Output(
+            not_found=[1]
+        )
+        consumer = VideoConvertedBatchConsumer(use_case=use_case)
+
+        outcomes = consumer.on_batch(
+            [completed_message(), b"not valid json", completed_message()]
+        )
+
+        assert outcomes == [Outcome.ACK, Outcome.REJECT, Outcome.REJECT]
+
+    def test_failed_batch_is_retried(self, use_case: MagicMock) -> None:
+        use_case.execute.side_effect = ConnectionError
+        consumer = VideoConvertedBatchConsumer(use_case=use_case)
+
+        outcomes = consumer.on_batch([completed_message(), b"not valid json"])
+
+        assert outcomes == [Outcome.RETRY, Outcome.REJECT]
+        assert use_case.execute.call_count == 1
+
+    def test_failed_batch_falls_back_to_one_item_at_a_time(
+        self, use_case: MagicMock
+    ) -> None:
+        poison = completed_message()
+        poison_id = json.loads(poison)["video"]["resource_id"].split(".")[0]
+        missing = completed_message()
+        missing_id = json.loads(missing)["video"]["resource_id"].split(".")[0]
+
+        def execute(request):
+            ids = {str(item.video_id) for item in request.items}
+            if len(request.items) > 1 or poison_id in ids:
+                raise ConnectionError
+            return BulkProcessAudioVideoMedia.Output(
+                not_found=[0] if missing_id in ids else []
+            )
+
+        use_case.execute.side_effect = execute
+        store = InMemoryDeduplicationStore()
+        consumer = VideoConvertedBatchConsumer(
+            use_case=use_case, deduplication_store=store
+        )
+        good = completed_message()
+
+        outcomes = consumer.on_batch([good, poison, missing])
+
+        assert outcomes == [Outcome.ACK, Outcome.RETRY, Outcome.REJECT]
+        assert use_case.execute.call_count == 4
+        # Only the item that was applied is remembered.
+        assert consumer.on_batch([good]) == [Outcome.ACK]
+        assert use_case.execute.call_count == 4
+
+    def test_already_processed_messages_are_acked_without_the_use_case(
+        self, use_case: MagicMock
+    ) -> None:
+        consumer = VideoConvertedBatchConsumer(
+            use_case=use_case, deduplication_store=InMemoryDeduplicationStore()
+        )
+        first, second = completed_message(), completed_message()
+        consumer.on_batch([first])
+
+        outcomes = consumer.on_batch([first, second, second])
+
+        assert outcomes == [Outcome.ACK] * 3
+        [request] = use_case.execute.call_args.args
+        assert len(request.items) == 1
+        assert use_case.execute.call_count == 2
+
+    def test_missing_videos_are_not_remembered(self, use_case: MagicMock) -> None:
+        use_case.execute.return_value = BulkProcessAudioVideoMedia.Output(
+            not_found=[0]
+        )
+        consumer = VideoConvertedBatchConsumer(
+            use_case=use_case, deduplication_store=InMemoryDeduplicationStore()
+        )
+        message = completed_message()
+
+        consumer.on_batch([message])
+        consumer.on_batch([message])
+
+        assert use_case.execute.call_count == 2
+
+
+class TestVideoConvertedBatchConsumer:
+    def test_expired_keys_are_purged_once_connected(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        store = MagicMock(wraps=InMemoryDeduplicationStore())
+        broker.publish("videos.converted", completed_message())
+
+        VideoConvertedBatchConsumer(
+            use_case=use_case,
+            max_wait=0.01,
+            connection_factory=broker.connect,
+            deduplication_store=store,
+        ).start()
+
+        store.purge_expired.assert_called_once_with()
+
+    def test_full_batches_are_processed_together_and_acked(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        messages = [completed_message() for _ in range(10)]
+        for message in messages:
+            broker.publish("videos.converted", message)
+
+        consume(broker, use_case, batch_size=5, max_wait=60)
+
+        assert use_case.execute.call_count == 2
+        assert broker.acked == messages
+
+    def test_partial_batch_is_flushed_after_max_wait(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        for _ in range(3):
+            broker.publish("videos.converted", completed_message())
+
+        consume(broker, use_case, batch_size=100, max_wait=0.01)
+
+        assert use_case.execute.call_count == 1
+        assert len(broker.acked) == 3
+
+    def test_rejected_messages_do_not_block_the_batch_ack(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        use_case.execute.return_value = BulkProcessAudioVideoMedia.Output(
+            not_found=[0]
+        )
+        messages = [completed_message() for _ in range(3)]
+        for message in messages:
+            broker.publish("videos.converted", message)
+
+        consume(broker, use_case, batch_size=3)
+
+        assert broker.messages("videos.converted.dead") == [messages[0]]
+        assert broker.acked == messages
+
+    def test_failed_batch_is_retried_then_dead_lettered(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        use_case.execute.side_effect = ConnectionError
+        messages = [completed_message() for _ in range(2)]
+        for message in messages:
+            broker.publish("videos.converted", message)
+
+        consume(broker, use_case, batch_size=2, max_retries=1)
+
+        # Per round: the batch, then each item on its own.
+        assert use_case.execute.call_count == 6
+        assert sorted(broker.messages("videos.converted.dead")) == sorted(messages)
+        assert broker.messages("videos.converted") == []
+
+    def test_retried_message_keeps_its_place_among_its_video(
+        self, broker: InMemoryBroker, use_case: MagicMock
+    ) -> None:
+        video_id = uuid4()
+        processed: list[str] = []
+        # The first batch fails, then the item on its own.
+        failures: list[str] = ["/encoded/0", "/encoded/0"]
+
+        def execute(request: BulkProcessAudioVideoMedia.Input):
+            locations = [
+                item.encoded_location
+                for item in request.items
+                if item.video_id == video_id
+            ]
+            if failures and failures[0] in locations:
+                failures.pop()
+                raise ConnectionError
+            processed.extend(locations)
+            return BulkProcessAudioVideoMedia.Output()
+
+        use_case.execute.side_effect = execute
+        for index in range(4):
+            broker.publish(
+                "videos.converted",
+                completed_message(video_id, encoded_location=f"/encoded/{index}"),
+            )
+            broker.publish("videos.converted", completed_message())
+
+        consume(broker, use_case, batch_size=4)
+
+        assert processed == [f"/encoded/{index}" for index in range(4)]
+        assert broker.messages("videos.converted.dead") == []
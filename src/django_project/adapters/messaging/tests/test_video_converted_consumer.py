@@ -2,16 +2,26 @@
 Unit tests for VideoConvertedRabbitMQConsumer.on_message method.
 """
 import json
+import threading
+from collections import deque
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from pika import BasicProperties
 
 from core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
+from core.video.application.exceptions import VideoNotFound
 from core.video.domain.value_objects import MediaStatus, MediaType
+from django_project.adapters.messaging.in_memory_broker import InMemoryBroker
+from django_project.adapters.messaging.in_memory_deduplication_store import (
+    InMemoryDeduplicationStore,
+)
 from django_project.adapters.messaging.video_converted_consumer import (
+    Outcome,
+    VideoBacklog,
     VideoConvertedRabbitMQConsumer,
 )
 
@@ -260,3 +270,314 @@ class TestVideoConvertedRabbitMQConsumerOnMessage:
         ]
 
         assert input_data.status == MediaStatus.PROCESSING
+
+
+def completed_message(
+    video_id: UUID | None = None,
+    media_type: str = "VIDEO",
+    encoded_location: str = "/encoded/videos/output.mp4",
+) -> bytes:
+    return json.dumps(
+        {
+            "error": "",
+            "video": {
+                "resource_id": f"{video_id or uuid4()}.{media_type}",
+                "encoded_video_folder": encoded_location,
+            },
+            "status": "COMPLETED",
+        }
+    ).encode("utf-8")
+
+
+def consume(
+    broker: InMemoryBroker,
+    use_case: MagicMock,
+    workers: int = 2,
+    prefetch_count: int = 4,
+    max_retries: int = 5,
+) -> None:
+    VideoConvertedRabbitMQConsumer(
+        use_case=use_case,
+        queue="videos.converted",
+        workers=workers,
+        prefetch_count=prefetch_count,
+        connection_factory=broker.connect,
+        max_retries=max_retries,
+        retry_delay=0,
+    ).start()
+
+
+@pytest.fixture
+def broker() -> InMemoryBroker:
+    return InMemoryBroker(stop_when_drained=True)
+
+
+class TestVideoConvertedRabbitMQConsumerOutcome:
+    def test_processed_message_is_acked(
+        self, consumer: VideoConvertedRabbitMQConsumer
+    ) -> None:
+        assert consumer.on_message(completed_message()) is Outcome.ACK
+
+    def test_malformed_message_is_rejected(
+        self, consumer: VideoConvertedRabbitMQConsumer
+    ) -> None:
+        assert consumer.on_message(b"not valid json") is Outcome.REJECT
+
+    def test_missing_video_is_rejected(
+        self, mock_use_case: MagicMock, consumer: VideoConvertedRabbitMQConsumer
+    ) -> None:
+        mock_use_case.execute.side_effect = VideoNotFound
+
+        assert consumer.on_message(completed_message()) is Outcome.REJECT
+
+    def test_unexpected_failure_is_retried(
+        self, mock_use_case: MagicMock, consumer: VideoConvertedRabbitMQConsumer
+    ) -> None:
+        mock_use_case.execute.side_effect = ConnectionError
+
+        assert consumer.on_message(completed_message()) is Outcome.RETRY
+
+
+class TestVideoConvertedRabbitMQConsumerConcurrency:
+    def test_acks_every_processed_message(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        messages = [completed_message() for _ in range(10)]
+        for message in messages:
+            broker.publish("videos.converted", message)
+
+        consume(broker, mock_use_case)
+
+        assert mock_use_case.execute.call_count == 10
+        assert sorted(broker.acked) == sorted(messages)
+        assert broker.rejected == []
+
+    def test_failing_message_is_retried_then_dead_lettered(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        mock_use_case.execute.side_effect = ConnectionError
+        message = completed_message()
+        broker.publish("videos.converted", message)
+
+        consume(broker, mock_use_case, max_retries=2)
+
+        assert mock_use_case.execute.call_count == 3
+        assert broker.messages("videos.converted.dead") == [message]
+        assert broker.messages("videos.converted") == []
+
+    def test_retry_succeeds_after_transient_failure(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        mock_use_case.execute.side_effect = [ConnectionError, None]
+        broker.publish("videos.converted", completed_message())
+
+        consume(broker, mock_use_case)
+
+        assert mock_use_case.execute.call_count == 2
+        assert broker.messages("videos.converted.dead") == []
+
+    def test_redelivery_after_restart_is_not_a_retry(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        mock_use_case.execute.side_effect = [ConnectionError, None]
+        # What the broker hands out again after a consumer restart.
+        broker.queues["videos.converted"] = deque(
+            [(completed_message(), True, BasicProperties())]
+        )
+
+        consume(broker, mock_use_case)
+
+        assert mock_use_case.execute.call_count == 2
+        assert broker.messages("videos.converted.dead") == []
+
+    def test_rejected_message_is_dead_lettered(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        broker.publish("videos.converted", b"not valid json")
+
+        consume(broker, mock_use_case)
+
+        assert broker.messages("videos.converted.dead") == [b"not valid json"]
+        assert mock_use_case.execute.call_count == 0
+
+    def test_messages_are_processed_in_parallel(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        # Only completes if four messages are being handled at the same time.
+        barrier = threading.Barrier(4, timeout=5)
+        mock_use_case.execute.side_effect = lambda request: barrier.wait()
+        partitioner = VideoConvertedRabbitMQConsumer(use_case=mock_use_case, workers=4)
+        by_partition: dict[int, bytes] = {}
+        while len(by_partition) < 4:
+            message = completed_message()
+            by_partition.setdefault(partitioner.partition(message), message)
+        for message in by_partition.values():
+            broker.publish("videos.converted", message)
+
+        consume(broker, mock_use_case, workers=4, prefetch_count=4)
+
+        assert len(broker.acked) == 4
+
+    def test_in_flight_messages_are_bounded_by_prefetch_count(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def execute(request) -> None:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        mock_use_case.execute.side_effect = execute
+        for _ in range(12):
+            broker.publish("videos.converted", completed_message())
+
+        consume(broker, mock_use_case, workers=8, prefetch_count=2)
+
+        assert in_flight[1] <= 2
+        assert len(broker.acked) == 12
+
+
+class TestVideoConvertedRabbitMQConsumerPartitioning:
+    def test_media_of_one_video_share_a_partition(
+        self, mock_use_case: MagicMock
+    ) -> None:
+        consumer = VideoConvertedRabbitMQConsumer(use_case=mock_use_case, workers=8)
+        video_id = uuid4()
+
+        assert consumer.partition(
+            completed_message(video_id, "VIDEO")
+        ) == consumer.partition(completed_message(video_id, "TRAILER"))
+
+    def test_malformed_message_still_gets_a_partition(
+        self, mock_use_case: MagicMock
+    ) -> None:
+        consumer = VideoConvertedRabbitMQConsumer(use_case=mock_use_case, workers=8)
+
+        assert 0 <= consumer.partition(b"not valid json") < 8
+
+    def test_messages_for_one_video_are_processed_in_order(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        video_id = uuid4()
+        processed: list[str] = []
+
+        def execute(request) -> None:
+            if request.video_id == video_id:
+                threading.Event().wait(0.001)
+                processed.append(request.encoded_location)
+
+        mock_use_case.execute.side_effect = execute
+        for index in range(20):
+            broker.publish(
+                "videos.converted",
+                completed_message(video_id, encoded_location=f"/encoded/{index}"),
+            )
+            broker.publish("videos.converted", completed_message())
+
+        consume(broker, mock_use_case, workers=4, prefetch_count=16)
+
+        assert processed == [f"/encoded/{index}" for index in range(20)]
+        assert len(broker.acked) == 40
+
+    def test_retried_message_keeps_its_place_among_its_video(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        video_id = uuid4()
+        processed: list[str] = []
+        failures: list[str] = ["/encoded/0", "/encoded/0", "/encoded/3"]
+
+        def execute(request) -> None:
+            if request.video_id != video_id:
+                return
+            if request.encoded_location in failures:
+                failures.remove(request.encoded_location)
+                raise ConnectionError
+            processed.append(request.encoded_location)
+
+        mock_use_case.execute.side_effect = execute
+        for index in range(6):
+            broker.publish(
+                "videos.converted",
+                completed_message(video_id, encoded_location=f"/encoded/{index}"),
+            )
+            broker.publish("videos.converted", completed_message())
+
+        consume(broker, mock_use_case, workers=4, prefetch_count=16)
+
+        assert processed == [f"/encoded/{index}" for index in range(6)]
+        assert broker.messages("videos.converted.dead") == []
+
+
+class TestVideoBacklog:
+    def test_defers_a_video_behind_its_failed_message(self) -> None:
+        backlog = VideoBacklog()
+        failed = backlog.park(b"video", failed=True)
+
+        assert backlog.admit(b"other", None) is True
+        assert backlog.admit(b"video", None) is False
+        deferred = backlog.park(b"video", failed=False)
+        assert backlog.admit(b"video", failed) is True
+        assert backlog.admit(b"video", deferred) is True
+        assert backlog.admit(b"video", None) is True
+
+    def test_defers_again_behind_a_message_that_fails_twice(self) -> None:
+        backlog = VideoBacklog()
+        failed = backlog.park(b"video", failed=True)
+        assert backlog.admit(b"video", None) is False
+        deferred = backlog.park(b"video", failed=False)
+
+        assert backlog.admit(b"video", failed) is True
+        failed = backlog.park(b"video", failed=True)
+
+        assert backlog.admit(b"video", deferred) is False
+        deferred = backlog.park(b"video", failed=False)
+        assert backlog.admit(b"video", failed) is True
+        assert backlog.admit(b"video", deferred) is True
+
+
+class TestVideoConvertedRabbitMQConsumerDeduplication:
+    def test_redelivered_result_is_acked_without_running_the_use_case(
+        self, mock_use_case: MagicMock
+    ) -> None:
+        consumer = VideoConvertedRabbitMQConsumer(
+            use_case=mock_use_case,
+            deduplication_store=InMemoryDeduplicationStore(),
+        )
+        message = completed_message()
+
+        assert consumer.on_message(message) is Outcome.ACK
+        assert consumer.on_message(message) is Outcome.ACK
+
+        mock_use_case.execute.assert_called_once()
+
+    def test_failed_message_is_not_remembered(self, mock_use_case: MagicMock) -> None:
+        consumer = VideoConvertedRabbitMQConsumer(
+            use_case=mock_use_case,
+            deduplication_store=InMemoryDeduplicationStore(),
+        )
+        mock_use_case.execute.side_effect = [ConnectionError, None]
+        message = completed_message()
+
+        assert consumer.on_message(message) is Outcome.RETRY
+        assert consumer.on_message(message) is Outcome.ACK
+
+        assert mock_use_case.execute.call_count == 2
+
+    def test_expired_keys_are_purged_once_connected(
+        self, broker: InMemoryBroker, mock_use_case: MagicMock
+    ) -> None:
+        store = MagicMock(wraps=InMemoryDeduplicationStore())
+        broker.publish("videos.converted", completed_message())
+
+        VideoConvertedRabbitMQConsumer(
+            use_case=mock_use_case,
+            connection_factory=broker.connect,
+            deduplication_store=store,
+        ).start()
+
+        store.purge_expired.assert_called_once_with()
@@ -0,0 +1,320 @@
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from uuid import UUID
+
+from django.db import close_old_connections
+from pika import BlockingConnection, ConnectionParameters
+from pika.adapters.blocking_connection import BlockingChannel
+
+from core.video.application.use_cases.bulk_process_audio_video_media import (
+    BulkProcessAudioVideoMedia,
+)
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+from django_project.adapters.messaging.abstract_consumer import AbstractConsumer
+from django_project.adapters.messaging.deduplication_store import (
+    DeduplicationStore,
+    NullDeduplicationStore,
+    message_key,
+)
+from django_project.adapters.messaging.video_converted_consumer import (
+    PARSE_ERRORS,
+    Outcome,
+    RetryPolicy,
+    VideoBacklog,
+    delivery_retries,
+    delivery_stamp,
+    parse_message,
+    purge_processed,
+    video_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PendingMessage:
+    delivery_tag: int
+    retries: int
+    stamp: int | None
+    body: bytes
+
+
+class VideoConvertedBatchConsumer(AbstractConsumer):
+    """Consumes encoder results in micro-batches.
+
+    Deliveries are buffered on the I/O thread until batch_size arrive or
+    max_wait seconds pass, then a single worker applies the whole batch in
+    one transaction and acks it with one multiple-ack. Having one worker
+    keeps batches, and so each video's callbacks, in delivery order; the
+    messages of a video after one that failed follow it through the delay
+    queue (see VideoBacklog).
+
+    Every purge_interval seconds, starting when it connects, the worker
+    also deletes the expired keys of deduplication_store.
+    """
+
+    def __init__(
+        self,
+        use_case: BulkProcessAudioVideoMedia,
+        host: str = "localhost",
+        queue: str = "videos.converted",
+        batch_size: int = 100,
+        max_wait: float = 0.2,
+        prefetch_count: int | None = None,
+        connection_factory: Callable[[], BlockingConnection] | None = None,
+        deduplication_store: DeduplicationStore | None = None,
+        max_retries: int = 5,
+        dead_letter_queue: str | None = None,
+        retry_delay: float = 5.0,
+        purge_interval: float = 3600.0,
+    ):
+        self.use_case = use_case
+        self.host: str = host
+        self.queue: str = queue
+        self.retry_policy = RetryPolicy(
+            queue=queue,
+            dead_letter_queue=dead_letter_queue or f"{queue}.dead",
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+        self.batch_size: int = batch_size
+        self.max_wait: float = max_wait
+        # Room for the next batch to fill while the current one is written.
+        self.prefetch_count: int = prefetch_count or 2 * batch_size
+        self.connection_factory: Callable[[], BlockingConnection] = (
+            connection_factory
+            or (lambda: BlockingConnection(ConnectionParameters(host=self.host)))
+        )
+        self.deduplication_store: DeduplicationStore = (
+            deduplication_store or NullDeduplicationStore()
+        )
+        self.purge_interval: float = purge_interval
+        self.connection: BlockingConnection | None = None
+        self.channel: BlockingChannel | None = None
+        self.executor: ThreadPoolExecutor | None = None
+        self.backlog = VideoBacklog()
+        self.pending: list[PendingMessage] = []
+        self.timer = None
+
+    def on_message(self, message: bytes) -> Outcome:
+        return self.on_batch([message])[0]
+
+    def on_batch(self, messages: list[bytes]) -> list[Outcome]:
+        outcomes: list[Outcome] = [Outcome.ACK] * len(messages)
+        parsed: dict[int, ProcessAudioVideoMedia.Input] = {}
+        for index, message in enumerate(messages):
+            try:
+                item: ProcessAudioVideoMedia.Input | None = parse_message(message)
+            except PARSE_ERRORS:
+                logger.error(f"Error processing payload {message}", exc_info=True)
+                outcomes[index] = Outcome.REJECT
+                continue
+            if item is not None:
+                parsed[index] = item
+        if not parsed:
+            return outcomes
+
+        try:
+            keys: dict[int, str] = {
+                index: message_key(item) for index, item in parsed.items()
+            }
+            duplicates: set[str] = self.deduplication_store.seen(keys.values())
+        except Exception:
+            logger.error(f"Error processing batch of {len(parsed)}", exc_info=True)
+            for index in parsed:
+                outcomes[index] = Outcome.RETRY
+            return outcomes
+        positions: list[int] = []
+        for index, key in keys.items():
+            # Also drops repeats of a key within the batch.
+            if key not in duplicates:
+                duplicates.add(key)
+                positions.append(index)
+        if not positions:
+            return outcomes
+
+        try:
+            not_found: set[int] = self._execute(parsed, positions)
+        except Exception:
+            logger.error(f"Error processing batch of {len(positions)}", exc_info=True)
+            not_found, failed = (
+                self._execute_each(parsed, positions)
+                if len(positions) > 1
+                else (set(), set(positions))
+            )
+            for index in failed:
+                outcomes[index] = Outcome.RETRY
+            positions = [index for index in positions if index not in failed]
+
+        for index in not_found:
+            logger.error(f"Video or media not found for payload {messages[index]}")
+            outcomes[index] = Outcome.REJECT
+        try:
+            self.deduplication_store.mark(
+                keys[index] for index in positions if index not in not_found
+            )
+        except Exception:
+            # The batch is committed; at worst a redelivery runs it again.
+            logger.error("Error recording processed messages", exc_info=True)
+        return outcomes
+
+    def _execute(
+        self, parsed: dict[int, ProcessAudioVideoMedia.Input], positions: list[int]
+    ) -> set[int]:
+        """Applies the items at positions in one transaction and returns the
+        positions whose video or media does not exist."""
+        output: BulkProcessAudioVideoMedia.Output = self.use_case.execute(
+            BulkProcessAudioVideoMedia.Input(
+                items=[parsed[index] for index in positions]
+            )
+        )
+        return {positions[item_index] for item_index in output.not_found}
+
+    def _execute_each(
+        self, parsed: dict[int, ProcessAudioVideoMedia.Input], positions: list[int]
+    ) -> tuple[set[int], set[int]]:
+        """Fallback for a failed batch: applies items one at a time, so one bad
+        item does not hold back the items of other videos. Returns the not
+        found and the failed positions; the items of a video after one that
+        failed count as failed without being applied."""
+        not_found: set[int] = set()
+        failed: set[int] = set()
+        failed_videos: set[UUID] = set()
+        for index in positions:
+            if parsed[index].video_id in failed_videos:
+                failed.add(index)
+                continue
+            try:
+                not_found |= self._execute(parsed, [index])
+            except Exception:
+                logger.error(f"Error processing item {index} of batch", exc_info=True)
+                failed.add(index)
+                failed_videos.add(parsed[index].video_id)
+        return not_found, failed
+
+    def start(self):
+        self.connection = self.connection_factory()
+        self.channel = self.connection.channel()
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
+        self.retry_policy.declare(self.channel)
+        self.channel.basic_consume(
+            queue=self.queue,
+            on_message_callback=self.on_message_callback,
+            auto_ack=False,
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="video-converted-batch"
+        )
+        # Messages parked by an earlier connection may never have been sent.
+        self.backlog = VideoBacklog()
+        self.connection.call_later(0, self._schedule_purge)
+        print("Batch consumer started. Waiting for messages. To exit press CTRL+C")
+        try:
+            self.channel.start_consuming()
+        finally:
+            # Buffered messages stay unacked and are redelivered by the broker.
+            self.executor.shutdown(wait=True)
+            if self.connection.is_open:
+                self.connection.process_data_events(time_limit=0)
+                self.connection.close()
+
+    def on_message_callback(self, ch, method, properties, body):
+        self.pending.append(
+            PendingMessage(
+                method.delivery_tag,
+                delivery_retries(properties),
+                delivery_stamp(properties),
+                body,
+            )
+        )
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = self.connection.call_later(self.max_wait, self._on_timeout)
+
+    def flush(self) -> None:
+        if self.timer is not None:
+            self.connection.remove_timeout(self.timer)
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            self.executor.submit(self._process, self.channel, batch)
+
+    def _on_timeout(self) -> None:
+        self.timer = None
+        self.flush()
+
+    def _process(self, channel: BlockingChannel, batch: list[PendingMessage]) -> None:
+        videos: list[bytes] = [video_key(message.body) for message in batch]
+        admitted: list[int] = [
+            index
+            for index, message in enumerate(batch)
+            if self.backlog.admit(videos[index], message.stamp)
+        ]
+        outcomes: list[Outcome] = [Outcome.DEFER] * len(batch)
+        try:
+            results: list[Outcome] = self.on_batch(
+                [batch[index].body for index in admitted]
+            )
+        finally:
+            close_old_connections()
+        for index, outcome in zip(admitted, results):
+            outcomes[index] = outcome
+        stamps: list[int | None] = self._park(batch, videos, outcomes)
+        self.connection.add_callback_threadsafe(
+            functools.partial(self._settle, channel, batch, outcomes, stamps)
+        )
+
+    def _park(
+        self,
+        batch: list[PendingMessage],
+        videos: list[bytes],
+        outcomes: list[Outcome],
+    ) -> list[int | None]:
+        """Stamps the messages going to the delay queue. Within the batch,
+        a video's messages after one that failed are deferred behind it
+        rather than retried on their own."""
+        stamps: list[int | None] = []
+        failed_videos: set[bytes] = set()
+        for index, message in enumerate(batch):
+            if outcomes[index] is Outcome.RETRY and videos[index] in failed_videos:
+                outcomes[index] = Outcome.DEFER
+            if not self.retry_policy.delays(outcomes[index], message.retries):
+                stamps.append(None)
+                continue
+            failed: bool = outcomes[index] is Outcome.RETRY
+            if failed:
+                failed_videos.add(videos[index])
+            stamps.append(self.backlog.park(videos[index], failed=failed))
+        return stamps
+
+    def _settle(
+        self,
+        channel: BlockingChannel,
+        batch: list[PendingMessage],
+        outcomes: list[Outcome],
+        stamps: list[int | None],
+    ) -> None:
+        if not channel.is_open:
+            return
+        for message, outcome, stamp in zip(batch, outcomes, stamps):
+            if outcome is not Outcome.ACK:
+                self.retry_policy.forward(
+                    channel, message.body, message.retries, outcome, stamp
+                )
+        # Earlier batches are already settled and later deliveries have
+        # higher tags, so this acks exactly this batch, republished copies
+        # included.
+        channel.basic_ack(delivery_tag=batch[-1].delivery_tag, multiple=True)
+
+    def _schedule_purge(self) -> None:
+        self.executor.submit(purge_processed, self.deduplication_store)
+        self.connection.call_later(self.purge_interval, self._schedule_purge)
+
+    def stop(self):
+        self.connection.add_callback_threadsafe(self.channel.stop_consuming)
@@ -1,77 +1,417 @@
+import functools
 import json
 import logging
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
 from uuid import UUID
 
-from pika import BlockingConnection, ConnectionParameters
+from django.db import close_old_connections
+from pika import BasicProperties, BlockingConnection, ConnectionParameters
 from pika.adapters.blocking_connection import BlockingChannel
 
+from core.video.application.exceptions import AudioVideoMediaNotFound, VideoNotFound
 from core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
 from core.video.domain.value_objects import MediaStatus, MediaType
 from django_project.adapters.messaging.abstract_consumer import AbstractConsumer
+from django_project.adapters.messaging.deduplication_store import (
+    DeduplicationStore,
+    NullDeduplicationStore,
+    message_key,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class Outcome(Enum):
+    ACK = "ack"
+    REJECT = "reject"
+    RETRY = "retry"
+    # Not run, to stay behind an earlier message of its video that is waiting
+    # in the delay queue.
+    DEFER = "defer"
+
+
+PARSE_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+RETRIES_HEADER = "x-retries"
+STAMP_HEADER = "x-delay-stamp"
+
+
+def delivery_retries(properties: BasicProperties | None) -> int:
+    headers: dict = getattr(properties, "headers", None) or {}
+    return int(headers.get(RETRIES_HEADER, 0))
+
+
+def delivery_stamp(properties: BasicProperties | None) -> int | None:
+    """The stamp VideoBacklog.park gave the message when it was sent to the
+    delay queue, or None for a message that has not been there."""
+    headers: dict = getattr(properties, "headers", None) or {}
+    stamp = headers.get(STAMP_HEADER)
+    return None if stamp is None else int(stamp)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Where a message that was not acked goes.
+
+    A RETRY is published to the delay queue with its attempt count in a
+    header, up to max_retries times. The delay queue has no consumers: after
+    retry_delay seconds the broker dead-letters the message back to the main
+    queue. A DEFER takes the same path without using up an attempt. A REJECT,
+    or a RETRY out of attempts, goes to the dead-letter queue to be inspected
+    and replayed. Nothing is dropped, and a consumer restart does not count
+    as an attempt.
+    """
+
+    queue: str
+    dead_letter_queue: str
+    max_retries: int
+    retry_delay: float = 5.0
+
+    @property
+    def delay_queue(self) -> str:
+        return f"{self.queue}.retry"
+
+    def declare(self, channel: BlockingChannel) -> None:
+        channel.queue_declare(queue=self.queue)
+        channel.queue_declare(
+            queue=self.delay_queue,
+            arguments={
+                "x-message-ttl": int(self.retry_delay * 1000),
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": self.queue,
+            },
+        )
+        channel.queue_declare(queue=self.dead_letter_queue)
+        # basic_publish raises if the broker does not take the message, so the
+        # original is never acked without its copy.
+        channel.confirm_delivery()
+
+    def delays(self, outcome: Outcome, retries: int) -> bool:
+        """Whether forward sends the message to the delay queue rather than
+        to the dead-letter queue."""
+        return outcome is Outcome.DEFER or (
+            outcome is Outcome.RETRY and retries < self.max_retries
+        )
+
+    def forward(
+        self,
+        channel: BlockingChannel,
+        body: bytes,
+        retries: int,
+        outcome: Outcome,
+        stamp: int | None = None,
+    ) -> None:
+        headers: dict = {RETRIES_HEADER: retries}
+        if not self.delays(outcome, retries):
+            routing_key = self.dead_letter_queue
+        else:
+            routing_key = self.delay_queue
+            if outcome is Outcome.RETRY:
+                headers[RETRIES_HEADER] = retries + 1
+            if stamp is not None:
+                headers[STAMP_HEADER] = stamp
+        channel.basic_publish(
+            exchange="",
+            routing_key=routing_key,
+            body=body,
+            properties=BasicProperties(headers=headers),
+        )
+
+
+@dataclass
+class ParkedVideo:
+    # Messages of the video sent to the delay queue and not back yet.
+    waiting: int = 0
+    # Stamp of the last of them that failed; the ones stamped before it are
+    # later in the video's order but come back first.
+    barrier: int = 0
+    stamp: int = 0
+
+
+class VideoBacklog:
+    """Keeps each video's callbacks in order around the delay queue.
+
+    Once a message of a video goes to the delay queue, later messages of
+    that video are deferred there behind it instead of being run. The delay
+    queue is FIFO, so they come back in order; when a message fails again on
+    its way back, the ones that were queued behind it are deferred once more.
+
+    Not thread-safe: each instance belongs to one worker thread, which must
+    see every message of its videos. The state lives in memory, so ordering
+    around a retry is not kept across a consumer restart.
+    """
+
+    def __init__(self) -> None:
+        self.videos: dict[bytes, ParkedVideo] = {}
+
+    def admit(self, video: bytes, stamp: int | None) -> bool:
+        """Whether a message of video, delivered with stamp, may run now."""
+        parked: ParkedVideo | None = self.videos.get(video)
+        if parked is None:
+            return True
+        if stamp is None:
+            held: bool = parked.waiting > 0
+        else:
+            parked.waiting = max(parked.waiting - 1, 0)
+            held = stamp < parked.barrier
+        if not held and parked.waiting == 0:
+            del self.videos[video]
+        return not held
+
+    def park(self, video: bytes, failed: bool) -> int:
+        """Records a message of video going to the delay queue, because it
+        failed or was deferred, and returns the stamp to send it with."""
+        parked: ParkedVideo = self.videos.setdefault(video, ParkedVideo())
+        parked.stamp += 1
+        parked.waiting += 1
+        if failed:
+            parked.barrier = parked.stamp
+        return parked.stamp
+
+
+def purge_processed(store: DeduplicationStore) -> None:
+    """Forgets expired processed-message keys; runs on a consumer worker."""
+    try:
+        purged: int = store.purge_expired()
+    except Exception:
+        logger.error("Error purging processed messages", exc_info=True)
+        return
+    finally:
+        close_old_connections()
+    if purged:
+        logger.info("Purged %d processed messages", purged)
+
+
+def video_key(message: bytes) -> bytes:
+    """The aggregate id in resource_id, or the message itself when it does not
+    match the contract."""
+    try:
+        payload: dict = json.loads(message)
+        media: dict = payload.get("video") or payload["message"]
+        return media["resource_id"].split(".")[0].encode("utf-8")
+    except PARSE_ERRORS:
+        return message
+
+
+def parse_message(message: bytes) -> ProcessAudioVideoMedia.Input | None:
+    """Use case input for an encoder result, or None when the encoder failed.
+
+    Raises one of PARSE_ERRORS for payloads that do not match the contract.
+    """
+    payload: dict = json.loads(message)
+
+    error_message = payload["error"]
+    if error_message:
+        aggregate_id_raw, _ = payload["message"]["resource_id"].split(".")
+        logger.error(f"Error processing video {aggregate_id_raw}: {error_message}")
+        return None
+
+    aggregate_id_raw, media_type_raw = payload["video"]["resource_id"].split(".")
+    return ProcessAudioVideoMedia.Input(
+        video_id=UUID(aggregate_id_raw),
+        encoded_location=payload["video"]["encoded_video_folder"],
+        media_type=MediaType(media_type_raw),
+        status=MediaStatus(payload["status"]),
+    )
+
+
 class VideoConvertedRabbitMQConsumer(AbstractConsumer):
+    """Consumes encoder results with a pool of worker threads.
+
+    Each worker owns a partition of the videos, picked by hashing the
+    aggregate id in resource_id, so callbacks for one video are applied in
+    order while different videos run in parallel. A message that fails goes
+    to the delay queue, and the worker defers its video's later messages
+    behind it (see VideoBacklog) rather than run them ahead of it.
+
+    pika channels belong to the I/O thread, so workers hand their ack or
+    nack back to it through add_callback_threadsafe. A message is acked
+    only after the use case has committed, or after retry_policy has
+    republished it; up to prefetch_count messages are in flight at once.
+
+    Every purge_interval seconds, starting when it connects, a separate
+    worker deletes the expired keys of deduplication_store.
+    """
+
     def __init__(
         self,
         use_case: ProcessAudioVideoMedia,
         host: str = "localhost",
         queue: str = "videos.converted",
+        prefetch_count: int = 16,
+        workers: int = 4,
+        connection_factory: Callable[[], BlockingConnection] | None = None,
+        deduplication_store: DeduplicationStore | None = None,
+        max_retries: int = 5,
+        dead_letter_queue: str | None = None,
+        retry_delay: float = 5.0,
+        purge_interval: float = 3600.0,
     ):
         self.use_case = use_case
         self.host: str = host
         self.queue: str = queue
+        self.prefetch_count: int = prefetch_count
+        self.workers: int = workers
+        self.retry_policy = RetryPolicy(
+            queue=queue,
+            dead_letter_queue=dead_letter_queue or f"{queue}.dead",
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+
+        self.deduplication_store: DeduplicationStore = (
+            deduplication_store or NullDeduplicationStore()
+        )
+        self.purge_interval: float = purge_interval
+        self.connection_factory: Callable[[], BlockingConnection] = (
+            connection_factory
+            or (lambda: BlockingConnection(ConnectionParameters(host=self.host)))
+        )
         self.connection: BlockingConnection | None = None
         self.channel: BlockingChannel | None = None
+        self.executors: list[ThreadPoolExecutor] = []
+        self.backlogs: list[VideoBacklog] = []
+        self.purger: ThreadPoolExecutor | None = None
 
-    def on_message(self, message: bytes):
+    def on_message(self, message: bytes) -> Outcome:
         print(f"Received message: {message}")
         try:
-            payload: dict = json.loads(message)
-
-            error_message = payload["error"]
-            if error_message:
-                aggregate_id_raw, _ = payload["message"]["resource_id"].split(".")
-                logger.error(
-                    f"Error processing video {aggregate_id_raw}: {error_message}"
-                )
-                return
-
-            aggregate_id_raw, media_type_raw = payload["video"]["resource_id"].split(
-                "."
-            )
-            aggregate_id: UUID = UUID(aggregate_id_raw)
-            media_type: MediaType = MediaType(media_type_raw)
-            encoded_location: str = payload["video"]["encoded_video_folder"]
-            status: MediaStatus = MediaStatus(payload["status"])
-
-            process_input = ProcessAudioVideoMedia.Input(
-                video_id=aggregate_id,
-                encoded_location=encoded_location,
-                media_type=media_type,
-                status=status,
+            process_input: ProcessAudioVideoMedia.Input | None = parse_message(
+                message
             )
+            if process_input is None:
+                return Outcome.ACK
+            key: str = message_key(process_input)
+            if self.deduplication_store.seen([key]):
+                logger.info(f"Skipping already processed message {message}")
+                return Outcome.ACK
             print("Calling use case with input", process_input)
             self.use_case.execute(request=process_input)
+        except (*PARSE_ERRORS, VideoNotFound, AudioVideoMediaNotFound):
+            # Redelivering a malformed message or one for a missing video
+            # cannot succeed.
+            logger.error(f"Error processing payload {message}", exc_info=True)
+            return Outcome.REJECT
         except Exception:
             logger.error(f"Error processing payload {message}", exc_info=True)
-            return
+            return Outcome.RETRY
+        self._mark_processed([key])
+        return Outcome.ACK
+
+    def _mark_processed(self, keys: list[str]) -> None:
+        try:
+            self.deduplication_store.mark(keys)
+        except Exception:
+            # The work is committed; at worst a redelivery runs it again.
+            logger.error("Error recording processed messages", exc_info=True)
 
     def start(self):
-        self.connection = BlockingConnection(ConnectionParameters(host=self.host))
+        self.connection = self.connection_factory()
         self.channel = self.connection.channel()
-        self.channel.queue_declare(queue=self.queue)
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
+        self.retry_policy.declare(self.channel)
         self.channel.basic_consume(
-            queue=self.queue, on_message_callback=self.on_message_callback
+            queue=self.queue,
+            on_message_callback=self.on_message_callback,
+            auto_ack=False,
+        )
+        self.executors = [
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"video-converted-{partition}"
+            )
+            for partition in range(self.workers)
+        ]
+        # Messages parked by an earlier connection may never have been sent.
+        self.backlogs = [VideoBacklog() for _ in range(self.workers)]
+        self.purger = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="video-converted-purge"
         )
+        self.connection.call_later(0, self._schedule_purge)
         print("Consumer started. Waiting for messages. To exit press CTRL+C")
-        self.channel.start_consuming()
+        try:
+            self.channel.start_consuming()
+        finally:
+            for executor in [*self.executors, self.purger]:
+                executor.shutdown(wait=True)
+            if self.connection.is_open:
+                # Runs the acks queued by the last workers before closing.
+                self.connection.process_data_events(time_limit=0)
+                self.connection.close()
 
     def on_message_callback(self, ch, method, properties, body):
-        self.on_message(body)
+        partition: int = self.partition(body)
+        self.executors[partition].submit(
+            self._process,
+            ch,
+            method.delivery_tag,
+            delivery_retries(properties),
+            delivery_stamp(properties),
+            body,
+            self.backlogs[partition],
+        )
+
+    def partition(self, message: bytes) -> int:
+        # Malformed messages, which on_message rejects, spread by content.
+        return zlib.crc32(video_key(message)) % self.workers
+
+    def _process(
+        self,
+        channel: BlockingChannel,
+        delivery_tag: int,
+        retries: int,
+        stamp: int | None,
+        body: bytes,
+        backlog: VideoBacklog,
+    ) -> None:
+        video: bytes = video_key(body)
+        if not backlog.admit(video, stamp):
+            outcome: Outcome = Outcome.DEFER
+        else:
+            try:
+                outcome = self.on_message(body)
+            finally:
+                # Worker threads keep their own DB connection; recycle it the
+                # way Django does at the end of a request.
+                close_old_connections()
+        parked_stamp: int | None = None
+        if self.retry_policy.delays(outcome, retries):
+            parked_stamp = backlog.park(video, failed=outcome is Outcome.RETRY)
+        self.connection.add_callback_threadsafe(
+            functools.partial(
+                self._settle,
+                channel,
+                delivery_tag,
+                retries,
+                parked_stamp,
+                body,
+                outcome,
+            )
+        )
+
+    def _settle(
+        self,
+        channel: BlockingChannel,
+        delivery_tag: int,
+        retries: int,
+        stamp: int | None,
+        body: bytes,
+        outcome: Outcome,
+    ) -> None:
+        if not channel.is_open:
+            # The broker redelivers unacked messages once the channel is gone.
+            return
+        if outcome is not Outcome.ACK:
+            self.retry_policy.forward(channel, body, retries, outcome, stamp)
+        channel.basic_ack(delivery_tag=delivery_tag)
+
+    def _schedule_purge(self) -> None:
+        self.purger.submit(purge_processed, self.deduplication_store)
+        self.connection.call_later(self.purge_interval, self._schedule_purge)
 
     def stop(self):
-        self.connection.close()
+        self.connection.add_callback_threadsafe(self.channel.stop_consuming)
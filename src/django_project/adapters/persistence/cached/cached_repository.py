@@ -0,0 +1,109 @@
+import copy
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, TypeVar
+from uuid import UUID
+
+from core._shared.application.ports.cache import Cache
+from core._shared.domain.pagination import Cursor, Page
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Shared by every request thread using the singleton repositories.
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, hits: int = 0, misses: int = 0) -> None:
+        with self.lock:
+            self.hits += hits
+            self.misses += misses
+
+
+class CachedRepository(Generic[T]):
+    """Read-through get_by_id on top of another repository, for any of the
+    category, genre and cast member repositories.
+
+    Writes go to the wrapped repository first and then evict the touched ids,
+    so the next read reloads them. Entities are copied in and out of the cache
+    because use cases mutate what they load.
+
+    dependents are the caches of aggregates holding ids of this one; they are
+    cleared when one of its entities is deleted.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        cache: Cache,
+        namespace: str = "",
+        stats: CacheStats | None = None,
+        dependents: tuple[Cache, ...] = (),
+    ) -> None:
+        self.repository = repository
+        self.cache: Cache = cache
+        self.namespace: str = namespace
+        self.stats: CacheStats = stats or CacheStats()
+        self.dependents: tuple[Cache, ...] = dependents
+
+    def save(self, entity: T) -> None:
+        self.repository.save(entity)
+        self._evict(entity.id)
+
+    def save_many(self, entities: List[T]) -> None:
+        self.repository.save_many(entities)
+        self._evict(*(entity.id for entity in entities))
+
+    def get_by_id(self, id: UUID) -> T | None:
+        entity = self.cache.get(self._key(id))
+        if entity is not None:
+            self.stats.record(hits=1)
+            return copy.deepcopy(entity)
+
+        self.stats.record(misses=1)
+        entity = self.repository.get_by_id(id)
+        if entity is not None:
+            self.cache.set(self._key(id), copy.deepcopy(entity))
+        return entity
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+        self._evict(id)
+        for cache in self.dependents:
+            cache.clear()
+
+    def update(self, entity: T) -> None:
+        self.repository.update(entity)
+        self._evict(entity.id)
+
+    def list(self) -> List[T]:
+        return self.repository.list()
+
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[T]:
+        return self.repository.paginate(order_by=order_by, offset=offset, limit=limit)
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[T]:
+        return self.repository.list_after(order_by=order_by, after=after, limit=limit)
+
+    def exists_by_ids(self, ids: set[UUID]) -> bool:
+        return not self.find_missing_ids(ids)
+
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        # A cached entity is known to exist; only the rest go to the database.
+        unknown: set[UUID] = {id for id in ids if self.cache.get(self._key(id)) is None}
+        self.stats.record(hits=len(ids) - len(unknown), misses=len(unknown))
+        if not unknown:
+            return set()
+        return self.repository.find_missing_ids(unknown)
+
+    def _key(self, id: UUID) -> str:
+        return f"{self.namespace}:{id}"
+
+    def _evict(self, *ids: UUID) -> None:
+        for id in ids:
+            self.cache.delete(self._key(id))
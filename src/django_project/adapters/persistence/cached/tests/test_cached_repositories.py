@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.category.domain.category import Category
+from core.genre.domain.genre import Genre
+from django_project.adapters.cache.lru_cache import LRUCache
+from django_project.adapters.persistence.cached.cached_repository import (
+    CachedRepository,
+    CacheStats,
+)
+from django_project.adapters.persistence.in_memory.category_repository import (
+    InMemoryCategoryRepository,
+)
+from django_project.adapters.persistence.in_memory.genre_repository import (
+    InMemoryGenreRepository,
+)
+
+
+@pytest.fixture
+def movie() -> Category:
+    return Category(name="Movie", description="Movies")
+
+
+@pytest.fixture
+def inner(movie: Category) -> MagicMock:
+    return MagicMock(wraps=InMemoryCategoryRepository([movie]))
+
+
+@pytest.fixture
+def repository(inner: MagicMock) -> CachedRepository:
+    return CachedRepository(repository=inner, cache=LRUCache(), namespace="category")
+
+
+class TestGetById:
+
+    def test_second_read_is_served_from_cache(
+        self, repository: CachedRepository, inner: MagicMock, movie: Category
+    ) -> None:
+        assert repository.get_by_id(movie.id) == movie
+        assert repository.get_by_id(movie.id) == movie
+
+        inner.get_by_id.assert_called_once_with(movie.id)
+        assert (repository.stats.hits, repository.stats.misses) == (1, 1)
+
+    def test_missing_entity_is_not_cached(
+        self, repository: CachedRepository, inner: MagicMock
+    ) -> None:
+        missing_id = uuid4()
+
+        assert repository.get_by_id(missing_id) is None
+        assert repository.get_by_id(missing_id) is None
+
+        assert inner.get_by_id.call_count == 2
+
+    def test_mutating_a_loaded_entity_does_not_touch_the_cache(
+        self, repository: CachedRepository, movie: Category
+    ) -> None:
+        loaded = repository.get_by_id(movie.id)
+        loaded.update_category(name="Changed", description="Changed")
+
+        assert repository.get_by_id(movie.id).name == "Movie"
+
+
+class TestInvalidation:
+
+    def test_update_evicts_entry(
+        self, repository: CachedRepository, inner: MagicMock, movie: Category
+    ) -> None:
+        category = repository.get_by_id(movie.id)
+        category.update_category(name="Film", description="Films")
+
+        repository.update(category)
+
+        assert repository.get_by_id(movie.id).name == "Film"
+        assert inner.get_by_id.call_count == 2
+
+    def test_delete_evicts_entry(
+        self, repository: CachedRepository, movie: Category
+    ) -> None:
+        repository.get_by_id(movie.id)
+
+        repository.delete(movie.id)
+
+        assert repository.get_by_id(movie.id) is None
+
+    def test_save_evicts_entry(
+        self, repository: CachedRepository, inner: MagicMock, movie: Category
+    ) -> None:
+        repository.get_by_id(movie.id)
+
+        repository.save(movie)
+
+        assert repository.cache.get(f"category:{movie.id}") is None
+
+
+class TestFindMissingIds:
+
+    def test_cached_ids_skip_the_wrapped_repository(
+        self, repository: CachedRepository, inner: MagicMock, movie: Category
+    ) -> None:
+        repository.get_by_id(movie.id)
+
+        assert repository.find_missing_ids({movie.id}) == set()
+        inner.find_missing_ids.assert_not_called()
+
+    def test_only_unknown_ids_are_looked_up(
+        self, repository: CachedRepository, inner: MagicMock, movie: Category
+    ) -> None:
+        repository.get_by_id(movie.id)
+        missing_id = uuid4()
+
+        assert repository.find_missing_ids({movie.id, missing_id}) == {missing_id}
+        inner.find_missing_ids.assert_called_once_with({missing_id})
+        assert repository.exists_by_ids({movie.id, missing_id}) is False
+
+
+class TestSaveMany:
+
+    def test_save_many_evicts_every_saved_genre(self) -> None:
+        drama = Genre(name="Drama")
+        repository = CachedRepository(
+            repository=InMemoryGenreRepository([drama]),
+            cache=LRUCache(),
+            namespace="genre",
+        )
+        repository.get_by_id(drama.id)
+        drama.update_name("Romance")
+
+        repository.save_many([drama])
+
+        assert repository.cache.get(f"genre:{drama.id}") is None
+
+
+class TestCrossAggregateInvalidation:
+
+    def test_deleting_a_category_evicts_genres_holding_it(
+        self, movie: Category
+    ) -> None:
+        drama = Genre(name="Drama", categories={movie.id})
+        genre_cache = LRUCache()
+        genres = CachedRepository(
+            repository=InMemoryGenreRepository([drama]),
+            cache=genre_cache,
+            namespace="genre",
+        )
+        categories = CachedRepository(
+            repository=InMemoryCategoryRepository([movie]),
+            cache=LRUCache(),
+            namespace="category",
+            dependents=(genre_cache,),
+        )
+        genres.get_by_id(drama.id)
+
+        categories.delete(movie.id)
+
+        assert genre_cache.get(f"genre:{drama.id}") is None
+
+
+class TestCacheStats:
+
+    def test_counts_from_many_threads(self) -> None:
+        stats = CacheStats()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(1000):
+                executor.submit(stats.record, hits=1, misses=2)
+
+        assert (stats.hits, stats.misses) == (1000, 2000)
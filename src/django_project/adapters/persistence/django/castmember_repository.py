@@ -1,10 +1,13 @@
 from typing import List
 from uuid import UUID
+from config import BULK_BATCH_SIZE
+from core._shared.domain.pagination import Cursor, Page
 from core.castmember.domain.castmember import CastMember
 from core.castmember.domain.castmember_repository import CastMemberRepository
 from django_project.castmember_app.models import CastMember as CastMemberORM
 
 from django.db import transaction
+from django.db.models import Q
 
 
 class DjangoORMCastMemberRepository(CastMemberRepository):
@@ -20,6 +23,17 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             castmember_model.save()
         return None
 
+    def save_many(self, castmembers: List[CastMember]) -> None:
+        with transaction.atomic():
+            self.castmember_orm.objects.bulk_create(
+                [
+                    CastMemberModelMapper.to_model(castmember)
+                    for castmember in castmembers
+                ],
+                batch_size=BULK_BATCH_SIZE,
+            )
+        return None
+
     def get_by_id(self, id: UUID) -> CastMember:
         try:
             castmember_model = self.castmember_orm.objects.get(id=id)
@@ -49,6 +63,30 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             for castmember_model in self.castmember_orm.objects.all()
         ]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[CastMember]:
+        queryset = self.castmember_orm.objects.order_by(order_by, "id")
+        return Page(
+            items=[
+                CastMemberModelMapper.to_entity(castmember_model)
+                for castmember_model in queryset[offset : offset + limit]
+            ],
+            total=self.castmember_orm.objects.count(),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[CastMember]:
+        queryset = (
+            self.castmember_orm.objects
+            .filter(
+                Q(**{f"{order_by}__gt": after.value})
+                | Q(**{order_by: after.value, "id__gt": after.id})
+            )
+            .order_by(order_by, "id")
+        )
+        return [
+            CastMemberModelMapper.to_entity(castmember_model)
+            for castmember_model in queryset[:limit]
+        ]
+
     def update(self, castmember: CastMember) -> CastMember:
         try:
             self.castmember_orm.objects.get(id=castmember.id)
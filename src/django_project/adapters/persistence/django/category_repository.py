@@ -1,11 +1,14 @@
 from typing import List
 from uuid import UUID
 
+from config import BULK_BATCH_SIZE
+from core._shared.domain.pagination import Cursor, Page
 from core.category.domain.category_repository import CategoryRepository
 from core.category.domain.category import Category
 
 from django_project.category_app.models import Category as CategoryORM
 from django.db import transaction
+from django.db.models import Q
 
 
 class DjangoORMCategoryRepository(CategoryRepository):
@@ -24,6 +27,14 @@ class DjangoORMCategoryRepository(CategoryRepository):
         #     is_active=category.is_active,
         # )
 
+    def save_many(self, categories: List[Category]) -> None:
+        with transaction.atomic():
+            self.category_orm.objects.bulk_create(
+                [CategoryModelMapper.to_model(category) for category in categories],
+                batch_size=BULK_BATCH_SIZE,
+            )
+        return None
+
     def get_by_id(self, id: UUID) -> Category | None:
         try:
             category = self.category_orm.objects.get(id=id)
@@ -53,6 +64,30 @@ class DjangoORMCategoryRepository(CategoryRepository):
             for category_model in self.category_orm.objects.all()
         ]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        queryset = self.category_orm.objects.order_by(order_by, "id")
+        return Page(
+            items=[
+                CategoryModelMapper.to_entity(category_model)
+                for category_model in queryset[offset : offset + limit]
+            ],
+            total=self.category_orm.objects.count(),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Category]:
+        queryset = (
+            self.category_orm.objects
+            .filter(
+                Q(**{f"{order_by}__gt": after.value})
+                | Q(**{order_by: after.value, "id__gt": after.id})
+            )
+            .order_by(order_by, "id")
+        )
+        return [
+            CategoryModelMapper.to_entity(category_model)
+            for category_model in queryset[:limit]
+        ]
+
     def update(self, category: Category) -> None:
         try:
             self.category_orm.objects.get(pk=category.id)
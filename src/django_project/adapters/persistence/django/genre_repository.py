@@ -1,10 +1,13 @@
 from typing import List
 from uuid import UUID
+from config import BULK_BATCH_SIZE
+from core._shared.domain.pagination import Cursor, Page
 from core.genre.domain.genre import Genre
 from core.genre.domain.genre_repository import GenreRepository
 from django_project.genre_app.models import Genre as GenreORM
 
 from django.db import transaction
+from django.db.models import Q
 
 
 class DjangoORMGenreRepository(GenreRepository):
@@ -22,6 +25,28 @@ class DjangoORMGenreRepository(GenreRepository):
 
         return None
 
+    def save_many(self, genres: List[Genre]) -> None:
+        through = self.genre_orm.categories.through
+        with transaction.atomic():
+            self.genre_orm.objects.bulk_create(
+                [
+                    self.genre_orm(
+                        id=genre.id, name=genre.name, is_active=genre.is_active
+                    )
+                    for genre in genres
+                ],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            through.objects.bulk_create(
+                [
+                    through(genre_id=genre.id, category_id=category_id)
+                    for genre in genres
+                    for category_id in genre.categories
+                ],
+                batch_size=BULK_BATCH_SIZE,
+            )
+        return None
+
     def get_by_id(self, id: UUID) -> Genre:
         try:
             genre_model = self.genre_orm.objects.get(id=id)
@@ -53,6 +78,32 @@ class DjangoORMGenreRepository(GenreRepository):
             for genre_model in self.genre_orm.objects.all()
         ]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Genre]:
+        queryset = self.genre_orm.objects.prefetch_related("categories").order_by(
+            order_by, "id"
+        )
+        return Page(
+            items=[
+                GenreModelMapper.to_entity(genre_model)
+                for genre_model in queryset[offset : offset + limit]
+            ],
+            total=self.genre_orm.objects.count(),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Genre]:
+        queryset = (
+            self.genre_orm.objects.prefetch_related("categories")
+            .filter(
+                Q(**{f"{order_by}__gt": after.value})
+                | Q(**{order_by: after.value, "id__gt": after.id})
+            )
+            .order_by(order_by, "id")
+        )
+        return [
+            GenreModelMapper.to_entity(genre_model)
+            for genre_model in queryset[:limit]
+        ]
+
     def update(self, genre: Genre) -> Genre:
         try:
             self.genre_orm.objects.get(id=genre.id)
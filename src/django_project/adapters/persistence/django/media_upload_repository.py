@@ -0,0 +1,95 @@
+from datetime import datetime
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from core.video.domain.media_upload import MediaUpload, UploadStatus
+from core.video.domain.media_upload_repository import MediaUploadRepository
+from core.video.domain.value_objects import MediaType
+from django_project.video_app.models import MediaUpload as MediaUploadORM
+from django_project.video_app.models import MediaUploadChunk as MediaUploadChunkORM
+from django_project.video_app.models import MediaUploadLease as MediaUploadLeaseORM
+
+
+class DjangoORMMediaUploadRepository(MediaUploadRepository):
+    def save(self, upload: MediaUpload) -> None:
+        with transaction.atomic():
+            MediaUploadORM.objects.update_or_create(
+                id=upload.id,
+                defaults={
+                    "video_id": upload.video_id,
+                    "file_name": upload.file_name,
+                    "content_type": upload.content_type,
+                    "media_type": upload.media_type.name,
+                    "size": upload.size,
+                    "chunk_size": upload.chunk_size,
+                    "status": upload.status.name,
+                    "file_path": upload.file_path,
+                    "checksum": upload.checksum,
+                },
+            )
+
+    def get_by_id(self, id: UUID) -> MediaUpload | None:
+        return self._get(MediaUploadORM.objects.all(), id)
+
+    def get_for_update(self, id: UUID) -> MediaUpload | None:
+        return self._get(MediaUploadORM.objects.select_for_update(), id)
+
+    def _get(self, queryset: QuerySet, id: UUID) -> MediaUpload | None:
+        try:
+            model: MediaUploadORM = queryset.get(id=id)
+        except MediaUploadORM.DoesNotExist:
+            return None
+        return MediaUpload(
+            id=model.id,
+            video_id=model.video_id,
+            file_name=model.file_name,
+            content_type=model.content_type,
+            media_type=MediaType[model.media_type],
+            size=model.size,
+            chunk_size=model.chunk_size,
+            status=UploadStatus[model.status],
+            file_path=model.file_path,
+            checksum=model.checksum,
+        )
+
+    def delete(self, id: UUID) -> None:
+        MediaUploadORM.objects.filter(id=id).delete()
+
+    def delete_created_before(self, created_before: datetime) -> list[UUID]:
+        with transaction.atomic():
+            expired = MediaUploadORM.objects.select_for_update().filter(
+                created_at__lt=created_before
+            )
+            ids: list[UUID] = list(expired.values_list("id", flat=True))
+            MediaUploadORM.objects.filter(id__in=ids).delete()
+        return ids
+
+    def save_chunk(self, upload_id: UUID, index: int, checksum: str) -> None:
+        # Chunks arrive concurrently and may be retried; the unique
+        # (upload, index) constraint turns a resend into an update.
+        MediaUploadChunkORM.objects.bulk_create(
+            [MediaUploadChunkORM(upload_id=upload_id, index=index, checksum=checksum)],
+            update_conflicts=True,
+            unique_fields=["upload", "index"],
+            update_fields=["checksum"],
+        )
+
+    def get_chunk_checksums(self, upload_id: UUID) -> dict[int, str]:
+        return dict(
+            MediaUploadChunkORM.objects.filter(upload_id=upload_id).values_list(
+                "index", "checksum"
+            )
+        )
+
+    def acquire_lease(self, upload_id: UUID) -> UUID:
+        return MediaUploadLeaseORM.objects.create(upload_id=upload_id).id
+
+    def release_lease(self, lease_id: UUID) -> None:
+        MediaUploadLeaseORM.objects.filter(id=lease_id).delete()
+
+    def count_leases(self, upload_id: UUID, acquired_after: datetime) -> int:
+        return MediaUploadLeaseORM.objects.filter(
+            upload_id=upload_id, acquired_at__gt=acquired_after
+        ).count()
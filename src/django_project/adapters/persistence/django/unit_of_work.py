@@ -0,0 +1,10 @@
+from contextlib import AbstractContextManager
+
+from django.db import transaction
+
+from core._shared.application.ports.unit_of_work import UnitOfWork
+
+
+class DjangoUnitOfWork(UnitOfWork):
+    def atomic(self) -> AbstractContextManager[None]:
+        return transaction.atomic()
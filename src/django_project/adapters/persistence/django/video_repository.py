@@ -1,6 +1,13 @@
-from typing import List
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List
 from uuid import UUID
 from django.db import transaction
+from django.db.models import CharField, Count, Model, Q, QuerySet, Value
+from config import BULK_BATCH_SIZE
+from core._shared.domain.pagination import Cursor, Page
 from core.video.domain.video import Video
 from core.video.domain.video_repository import VideoRepository
 from core.video.domain.value_objects import (
@@ -14,23 +21,109 @@ from django_project.video_app.models import Video as VideoORM
 from django_project.video_app.models import ImageMedia as ImageMediaORM
 from django_project.video_app.models import AudioVideoMedia as AudioVideoMediaORM
 
+SCALAR_FIELDS = (
+    "title",
+    "description",
+    "launch_year",
+    "duration",
+    "published",
+    "rating",
+)
+RELATION_FIELDS = ("categories", "genres", "cast_members")
+MEDIA_FIELDS = ("banner", "thumbnail", "thumbnail_half", "trailer", "video")
+# Reverse one-to-one names from AudioVideoMedia back to its Video row.
+MEDIA_OWNER_LOOKUPS = {
+    MediaType.VIDEO: "video_media__id",
+    MediaType.TRAILER: "video_trailer__id",
+}
+
+
+@dataclass(frozen=True)
+class VideoSnapshot:
+    entity: weakref.ref
+    columns: dict[str, Any]
+    relations: dict[str, set[UUID]]
+    media: dict[str, tuple[UUID | None, ImageMedia | AudioVideoMedia | None]]
+
+    @classmethod
+    def capture(
+        cls, video: Video, media_ids: dict[str, UUID | None]
+    ) -> "VideoSnapshot":
+        return cls(
+            entity=weakref.ref(video),
+            columns={name: getattr(video, name) for name in SCALAR_FIELDS},
+            relations={name: set(getattr(video, name)) for name in RELATION_FIELDS},
+            media={
+                name: (media_ids.get(name), getattr(video, name))
+                for name in MEDIA_FIELDS
+            },
+        )
+
 
 class DjangoORMVideoRepository(VideoRepository):
-    def __init__(self, video_orm: VideoORM | None = None):
+    def __init__(self, video_orm: VideoORM | None = None, max_snapshots: int = 1024):
         self.video_orm: VideoORM | None = video_orm or VideoORM
+        # Bounded and locked because consumers and the relay share one
+        # repository across threads for the life of the process; the oldest
+        # loads are forgotten first.
+        self.max_snapshots: int = max_snapshots
+        self.snapshots: OrderedDict[UUID, VideoSnapshot] = OrderedDict()
+        self.snapshots_lock = threading.Lock()
 
     def save(self, video: Video) -> None:
         with transaction.atomic():
             video_model = VideoModelMapper.to_model(video)
             video_model.save()
+        self._remember(video, VideoModelMapper.media_ids(video_model))
+        return None
+
+    def save_many(self, videos: List[Video]) -> None:
+        media_models: dict[type[Model], list[Model]] = {
+            ImageMediaORM: [],
+            AudioVideoMediaORM: [],
+        }
+        video_models: list[VideoORM] = []
+        for video in videos:
+            video_model = self.video_orm(
+                id=video.id, **{name: getattr(video, name) for name in SCALAR_FIELDS}
+            )
+            for name in MEDIA_FIELDS:
+                media = getattr(video, name)
+                if media is None:
+                    continue
+                media_orm = VideoModelMapper.media_orm(media)
+                media_model = media_orm(**VideoModelMapper.media_columns(media))
+                media_models[media_orm].append(media_model)
+                setattr(video_model, name, media_model)
+            video_models.append(video_model)
+
+        with transaction.atomic():
+            for media_orm, models in media_models.items():
+                media_orm.objects.bulk_create(models, batch_size=BULK_BATCH_SIZE)
+            self.video_orm.objects.bulk_create(video_models, batch_size=BULK_BATCH_SIZE)
+            for name in RELATION_FIELDS:
+                through, source, target = self._through(name)
+                through.objects.bulk_create(
+                    [
+                        through(**{source: video.id, target: related_id})
+                        for video in videos
+                        for related_id in getattr(video, name)
+                    ],
+                    batch_size=BULK_BATCH_SIZE,
+                )
+
+        for video, video_model in zip(videos, video_models):
+            self._remember(video, VideoModelMapper.media_ids(video_model))
         return None
 
     def get_by_id(self, id: UUID) -> Video | None:
         try:
-            video_model = self.video_orm.objects.get(id=id)
-        except VideoORM.DoesNotExist:
+            video_model = self._with_relations().get(id=id)
+        except self.video_orm.DoesNotExist:
             return None
-        return VideoModelMapper.to_entity(video_model)
+        video: Video = VideoModelMapper.to_entity(video_model)
+        self._remember(video, VideoModelMapper.media_ids(video_model))
+        return video
 
     def delete(self, id: UUID) -> None:
         self.video_orm.objects.filter(id=id).delete()
@@ -39,105 +132,297 @@ class DjangoORMVideoRepository(VideoRepository):
     def list(self) -> List[Video]:
         return [
             VideoModelMapper.to_entity(video_model)
-            for video_model in self.video_orm.objects.all()
+            for video_model in self._with_relations()
         ]
 
-    def update(self, video: Video) -> None:
-        try:
-            video_model = self.video_orm.objects.get(id=video.id)
-        except self.video_orm.DoesNotExist:
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Video]:
+        queryset = self._with_relations().order_by(order_by, "id")
+        return Page(
+            items=[
+                VideoModelMapper.to_entity(video_model)
+                for video_model in queryset[offset : offset + limit]
+            ],
+            total=self.video_orm.objects.count(),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Video]:
+        queryset = (
+            self._with_relations()
+            .filter(
+                Q(**{f"{order_by}__gt": after.value})
+                | Q(**{order_by: after.value, "id__gt": after.id})
+            )
+            .order_by(order_by, "id")
+        )
+        return [
+            VideoModelMapper.to_entity(video_model)
+            for video_model in queryset[:limit]
+        ]
+
+    def exists(self, id: UUID) -> bool:
+        return self.video_orm.objects.filter(id=id).exists()
+
+    def get_media(
+        self, video_id: UUID, media_type: MediaType
+    ) -> AudioVideoMedia | None:
+        row: dict | None = (
+            self._media_of(video_id, media_type)
+            .values("name", "checksum", "raw_location", "encoded_location", "status")
+            .first()
+        )
+        if row is None:
             return None
+        return AudioVideoMedia(
+            name=row["name"],
+            checksum=row["checksum"],
+            raw_location=row["raw_location"],
+            encoded_location=row["encoded_location"],
+            status=MediaStatus[row["status"]],
+            media_type=media_type,
+        )
 
+    def update_media(
+        self, video_id: UUID, media: AudioVideoMedia, published: bool | None = None
+    ) -> None:
+        # Any snapshot of this video no longer matches the row.
+        self._forget(video_id)
         with transaction.atomic():
-            # Update scalar fields
-            video_model.title = video.title
-            video_model.description = video.description
-            video_model.launch_year = video.launch_year
-            video_model.duration = video.duration
-            video_model.published = video.published
-            video_model.rating = video.rating
-
-            # Save the updated instance (this will UPDATE, not INSERT)
-            video_model.save()
-
-            # Update M2M relationships (must be after save)
-            video_model.categories.set(video.categories)
-            video_model.genres.set(video.genres)
-            video_model.cast_members.set(video.cast_members)
-
-            # Handle banner media
-            if video.banner:
-                if video_model.banner:
-                    video_model.banner.delete()
-                banner_model = ImageMediaORM(
-                    checksum=video.banner.checksum,
-                    name=video.banner.name,
-                    raw_location=video.banner.location,
-                )
-                banner_model.save()
-                video_model.banner = banner_model
-                video_model.save()
-
-            # Handle thumbnail media
-            if video.thumbnail:
-                if video_model.thumbnail:
-                    video_model.thumbnail.delete()
-                thumbnail_model = ImageMediaORM(
-                    checksum=video.thumbnail.checksum,
-                    name=video.thumbnail.name,
-                    raw_location=video.thumbnail.location,
-                )
-                thumbnail_model.save()
-                video_model.thumbnail = thumbnail_model
-                video_model.save()
-
-            # Handle thumbnail_half media
-            if video.thumbnail_half:
-                if video_model.thumbnail_half:
-                    video_model.thumbnail_half.delete()
-                thumbnail_half_model = ImageMediaORM(
-                    checksum=video.thumbnail_half.checksum,
-                    name=video.thumbnail_half.name,
-                    raw_location=video.thumbnail_half.location,
-                )
-                thumbnail_half_model.save()
-                video_model.thumbnail_half = thumbnail_half_model
-                video_model.save()
-
-            # Handle trailer media
-            if video.trailer:
-                if video_model.trailer:
-                    video_model.trailer.delete()
-                trailer_model = AudioVideoMediaORM(
-                    checksum=video.trailer.checksum,
-                    name=video.trailer.name,
-                    raw_location=video.trailer.raw_location,
-                    encoded_location=video.trailer.encoded_location,
-                    status=video.trailer.status.name,
-                    media_type=video.trailer.media_type.name,
+            self._media_of(video_id, media.media_type).update(
+                status=media.status.name,
+                encoded_location=media.encoded_location,
+            )
+            if published is not None:
+                self.video_orm.objects.filter(id=video_id).update(published=published)
+
+    def get_media_many(
+        self, keys: set[tuple[UUID, MediaType]]
+    ) -> dict[tuple[UUID, MediaType], AudioVideoMedia]:
+        found: dict[tuple[UUID, MediaType], AudioVideoMedia] = {}
+        for row in self._media_of_many(keys).values(
+            *MEDIA_OWNER_LOOKUPS.values(),
+            "name",
+            "checksum",
+            "raw_location",
+            "encoded_location",
+            "status",
+            "media_type",
+        ):
+            media_type: MediaType = MediaType[row["media_type"]]
+            key = (row[MEDIA_OWNER_LOOKUPS[media_type]], media_type)
+            if key in keys:
+                found[key] = AudioVideoMedia(
+                    name=row["name"],
+                    checksum=row["checksum"],
+                    raw_location=row["raw_location"],
+                    encoded_location=row["encoded_location"],
+                    status=MediaStatus[row["status"]],
+                    media_type=media_type,
                 )
-                trailer_model.save()
-                video_model.trailer = trailer_model
-                video_model.save()
-
-            # Handle video media
-            if video.video:
-                if video_model.video:
-                    video_model.video.delete()
-                video_media_model = AudioVideoMediaORM(
-                    checksum=video.video.checksum,
-                    name=video.video.name,
-                    raw_location=video.video.raw_location,
-                    encoded_location=video.video.encoded_location,
-                    status=video.video.status.name,
-                    media_type=video.video.media_type.name,
+        return found
+
+    def update_media_many(
+        self, media: dict[UUID, List[AudioVideoMedia]], published: set[UUID]
+    ) -> None:
+        latest: dict[tuple[UUID, MediaType], AudioVideoMedia] = {
+            (video_id, item.media_type): item
+            for video_id, video_media in media.items()
+            for item in video_media
+        }
+        for video_id in media.keys() | published:
+            self._forget(video_id)
+
+        with transaction.atomic():
+            media_models: list[AudioVideoMediaORM] = []
+            for row in self._media_of_many(set(latest)).values(
+                "id", *MEDIA_OWNER_LOOKUPS.values(), "media_type"
+            ):
+                media_type: MediaType = MediaType[row["media_type"]]
+                item = latest.get((row[MEDIA_OWNER_LOOKUPS[media_type]], media_type))
+                if item is not None:
+                    media_models.append(
+                        AudioVideoMediaORM(
+                            id=row["id"],
+                            status=item.status.name,
+                            encoded_location=item.encoded_location,
+                        )
+                    )
+            AudioVideoMediaORM.objects.bulk_update(
+                media_models,
+                ["status", "encoded_location"],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            if published:
+                self.video_orm.objects.filter(id__in=published).update(published=True)
+
+    def count_media_references(self, raw_locations: set[str]) -> dict[str, int]:
+        owned: Q = Q(pk__in=[])
+        for lookup in MEDIA_OWNER_LOOKUPS.values():
+            owned |= Q(**{f"{lookup}__isnull": False})
+        # Rows left behind by a deleted video no longer hold their file.
+        counts: dict[str, int] = dict.fromkeys(raw_locations, 0)
+        for raw_location, references in (
+            AudioVideoMediaORM.objects.filter(owned, raw_location__in=raw_locations)
+            .values("raw_location")
+            .annotate(references=Count("id"))
+            .values_list("raw_location", "references")
+        ):
+            counts[raw_location] = references
+        return counts
+
+    def find_missing_related_ids(
+        self, categories: set[UUID], genres: set[UUID], cast_members: set[UUID]
+    ) -> dict[str, set[UUID]]:
+        missing: dict[str, set[UUID]] = {
+            "categories": set(categories),
+            "genres": set(genres),
+            "cast_members": set(cast_members),
+        }
+        # One UNION ALL over the related tables, tagging each found id with
+        # the relation it belongs to.
+        lookups: list[QuerySet] = [
+            self.video_orm._meta.get_field(relation)
+            .related_model.objects.filter(id__in=ids)
+            .annotate(relation=Value(relation, output_field=CharField()))
+            .values_list("relation", "id")
+            for relation, ids in missing.items()
+            if ids
+        ]
+        if lookups:
+            for relation, id in lookups[0].union(*lookups[1:], all=True):
+                missing[relation].discard(id)
+        return missing
+
+    def _media_of(self, video_id: UUID, media_type: MediaType) -> QuerySet:
+        return AudioVideoMediaORM.objects.filter(
+            **{MEDIA_OWNER_LOOKUPS[media_type]: video_id},
+            media_type=media_type.name,
+        )
+
+    def _media_of_many(self, keys: set[tuple[UUID, MediaType]]) -> QuerySet:
+        owners: Q = Q(pk__in=[])
+        for media_type, lookup in MEDIA_OWNER_LOOKUPS.items():
+            video_ids: list[UUID] = [
+                video_id for video_id, key_type in keys if key_type == media_type
+            ]
+            if video_ids:
+                owners |= Q(**{f"{lookup}__in": video_ids}, media_type=media_type.name)
+        return AudioVideoMediaORM.objects.filter(owners)
+
+    def _with_relations(self) -> QuerySet:
+        # Media FKs are joined and M2M ids are batch-loaded, so hydrating any
+        # number of videos costs the same fixed number of queries.
+        return self.video_orm.objects.select_related(
+            "banner", "thumbnail", "thumbnail_half", "trailer", "video"
+        ).prefetch_related("categories", "genres", "cast_members")
+
+    def update(self, video: Video) -> None:
+        snapshot: VideoSnapshot | None = self._forget(video.id)
+        if snapshot is None or snapshot.entity() is not video:
+            try:
+                video_model = self._with_relations().get(id=video.id)
+            except self.video_orm.DoesNotExist:
+                return None
+            snapshot = VideoSnapshot.capture(
+                VideoModelMapper.to_entity(video_model),
+                VideoModelMapper.media_ids(video_model),
+            )
+
+        dirty_columns: dict[str, Any] = {
+            name: getattr(video, name)
+            for name in SCALAR_FIELDS
+            if getattr(video, name) != snapshot.columns[name]
+        }
+        changed_media: list[str] = [
+            name
+            for name in MEDIA_FIELDS
+            if getattr(video, name) not in (None, snapshot.media[name][1])
+        ]
+        changed_relations: list[str] = [
+            name
+            for name in RELATION_FIELDS
+            if getattr(video, name) != snapshot.relations[name]
+        ]
+        if not (dirty_columns or changed_media or changed_relations):
+            return None
+
+        stale_media: list[tuple[type[Model], UUID]] = []
+        with transaction.atomic():
+            for name in changed_media:
+                media_id, persisted = snapshot.media[name]
+                media = getattr(video, name)
+                media_orm = VideoModelMapper.media_orm(media)
+                columns = VideoModelMapper.media_columns(media)
+
+                if media_id and VideoModelMapper.is_same_file(persisted, media):
+                    persisted_columns = VideoModelMapper.media_columns(persisted)
+                    media_orm.objects.filter(pk=media_id).update(
+                        **{
+                            column: value
+                            for column, value in columns.items()
+                            if persisted_columns[column] != value
+                        }
+                    )
+                    continue
+
+                media_model = media_orm.objects.create(**columns)
+                dirty_columns[name] = media_model
+                if media_id:
+                    stale_media.append((media_orm, media_id))
+
+            if dirty_columns:
+                self.video_orm.objects.filter(pk=video.id).update(**dirty_columns)
+
+            for name in changed_relations:
+                self._sync_relation(
+                    video.id, name, snapshot.relations[name], getattr(video, name)
                 )
-                video_media_model.save()
-                video_model.video = video_media_model
-                video_model.save()
 
+            for media_orm, media_id in stale_media:
+                media_orm.objects.filter(pk=media_id).delete()
         return None
 
+    def _sync_relation(
+        self, video_id: UUID, name: str, persisted: set[UUID], current: set[UUID]
+    ) -> None:
+        through, source, target = self._through(name)
+
+        removed: set[UUID] = persisted - current
+        if removed:
+            through.objects.filter(
+                **{source: video_id, f"{target}__in": removed}
+            ).delete()
+
+        added: set[UUID] = current - persisted
+        if added:
+            through.objects.bulk_create(
+                [
+                    through(**{source: video_id, target: related_id})
+                    for related_id in added
+                ]
+            )
+
+    def _through(self, name: str) -> tuple[type[Model], str, str]:
+        field = self.video_orm._meta.get_field(name)
+        return (
+            field.remote_field.through,
+            f"{field.m2m_field_name()}_id",
+            f"{field.m2m_reverse_field_name()}_id",
+        )
+
+    def _remember(self, video: Video, media_ids: dict[str, UUID | None]) -> None:
+        # Keyed by id but bound to the loaded instance: update() only trusts a
+        # snapshot taken for that exact object and re-reads the row otherwise.
+        snapshot: VideoSnapshot = VideoSnapshot.capture(video, media_ids)
+        with self.snapshots_lock:
+            self.snapshots[video.id] = snapshot
+            self.snapshots.move_to_end(video.id)
+            while len(self.snapshots) > self.max_snapshots:
+                self.snapshots.popitem(last=False)
+
+    def _forget(self, video_id: UUID) -> VideoSnapshot | None:
+        with self.snapshots_lock:
+            return self.snapshots.pop(video_id, None)
+
 
 class VideoModelMapper:
     @staticmethod
@@ -279,39 +564,42 @@ class VideoModelMapper:
         return video_model
 
     @staticmethod
-    def to_entity(model: VideoORM) -> Video:
-        video = Video(
-            id=model.id,
-            title=model.title,
-            description=model.description,
-            launch_year=model.launch_year,
-            # opened=model.opened,
-            duration=model.duration,
-            rating=model.rating,
-            published=model.published,
-            categories=set(model.categories.values_list("id", flat=True)),
-            genres=set(model.genres.values_list("id", flat=True)),
-            cast_members=set(model.cast_members.values_list("id", flat=True)),
-        )
+    def media_ids(video: VideoORM) -> dict[str, UUID | None]:
+        return {name: getattr(video, f"{name}_id") for name in MEDIA_FIELDS}
 
-        if model.video:
-            video.video = AudioVideoMedia(
-                name=model.video.name,
-                checksum=model.video.checksum,
-                raw_location=model.video.raw_location,
-                encoded_location=model.video.encoded_location,
-                status=MediaStatus[model.video.status],
-                media_type=MediaType[model.video.media_type],
-            )
+    @staticmethod
+    def media_orm(media: ImageMedia | AudioVideoMedia) -> type[Model]:
+        if isinstance(media, ImageMedia):
+            return ImageMediaORM
+        return AudioVideoMediaORM
 
-        if model.trailer:
-            video.trailer = AudioVideoMedia(
-                name=model.trailer.name,
-                checksum=model.trailer.checksum,
-                raw_location=model.trailer.raw_location,
-                encoded_location=model.trailer.encoded_location,
-                status=MediaStatus[model.trailer.status],
-                media_type=MediaType[model.trailer.media_type],
-            )
+    @staticmethod
+    def media_columns(media: ImageMedia | AudioVideoMedia) -> dict[str, str]:
+        if isinstance(media, ImageMedia):
+            return {
+                "checksum": media.checksum,
+                "name": media.name,
+                "raw_location": media.location,
+            }
+        return {
+            "checksum": media.checksum,
+            "name": media.name,
+            "raw_location": media.raw_location,
+            "encoded_location": media.encoded_location,
+            "status": media.status.name,
+            "media_type": media.media_type.name,
+        }
 
-        return video
+    @staticmethod
+    def is_same_file(
+        persisted: ImageMedia | AudioVideoMedia | None,
+        media: ImageMedia | AudioVideoMedia,
+    ) -> bool:
+        if persisted is None or type(persisted) is not type(media):
+            return False
+        persisted_columns = VideoModelMapper.media_columns(persisted)
+        columns = VideoModelMapper.media_columns(media)
+        return (
+            persisted_columns["checksum"] == columns["checksum"]
+            and persisted_columns["raw_location"] == columns["raw_location"]
+        )
@@ -1,6 +1,7 @@
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
 from core.castmember.domain.castmember import CastMember
 from core.castmember.domain.castmember_repository import CastMemberRepository
 
@@ -12,6 +13,9 @@ class InMemoryCastMemberRepository(CastMemberRepository):
     def save(self, castmember: CastMember) -> None:
         self.castmembers.append(castmember)
 
+    def save_many(self, castmembers: List[CastMember]) -> None:
+        self.castmembers.extend(castmembers)
+
     def get_by_id(self, id: UUID) -> CastMember | None:
         return next(
             (castmember for castmember in self.castmembers if castmember.id == id),
@@ -34,6 +38,27 @@ class InMemoryCastMemberRepository(CastMemberRepository):
     def list(self) -> List[CastMember]:
         return [castmember for castmember in self.castmembers]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[CastMember]:
+        sorted_castmembers: List[CastMember] = sorted(
+            self.castmembers,
+            key=lambda castmember: (getattr(castmember, order_by), castmember.id),
+        )
+        return Page(
+            items=sorted_castmembers[offset : offset + limit],
+            total=len(sorted_castmembers),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[CastMember]:
+        return sorted(
+            (
+                castmember
+                for castmember in self.castmembers
+                if (getattr(castmember, order_by), castmember.id)
+                > (after.value, after.id)
+            ),
+            key=lambda castmember: (getattr(castmember, order_by), castmember.id),
+        )[:limit]
+
     def exists_by_ids(self, ids: set[UUID]) -> bool:
         if not ids:
             return True
@@ -1,6 +1,7 @@
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
 from core.category.domain.category import Category
 from core.category.domain.category_repository import CategoryRepository
 
@@ -12,6 +13,9 @@ class InMemoryCategoryRepository(CategoryRepository):
     def save(self, category: Category) -> None:
         self.categories.append(category)
 
+    def save_many(self, categories: List[Category]) -> None:
+        self.categories.extend(categories)
+
     def get_by_id(self, id: UUID) -> Category | None:
         return next(
             (category for category in self.categories if category.id == id), None
@@ -33,6 +37,26 @@ class InMemoryCategoryRepository(CategoryRepository):
     def list(self) -> List[Category]:
         return [category for category in self.categories]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        sorted_categories: List[Category] = sorted(
+            self.categories,
+            key=lambda category: (getattr(category, order_by), category.id),
+        )
+        return Page(
+            items=sorted_categories[offset : offset + limit],
+            total=len(sorted_categories),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Category]:
+        return sorted(
+            (
+                category
+                for category in self.categories
+                if (getattr(category, order_by), category.id) > (after.value, after.id)
+            ),
+            key=lambda category: (getattr(category, order_by), category.id),
+        )[:limit]
+
     def exists_by_ids(self, ids: set[UUID]) -> bool:
         if not ids:
             return True
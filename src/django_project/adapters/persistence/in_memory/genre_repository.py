@@ -1,6 +1,7 @@
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
 from core.genre.domain.genre import Genre
 from core.genre.domain.genre_repository import GenreRepository
 
@@ -12,6 +13,9 @@ class InMemoryGenreRepository(GenreRepository):
     def save(self, genre: Genre) -> None:
         self.genres.append(genre)
 
+    def save_many(self, genres: List[Genre]) -> None:
+        self.genres.extend(genres)
+
     def get_by_id(self, id: UUID) -> Genre | None:
         return next((genre for genre in self.genres if genre.id == id), None)
 
@@ -29,6 +33,26 @@ class InMemoryGenreRepository(GenreRepository):
     def list(self) -> List[Genre]:
         return [genre for genre in self.genres]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Genre]:
+        sorted_genres: List[Genre] = sorted(
+            self.genres,
+            key=lambda genre: (getattr(genre, order_by), genre.id),
+        )
+        return Page(
+            items=sorted_genres[offset : offset + limit],
+            total=len(sorted_genres),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Genre]:
+        return sorted(
+            (
+                genre
+                for genre in self.genres
+                if (getattr(genre, order_by), genre.id) > (after.value, after.id)
+            ),
+            key=lambda genre: (getattr(genre, order_by), genre.id),
+        )[:limit]
+
     def exists_by_ids(self, ids: set[UUID]) -> bool:
         if not ids:
             return True
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from core.video.domain.media_upload import MediaUpload
+from core.video.domain.media_upload_repository import MediaUploadRepository
+
+
+class InMemoryMediaUploadRepository(MediaUploadRepository):
+    def __init__(self) -> None:
+        self.uploads: dict[UUID, MediaUpload] = {}
+        self.chunks: dict[UUID, dict[int, str]] = {}
+        self.created_at: dict[UUID, datetime] = {}
+        # Lease id to (upload id, acquired at).
+        self.leases: dict[UUID, tuple[UUID, datetime]] = {}
+
+    def save(self, upload: MediaUpload) -> None:
+        self.uploads[upload.id] = upload
+        self.created_at.setdefault(upload.id, datetime.now(timezone.utc))
+
+    def get_by_id(self, id: UUID) -> MediaUpload | None:
+        return self.uploads.get(id)
+
+    def get_for_update(self, id: UUID) -> MediaUpload | None:
+        return self.get_by_id(id)
+
+    def delete(self, id: UUID) -> None:
+        self.uploads.pop(id, None)
+        self.chunks.pop(id, None)
+        self.created_at.pop(id, None)
+        for lease_id, (upload_id, _) in list(self.leases.items()):
+            if upload_id == id:
+                del self.leases[lease_id]
+
+    def delete_created_before(self, created_before: datetime) -> list[UUID]:
+        expired: list[UUID] = [
+            id
+            for id, created_at in self.created_at.items()
+            if created_at < created_before
+        ]
+        for id in expired:
+            self.delete(id)
+        return expired
+
+    def save_chunk(self, upload_id: UUID, index: int, checksum: str) -> None:
+        self.chunks.setdefault(upload_id, {})[index] = checksum
+
+    def get_chunk_checksums(self, upload_id: UUID) -> dict[int, str]:
+        return dict(self.chunks.get(upload_id, {}))
+
+    def acquire_lease(self, upload_id: UUID) -> UUID:
+        lease_id: UUID = uuid4()
+        self.leases[lease_id] = (upload_id, datetime.now(timezone.utc))
+        return lease_id
+
+    def release_lease(self, lease_id: UUID) -> None:
+        self.leases.pop(lease_id, None)
+
+    def count_leases(self, upload_id: UUID, acquired_after: datetime) -> int:
+        return sum(
+            1
+            for id, acquired_at in self.leases.values()
+            if id == upload_id and acquired_at > acquired_after
+        )
@@ -66,3 +66,19 @@ class TestDeleteInMemoryCategoryRepository:
         id: UUID = uuid4()
 
         assert repository.get_by_id(id) is None
+
+
+class TestPaginateInMemoryCategoryRepository:
+
+    def test_can_paginate_categories_sorted_by_field(self) -> None:
+        category_series = Category("Series")
+        category_documentary = Category("Documentary")
+        category_movie = Category("Movie")
+        repository = InMemoryCategoryRepository(
+            categories=[category_series, category_documentary, category_movie]
+        )
+
+        page = repository.paginate(order_by="name", offset=1, limit=2)
+
+        assert page.items == [category_movie, category_series]
+        assert page.total == 3
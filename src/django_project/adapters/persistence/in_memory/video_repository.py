@@ -1,17 +1,36 @@
 from typing import List
 from uuid import UUID
 
+from core._shared.domain.pagination import Cursor, Page
+from core.castmember.domain.castmember_repository import CastMemberRepository
+from core.category.domain.category_repository import CategoryRepository
+from core.genre.domain.genre_repository import GenreRepository
+from core.video.domain.value_objects import AudioVideoMedia, MediaType
 from core.video.domain.video import Video
 from core.video.domain.video_repository import VideoRepository
 
 
 class InMemoryVideoRepository(VideoRepository):
-    def __init__(self, videos: List[Video] = None) -> None:
+    def __init__(
+        self,
+        videos: List[Video] = None,
+        category_repository: CategoryRepository | None = None,
+        genre_repository: GenreRepository | None = None,
+        cast_member_repository: CastMemberRepository | None = None,
+    ) -> None:
         self.videos: List[Video] = videos or []
+        self.related_repositories: dict = {
+            "categories": category_repository,
+            "genres": genre_repository,
+            "cast_members": cast_member_repository,
+        }
 
     def save(self, video: Video) -> None:
         self.videos.append(video)
 
+    def save_many(self, videos: List[Video]) -> None:
+        self.videos.extend(videos)
+
     def get_by_id(self, id: UUID) -> Video | None:
         return next((video for video in self.videos if video.id == id), None)
 
@@ -29,5 +48,92 @@ class InMemoryVideoRepository(VideoRepository):
     def list(self) -> List[Video]:
         return [video for video in self.videos]
 
+    def paginate(self, order_by: str, offset: int, limit: int) -> Page[Video]:
+        sorted_videos: List[Video] = sorted(
+            self.videos,
+            key=lambda video: (getattr(video, order_by), video.id),
+        )
+        return Page(
+            items=sorted_videos[offset : offset + limit],
+            total=len(sorted_videos),
+        )
+
+    def list_after(self, order_by: str, after: Cursor, limit: int) -> List[Video]:
+        return sorted(
+            (
+                video
+                for video in self.videos
+                if (getattr(video, order_by), video.id) > (after.value, after.id)
+            ),
+            key=lambda video: (getattr(video, order_by), video.id),
+        )[:limit]
+
+    def exists(self, id: UUID) -> bool:
+        return self.get_by_id(id=id) is not None
+
+    def get_media(
+        self, video_id: UUID, media_type: MediaType
+    ) -> AudioVideoMedia | None:
+        video: Video | None = self.get_by_id(id=video_id)
+        if video is None:
+            return None
+        return video.video if media_type == MediaType.VIDEO else video.trailer
+
+    def update_media(
+        self, video_id: UUID, media: AudioVideoMedia, published: bool | None = None
+    ) -> None:
+        video: Video | None = self.get_by_id(id=video_id)
+        if video is None:
+            return
+        if media.media_type == MediaType.VIDEO:
+            video.video = media
+        else:
+            video.trailer = media
+        if published is not None:
+            video.published = published
+
+    def get_media_many(
+        self, keys: set[tuple[UUID, MediaType]]
+    ) -> dict[tuple[UUID, MediaType], AudioVideoMedia]:
+        found: dict[tuple[UUID, MediaType], AudioVideoMedia] = {}
+        for video_id, media_type in keys:
+            media = self.get_media(video_id=video_id, media_type=media_type)
+            if media is not None:
+                found[(video_id, media_type)] = media
+        return found
+
+    def update_media_many(
+        self, media: dict[UUID, List[AudioVideoMedia]], published: set[UUID]
+    ) -> None:
+        for video_id, video_media in media.items():
+            for item in video_media:
+                self.update_media(video_id=video_id, media=item)
+        for video_id in published:
+            video: Video | None = self.get_by_id(id=video_id)
+            if video is not None:
+                video.published = True
+
+    def count_media_references(self, raw_locations: set[str]) -> dict[str, int]:
+        counts: dict[str, int] = dict.fromkeys(raw_locations, 0)
+        for video in self.videos:
+            for media in (video.video, video.trailer):
+                if media is not None and media.raw_location in counts:
+                    counts[media.raw_location] += 1
+        return counts
+
+    def find_missing_related_ids(
+        self, categories: set[UUID], genres: set[UUID], cast_members: set[UUID]
+    ) -> dict[str, set[UUID]]:
+        requested: dict[str, set[UUID]] = {
+            "categories": categories,
+            "genres": genres,
+            "cast_members": cast_members,
+        }
+        missing: dict[str, set[UUID]] = {}
+        for relation, ids in requested.items():
+            repository = self.related_repositories[relation]
+            missing[relation] = repository.find_missing_ids(ids) if repository else set(ids)
+        return missing
+
 
 __all__ = ["InMemoryVideoRepository"]
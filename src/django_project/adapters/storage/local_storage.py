@@ -1,11 +1,25 @@
+import errno
+import hashlib
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
+from uuid import uuid4
 
-from core._shared.application.ports.storage_service import StorageService
+from core._shared.application.ports.storage_service import (
+    ContentSource,
+    OpenedFile,
+    StorageService,
+    StoredFile,
+    StoredObject,
+    iter_chunks,
+)
 
 
 class LocalStorage(StorageService):
-    def __init__(self, bucket: str) -> None:
+    def __init__(self, bucket: str, chunk_size: int = 1024 * 1024) -> None:
         self.bucket = Path(bucket)
+        self.chunk_size: int = chunk_size
 
         if not self.bucket.exists():
             self.bucket.mkdir(parents=True)
@@ -13,11 +27,119 @@ class LocalStorage(StorageService):
     def store(
         self,
         file_path: str,
-        content: bytes,
+        content: ContentSource,
         content_type: str,
-    ) -> None:
+    ) -> StoredFile:
         full_path = self.bucket / file_path
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(full_path, "wb") as f:
-            f.write(content)
+        # Streamed into a sibling file and renamed once complete, so an
+        # interrupted upload never replaces the stored file.
+        partial_path = full_path.with_name(f".{full_path.name}.{uuid4().hex}.part")
+        try:
+            with open(partial_path, "wb") as f:
+                stored: StoredFile = self._copy(content, f)
+            os.replace(partial_path, full_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        return stored
+
+    def allocate(self, file_path: str, size: int) -> None:
+        full_path = self.bucket / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(full_path, "wb") as f:
+                f.truncate(size)
+        except (OverflowError, OSError) as error:
+            if isinstance(error, OSError) and error.errno not in (
+                errno.EFBIG,
+                errno.EINVAL,
+            ):
+                raise
+            full_path.unlink(missing_ok=True)
+            raise ValueError(f"Cannot allocate {size} bytes: {error}") from error
+
+    def write_at(
+        self, file_path: str, offset: int, content: ContentSource, size: int
+    ) -> StoredFile:
+        # Each writer has its own handle, so chunks can land in parallel.
+        with open(self.bucket / file_path, "r+b") as f:
+            f.seek(offset)
+            return self._copy(content, f, limit=size)
+
+    def move(self, source_path: str, target_path: str) -> None:
+        target = self.bucket / target_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.bucket / source_path, target)
+
+    def open(self, file_path: str) -> OpenedFile | None:
+        try:
+            content = open(self.bucket / file_path, "rb")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+        # Taken from the open handle, so a concurrent replace of the path
+        # cannot mismatch the bytes about to be served.
+        stat: os.stat_result = os.fstat(content.fileno())
+        return OpenedFile(
+            path=file_path,
+            modified_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            size=stat.st_size,
+            content=content,
+        )
+
+    def stat(self, file_path: str) -> StoredObject | None:
+        try:
+            stat: os.stat_result = (self.bucket / file_path).stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return StoredObject(
+            path=file_path,
+            modified_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            size=stat.st_size,
+        )
+
+    def delete(self, file_path: str) -> None:
+        (self.bucket / file_path).unlink(missing_ok=True)
+
+    def list_files(self, prefix: str) -> Iterator[StoredObject]:
+        for directory, _, file_names in os.walk(self.bucket / prefix):
+            for file_name in file_names:
+                path = Path(directory) / file_name
+                try:
+                    stat: os.stat_result = path.stat()
+                except FileNotFoundError:
+                    continue
+                yield StoredObject(
+                    path=path.relative_to(self.bucket).as_posix(),
+                    modified_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                    size=stat.st_size,
+                )
+
+    def _copy(
+        self, content: ContentSource, target, limit: int | None = None
+    ) -> StoredFile:
+        # The checksum is taken from the bytes as they are written, so the
+        # file is never read back.
+        digest = hashlib.sha256()
+        size: int = 0
+        if hasattr(content, "readinto"):
+            # One reusable buffer instead of a new bytes object per chunk.
+            buffer = memoryview(bytearray(self.chunk_size))
+            while limit is None or size < limit:
+                window = buffer if limit is None else buffer[: limit - size]
+                read: int = content.readinto(window)
+                if not read:
+                    break
+                digest.update(window[:read])
+                target.write(window[:read])
+                size += read
+        else:
+            for chunk in iter_chunks(content, self.chunk_size):
+                if limit is not None:
+                    chunk = chunk[: limit - size]
+                digest.update(chunk)
+                target.write(chunk)
+                size += len(chunk)
+                if size == limit:
+                    break
+        return StoredFile(checksum=digest.hexdigest(), size=size)
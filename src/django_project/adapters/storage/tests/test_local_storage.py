@@ -0,0 +1,157 @@
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from core._shared.application.ports.storage_service import iter_chunks
+from django_project.adapters.storage.local_storage import LocalStorage
+
+
+class RecordingReader(io.BytesIO):
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.reads: list[int] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.reads.append(size)
+        return super().read(size)
+
+    def readinto(self, buffer) -> int:
+        self.reads.append(len(buffer))
+        return super().readinto(buffer)
+
+
+class TestIterChunks:
+    def test_splits_bytes(self) -> None:
+        assert list(iter_chunks(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+
+    def test_reads_files_a_chunk_at_a_time(self) -> None:
+        reader = RecordingReader(b"abcdefg")
+
+        assert list(iter_chunks(reader, 3)) == [b"abc", b"def", b"g"]
+        assert set(reader.reads) == {3}
+
+    def test_bounds_chunks_of_iterables(self) -> None:
+        assert list(iter_chunks(iter([b"abcde", b"", b"f"]), 2)) == [
+            b"ab",
+            b"cd",
+            b"e",
+            b"f",
+        ]
+
+
+class TestLocalStorage:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"0123456789" * 100,
+            io.BytesIO(b"0123456789" * 100),
+            iter([b"0123456789"] * 100),
+        ],
+        ids=["bytes", "file", "iterable"],
+    )
+    def test_stores_every_kind_of_source(self, tmp_path: Path, content) -> None:
+        storage = LocalStorage(bucket=str(tmp_path), chunk_size=64)
+
+        stored = storage.store("videos/1/video.mp4", content, "video/mp4")
+
+        expected = b"0123456789" * 100
+        assert (tmp_path / "videos/1/video.mp4").read_bytes() == expected
+        assert stored.checksum == hashlib.sha256(expected).hexdigest()
+        assert stored.size == len(expected)
+
+    def test_reads_uploads_in_bounded_chunks(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path), chunk_size=64)
+        reader = RecordingReader(b"x" * 1000)
+
+        storage.store("video.mp4", reader, "video/mp4")
+
+        assert set(reader.reads) == {64}
+
+    def test_interrupted_upload_keeps_the_stored_file(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path), chunk_size=64)
+        storage.store("video.mp4", b"original", "video/mp4")
+
+        def broken_upload():
+            yield b"partial"
+            raise ConnectionResetError
+
+        with pytest.raises(ConnectionResetError):
+            storage.store("video.mp4", broken_upload(), "video/mp4")
+
+        assert (tmp_path / "video.mp4").read_bytes() == b"original"
+        assert [path.name for path in tmp_path.iterdir()] == ["video.mp4"]
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"abcdefgh", io.BytesIO(b"abcdefgh"), iter([b"abc", b"defgh"])],
+        ids=["bytes", "file", "iterable"],
+    )
+    def test_writes_at_offset_up_to_size(self, tmp_path: Path, content) -> None:
+        storage = LocalStorage(bucket=str(tmp_path), chunk_size=3)
+        storage.allocate("uploads/1.part", 10)
+
+        stored = storage.write_at("uploads/1.part", offset=2, content=content, size=5)
+
+        assert (tmp_path / "uploads/1.part").read_bytes() == b"\0\0abcde\0\0\0"
+        assert stored.checksum == hashlib.sha256(b"abcde").hexdigest()
+        assert stored.size == 5
+
+    def test_rejects_allocations_too_large_for_the_filesystem(
+        self, tmp_path: Path
+    ) -> None:
+        storage = LocalStorage(bucket=str(tmp_path))
+
+        with pytest.raises(ValueError):
+            storage.allocate("uploads/1.part", 10**19)
+
+        assert not (tmp_path / "uploads/1.part").exists()
+
+    def test_stats_files(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path))
+        storage.store("blobs/ab/abc", b"content", "video/mp4")
+
+        stored = storage.stat("blobs/ab/abc")
+
+        assert (stored.path, stored.size) == ("blobs/ab/abc", 7)
+        assert storage.stat("blobs/ab/missing") is None
+        assert storage.stat("blobs/ab/abc/missing") is None
+
+    def test_move_replaces_target(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path))
+        storage.store("videos/1/video.mp4", b"old", "video/mp4")
+        storage.store("uploads/1.part", b"new", "video/mp4")
+
+        storage.move("uploads/1.part", "videos/1/video.mp4")
+
+        assert (tmp_path / "videos/1/video.mp4").read_bytes() == b"new"
+        assert not (tmp_path / "uploads/1.part").exists()
+
+    def test_lists_and_deletes_files(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path))
+        storage.store("blobs/ab/abc", b"1", "video/mp4")
+        storage.store("blobs/cd/cde", b"2", "video/mp4")
+        storage.store("videos/1/video.mp4", b"3", "video/mp4")
+
+        listed = list(storage.list_files("blobs"))
+        storage.delete("blobs/ab/abc")
+        storage.delete("blobs/ab/missing")
+
+        assert sorted(item.path for item in listed) == ["blobs/ab/abc", "blobs/cd/cde"]
+        assert all(item.modified_at.tzinfo is not None for item in listed)
+        assert [item.path for item in storage.list_files("blobs")] == ["blobs/cd/cde"]
+        assert list(storage.list_files("missing")) == []
+
+    def test_opens_files_with_their_metadata(self, tmp_path: Path) -> None:
+        storage = LocalStorage(bucket=str(tmp_path))
+        storage.store("videos/1/video.mp4", b"content", "video/mp4")
+
+        opened = storage.open("videos/1/video.mp4")
+        with opened.content as content:
+            assert content.read() == b"content"
+
+        assert opened.size == 7
+        assert opened.modified_at.tzinfo is not None
+        assert storage.open("videos/1/missing.mp4") is None
+        assert storage.open("videos/1") is None
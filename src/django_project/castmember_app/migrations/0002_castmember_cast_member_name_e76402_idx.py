@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('castmember_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='castmember',
+            index=models.Index(fields=['name', 'id'], name='cast_member_name_e76402_idx'),
+        ),
+    ]
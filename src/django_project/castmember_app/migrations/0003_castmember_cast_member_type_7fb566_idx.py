@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('castmember_app', '0002_castmember_cast_member_name_e76402_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='castmember',
+            index=models.Index(fields=['type', 'id'], name='cast_member_type_7fb566_idx'),
+        ),
+    ]
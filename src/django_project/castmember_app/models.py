@@ -1,4 +1,4 @@
-from django.db.models import UUIDField, CharField, Model
+from django.db.models import UUIDField, CharField, Index, Model
 from uuid import uuid4
 
 from core.castmember.domain.value_objects import CastMemberType
@@ -20,6 +20,10 @@ class CastMember(Model):
 
     class Meta:
         db_table: str = "cast_members"
+        indexes: list[Index] = [
+            Index(fields=["name", "id"]),
+            Index(fields=["type", "id"]),
+        ]
 
     def __str__(self):
         return self.name
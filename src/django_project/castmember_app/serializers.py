@@ -1,9 +1,11 @@
 from rest_framework.serializers import (
+    SerializerMethodField,
     Serializer,
     UUIDField,
     CharField,
     ChoiceField,
     IntegerField,
+    ListField,
 )
 
 # from django_project.castmember_app.models import CastMemberType
@@ -34,7 +36,8 @@ class CastMemberOutputSerializer(Serializer):
 class ListCastMemberOutputMetaSerializer(Serializer):
     current_page: IntegerField = IntegerField()
     per_page: IntegerField = IntegerField()
-    total: IntegerField = IntegerField()
+    total: IntegerField = IntegerField(allow_null=True)
+    next_cursor: CharField = CharField(allow_null=True)
 
 
 class ListCastMemberOutputSerializer(Serializer):
@@ -50,6 +53,14 @@ class CreateCastMemberOutputSerializer(Serializer):
     id: UUIDField = UUIDField()
 
 
+class BulkCreateCastMemberOutputSerializer(Serializer):
+    # One result per submitted item, in order.
+    data: SerializerMethodField = SerializerMethodField()
+
+    def get_data(self, output) -> list[dict]:
+        return [{"index": index, "id": str(id)} for index, id in enumerate(output.ids)]
+
+
 class RetrieveCastMemberRequestSerializer(Serializer):
     id: UUIDField = UUIDField()
 
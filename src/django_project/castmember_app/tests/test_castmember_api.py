@@ -45,6 +45,31 @@ class TestListAPI:
         assert response.data["data"][0]["name"] == "Christopher Nolan"
         assert response.data["data"][0]["type"] == "DIRECTOR"
 
+    def test_walk_by_type_with_cursor(
+        self,
+        api_client: APIClient,
+        castmember_repository: DjangoORMCastMemberRepository,
+        pedro_castmember: CastMember,
+        chris_castmember: CastMember,
+    ) -> None:
+        castmember_repository.save(pedro_castmember)
+        castmember_repository.save(chris_castmember)
+
+        first_page: Any = api_client.get("/api/cast_members/?order_by=type&page_size=1")
+        second_page: Any = api_client.get(
+            "/api/cast_members/?order_by=type&page_size=1"
+            f"&cursor={first_page.data['meta']['next_cursor']}"
+        )
+
+        assert first_page.data["data"][0]["type"] == "ACTOR"
+        assert second_page.status_code == HTTP_200_OK
+        assert second_page.data["data"][0]["type"] == "DIRECTOR"
+
+    def test_list_with_unknown_order_by(self, api_client: APIClient) -> None:
+        response: Any = api_client.get("/api/cast_members/?order_by=unknown")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 class TestCreateAPI:
@@ -133,6 +158,46 @@ class TestCreateAPI:
         assert response.data == {"type": [f'"{invalid_type}" is not a valid choice.']}
 
 
+@pytest.mark.django_db
+class TestBulkCreateAPI:
+
+    def test_bulk_create_castmembers(self, api_client: APIClient) -> None:
+        data: list[dict[str, Any]] = [
+            {"name": "Jim Carrey", "type": "ACTOR"},
+            {"name": "Christopher Nolan", "type": "DIRECTOR"},
+        ]
+        response: Any = api_client.post(
+            "/api/cast_members/bulk/", data, format="json"
+        )
+
+        assert response.status_code == HTTP_201_CREATED
+        assert {
+            str(id): (name, type)
+            for id, name, type in CastMemberORM.objects.values_list(
+                "id", "name", "type"
+            )
+        } == dict(
+            zip(
+                [item["id"] for item in response.data["data"]],
+                [("Jim Carrey", "ACTOR"), ("Christopher Nolan", "DIRECTOR")],
+            )
+        )
+
+    def test_bulk_create_with_invalid_type(self, api_client: APIClient) -> None:
+        data: list[dict[str, Any]] = [
+            {"name": "Jim Carrey", "type": "ACTOR"},
+            {"name": "Christopher Nolan", "type": "WRITER"},
+        ]
+        response: Any = api_client.post(
+            "/api/cast_members/bulk/", data, format="json"
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert list(response.json()) == ["1"]
+        assert "type" in response.json()["1"]
+        assert CastMemberORM.objects.count() == 0
+
+
 @pytest.mark.django_db
 class TestDeleteAPI:
 
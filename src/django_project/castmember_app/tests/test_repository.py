@@ -53,6 +53,28 @@ class TestSave:
         assert jane_castmember_model.type == jane_castmember.type
 
 
+@pytest.mark.django_db
+class TestSaveMany:
+
+    def test_save_many_castmembers(self, django_assert_num_queries):
+        castmembers = [
+            CastMember(name="Jim Carrey", type=CastMemberType.ACTOR),
+            CastMember(name="Christopher Nolan", type=CastMemberType.DIRECTOR),
+        ]
+        castmember_repository = DjangoORMCastMemberRepository()
+
+        with django_assert_num_queries(3):  # SAVEPOINT, INSERT, RELEASE
+            castmember_repository.save_many(castmembers)
+
+        assert {
+            (castmember.id, castmember.name, castmember.type)
+            for castmember in CastMemberORM.objects.all()
+        } == {
+            (castmember.id, castmember.name, castmember.type)
+            for castmember in castmembers
+        }
+
+
 @pytest.mark.django_db
 class TestDelete:
 
@@ -110,6 +132,27 @@ class TestList:
         assert chris_castmember in castmembers
 
 
+@pytest.mark.django_db
+class TestPaginate:
+
+    def test_paginate_castmembers(self):
+        castmember_repository: DjangoORMCastMemberRepository = (
+            DjangoORMCastMemberRepository()
+        )
+        for name in ["Sylvester Stallone", "Jim Carrey", "Christopher Nolan"]:
+            castmember_repository.save(
+                CastMember(name=name, type=CastMemberType.ACTOR)
+            )
+
+        page = castmember_repository.paginate(order_by="name", offset=0, limit=2)
+
+        assert [castmember.name for castmember in page.items] == [
+            "Christopher Nolan",
+            "Jim Carrey",
+        ]
+        assert page.total == 3
+
+
 @pytest.mark.django_db
 class TestUpdate:
 
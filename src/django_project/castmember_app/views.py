@@ -1,5 +1,6 @@
 from uuid import UUID
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -10,15 +11,24 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from core.castmember.application.use_cases.bulk_create_castmember import (
+    BulkCreateCastMember,
+)
 from core.castmember.application.use_cases.create_castmember import CreateCastMember
 from core.castmember.application.use_cases.delete_castmember import DeleteCastMember
 from core.castmember.application.use_cases.get_castmember import GetCastMember
 from core.castmember.application.use_cases.list_castmember import ListCastMember
 from core.castmember.application.use_cases.update_castmember import UpdateCastMember
-from core.castmember.application.exceptions import CastMemberNotFound, InvalidCastMember
-from config import DEFAULT_PAGE_SIZE
+from core.castmember.application.exceptions import (
+    CastMemberNotFound,
+    InvalidCastMember,
+    InvalidCastMemberBatch,
+)
+from core._shared.domain.pagination import InvalidCursor
+from config import BULK_CREATE_MAX_ITEMS, DEFAULT_PAGE_SIZE
 from django_project.adapters.composition.container import get_container
 from django_project.castmember_app.serializers import (
+    BulkCreateCastMemberOutputSerializer,
     CreateCastMemberInputSerializer,
     CreateCastMemberOutputSerializer,
     DeleteCastMemberInputSerializer,
@@ -27,20 +37,29 @@ from django_project.castmember_app.serializers import (
     RetrieveCastMemberResponseSerializer,
     UpdateCastMemberInputSerializer,
 )
+from django_project.ordering import OrderByMixin
 from django_project.permissions import IsAuthenticated, IsAdmin
 
 
-class CastMemberViewSet(viewsets.ViewSet):
+class CastMemberViewSet(OrderByMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated & IsAdmin]
+    order_by_fields = ("name", "type", "id")
 
     def list(self, request: Request) -> Response:
-        order_by: str = request.query_params.get("order_by", "name")
+        order_by: str = self.get_order_by(request)
         current_page: int = int(request.query_params.get("current_page", 1))
         page_size: int = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+        cursor: str | None = request.query_params.get("cursor")
         input: ListCastMember.Input = ListCastMember.Input(
-            order_by=order_by, current_page=current_page, page_size=page_size
+            order_by=order_by,
+            current_page=current_page,
+            page_size=page_size,
+            cursor=cursor,
         )
-        output = get_container().list_castmember().execute(input)
+        try:
+            output = get_container().list_castmember().execute(input)
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
 
         serializer: ListCastMemberOutputSerializer = ListCastMemberOutputSerializer(
             instance=output
@@ -93,6 +112,41 @@ class CastMemberViewSet(viewsets.ViewSet):
             status=HTTP_201_CREATED, data=CreateCastMemberOutputSerializer(output).data
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer: CreateCastMemberInputSerializer = CreateCastMemberInputSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        input: BulkCreateCastMember.Input = BulkCreateCastMember.Input(
+            items=[
+                CreateCastMember.Input(**item) for item in serializer.validated_data
+            ]
+        )
+
+        try:
+            output: BulkCreateCastMember.Output = (
+                get_container().bulk_create_castmember().execute(input)
+            )
+        except InvalidCastMemberBatch as e:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={
+                    "errors": [
+                        {"index": index, "error": error}
+                        for index, error in sorted(e.errors.items())
+                    ]
+                },
+            )
+        return Response(
+            status=HTTP_201_CREATED,
+            data=BulkCreateCastMemberOutputSerializer(output).data,
+        )
+
     def destroy(self, request: Request, pk: UUID) -> Response:
         serializer: DeleteCastMemberInputSerializer = DeleteCastMemberInputSerializer(
             data={"id": pk}
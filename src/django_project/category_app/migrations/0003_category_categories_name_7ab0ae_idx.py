@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_alter_category_table'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name', 'id'], name='categories_name_7ab0ae_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_category_categories_name_7ab0ae_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['is_active', 'id'], name='categories_is_acti_3d03d3_idx'),
+        ),
+    ]
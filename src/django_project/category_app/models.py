@@ -10,6 +10,10 @@ class Category(models.Model):
 
     class Meta:
         db_table = "categories"
+        indexes = [
+            models.Index(fields=["name", "id"]),
+            models.Index(fields=["is_active", "id"]),
+        ]
 
     def __str__(self):
         return self.name
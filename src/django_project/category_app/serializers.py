@@ -1,9 +1,11 @@
 from rest_framework.serializers import (
+    SerializerMethodField,
     Serializer,
     UUIDField,
     CharField,
     BooleanField,
     IntegerField,
+    ListField,
 )
 
 
@@ -17,7 +19,8 @@ class CategoryResponseSerializer(Serializer):
 class ListCategoryOutputMetaSerializer(Serializer):
     current_page: IntegerField = IntegerField()
     per_page: IntegerField = IntegerField()
-    total: IntegerField = IntegerField()
+    total: IntegerField = IntegerField(allow_null=True)
+    next_cursor: CharField = CharField(allow_null=True)
 
 
 class ListCategoryResponseSerializer(Serializer):
@@ -43,6 +46,14 @@ class CreateCategoryResponseSerializer(Serializer):
     id: UUIDField = UUIDField()
 
 
+class BulkCreateCategoryResponseSerializer(Serializer):
+    # One result per submitted item, in order.
+    data: SerializerMethodField = SerializerMethodField()
+
+    def get_data(self, output) -> list[dict]:
+        return [{"index": index, "id": str(id)} for index, id in enumerate(output.ids)]
+
+
 class UpdateCategoryRequestSerializer(Serializer):
     id: UUIDField = UUIDField()
     name: CharField = CharField(max_length=255, allow_blank=False)
@@ -14,3 +14,13 @@ class TestCategoryAuthAPI:
             response = unauthenticated_client.get("/api/categories/")
 
         assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_permissions_share_one_auth_service_per_request(
+        self, api_client: APIClient, mock_jwt_auth
+    ) -> None:
+        response = api_client.get("/api/categories/")
+
+        assert response.status_code == 200
+        mock_jwt_auth.return_value.auth_service.assert_called_once_with(
+            "Bearer test-token"
+        )
@@ -11,6 +11,7 @@ from rest_framework.status import (
 )
 from rest_framework.test import APIClient
 
+from core._shared.domain.pagination import Cursor
 from core.category.domain.category import Category
 from django_project.adapters.persistence.django.category_repository import (
     DjangoORMCategoryRepository,
@@ -52,6 +53,7 @@ class TestCategoryListAPI:
                 "current_page": 1,
                 "per_page": 2,
                 "total": 2,
+                "next_cursor": None,
             },
         }
 
@@ -59,6 +61,75 @@ class TestCategoryListAPI:
         assert len(response.data["data"]) == 2
         assert response.data == expected_data
 
+    def test_walk_categories_with_cursor(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        first_page: Any = api_client.get("/api/categories/?page_size=1")
+        next_cursor: str = first_page.data["meta"]["next_cursor"]
+        second_page: Any = api_client.get(
+            f"/api/categories/?page_size=1&cursor={next_cursor}"
+        )
+
+        assert [item["id"] for item in first_page.data["data"]] == [
+            str(category_documentary.id)
+        ]
+        assert second_page.status_code == HTTP_200_OK
+        assert [item["id"] for item in second_page.data["data"]] == [
+            str(category_movie.id)
+        ]
+        assert second_page.data["meta"]["next_cursor"] is None
+        assert second_page.data["meta"]["total"] is None
+
+    def test_walk_categories_by_is_active_with_cursor(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_documentary.deactivate()
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        first_page: Any = api_client.get(
+            "/api/categories/?order_by=is_active&page_size=1"
+        )
+        second_page: Any = api_client.get(
+            "/api/categories/?order_by=is_active&page_size=1"
+            f"&cursor={first_page.data['meta']['next_cursor']}"
+        )
+
+        assert [item["is_active"] for item in first_page.data["data"]] == [False]
+        assert second_page.status_code == HTTP_200_OK
+        assert [item["is_active"] for item in second_page.data["data"]] == [True]
+
+    def test_list_categories_with_invalid_cursor(self, api_client: APIClient) -> None:
+        response: Any = api_client.get("/api/categories/?cursor=not-a-cursor")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    def test_list_categories_with_unknown_order_by(self, api_client: APIClient) -> None:
+        response: Any = api_client.get("/api/categories/?order_by=password")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert "order_by" in response.data["error"]
+
+    def test_list_categories_with_cursor_for_unknown_field(
+        self, api_client: APIClient
+    ) -> None:
+        cursor: str = Cursor(order_by="password", value="x", id=uuid4()).encode()
+
+        response: Any = api_client.get(f"/api/categories/?cursor={cursor}")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 class TestCategoryRetrieveAPI:
@@ -147,6 +218,49 @@ class TestCategoryCreateAPI:
         ]
 
 
+@pytest.mark.django_db
+class TestCategoryBulkCreateAPI:
+
+    def test_bulk_create_categories(
+        self,
+        api_client: APIClient,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        data: list[dict] = [
+            {"name": "Movie", "description": "Movies"},
+            {"name": "Series", "description": "Series", "is_active": False},
+        ]
+        response: Any = api_client.post("/api/categories/bulk/", data, format="json")
+
+        assert response.status_code == HTTP_201_CREATED
+        assert [item["index"] for item in response.data["data"]] == [0, 1]
+        created_ids: list[UUID] = [UUID(item["id"]) for item in response.data["data"]]
+        assert [
+            category_repository.get_by_id(id).name for id in created_ids
+        ] == ["Movie", "Series"]
+        assert category_repository.get_by_id(created_ids[1]).is_active is False
+
+    def test_bulk_create_reports_invalid_items(
+        self,
+        api_client: APIClient,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        data: list[dict] = [
+            {"name": "Movie", "description": "Movies"},
+            {"name": "", "description": "Series"},
+        ]
+        response: Any = api_client.post("/api/categories/bulk/", data, format="json")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json() == {"1": {"name": ["This field may not be blank."]}}
+        assert category_repository.list() == []
+
+    def test_bulk_create_rejects_empty_list(self, api_client: APIClient) -> None:
+        response: Any = api_client.post("/api/categories/bulk/", [], format="json")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 class TestCategoryUpdateAPI:
 
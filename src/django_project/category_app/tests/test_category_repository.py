@@ -1,5 +1,11 @@
 from uuid import uuid4
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core._shared.domain.pagination import Cursor
+from core.category.domain.category import Category as CategoryEntity
+
 from django_project.category_app.models import Category as CategoryORM
 from django_project.category_app.models import Category
 from django_project.adapters.persistence.django.category_repository import DjangoORMCategoryRepository
@@ -29,6 +35,34 @@ class TestSave:
         assert category_from_database.is_active == category.is_active
 
 
+@pytest.mark.django_db
+class TestSaveMany:
+
+    def test_save_many_inserts_all_categories_in_one_statement(self):
+        categories = [
+            CategoryEntity(name=f"Category {index}", description="Bulk")
+            for index in range(5)
+        ]
+        category_repository = DjangoORMCategoryRepository()
+
+        with CaptureQueriesContext(connection) as queries:
+            category_repository.save_many(categories)
+
+        inserts = [
+            query for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        assert len(inserts) == 1
+        assert set(CategoryORM.objects.values_list("id", flat=True)) == {
+            category.id for category in categories
+        }
+
+    def test_save_many_with_empty_list(self):
+        DjangoORMCategoryRepository().save_many([])
+
+        assert CategoryORM.objects.count() == 0
+
+
 @pytest.mark.django_db
 class TestGetById:
 
@@ -110,6 +144,47 @@ class TestList:
         assert documentary_category_from_database.is_active == documentary_category.is_active
 
 
+@pytest.mark.django_db
+class TestPaginate:
+
+    def test_paginate_orders_and_slices_categories(self):
+        category_repository = DjangoORMCategoryRepository()
+        for name in ["Series", "Documentary", "Movie"]:
+            category_repository.save(
+                Category(name=name, description=f"{name} category")
+            )
+
+        page = category_repository.paginate(order_by="name", offset=1, limit=1)
+
+        assert [category.name for category in page.items] == ["Movie"]
+        assert page.total == 3
+
+    def test_paginate_beyond_last_page_returns_empty_items(self):
+        category_repository = DjangoORMCategoryRepository()
+        category_repository.save(Category(name="Movie", description="Movie category"))
+
+        page = category_repository.paginate(order_by="name", offset=10, limit=10)
+
+        assert page.items == []
+        assert page.total == 1
+
+
+    def test_list_after_seeks_past_cursor(self):
+        category_repository = DjangoORMCategoryRepository()
+        for name in ["Series", "Documentary", "Movie", "Anime"]:
+            category_repository.save(
+                Category(name=name, description=f"{name} category")
+            )
+        documentary = CategoryORM.objects.get(name="Documentary")
+
+        categories = category_repository.list_after(
+            order_by="name",
+            after=Cursor(order_by="name", value="Documentary", id=documentary.id),
+            limit=2,
+        )
+
+        assert [category.name for category in categories] == ["Movie", "Series"]
+
 @pytest.mark.django_db
 class TestUpdate:
 
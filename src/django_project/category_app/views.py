@@ -1,4 +1,5 @@
 from uuid import UUID
+from rest_framework.decorators import action
 from rest_framework.viewsets import ViewSet
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -6,18 +7,27 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
 )
 
+from core.category.application.use_cases.bulk_create_category import (
+    BulkCreateCategoryRequest,
+)
 from core.category.application.use_cases.create_category import CreateCategoryRequest
 from core.category.application.use_cases.delete_category import DeleteCategoryRequest
-from core.category.application.use_cases.exceptions import CategoryNotFound
+from core.category.application.use_cases.exceptions import (
+    CategoryNotFound,
+    InvalidCategoryBatch,
+)
 from core.category.application.use_cases.get_category import GetCategoryRequest
 from core.category.application.use_cases.list_category import ListCategory
 from core.category.application.use_cases.update_category import UpdateCategoryRequest
-from config import DEFAULT_PAGE_SIZE
+from core._shared.domain.pagination import InvalidCursor
+from config import BULK_CREATE_MAX_ITEMS, DEFAULT_PAGE_SIZE
 from django_project.adapters.composition.container import get_container
 from django_project.category_app.serializers import (
+    BulkCreateCategoryResponseSerializer,
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
@@ -27,20 +37,29 @@ from django_project.category_app.serializers import (
     RetrieveCategoryResponseSerializer,
     UpdateCategoryRequestSerializer,
 )
+from django_project.ordering import OrderByMixin
 from django_project.permissions import IsAuthenticated, IsAdmin
 
 
-class CategoryViewSet(ViewSet):
+class CategoryViewSet(OrderByMixin, ViewSet):
     permission_classes = [IsAuthenticated & IsAdmin]
+    order_by_fields = ("name", "description", "is_active", "id")
 
     def list(self, request: Request) -> Response:
-        order_by: str = request.query_params.get("order_by", "name")
+        order_by: str = self.get_order_by(request)
         current_page: int = int(request.query_params.get("current_page", 1))
         page_size: int = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+        cursor: str | None = request.query_params.get("cursor")
         input: ListCategory.Input = ListCategory.Input(
-            order_by=order_by, current_page=current_page, page_size=page_size
+            order_by=order_by,
+            current_page=current_page,
+            page_size=page_size,
+            cursor=cursor,
         )
-        output = get_container().list_category().execute(input=input)
+        try:
+            output = get_container().list_category().execute(input=input)
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
 
         serializer: ListCategoryResponseSerializer = ListCategoryResponseSerializer(
             instance=output
@@ -89,6 +108,37 @@ class CategoryViewSet(ViewSet):
             data=CreateCategoryResponseSerializer(instance=output).data,
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer: CreateCategoryRequestSerializer = CreateCategoryRequestSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        input: BulkCreateCategoryRequest = BulkCreateCategoryRequest(
+            items=[CreateCategoryRequest(**item) for item in serializer.validated_data]
+        )
+        try:
+            output = get_container().bulk_create_category().execute(input)
+        except InvalidCategoryBatch as e:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={
+                    "errors": [
+                        {"index": index, "error": error}
+                        for index, error in sorted(e.errors.items())
+                    ]
+                },
+            )
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=BulkCreateCategoryResponseSerializer(instance=output).data,
+        )
+
     def update(self, request: Request, pk: UUID) -> Response:
         serializer: UpdateCategoryRequestSerializer = UpdateCategoryRequestSerializer(
             data={**request.data, "id": pk}
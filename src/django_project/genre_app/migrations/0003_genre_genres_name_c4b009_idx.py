@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-17 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_category_categories_name_7ab0ae_idx'),
+        ('genre_app', '0002_genre_categories_alter_genre_table'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genre',
+            index=models.Index(fields=['name', 'id'], name='genres_name_c4b009_idx'),
+        ),
+    ]
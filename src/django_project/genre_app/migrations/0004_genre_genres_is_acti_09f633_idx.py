@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0004_category_categories_is_acti_3d03d3_idx'),
+        ('genre_app', '0003_genre_genres_name_c4b009_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genre',
+            index=models.Index(fields=['is_active', 'id'], name='genres_is_acti_09f633_idx'),
+        ),
+    ]
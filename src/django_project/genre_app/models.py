@@ -12,6 +12,10 @@ class Genre(models.Model):
 
     class Meta:
         db_table = "genres"
+        indexes = [
+            models.Index(fields=["name", "id"]),
+            models.Index(fields=["is_active", "id"]),
+        ]
 
     def __str__(self):
         return self.name
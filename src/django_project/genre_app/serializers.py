@@ -1,4 +1,5 @@
 from rest_framework.serializers import (
+    SerializerMethodField,
     Serializer,
     UUIDField,
     CharField,
@@ -18,7 +19,8 @@ class GenreOutputSerializer(Serializer):
 class ListGenreOutputMetaSerializer(Serializer):
     current_page: IntegerField = IntegerField()
     per_page: IntegerField = IntegerField()
-    total: IntegerField = IntegerField()
+    total: IntegerField = IntegerField(allow_null=True)
+    next_cursor: CharField = CharField(allow_null=True)
 
 
 class ListGenreOutputSerializer(Serializer):
@@ -44,6 +46,14 @@ class CreateGenreResponseSerializer(Serializer):
     id: UUIDField = UUIDField()
 
 
+class BulkCreateGenreResponseSerializer(Serializer):
+    # One result per submitted item, in order.
+    data: SerializerMethodField = SerializerMethodField()
+
+    def get_data(self, output) -> list[dict]:
+        return [{"index": index, "id": str(id)} for index, id in enumerate(output.ids)]
+
+
 class RetrieveGenreRequestSerializer(Serializer):
     id: UUIDField = UUIDField()
 
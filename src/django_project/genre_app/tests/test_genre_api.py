@@ -58,6 +58,11 @@ class TestListAPI:
         assert response.data["data"][0]["is_active"] is True
         assert response.data["data"][0]["categories"] == []
 
+    def test_list_with_unknown_order_by(self, api_client: APIClient) -> None:
+        response: Any = api_client.get("/api/genres/?order_by=unknown")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 class TestCreateAPI:
@@ -171,6 +176,77 @@ class TestCreateAPI:
         assert response.data == {"categories": {0: ["Must be a valid UUID."]}}
 
 
+@pytest.mark.django_db
+class TestBulkCreateAPI:
+
+    def test_bulk_create_genres(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        data: list[dict[str, Any]] = [
+            {
+                "name": "Romance",
+                "categories": [str(category_movie.id), str(category_documentary.id)],
+            },
+            {"name": "Drama", "is_active": False, "categories": []},
+        ]
+        response: Any = api_client.post("/api/genres/bulk/", data, format="json")
+
+        assert response.status_code == HTTP_201_CREATED
+        romance_id, drama_id = [item["id"] for item in response.data["data"]]
+        romance: Genre = genre_repository.get_by_id(romance_id)
+        assert romance.categories == {category_movie.id, category_documentary.id}
+        drama: Genre = genre_repository.get_by_id(drama_id)
+        assert drama.is_active is False
+        assert drama.categories == set()
+
+    def test_bulk_create_reports_missing_categories_per_item(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        missing_category_id = uuid4()
+
+        data: list[dict[str, Any]] = [
+            {"name": "Romance", "categories": [str(category_movie.id)]},
+            {
+                "name": "Drama",
+                "categories": [str(category_movie.id), str(missing_category_id)],
+            },
+        ]
+        response: Any = api_client.post("/api/genres/bulk/", data, format="json")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "errors": [
+                {
+                    "index": 1,
+                    "error": "Categories with provided IDs not found",
+                    "missing_categories": [str(missing_category_id)],
+                }
+            ]
+        }
+        assert GenreORM.objects.count() == 0
+
+    def test_bulk_create_rejects_non_list_payload(
+        self, api_client: APIClient
+    ) -> None:
+        response: Any = api_client.post(
+            "/api/genres/bulk/", {"name": "Romance", "categories": []}, format="json"
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 class TestDeleteAPI:
 
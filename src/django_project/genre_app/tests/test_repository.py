@@ -87,6 +87,36 @@ class TestSave:
         assert series_related_category.id == series_category.id
 
 
+@pytest.mark.django_db
+class TestSaveMany:
+
+    def test_save_many_genres_with_categories(self, django_assert_num_queries):
+        category_repository: DjangoORMCategoryRepository = DjangoORMCategoryRepository()
+        movie_category = Category(name="Movie", description="Movies description")
+        series_category = Category(name="Series", description="Series description")
+        category_repository.save(movie_category)
+        category_repository.save(series_category)
+        genres = [
+            Genre(name="Action", categories={movie_category.id, series_category.id}),
+            Genre(name="Drama", categories={movie_category.id}),
+            Genre(name="Romance"),
+        ]
+
+        # SAVEPOINT, genres INSERT, through-table INSERT, RELEASE
+        with django_assert_num_queries(4):
+            DjangoORMGenreRepository().save_many(genres)
+
+        saved = {
+            genre.name: {category.id for category in genre.categories.all()}
+            for genre in GenreORM.objects.prefetch_related("categories")
+        }
+        assert saved == {
+            "Action": {movie_category.id, series_category.id},
+            "Drama": {movie_category.id},
+            "Romance": set(),
+        }
+
+
 @pytest.mark.django_db
 class TestGetById:
 
@@ -305,6 +335,29 @@ class TestList:
         assert related_category.id == movie_category.id
 
 
+@pytest.mark.django_db
+class TestPaginate:
+
+    def test_paginate_genres_loads_categories_in_constant_queries(
+        self, django_assert_num_queries
+    ):
+        genre_repository: DjangoORMGenreRepository = DjangoORMGenreRepository()
+        category_repository: DjangoORMCategoryRepository = DjangoORMCategoryRepository()
+        movie_category: Category = Category(
+            name="Movie", description="Movies description"
+        )
+        category_repository.save(movie_category)
+        for name in ["Drama", "Action", "Comedy"]:
+            genre_repository.save(Genre(name=name, categories={movie_category.id}))
+
+        with django_assert_num_queries(3):
+            page = genre_repository.paginate(order_by="name", offset=0, limit=2)
+
+        assert [genre.name for genre in page.items] == ["Action", "Comedy"]
+        assert all(genre.categories == {movie_category.id} for genre in page.items)
+        assert page.total == 3
+
+
 @pytest.mark.django_db
 class TestUpdate:
 
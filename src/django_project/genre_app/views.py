@@ -1,5 +1,6 @@
 from uuid import UUID
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -10,19 +11,23 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from core.genre.application.use_cases.bulk_create_genre import BulkCreateGenre
 from core.genre.application.use_cases.create_genre import CreateGenre
 from core.genre.application.use_cases.delete_genre import DeleteGenre
 from core.genre.application.use_cases.get_genre import GetGenre
 from core.genre.application.exceptions import (
     GenreNotFound,
     InvalidGenre,
+    InvalidGenreBatch,
     RelatedCategoriesNotFound,
 )
 from core.genre.application.use_cases.list_genre import ListGenre
 from core.genre.application.use_cases.update_genre import UpdateGenre
-from config import DEFAULT_PAGE_SIZE
+from core._shared.domain.pagination import InvalidCursor
+from config import BULK_CREATE_MAX_ITEMS, DEFAULT_PAGE_SIZE
 from django_project.adapters.composition.container import get_container
 from django_project.genre_app.serializers import (
+    BulkCreateGenreResponseSerializer,
     CreateGenreInputSerializer,
     CreateGenreResponseSerializer,
     DeleteGenreInputSerializer,
@@ -31,20 +36,45 @@ from django_project.genre_app.serializers import (
     RetrieveGenreResponseSerializer,
     UpdateGenreInputSerializer,
 )
+from django_project.ordering import OrderByMixin
 from django_project.permissions import IsAuthenticated, IsAdmin
 
 
-class GenreViewSet(viewsets.ViewSet):
+def batch_errors(error: InvalidGenreBatch) -> list[dict]:
+    """One entry per rejected item, in item order."""
+    entries: list[dict] = []
+    for index in sorted(error.errors.keys() | error.missing_categories.keys()):
+        entry: dict = {
+            "index": index,
+            "error": error.errors.get(index, "Categories with provided IDs not found"),
+        }
+        if index in error.missing_categories:
+            entry["missing_categories"] = sorted(
+                str(category_id) for category_id in error.missing_categories[index]
+            )
+        entries.append(entry)
+    return entries
+
+
+class GenreViewSet(OrderByMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated & IsAdmin]
+    order_by_fields = ("name", "is_active", "id")
 
     def list(self, request: Request) -> Response:
-        order_by: str = request.query_params.get("order_by", "name")
+        order_by: str = self.get_order_by(request)
         current_page: int = int(request.query_params.get("current_page", 1))
         page_size: int = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+        cursor: str | None = request.query_params.get("cursor")
         input: ListGenre.Input = ListGenre.Input(
-            order_by=order_by, current_page=current_page, page_size=page_size
+            order_by=order_by,
+            current_page=current_page,
+            page_size=page_size,
+            cursor=cursor,
         )
-        output = get_container().list_genre().execute(input)
+        try:
+            output = get_container().list_genre().execute(input)
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
 
         serializer: ListGenreOutputSerializer = ListGenreOutputSerializer(
             instance=output
@@ -97,6 +127,32 @@ class GenreViewSet(viewsets.ViewSet):
             data=CreateGenreResponseSerializer(instance=output).data,
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer: CreateGenreInputSerializer = CreateGenreInputSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+        input: BulkCreateGenre.Input = BulkCreateGenre.Input(
+            items=[CreateGenre.Input(**item) for item in serializer.validated_data]
+        )
+
+        try:
+            output = get_container().bulk_create_genre().execute(input=input)
+        except InvalidGenreBatch as e:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"errors": batch_errors(e)},
+            )
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=BulkCreateGenreResponseSerializer(instance=output).data,
+        )
+
     def destroy(self, request: Request, pk: UUID) -> Response:
         serializer: DeleteGenreInputSerializer = DeleteGenreInputSerializer(
             data={"id": pk}
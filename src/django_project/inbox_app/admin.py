@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from django_project.inbox_app.models import ProcessedMessage
+
+
+class ProcessedMessageAdmin(admin.ModelAdmin):
+    list_display = ("key", "processed_at")
+
+
+admin.site.register(ProcessedMessage, ProcessedMessageAdmin)
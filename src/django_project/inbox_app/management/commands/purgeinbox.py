@@ -0,0 +1,26 @@
+import os
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django_project.adapters.messaging.django_deduplication_store import (
+    DjangoDeduplicationStore,
+)
+import dotenv
+
+dotenv.load_dotenv()
+
+
+class Command(BaseCommand):
+    help = "Delete processed-message records older than the deduplication TTL."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ttl-hours",
+            type=float,
+            default=float(os.getenv("CONSUMER_DEDUP_TTL_HOURS", "24")),
+        )
+
+    def handle(self, *args, **options):
+        store = DjangoDeduplicationStore(ttl=timedelta(hours=options["ttl_hours"]))
+        purged: int = store.purge_expired()
+        self.stdout.write(f"Purged {purged} processed messages.")
@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-17 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessedMessage',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('processed_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'inbox_processed_message',
+            },
+        ),
+    ]
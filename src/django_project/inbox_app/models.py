@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class ProcessedMessage(models.Model):
+    """A consumed message, remembered so redeliveries can be skipped.
+
+    key is a digest of the fields that identify the message's effect.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True)
+    processed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "inbox_processed_message"
+
+    def __str__(self) -> str:
+        return self.key
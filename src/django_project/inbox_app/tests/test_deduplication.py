@@ -0,0 +1,104 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+from core.video.domain.value_objects import MediaStatus, MediaType
+from django_project.adapters.cache.lru_cache import LRUCache
+from django_project.adapters.messaging.deduplication_store import message_key
+from django_project.adapters.messaging.django_deduplication_store import (
+    DjangoDeduplicationStore,
+)
+from django_project.inbox_app.models import ProcessedMessage
+
+
+def process_input(
+    status: MediaStatus = MediaStatus.COMPLETED,
+    encoded_location: str = "/encoded/video",
+) -> ProcessAudioVideoMedia.Input:
+    return ProcessAudioVideoMedia.Input(
+        video_id=uuid4(),
+        media_type=MediaType.VIDEO,
+        encoded_location=encoded_location,
+        status=status,
+    )
+
+
+class TestMessageKey:
+    def test_identifies_resource_status_and_location(self) -> None:
+        item = process_input()
+
+        assert message_key(item) == message_key(
+            ProcessAudioVideoMedia.Input(**vars(item))
+        )
+        assert message_key(item) != message_key(
+            ProcessAudioVideoMedia.Input(**{**vars(item), "status": MediaStatus.ERROR})
+        )
+        assert message_key(item) != message_key(
+            ProcessAudioVideoMedia.Input(
+                **{**vars(item), "encoded_location": "/encoded/other"}
+            )
+        )
+        assert message_key(item) != message_key(
+            ProcessAudioVideoMedia.Input(
+                **{**vars(item), "media_type": MediaType.TRAILER}
+            )
+        )
+
+
+@pytest.mark.django_db
+class TestDjangoDeduplicationStore:
+    def test_reports_only_marked_keys(self) -> None:
+        store = DjangoDeduplicationStore(ttl=timedelta(hours=1))
+
+        store.mark(["a", "b"])
+
+        assert store.seen(["a", "b", "c"]) == {"a", "b"}
+
+    def test_expired_keys_are_not_seen_until_marked_again(self) -> None:
+        store = DjangoDeduplicationStore(ttl=timedelta(hours=1))
+        ProcessedMessage.objects.create(
+            key="a", processed_at=timezone.now() - timedelta(hours=2)
+        )
+
+        assert store.seen(["a"]) == set()
+
+        store.mark(["a"])
+
+        assert store.seen(["a"]) == {"a"}
+        assert ProcessedMessage.objects.count() == 1
+
+    def test_cache_answers_known_keys_without_a_query(
+        self, django_assert_num_queries
+    ) -> None:
+        store = DjangoDeduplicationStore(ttl=timedelta(hours=1), cache=LRUCache())
+        ProcessedMessage.objects.create(key="a", processed_at=timezone.now())
+
+        with django_assert_num_queries(1):
+            assert store.seen(["a", "b"]) == {"a"}
+        with django_assert_num_queries(0):
+            assert store.seen(["a"]) == {"a"}
+
+    def test_keys_are_shared_between_store_instances(self) -> None:
+        DjangoDeduplicationStore(ttl=timedelta(hours=1), cache=LRUCache()).mark(["a"])
+
+        other = DjangoDeduplicationStore(ttl=timedelta(hours=1), cache=LRUCache())
+
+        assert other.seen(["a"]) == {"a"}
+
+    def test_purgeinbox_deletes_expired_keys(self) -> None:
+        ProcessedMessage.objects.create(
+            key="old", processed_at=timezone.now() - timedelta(hours=48)
+        )
+        ProcessedMessage.objects.create(key="new", processed_at=timezone.now())
+
+        call_command("purgeinbox", "--ttl-hours", "24")
+
+        assert list(ProcessedMessage.objects.values_list("key", flat=True)) == [
+            "new"
+        ]
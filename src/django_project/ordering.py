@@ -0,0 +1,25 @@
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.status import HTTP_400_BAD_REQUEST
+
+
+class InvalidOrderBy(APIException):
+    status_code = HTTP_400_BAD_REQUEST
+
+
+class OrderByMixin:
+    """For list views sorted by ?order_by=, which must name one of
+    order_by_fields and defaults to the first."""
+
+    order_by_fields: tuple[str, ...] = ()
+
+    def get_order_by(self, request: Request) -> str:
+        order_by: str = request.query_params.get("order_by", self.order_by_fields[0])
+        if order_by not in self.order_by_fields:
+            raise InvalidOrderBy(
+                {
+                    "error": f"Invalid order_by: {order_by}. "
+                    f"Must be one of {', '.join(self.order_by_fields)}."
+                }
+            )
+        return order_by
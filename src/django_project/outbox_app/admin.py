@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from django_project.outbox_app.models import OutboxMessage
+
+
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("event_type", "queue", "created_at", "sent_at", "attempts")
+
+
+admin.site.register(OutboxMessage, OutboxMessageAdmin)
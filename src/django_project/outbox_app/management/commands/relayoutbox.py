@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_project.adapters.composition.container import get_container
+import dotenv
+
+dotenv.load_dotenv()
+
+
+class Command(BaseCommand):
+    help = "Relay pending outbox messages to RabbitMQ."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Relay one batch.")
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--retention-hours",
+            type=float,
+            default=24.0,
+            help="Delete messages sent longer ago than this, checked hourly.",
+        )
+
+    def handle(self, *args, **options):
+        relay = get_container().outbox_relay()
+        retention = timedelta(hours=options["retention_hours"])
+
+        if options["once"]:
+            purged: int = relay.purge_sent(before=timezone.now() - retention)
+            if purged:
+                self.stdout.write(f"Purged {purged} sent outbox messages.")
+            sent: int = relay.relay_batch()
+            self.stdout.write(f"Relayed {sent} outbox messages.")
+            return
+
+        relay.run(poll_interval=options["poll_interval"], retention=retention)
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+    """An integration event waiting to be relayed to the broker.
+
+    The auto-increment id gives the relay its delivery order.
+    """
+
+    queue = models.CharField(max_length=255)
+    event_type = models.CharField(max_length=255)
+    body = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "outbox_message"
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(sent_at__isnull=True),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} -> {self.queue}"
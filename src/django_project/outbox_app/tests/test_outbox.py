@@ -0,0 +1,249 @@
+import json
+import threading
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from core._shared.events.event import Event
+from core.video.application.events.integrations_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMedia,
+)
+from core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from core.video.domain.video import Video
+from django_project.adapters.composition.container import get_container
+from django_project.adapters.messaging.in_memory_publisher import InMemoryPublisher
+from django_project.adapters.messaging.message_publisher import MessagePublisher
+from django_project.adapters.messaging.outbox_event_publisher import (
+    OutboxEventPublisher,
+)
+from django_project.adapters.messaging.outbox_relay import OutboxRelay
+from django_project.adapters.persistence.django.unit_of_work import DjangoUnitOfWork
+from django_project.adapters.persistence.django.video_repository import (
+    DjangoORMVideoRepository,
+)
+from django_project.outbox_app.models import OutboxMessage
+
+
+class UnroutedEvent(Event): ...
+
+
+class FailingPublisher(MessagePublisher):
+    def __init__(self, fail_on: int) -> None:
+        self.published: list[bytes] = []
+        self.fail_on: int = fail_on
+
+    def publish(self, queue: str, body: bytes) -> None:
+        if len(self.published) == self.fail_on:
+            raise ConnectionError("broker unavailable")
+        self.published.append(body)
+
+    def publish_batch(self, queue: str, bodies: list[bytes]) -> None:
+        for body in bodies:
+            self.publish(queue, body)
+
+    def close(self) -> None:
+        pass
+
+
+def media_updated(index: int) -> AudioVideoMediaUpdatedIntegrationEvent:
+    return AudioVideoMediaUpdatedIntegrationEvent(
+        resource_id=f"{index}.VIDEO", file_path=f"/encoded/{index}"
+    )
+
+
+@pytest.mark.django_db
+class TestOutboxEventPublisher:
+
+    def test_stores_routed_events(self) -> None:
+        OutboxEventPublisher().publish([media_updated(1), UnroutedEvent()])
+
+        [message] = OutboxMessage.objects.all()
+        assert message.queue == "videos.new"
+        assert message.event_type == "AudioVideoMediaUpdatedIntegrationEvent"
+        assert json.loads(message.body) == {
+            "resource_id": "1.VIDEO",
+            "file_path": "/encoded/1",
+        }
+        assert message.sent_at is None
+
+    def test_rows_roll_back_with_the_callers_transaction(self) -> None:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                OutboxEventPublisher().publish([media_updated(1)])
+                raise RuntimeError("aggregate update failed")
+
+        assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+class TestProcessAudioVideoMediaWithOutbox:
+
+    @pytest.fixture
+    def video(self) -> Video:
+        video = Video(
+            title="Outbox",
+            description="Outbox",
+            launch_year=2024,
+            duration=Decimal("90.0"),
+            published=False,
+            rating=Rating.L,
+            categories=set(),
+            genres=set(),
+            cast_members=set(),
+        )
+        video.update_video(
+            AudioVideoMedia(
+                name="video.mp4",
+                checksum="abc",
+                raw_location="/raw/video.mp4",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.VIDEO,
+            )
+        )
+        DjangoORMVideoRepository().save(video)
+        return video
+
+    def execute(self, video: Video, event_publisher) -> None:
+        ProcessAudioVideoMedia(
+            video_repository=DjangoORMVideoRepository(),
+            event_publisher=event_publisher,
+            unit_of_work=DjangoUnitOfWork(),
+        ).execute(
+            ProcessAudioVideoMedia.Input(
+                video_id=video.id,
+                media_type=MediaType.VIDEO,
+                encoded_location="/encoded/video",
+                status=MediaStatus.COMPLETED,
+            )
+        )
+
+    def test_media_update_and_event_are_committed_together(self, video) -> None:
+        self.execute(video, OutboxEventPublisher())
+
+        assert DjangoORMVideoRepository().get_by_id(video.id).published is True
+        [message] = OutboxMessage.objects.all()
+        assert json.loads(message.body)["resource_id"] == f"{video.id}.VIDEO"
+
+    def test_media_update_rolls_back_when_the_event_is_not_stored(
+        self, video
+    ) -> None:
+        with patch.object(
+            OutboxMessage.objects, "bulk_create", side_effect=RuntimeError
+        ):
+            with pytest.raises(RuntimeError):
+                self.execute(video, OutboxEventPublisher())
+
+        assert DjangoORMVideoRepository().get_by_id(video.id).published is False
+
+
+@pytest.mark.django_db
+class TestOutboxRelay:
+
+    def test_relays_pending_messages_in_order_and_marks_them_sent(self) -> None:
+        OutboxEventPublisher().publish([media_updated(index) for index in range(3)])
+        publisher = InMemoryPublisher()
+
+        assert OutboxRelay(publisher=publisher).relay_batch() == 3
+
+        assert [
+            json.loads(body)["resource_id"]
+            for body in publisher.messages["videos.new"]
+        ] == ["0.VIDEO", "1.VIDEO", "2.VIDEO"]
+        assert not OutboxMessage.objects.filter(sent_at__isnull=True).exists()
+        assert OutboxRelay(publisher=publisher).relay_batch() == 0
+
+    def test_relays_at_most_one_batch(self) -> None:
+        OutboxEventPublisher().publish([media_updated(index) for index in range(3)])
+
+        relay = OutboxRelay(publisher=InMemoryPublisher(), batch_size=2)
+
+        assert relay.relay_batch() == 2
+        assert OutboxMessage.objects.filter(sent_at__isnull=True).count() == 1
+
+    def test_failed_publish_keeps_the_batch_pending(self) -> None:
+        OutboxEventPublisher().publish([media_updated(index) for index in range(3)])
+        publisher = FailingPublisher(fail_on=1)
+
+        assert OutboxRelay(publisher=publisher).relay_batch() == 0
+
+        pending = OutboxMessage.objects.filter(sent_at__isnull=True).order_by("id")
+        assert [json.loads(message.body)["resource_id"] for message in pending] == [
+            "0.VIDEO",
+            "1.VIDEO",
+            "2.VIDEO",
+        ]
+        assert [message.attempts for message in pending] == [1, 1, 1]
+
+    def test_publishes_each_run_of_a_queue_as_one_batch(self) -> None:
+        OutboxMessage.objects.bulk_create(
+            OutboxMessage(queue=queue, event_type="Event", body=body)
+            for queue, body in [("a", "1"), ("a", "2"), ("b", "3"), ("a", "4")]
+        )
+        publisher = MagicMock(wraps=InMemoryPublisher())
+
+        assert OutboxRelay(publisher=publisher).relay_batch() == 4
+
+        assert publisher.publish_batch.call_args_list == [
+            call("a", [b"1", b"2"]),
+            call("b", [b"3"]),
+            call("a", [b"4"]),
+        ]
+
+    def test_run_purges_sent_messages_periodically(self) -> None:
+        OutboxEventPublisher().publish([media_updated(index) for index in range(2)])
+        OutboxRelay(publisher=InMemoryPublisher()).relay_batch()
+        OutboxMessage.objects.update(sent_at=timezone.now() - timedelta(days=2))
+        relay = OutboxRelay(publisher=InMemoryPublisher())
+        stop = threading.Event()
+        batches: list[int] = []
+
+        def relay_batch() -> int:
+            batches.append(OutboxMessage.objects.count())
+            if len(batches) == 2:
+                stop.set()
+            return 0
+
+        with (
+            patch.object(relay, "relay_batch", side_effect=relay_batch),
+            patch.object(relay, "purge_sent", wraps=relay.purge_sent) as purge_sent,
+        ):
+            relay.run(poll_interval=0, stop=stop, retention=timedelta(days=1))
+
+        assert batches == [0, 0]
+        purge_sent.assert_called_once()
+
+    def test_purge_sent_deletes_only_old_sent_messages(self) -> None:
+        OutboxEventPublisher().publish([media_updated(index) for index in range(2)])
+        OutboxRelay(publisher=InMemoryPublisher(), batch_size=1).relay_batch()
+
+        relay = OutboxRelay(publisher=InMemoryPublisher())
+        assert relay.purge_sent(before=timezone.now() - timedelta(hours=1)) == 0
+        assert relay.purge_sent(before=timezone.now() + timedelta(seconds=1)) == 1
+        assert OutboxMessage.objects.count() == 1
+
+    def test_relay_command_relays_one_batch(self) -> None:
+        OutboxEventPublisher().publish([media_updated(1)])
+        publisher = InMemoryPublisher()
+
+        with patch.object(
+            get_container(),
+            "outbox_relay",
+            return_value=OutboxRelay(publisher=publisher),
+        ):
+            call_command("relayoutbox", "--once")
+
+        assert len(publisher.messages["videos.new"]) == 1
@@ -5,17 +5,27 @@ from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from core._shared.application.ports.auth_service import AuthService
 from django_project.adapters.composition.container import get_container
 
 dotenv.load_dotenv()
 
 
+def request_auth_service(request: Request) -> AuthService:
+    """Auth service shared by every permission check of the same request."""
+    auth_service: AuthService | None = getattr(request, "_auth_service", None)
+    if auth_service is None:
+        token: str = request.headers.get("Authorization", "")
+        auth_service = get_container().auth_service(token)
+        request._auth_service = auth_service
+    return auth_service
+
+
 class IsAuthenticated(BasePermission):
     message = "Invalid or expired token."
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        token: str = request.headers.get("Authorization", "")
-        if not get_container().auth_service(token).is_authenticated():
+        if not request_auth_service(request).is_authenticated():
             return False
         return True
 
@@ -24,8 +34,7 @@ class IsAdmin(BasePermission):
     message = "User does not have admin privileges."
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        token: str = request.headers.get("Authorization", "")
-        if not get_container().auth_service(token).has_role(
+        if not request_auth_service(request).has_role(
             os.getenv("DEFAULT_REALM_ADMIN_ROLE_NAME", "admin")
         ):
             return False
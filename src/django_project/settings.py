@@ -43,6 +43,8 @@ INSTALLED_APPS = [
     'django_project.genre_app',
     'django_project.castmember_app',
     'django_project.video_app',
+    'django_project.outbox_app',
+    'django_project.inbox_app',
 ]
 
 REST_FRAMEWORK = {
@@ -57,6 +59,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'django_project.adapters.composition.middleware.ContainerRequestScopeMiddleware',
 ]
 
 ROOT_URLCONF = 'django_project.urls'
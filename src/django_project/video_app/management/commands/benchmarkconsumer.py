@@ -0,0 +1,111 @@
+import contextlib
+import io
+import json
+import time
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+
+from core.video.application.use_cases.bulk_process_audio_video_media import (
+    BulkProcessAudioVideoMedia,
+)
+from django_project.adapters.messaging.in_memory_broker import InMemoryBroker
+from django_project.adapters.messaging.video_converted_batch_consumer import (
+    VideoConvertedBatchConsumer,
+)
+from django_project.adapters.messaging.video_converted_consumer import (
+    VideoConvertedRabbitMQConsumer,
+)
+
+
+class SimulatedUseCase:
+    """Stands in for the process use cases with a fixed latency per
+    transaction, whatever the number of items in it."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency: float = latency
+
+    def execute(self, request) -> BulkProcessAudioVideoMedia.Output:
+        time.sleep(self.latency)
+        return BulkProcessAudioVideoMedia.Output()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure video-converted consumer throughput per worker count "
+        "against an in-memory broker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=500)
+        parser.add_argument(
+            "--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16]
+        )
+        parser.add_argument("--prefetch", type=int, default=32)
+        parser.add_argument(
+            "--batch-sizes",
+            type=int,
+            nargs="*",
+            default=[],
+            help="Also measure the batch consumer with these batch sizes.",
+        )
+        parser.add_argument(
+            "--latency-ms",
+            type=float,
+            default=5.0,
+            help="Simulated database time per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        use_case = SimulatedUseCase(latency=options["latency_ms"] / 1000)
+        self.stdout.write(f"{'consumer':>9} {'msg/s':>10} {'seconds':>8}")
+
+        for workers in options["workers"]:
+            consumer = VideoConvertedRabbitMQConsumer(
+                use_case=use_case,
+                queue="videos.converted",
+                prefetch_count=max(options["prefetch"], workers),
+                workers=workers,
+            )
+            self._run(f"{workers}", consumer, options["messages"])
+
+        for batch_size in options["batch_sizes"]:
+            consumer = VideoConvertedBatchConsumer(
+                use_case=use_case,
+                queue="videos.converted",
+                batch_size=batch_size,
+                max_wait=0.05,
+            )
+            self._run(f"batch {batch_size}", consumer, options["messages"])
+
+    def _run(
+        self,
+        label: str,
+        consumer: VideoConvertedRabbitMQConsumer | VideoConvertedBatchConsumer,
+        messages: int,
+    ) -> None:
+        broker = InMemoryBroker(stop_when_drained=True)
+        for _ in range(messages):
+            broker.publish("videos.converted", self._message())
+        consumer.connection_factory = broker.connect
+
+        started: float = time.perf_counter()
+        # The consumer prints every message; keep the report readable.
+        with contextlib.redirect_stdout(io.StringIO()):
+            consumer.start()
+        elapsed: float = time.perf_counter() - started
+
+        rate: float = len(broker.acked) / elapsed
+        self.stdout.write(f"{label:>9} {rate:>10.1f} {elapsed:>8.2f}")
+
+    def _message(self) -> bytes:
+        return json.dumps(
+            {
+                "error": "",
+                "video": {
+                    "resource_id": f"{uuid4()}.VIDEO",
+                    "encoded_video_folder": "/encoded/benchmark",
+                },
+                "status": "COMPLETED",
+            }
+        ).encode("utf-8")
@@ -0,0 +1,51 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from core.video.application.use_cases.collect_media_garbage import (
+    CollectMediaGarbage,
+)
+from django_project.adapters.composition.container import get_container
+import dotenv
+
+dotenv.load_dotenv()
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete content-addressed media blobs no video references anymore and "
+        "chunked uploads left unfinished."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=float(os.getenv("MEDIA_GC_GRACE_HOURS", "24")),
+            help="Keep unreferenced blobs written or relinked this recently.",
+        )
+        parser.add_argument(
+            "--upload-expiry-hours",
+            type=float,
+            default=float(os.getenv("MEDIA_UPLOAD_EXPIRY_HOURS", "168")),
+            help="Delete chunked uploads started longer ago than this.",
+        )
+
+    def handle(self, *args, **options):
+        now = datetime.now(timezone.utc)
+        with get_container().request_scope():
+            output = (
+                get_container()
+                .collect_media_garbage()
+                .execute(
+                    CollectMediaGarbage.Input(
+                        modified_before=now - timedelta(hours=options["grace_hours"]),
+                        uploads_started_before=now
+                        - timedelta(hours=options["upload_expiry_hours"]),
+                    )
+                )
+            )
+        self.stdout.write(
+            f"Scanned {output.scanned} blobs, deleted {len(output.deleted)} files "
+            f"and {len(output.expired_uploads)} expired uploads."
+        )
@@ -0,0 +1,154 @@
+import io
+import mimetypes
+import re
+from typing import BinaryIO
+
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+)
+from django.http.response import HttpResponseBase
+from django.utils.http import http_date, parse_etags
+from rest_framework.renderers import BaseRenderer
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
+
+from core._shared.application.ports.storage_service import OpenedFile
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+class RangeNotSatisfiable(Exception): ...
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Inclusive (start, end) of a single-range Range header.
+
+    None means the header is ignored and the whole file is served, as for
+    malformed and multi-range requests. Ranges that start past the end of the
+    file raise RangeNotSatisfiable.
+    """
+    match = RANGE_PATTERN.fullmatch(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        suffix: int = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - suffix, 0), size - 1
+
+    start: int = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    end: int = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+class FileRange(io.RawIOBase):
+    """A slice of an open file, read from start for length bytes.
+
+    fileno() exposes the underlying descriptor, already positioned at start,
+    so a WSGI server with a sendfile-backed wsgi.file_wrapper (gunicorn,
+    uWSGI) lets the kernel copy the Content-Length bytes straight to the
+    socket. Other servers read it like any file.
+    """
+
+    def __init__(self, file: BinaryIO, start: int, length: int) -> None:
+        self.file: BinaryIO = file
+        self.remaining: int = length
+        file.seek(start)
+
+    def readable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def readinto(self, buffer) -> int:
+        size: int = min(len(buffer), self.remaining)
+        if size <= 0:
+            return 0
+        read: int = self.file.readinto(memoryview(buffer)[:size])
+        self.remaining -= read
+        return read
+
+    def close(self) -> None:
+        self.file.close()
+        super().close()
+
+
+class PassthroughRenderer(BaseRenderer):
+    """Accepts any media type for views that return a Django response
+    themselves, so players sending Accept: video/* are not refused. Error
+    responses negotiated to it go out with an empty body."""
+
+    media_type = "*/*"
+    format = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b""
+
+
+def media_response(
+    request: HttpRequest, file: OpenedFile, name: str, etag: str
+) -> HttpResponseBase:
+    """Serves file honoring Range, If-Range and If-None-Match."""
+    headers: dict[str, str] = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{etag}"',
+        "Last-Modified": http_date(file.modified_at.timestamp()),
+    }
+    if _none_match_fails(request.headers.get("If-None-Match"), headers["ETag"]):
+        file.content.close()
+        return HttpResponseNotModified(headers=headers)
+
+    byte_range: tuple[int, int] | None = None
+    range_header: str | None = request.headers.get("Range")
+    if range_header and _range_applies(request.headers.get("If-Range"), headers):
+        try:
+            byte_range = parse_range(range_header, file.size)
+        except RangeNotSatisfiable:
+            file.content.close()
+            return HttpResponse(
+                status=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{file.size}"},
+            )
+
+    start, end = byte_range or (0, file.size - 1)
+    response = FileResponse(
+        FileRange(file.content, start, end - start + 1),
+        status=HTTP_206_PARTIAL_CONTENT if byte_range else HTTP_200_OK,
+        content_type=mimetypes.guess_type(name)[0] or "application/octet-stream",
+        headers=headers,
+    )
+    response["Content-Length"] = str(end - start + 1)
+    if byte_range:
+        response["Content-Range"] = f"bytes {start}-{end}/{file.size}"
+    return response
+
+
+def _none_match_fails(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/"x" matches "x" (RFC 9110).
+    if not if_none_match:
+        return False
+    tags: list[str] = [_opaque(tag) for tag in parse_etags(if_none_match)]
+    return "*" in tags or _opaque(etag) in tags
+
+
+def _opaque(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+def _range_applies(if_range: str | None, headers: dict[str, str]) -> bool:
+    # A client resuming with a stale validator gets the whole new file.
+    return if_range is None or if_range in (headers["ETag"], headers["Last-Modified"])
@@ -0,0 +1,28 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0005_media_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaupload',
+            name='checksum',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='mediaupload',
+            name='file_path',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='mediaupload',
+            name='status',
+            field=models.CharField(choices=[('UPLOADING', 'UPLOADING'), ('PLACED', 'PLACED'), ('COMPLETED', 'COMPLETED')], default='UPLOADING', max_length=255),
+        ),
+    ]
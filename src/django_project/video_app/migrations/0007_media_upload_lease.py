@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:23
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0006_media_upload_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaUploadLease',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('acquired_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('upload', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leases', to='video_app.mediaupload')),
+            ],
+        ),
+    ]
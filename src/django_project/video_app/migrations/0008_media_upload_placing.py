@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0007_media_upload_lease'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mediaupload',
+            name='status',
+            field=models.CharField(choices=[('UPLOADING', 'UPLOADING'), ('PLACING', 'PLACING'), ('PLACED', 'PLACED'), ('COMPLETED', 'COMPLETED')], default='UPLOADING', max_length=255),
+        ),
+    ]
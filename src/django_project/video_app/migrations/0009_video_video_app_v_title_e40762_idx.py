@@ -0,0 +1,20 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('castmember_app', '0003_castmember_cast_member_type_7fb566_idx'),
+        ('category_app', '0004_category_categories_is_acti_3d03d3_idx'),
+        ('genre_app', '0004_genre_genres_is_acti_09f633_idx'),
+        ('video_app', '0008_media_upload_placing'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['title', 'id'], name='video_app_v_title_e40762_idx'),
+        ),
+    ]
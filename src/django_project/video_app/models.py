@@ -4,7 +4,9 @@ from django.db import models
 from uuid import uuid4
 
 from django.db import models
+from django.utils import timezone
 
+from core.video.domain.media_upload import UploadStatus
 from core.video.domain.value_objects import MediaStatus, Rating, MediaType
 
 
@@ -57,6 +59,10 @@ class Video(models.Model):
         on_delete=models.SET_NULL,
     )
 
+    class Meta:
+        # The default list order.
+        indexes = [models.Index(fields=["title", "id"])]
+
 
 class ImageMedia(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
@@ -78,3 +84,46 @@ class AudioVideoMedia(models.Model):
     encoded_location = models.CharField(max_length=255)
     status = models.CharField(max_length=255, choices=STATUS_CHOICES)
     media_type = models.CharField(max_length=255, choices=MEDIA_TYPE_CHOICES)
+
+
+class MediaUpload(models.Model):
+    MEDIA_TYPE_CHOICES = [(media_type.name, media_type.name) for media_type in MediaType]
+    STATUS_CHOICES = [(status.name, status.name) for status in UploadStatus]
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+
+    video = models.ForeignKey("Video", on_delete=models.CASCADE, related_name="uploads")
+    file_name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255)
+    media_type = models.CharField(max_length=255, choices=MEDIA_TYPE_CHOICES)
+    size = models.BigIntegerField()
+    chunk_size = models.IntegerField()
+    status = models.CharField(
+        max_length=255, choices=STATUS_CHOICES, default=UploadStatus.UPLOADING.name
+    )
+    file_path = models.CharField(max_length=255, blank=True, default="")
+    checksum = models.CharField(max_length=64, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
+class MediaUploadLease(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    upload = models.ForeignKey(
+        "MediaUpload", on_delete=models.CASCADE, related_name="leases"
+    )
+    acquired_at = models.DateTimeField(default=timezone.now)
+
+
+class MediaUploadChunk(models.Model):
+    upload = models.ForeignKey(
+        "MediaUpload", on_delete=models.CASCADE, related_name="chunks"
+    )
+    index = models.IntegerField()
+    checksum = models.CharField(max_length=64)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["upload", "index"], name="unique_media_upload_chunk"
+            )
+        ]
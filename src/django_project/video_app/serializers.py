@@ -1,4 +1,6 @@
 from decimal import Decimal
+
+from config import MAX_UPLOAD_SIZE
 from core.video.domain.value_objects import Rating, MediaStatus, MediaType
 
 from rest_framework.serializers import (
@@ -95,7 +97,8 @@ class VideoOutputSerializer(Serializer):
 class ListVideoOutputMetaSerializer(Serializer):
     current_page = IntegerField()
     per_page = IntegerField()
-    total = IntegerField()
+    total = IntegerField(allow_null=True)
+    next_cursor = CharField(allow_null=True)
 
 
 class ListVideoOutputSerializer(Serializer):
@@ -145,4 +148,32 @@ class GetVideoInputSerializer(Serializer):
     id = UUIDField()
 
 class GetVideoOutputSerializer(Serializer):
-    data = VideoOutputSerializer(source="*")
\ No newline at end of file
+    data = VideoOutputSerializer(source="*")
+
+class InitiateMediaUploadInputSerializer(Serializer):
+    file_name = CharField(max_length=255)
+    content_type = CharField(max_length=255)
+    size = IntegerField(min_value=1, max_value=MAX_UPLOAD_SIZE)
+    media_type = MediaTypeField(default=MediaType.VIDEO)
+
+
+class InitiateMediaUploadOutputSerializer(Serializer):
+    upload_id = UUIDField()
+    chunk_size = IntegerField()
+    chunk_count = IntegerField()
+
+
+class GetMediaUploadOutputSerializer(Serializer):
+    upload_id = UUIDField()
+    status = CharField()
+    file_name = CharField()
+    size = IntegerField()
+    chunk_size = IntegerField()
+    chunk_count = IntegerField()
+    received_chunks = ListField(child=IntegerField())
+    missing_chunks = ListField(child=IntegerField())
+    received_bytes = IntegerField()
+
+
+class CompleteMediaUploadOutputSerializer(Serializer):
+    checksum = CharField()
@@ -0,0 +1,203 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
+from rest_framework.test import APIClient
+
+from config import TMP_BUCKET
+from core.castmember.domain.castmember import CastMember
+from core.category.domain.category import Category
+from core.genre.domain.genre import Genre
+from core.video.domain.value_objects import MediaStatus, MediaType
+from django_project.adapters.persistence.django.castmember_repository import (
+    DjangoORMCastMemberRepository,
+)
+from django_project.adapters.persistence.django.category_repository import (
+    DjangoORMCategoryRepository,
+)
+from django_project.adapters.persistence.django.genre_repository import (
+    DjangoORMGenreRepository,
+)
+from django_project.adapters.persistence.django.video_repository import (
+    DjangoORMVideoRepository,
+)
+
+CONTENT = bytes(range(256)) * 8  # 2 KiB
+CHECKSUM = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def video_id(
+    api_client: APIClient,
+    category_movie: Category,
+    genre_action: Genre,
+    cast_member_actor: CastMember,
+    category_repository: DjangoORMCategoryRepository,
+    genre_repository: DjangoORMGenreRepository,
+    cast_member_repository: DjangoORMCastMemberRepository,
+) -> str:
+    category_repository.save(category_movie)
+    genre_repository.save(genre_action)
+    cast_member_repository.save(cast_member_actor)
+    video_id = api_client.post(
+        "/api/videos/",
+        data={
+            "title": "Seekable Video",
+            "description": "Video served with ranges",
+            "launch_year": 2024,
+            "duration": "60.0",
+            "rating": "L",
+            "categories": [str(category_movie.id)],
+            "genres": [str(genre_action.id)],
+            "cast_members": [str(cast_member_actor.id)],
+        },
+    ).data["id"]
+    api_client.patch(
+        f"/api/videos/{video_id}/",
+        data={
+            "video_file": SimpleUploadedFile("seek.mp4", CONTENT, "video/mp4"),
+            "media_type": "VIDEO",
+        },
+        format="multipart",
+    )
+    return video_id
+
+
+def body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def current_etag(api_client: APIClient, url: str) -> str:
+    response = api_client.get(url)
+    response.close()
+    return response["ETag"]
+
+
+@pytest.mark.django_db
+class TestMediaAPI:
+    def test_serves_whole_file(self, api_client: APIClient, video_id: str) -> None:
+        response = api_client.get(f"/api/videos/{video_id}/media/video/")
+
+        assert response.status_code == HTTP_200_OK
+        assert body(response) == CONTENT
+        assert response["Content-Length"] == str(len(CONTENT))
+        assert response["Content-Type"] == "video/mp4"
+        assert response["Accept-Ranges"] == "bytes"
+        # Stored per video, so the path can be overwritten: the opened file's
+        # size and mtime follow the checksum.
+        assert response["ETag"].startswith(f'"{CHECKSUM}-800-')
+
+    @pytest.mark.parametrize(
+        "header,start,end",
+        [
+            ("bytes=100-199", 100, 199),
+            ("bytes=2000-", 2000, 2047),
+            ("bytes=-10", 2038, 2047),
+        ],
+    )
+    def test_serves_ranges(
+        self, api_client: APIClient, video_id: str, header: str, start: int, end: int
+    ) -> None:
+        response = api_client.get(
+            f"/api/videos/{video_id}/media/VIDEO/",
+            HTTP_RANGE=header,
+            HTTP_ACCEPT="video/mp4",
+        )
+
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert body(response) == CONTENT[start : end + 1]
+        assert response["Content-Length"] == str(end - start + 1)
+        assert response["Content-Range"] == f"bytes {start}-{end}/{len(CONTENT)}"
+
+    def test_unsatisfiable_range(self, api_client: APIClient, video_id: str) -> None:
+        response = api_client.get(
+            f"/api/videos/{video_id}/media/VIDEO/", HTTP_RANGE="bytes=5000-"
+        )
+
+        assert response.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response["Content-Range"] == f"bytes */{len(CONTENT)}"
+
+    def test_if_range_with_stale_etag_serves_whole_file(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        url = f"/api/videos/{video_id}/media/VIDEO/"
+        etag = current_etag(api_client, url)
+
+        fresh = api_client.get(url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag)
+        stale = api_client.get(url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"old"')
+
+        assert fresh.status_code == HTTP_206_PARTIAL_CONTENT
+        assert stale.status_code == HTTP_200_OK
+        assert body(stale) == CONTENT
+
+    @pytest.mark.parametrize("weak", [False, True])
+    def test_if_none_match(
+        self, api_client: APIClient, video_id: str, weak: bool
+    ) -> None:
+        url = f"/api/videos/{video_id}/media/VIDEO/"
+        etag = current_etag(api_client, url)
+
+        response = api_client.get(
+            url, HTTP_IF_NONE_MATCH=f"W/{etag}" if weak else etag
+        )
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_if_none_match_with_another_etag(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        response = api_client.get(
+            f"/api/videos/{video_id}/media/VIDEO/", HTTP_IF_NONE_MATCH='W/"old"'
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert body(response) == CONTENT
+
+    def test_serves_encoded_files(
+        self,
+        api_client: APIClient,
+        video_id: str,
+        video_repository: DjangoORMVideoRepository,
+    ) -> None:
+        encoded = Path(TMP_BUCKET) / "encoded" / video_id
+        encoded.mkdir(parents=True, exist_ok=True)
+        (encoded / "index.m3u8").write_bytes(b"#EXTM3U\n")
+        media = video_repository.get_media(video_id, MediaType.VIDEO)
+        video_repository.update_media(
+            video_id, media.process(MediaStatus.COMPLETED, f"encoded/{video_id}")
+        )
+        url = f"/api/videos/{video_id}/media/VIDEO/?variant=encoded"
+
+        response = api_client.get(f"{url}&file=index.m3u8", HTTP_RANGE="bytes=0-3")
+
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert body(response) == b"#EXT"
+        assert api_client.get(f"{url}&file=../../x").status_code == HTTP_404_NOT_FOUND
+        assert api_client.get(f"{url}&file=missing.ts").status_code == (
+            HTTP_404_NOT_FOUND
+        )
+
+    def test_missing_media(self, api_client: APIClient, video_id: str) -> None:
+        assert (
+            api_client.get(f"/api/videos/{video_id}/media/TRAILER/").status_code
+            == HTTP_404_NOT_FOUND
+        )
+        assert (
+            api_client.get(f"/api/videos/{video_id}/media/OTHER/").status_code
+            == HTTP_404_NOT_FOUND
+        )
+        assert (
+            api_client.get(
+                f"/api/videos/{video_id}/media/VIDEO/?variant=encoded"
+            ).status_code
+            == HTTP_404_NOT_FOUND
+        )
@@ -0,0 +1,56 @@
+import io
+import os
+
+import pytest
+
+from django_project.video_app.media_response import (
+    FileRange,
+    RangeNotSatisfiable,
+    parse_range,
+)
+
+
+class TestParseRange:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=10-", (10, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=990-2000", (990, 999)),
+            ("bytes=5-1", None),
+            ("bytes=0-1,5-9", None),
+            ("bytes=-", None),
+            ("items=0-1", None),
+        ],
+    )
+    def test_parses_single_ranges(self, header: str, expected) -> None:
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize(
+        "header,size", [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=-1", 0)]
+    )
+    def test_rejects_unsatisfiable_ranges(self, header: str, size: int) -> None:
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(header, size)
+
+
+class TestFileRange:
+    def test_reads_only_the_slice(self, tmp_path) -> None:
+        path = tmp_path / "media.mp4"
+        path.write_bytes(b"0123456789")
+
+        with FileRange(open(path, "rb"), start=3, length=4) as file_range:
+            # What a sendfile-based server reads from: the descriptor offset.
+            assert os.lseek(file_range.fileno(), 0, os.SEEK_CUR) == 3
+            assert file_range.read(2) == b"34"
+            assert file_range.read() == b"56"
+            assert file_range.read() == b""
+
+    def test_closes_the_file(self) -> None:
+        file = io.BytesIO(b"0123")
+
+        FileRange(file, start=0, length=4).close()
+
+        assert file.closed
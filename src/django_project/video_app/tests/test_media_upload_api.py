@@ -0,0 +1,227 @@
+import hashlib
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from django.core.management import call_command
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+)
+from rest_framework.test import APIClient
+
+from config import TMP_BUCKET
+from core.castmember.domain.castmember import CastMember
+from core.category.domain.category import Category
+from core.genre.domain.genre import Genre
+from core.video.domain.value_objects import MediaStatus, MediaType
+from django_project.adapters.persistence.django.castmember_repository import (
+    DjangoORMCastMemberRepository,
+)
+from django_project.adapters.persistence.django.category_repository import (
+    DjangoORMCategoryRepository,
+)
+from django_project.adapters.persistence.django.genre_repository import (
+    DjangoORMGenreRepository,
+)
+from django_project.adapters.persistence.django.media_upload_repository import (
+    DjangoORMMediaUploadRepository,
+)
+from django_project.adapters.persistence.django.video_repository import (
+    DjangoORMVideoRepository,
+)
+
+CONTENT = bytes(range(256)) * 40  # 10 KiB
+CHUNK_SIZE = 4096
+
+
+@pytest.fixture
+def video_id(
+    api_client: APIClient,
+    category_movie: Category,
+    genre_action: Genre,
+    cast_member_actor: CastMember,
+    category_repository: DjangoORMCategoryRepository,
+    genre_repository: DjangoORMGenreRepository,
+    cast_member_repository: DjangoORMCastMemberRepository,
+) -> str:
+    category_repository.save(category_movie)
+    genre_repository.save(genre_action)
+    cast_member_repository.save(cast_member_actor)
+    return api_client.post(
+        "/api/videos/",
+        data={
+            "title": "Chunked Upload",
+            "description": "Video uploaded in chunks",
+            "launch_year": 2024,
+            "duration": "60.0",
+            "rating": "L",
+            "categories": [str(category_movie.id)],
+            "genres": [str(genre_action.id)],
+            "cast_members": [str(cast_member_actor.id)],
+        },
+    ).data["id"]
+
+
+@pytest.fixture(autouse=True)
+def chunk_size():
+    with patch.dict("os.environ", {"UPLOAD_CHUNK_SIZE": str(CHUNK_SIZE)}):
+        yield
+
+
+def put_chunk(api_client: APIClient, url: str, index: int, content: bytes):
+    return api_client.put(
+        f"{url}chunks/{index}/",
+        data=content,
+        content_type="application/octet-stream",
+    )
+
+
+@pytest.mark.django_db
+class TestMediaUploadAPI:
+    def test_chunked_upload(
+        self,
+        api_client: APIClient,
+        video_id: str,
+        video_repository: DjangoORMVideoRepository,
+    ) -> None:
+        initiate_response = api_client.post(
+            f"/api/videos/{video_id}/uploads/",
+            data={
+                "file_name": "chunked.mp4",
+                "content_type": "video/mp4",
+                "size": len(CONTENT),
+                "media_type": "TRAILER",
+            },
+            format="json",
+        )
+        assert initiate_response.status_code == HTTP_201_CREATED
+        assert initiate_response.data["chunk_size"] == CHUNK_SIZE
+        assert initiate_response.data["chunk_count"] == 3
+        url = f"/api/videos/{video_id}/uploads/{initiate_response.data['upload_id']}/"
+
+        for index in (2, 0):
+            chunk = CONTENT[index * CHUNK_SIZE : (index + 1) * CHUNK_SIZE]
+            assert put_chunk(api_client, url, index, chunk).status_code == (
+                HTTP_204_NO_CONTENT
+            )
+
+        status_response = api_client.get(url)
+        assert status_response.status_code == HTTP_200_OK
+        assert status_response.data["received_chunks"] == [0, 2]
+        assert status_response.data["missing_chunks"] == [1]
+        assert status_response.data["status"] == "UPLOADING"
+
+        incomplete_response = api_client.post(f"{url}complete/")
+        assert incomplete_response.status_code == HTTP_409_CONFLICT
+        assert incomplete_response.data["missing_chunks"] == [1]
+
+        chunk = CONTENT[CHUNK_SIZE : 2 * CHUNK_SIZE]
+        assert put_chunk(api_client, url, 1, chunk).status_code == HTTP_204_NO_CONTENT
+        complete_response = api_client.post(f"{url}complete/")
+        assert complete_response.status_code == HTTP_200_OK
+
+        video = video_repository.get_by_id(video_id)
+        assert video.trailer is not None
+        assert video.trailer.name == "chunked.mp4"
+        assert complete_response.data["checksum"] == hashlib.sha256(CONTENT).hexdigest()
+        assert video.trailer.checksum == complete_response.data["checksum"]
+        assert video.trailer.status == MediaStatus.PENDING
+        assert video.trailer.media_type == MediaType.TRAILER
+        stored = Path(TMP_BUCKET) / "videos" / video_id / "chunked.mp4"
+        assert stored.read_bytes() == CONTENT
+        assert api_client.get(url).data["status"] == "COMPLETED"
+
+        retried_response = api_client.post(f"{url}complete/")
+        assert retried_response.status_code == HTTP_200_OK
+        assert retried_response.data == complete_response.data
+        assert put_chunk(api_client, url, 1, chunk).status_code == HTTP_409_CONFLICT
+
+    def test_rejects_chunk_of_wrong_size(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        upload_id = api_client.post(
+            f"/api/videos/{video_id}/uploads/",
+            data={"file_name": "a.mp4", "content_type": "video/mp4", "size": 10},
+            format="json",
+        ).data["upload_id"]
+        url = f"/api/videos/{video_id}/uploads/{upload_id}/"
+
+        response = put_chunk(api_client, url, 0, b"x" * 11)
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert api_client.get(url).data["received_chunks"] == []
+
+    def test_complete_is_refused_while_a_chunk_is_being_written(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        upload_id = api_client.post(
+            f"/api/videos/{video_id}/uploads/",
+            data={"file_name": "a.mp4", "content_type": "video/mp4", "size": 10},
+            format="json",
+        ).data["upload_id"]
+        url = f"/api/videos/{video_id}/uploads/{upload_id}/"
+        put_chunk(api_client, url, 0, b"x" * 10)
+        repository = DjangoORMMediaUploadRepository()
+        lease_id = repository.acquire_lease(UUID(upload_id))
+
+        busy_response = api_client.post(f"{url}complete/")
+        repository.release_lease(lease_id)
+
+        assert busy_response.status_code == HTTP_409_CONFLICT
+        assert api_client.post(f"{url}complete/").status_code == HTTP_200_OK
+
+    def test_rejects_oversized_upload(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        response = api_client.post(
+            f"/api/videos/{video_id}/uploads/",
+            data={"file_name": "a.mp4", "content_type": "video/mp4", "size": 10**19},
+            format="json",
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert "size" in response.data
+
+    def test_garbage_collection_expires_unfinished_uploads(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        upload_id = api_client.post(
+            f"/api/videos/{video_id}/uploads/",
+            data={"file_name": "a.mp4", "content_type": "video/mp4", "size": 10},
+            format="json",
+        ).data["upload_id"]
+
+        call_command("collectmediagarbage", upload_expiry_hours=0, stdout=StringIO())
+
+        url = f"/api/videos/{video_id}/uploads/{upload_id}/"
+        assert api_client.get(url).status_code == HTTP_404_NOT_FOUND
+        assert not (Path(TMP_BUCKET) / "uploads" / f"{upload_id}.part").exists()
+
+    def test_unknown_video_or_upload(
+        self, api_client: APIClient, video_id: str
+    ) -> None:
+        unknown = "00000000-0000-0000-0000-000000000000"
+
+        assert (
+            api_client.post(
+                f"/api/videos/{unknown}/uploads/",
+                data={"file_name": "a.mp4", "content_type": "video/mp4", "size": 10},
+                format="json",
+            ).status_code
+            == HTTP_404_NOT_FOUND
+        )
+        assert (
+            api_client.get(f"/api/videos/{video_id}/uploads/{unknown}/").status_code
+            == HTTP_404_NOT_FOUND
+        )
+        assert (
+            api_client.get(f"/api/videos/{video_id}/uploads/not-a-uuid/").status_code
+            == HTTP_404_NOT_FOUND
+        )
@@ -0,0 +1,512 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.castmember.domain.castmember import CastMember
+from core.castmember.domain.value_objects import CastMemberType
+from core.category.domain.category import Category
+from core.genre.domain.genre import Genre
+from core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from core.video.domain.video import Video
+from django_project.adapters.persistence.django.castmember_repository import (
+    DjangoORMCastMemberRepository,
+)
+from django_project.adapters.persistence.django.category_repository import (
+    DjangoORMCategoryRepository,
+)
+from django_project.adapters.persistence.django.genre_repository import (
+    DjangoORMGenreRepository,
+)
+from django_project.adapters.persistence.django.video_repository import (
+    DjangoORMVideoRepository,
+)
+from django_project.video_app.models import AudioVideoMedia as AudioVideoMediaORM
+from django_project.video_app.models import Video as VideoORM
+
+
+@pytest.fixture
+def related_entities() -> tuple[Category, Genre, CastMember]:
+    category = Category(name="Movie", description="Movie description")
+    genre = Genre(name="Action")
+    cast_member = CastMember(name="Actor", type=CastMemberType.ACTOR)
+    DjangoORMCategoryRepository().save(category)
+    DjangoORMGenreRepository().save(genre)
+    DjangoORMCastMemberRepository().save(cast_member)
+    return category, genre, cast_member
+
+
+def make_full_video(
+    title: str, related_entities: tuple[Category, Genre, CastMember]
+) -> Video:
+    category, genre, cast_member = related_entities
+    image = ImageMedia(name="image.png", checksum="img", location="image.png")
+    video = Video(
+        title=title,
+        description=f"{title} description",
+        launch_year=2023,
+        duration=Decimal("90.50"),
+        rating=Rating.AGE_12,
+        categories={category.id},
+        genres={genre.id},
+        cast_members={cast_member.id},
+        banner=image,
+        thumbnail=image,
+        thumbnail_half=image,
+    )
+    for media_type in MediaType:
+        media = AudioVideoMedia(
+            name=f"{media_type}.mp4",
+            checksum="abc",
+            raw_location=f"videos/{video.id}/{media_type}.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=media_type,
+        )
+        if media_type == MediaType.VIDEO:
+            video.update_video(media)
+        else:
+            video.update_trailer(media)
+    return video
+
+
+@pytest.mark.django_db
+class TestGetById:
+
+    def test_get_by_id_hydrates_media_and_relations(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+
+        found = video_repository.get_by_id(video.id)
+
+        assert found.banner == video.banner
+        assert found.thumbnail == video.thumbnail
+        assert found.thumbnail_half == video.thumbnail_half
+        assert found.trailer == video.trailer
+        assert found.video == video.video
+        assert found.categories == video.categories
+        assert found.genres == video.genres
+        assert found.cast_members == video.cast_members
+
+    def test_get_by_id_runs_constant_number_of_queries(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+
+        # One joined SELECT for the row and its media, one per M2M relation.
+        with django_assert_num_queries(4):
+            video_repository.get_by_id(video.id)
+
+    def test_get_by_id_not_found(
+        self, video_repository: DjangoORMVideoRepository
+    ) -> None:
+        assert video_repository.get_by_id(uuid4()) is None
+
+
+@pytest.mark.django_db
+class TestList:
+
+    def test_list_runs_constant_number_of_queries(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        for index in range(5):
+            video_repository.save(make_full_video(f"Video {index}", related_entities))
+
+        with django_assert_num_queries(4):
+            videos = video_repository.list()
+
+        assert len(videos) == 5
+        assert all(video.video is not None for video in videos)
+
+
+@pytest.mark.django_db
+class TestSaveMany:
+
+    def test_save_many_batches_every_table(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        videos = [
+            make_full_video(f"Video {index}", related_entities) for index in range(3)
+        ]
+
+        # SAVEPOINT, image media, AV media, videos, three through tables, RELEASE
+        with django_assert_num_queries(8):
+            video_repository.save_many(videos)
+
+        assert VideoORM.objects.count() == 3
+        assert AudioVideoMediaORM.objects.count() == 6
+        saved = DjangoORMVideoRepository().get_by_id(videos[0].id)
+        assert saved.categories == videos[0].categories
+        assert saved.cast_members == videos[0].cast_members
+        assert saved.video == videos[0].video
+        assert saved.banner == videos[0].banner
+
+    def test_update_after_save_many_writes_only_changes(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save_many([video])
+
+        with django_assert_num_queries(0):
+            video_repository.update(video)
+
+
+def executed_sql(queries: CaptureQueriesContext) -> list[str]:
+    return [query["sql"].split()[0] for query in queries.captured_queries]
+
+
+@pytest.mark.django_db
+class TestUpdate:
+
+    def test_update_without_changes_runs_no_queries(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        video_repository.save(make_full_video("Full Video", related_entities))
+        video = video_repository.get_by_id(
+            VideoORM.objects.values_list("id", flat=True).get()
+        )
+
+        with django_assert_num_queries(0):
+            video_repository.update(video)
+
+    def test_media_status_change_updates_rows_in_place(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video_repository.save(make_full_video("Full Video", related_entities))
+        video_model = VideoORM.objects.get()
+        video = video_repository.get_by_id(video_model.id)
+        video.process(
+            status=MediaStatus.COMPLETED,
+            encoded_location="encoded/video",
+            media_type=MediaType.VIDEO,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            video_repository.update(video)
+
+        assert executed_sql(queries).count("UPDATE") == 2
+        assert "INSERT" not in executed_sql(queries)
+        assert "DELETE" not in executed_sql(queries)
+        updated_model = VideoORM.objects.select_related("video").get()
+        assert updated_model.published is True
+        assert updated_model.video_id == video_model.video_id
+        assert updated_model.video.status == MediaStatus.COMPLETED.name
+        assert updated_model.video.encoded_location == "encoded/video"
+
+    def test_new_upload_replaces_media_row(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video_repository.save(make_full_video("Full Video", related_entities))
+        video_model = VideoORM.objects.get()
+        video = video_repository.get_by_id(video_model.id)
+        video.update_trailer(
+            AudioVideoMedia(
+                name="new.mp4",
+                checksum="new",
+                raw_location=f"videos/{video.id}/new.mp4",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.TRAILER,
+            )
+        )
+
+        video_repository.update(video)
+
+        updated_model = VideoORM.objects.select_related("trailer").get()
+        assert updated_model.trailer_id != video_model.trailer_id
+        assert updated_model.trailer.checksum == "new"
+        assert not AudioVideoMediaORM.objects.filter(
+            pk=video_model.trailer_id
+        ).exists()
+        assert updated_model.video_id == video_model.video_id
+
+    def test_relation_changes_write_only_the_delta(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        category, _, _ = related_entities
+        documentary = Category(name="Documentary", description="Documentaries")
+        DjangoORMCategoryRepository().save(documentary)
+        video_repository.save(make_full_video("Full Video", related_entities))
+        video = video_repository.get_by_id(VideoORM.objects.get().id)
+        video.remove_category(category.id)
+        video.add_category(documentary.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            video_repository.update(video)
+
+        assert executed_sql(queries).count("DELETE") == 1
+        assert executed_sql(queries).count("INSERT") == 1
+        assert "UPDATE" not in executed_sql(queries)
+        assert video_repository.get_by_id(video.id).categories == {documentary.id}
+
+    def test_update_video_not_loaded_by_repository(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+        video.update(
+            title="Renamed",
+            description=video.description,
+            launch_year=video.launch_year,
+            duration=video.duration,
+            published=video.published,
+            rating=video.rating,
+        )
+
+        DjangoORMVideoRepository().update(video)
+
+        assert VideoORM.objects.get().title == "Renamed"
+
+    def test_update_forgets_the_snapshot(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video_repository.save(make_full_video("Full Video", related_entities))
+        video = video_repository.get_by_id(VideoORM.objects.get().id)
+
+        video_repository.update(video)
+
+        assert video.id not in video_repository.snapshots
+
+    def test_keeps_only_the_latest_snapshots(self, related_entities) -> None:
+        video_repository = DjangoORMVideoRepository(max_snapshots=2)
+        videos = [make_full_video(f"Video {i}", related_entities) for i in range(3)]
+
+        video_repository.save_many(videos)
+
+        assert list(video_repository.snapshots) == [videos[1].id, videos[2].id]
+
+    def test_snapshots_are_shared_safely_across_threads(self, related_entities) -> None:
+        video_repository = DjangoORMVideoRepository(max_snapshots=4)
+        videos = [make_full_video(f"Video {i}", related_entities) for i in range(8)]
+
+        def churn(video: Video) -> None:
+            for _ in range(500):
+                video_repository._remember(video, {})
+                video_repository._forget(video.id)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(churn, videos))
+
+        assert len(video_repository.snapshots) <= 4
+
+
+@pytest.mark.django_db
+class TestMediaUpdates:
+
+    def test_get_media_reads_a_single_row(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+
+        with django_assert_num_queries(1):
+            media = video_repository.get_media(video.id, MediaType.TRAILER)
+
+        assert media == video.trailer
+
+    def test_get_media_returns_none_when_missing(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video.trailer = None
+        video_repository.save(video)
+
+        assert video_repository.get_media(video.id, MediaType.TRAILER) is None
+        assert video_repository.get_media(uuid4(), MediaType.VIDEO) is None
+        assert video_repository.exists(video.id) is True
+        assert video_repository.exists(uuid4()) is False
+
+    def test_update_media_issues_targeted_updates(
+        self, video_repository: DjangoORMVideoRepository, related_entities
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+        processed = video.video.process(
+            status=MediaStatus.COMPLETED, encoded_location="encoded/video"
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            video_repository.update_media(video.id, processed, published=True)
+
+        assert [sql for sql in executed_sql(queries) if sql == "UPDATE"] == [
+            "UPDATE",
+            "UPDATE",
+        ]
+        assert "SELECT" not in executed_sql(queries)
+        updated_model = VideoORM.objects.select_related("video", "trailer").get()
+        assert updated_model.published is True
+        assert updated_model.video.status == MediaStatus.COMPLETED.name
+        assert updated_model.video.encoded_location == "encoded/video"
+        assert updated_model.trailer.status == MediaStatus.PENDING.name
+
+    def test_update_media_leaves_published_untouched_by_default(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        video = make_full_video("Full Video", related_entities)
+        video_repository.save(video)
+        processed = video.trailer.process(
+            status=MediaStatus.ERROR, encoded_location=""
+        )
+
+        with django_assert_num_queries(3):  # SAVEPOINT, UPDATE, RELEASE
+            video_repository.update_media(video.id, processed)
+
+        updated_model = VideoORM.objects.select_related("trailer").get()
+        assert updated_model.published is False
+        assert updated_model.trailer.status == MediaStatus.ERROR.name
+
+
+@pytest.mark.django_db
+class TestBulkMediaUpdates:
+
+    def test_get_media_many_reads_every_media_in_one_query(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        videos = [make_full_video(f"Video {i}", related_entities) for i in range(3)]
+        video_repository.save_many(videos)
+        missing = uuid4()
+        keys = {(video.id, MediaType.VIDEO) for video in videos} | {
+            (videos[0].id, MediaType.TRAILER),
+            (missing, MediaType.VIDEO),
+        }
+
+        with django_assert_num_queries(1):
+            media = video_repository.get_media_many(keys)
+
+        assert media == {
+            **{(video.id, MediaType.VIDEO): video.video for video in videos},
+            (videos[0].id, MediaType.TRAILER): videos[0].trailer,
+        }
+
+    @pytest.mark.parametrize("count", [1, 5])
+    def test_update_media_many_runs_constant_number_of_queries(
+        self,
+        count: int,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        videos = [
+            make_full_video(f"Video {i}", related_entities) for i in range(count)
+        ]
+        video_repository.save_many(videos)
+        media = {
+            video.id: [
+                video.video.process(MediaStatus.COMPLETED, f"encoded/{video.id}"),
+                video.trailer.process(MediaStatus.ERROR, ""),
+            ]
+            for video in videos
+        }
+
+        # SAVEPOINT, SELECT ids, bulk UPDATE, UPDATE published, RELEASE
+        with django_assert_num_queries(5):
+            video_repository.update_media_many(
+                media, published={video.id for video in videos}
+            )
+
+        for model in VideoORM.objects.select_related("video", "trailer"):
+            assert model.published is True
+            assert model.video.status == MediaStatus.COMPLETED.name
+            assert model.video.encoded_location == f"encoded/{model.id}"
+            assert model.trailer.status == MediaStatus.ERROR.name
+
+
+@pytest.mark.django_db
+class TestCountMediaReferences:
+
+    def test_counts_media_of_existing_videos(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        videos = [make_full_video(f"Video {i}", related_entities) for i in range(3)]
+        for video in videos:
+            video.video = replace(video.video, raw_location="blobs/ab/shared")
+        videos[0].trailer = replace(videos[0].trailer, raw_location="blobs/ab/shared")
+        video_repository.save_many(videos)
+        video_repository.delete(videos[2].id)  # leaves its media rows behind
+
+        with django_assert_num_queries(1):
+            counts = video_repository.count_media_references(
+                {"blobs/ab/shared", f"videos/{videos[2].id}/TRAILER.mp4", "unknown"}
+            )
+
+        assert counts == {
+            "blobs/ab/shared": 3,
+            f"videos/{videos[2].id}/TRAILER.mp4": 0,
+            "unknown": 0,
+        }
+
+
+@pytest.mark.django_db
+class TestFindMissingRelatedIds:
+
+    def test_checks_every_relation_in_one_query(
+        self,
+        video_repository: DjangoORMVideoRepository,
+        related_entities,
+        django_assert_num_queries,
+    ) -> None:
+        category, genre, cast_member = related_entities
+        missing_category, missing_cast_member = uuid4(), uuid4()
+
+        with django_assert_num_queries(1):
+            missing = video_repository.find_missing_related_ids(
+                categories={category.id, missing_category},
+                genres={genre.id},
+                cast_members={cast_member.id, missing_cast_member},
+            )
+
+        assert missing == {
+            "categories": {missing_category},
+            "genres": set(),
+            "cast_members": {missing_cast_member},
+        }
+
+    def test_skips_the_query_without_ids(
+        self, video_repository: DjangoORMVideoRepository, django_assert_num_queries
+    ) -> None:
+        with django_assert_num_queries(0):
+            missing = video_repository.find_missing_related_ids(
+                categories=set(), genres=set(), cast_members=set()
+            )
+
+        assert missing == {"categories": set(), "genres": set(), "cast_members": set()}
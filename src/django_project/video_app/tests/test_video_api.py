@@ -3,13 +3,20 @@ from decimal import Decimal
 from typing import Any
 from uuid import uuid4
 
-from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from rest_framework.test import APIClient
 
 from core.castmember.domain.castmember import CastMember
 from core.category.domain.category import Category
 from core.genre.domain.genre import Genre
-from core.video.domain.value_objects import Rating
+from core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from core.video.domain.video import Video
 from django_project.adapters.persistence.django.castmember_repository import (
     DjangoORMCastMemberRepository,
 )
@@ -210,3 +217,145 @@ class TestCreateVideoAPI:
         response: Any = api_client.post("/api/videos/", data=data)
 
         assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def make_video(
+    title: str, category: Category, genre: Genre, cast_member: CastMember
+) -> Video:
+    video = Video(
+        title=title,
+        description=f"{title} description",
+        launch_year=2023,
+        duration=Decimal("90.5"),
+        rating=Rating.L,
+        categories={category.id},
+        genres={genre.id},
+        cast_members={cast_member.id},
+        banner=ImageMedia(name="banner.png", checksum="b", location="banner.png"),
+    )
+    video.update_video(
+        AudioVideoMedia(
+            name="video.mp4",
+            checksum="abc",
+            raw_location=f"videos/{video.id}/video.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        )
+    )
+    return video
+
+
+@pytest.mark.django_db
+class TestListVideoAPI:
+
+    def test_list_videos_with_relations_and_media(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        genre_action: Genre,
+        cast_member_actor: CastMember,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        cast_member_repository: DjangoORMCastMemberRepository,
+        video_repository: DjangoORMVideoRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_repository.save(genre_action)
+        cast_member_repository.save(cast_member_actor)
+        video_b = make_video("B Video", category_movie, genre_action, cast_member_actor)
+        video_a = make_video("A Video", category_movie, genre_action, cast_member_actor)
+        video_repository.save(video_b)
+        video_repository.save(video_a)
+
+        response: Any = api_client.get("/api/videos/")
+
+        assert response.status_code == HTTP_200_OK
+        assert [item["id"] for item in response.data["data"]] == [
+            str(video_a.id),
+            str(video_b.id),
+        ]
+        first_video = response.data["data"][0]
+        assert first_video["categories"] == [str(category_movie.id)]
+        assert first_video["genres"] == [str(genre_action.id)]
+        assert first_video["cast_members"] == [str(cast_member_actor.id)]
+        assert first_video["banner"]["name"] == "banner.png"
+        assert first_video["video"]["status"] == "PENDING"
+        assert response.data["meta"] == {
+            "current_page": 1,
+            "per_page": 2,
+            "total": 2,
+            "next_cursor": None,
+        }
+
+    @pytest.mark.parametrize("page_size", [1, 10])
+    def test_list_videos_runs_constant_number_of_queries(
+        self,
+        page_size: int,
+        api_client: APIClient,
+        category_movie: Category,
+        genre_action: Genre,
+        cast_member_actor: CastMember,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        cast_member_repository: DjangoORMCastMemberRepository,
+        video_repository: DjangoORMVideoRepository,
+        django_assert_num_queries,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_repository.save(genre_action)
+        cast_member_repository.save(cast_member_actor)
+        for index in range(10):
+            video_repository.save(
+                make_video(
+                    f"Video {index}", category_movie, genre_action, cast_member_actor
+                )
+            )
+
+        # COUNT, the page joined with its media, and one query per M2M relation.
+        with django_assert_num_queries(5):
+            response: Any = api_client.get(f"/api/videos/?page_size={page_size}")
+
+        assert response.status_code == HTTP_200_OK
+        assert len(response.data["data"]) == page_size
+
+    @pytest.mark.parametrize("order_by", ["duration", "rating", "published"])
+    def test_walk_videos_with_cursor(
+        self,
+        order_by: str,
+        api_client: APIClient,
+        category_movie: Category,
+        genre_action: Genre,
+        cast_member_actor: CastMember,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        cast_member_repository: DjangoORMCastMemberRepository,
+        video_repository: DjangoORMVideoRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_repository.save(genre_action)
+        cast_member_repository.save(cast_member_actor)
+        for index in range(3):
+            video_repository.save(
+                make_video(
+                    f"Video {index}", category_movie, genre_action, cast_member_actor
+                )
+            )
+
+        seen: list[str] = []
+        url: str = f"/api/videos/?order_by={order_by}&page_size=1"
+        while url:
+            response: Any = api_client.get(url)
+            assert response.status_code == HTTP_200_OK
+            seen += [item["id"] for item in response.data["data"]]
+            next_cursor = response.data["meta"]["next_cursor"]
+            url = next_cursor and (
+                f"/api/videos/?order_by={order_by}&page_size=1&cursor={next_cursor}"
+            )
+
+        assert len(set(seen)) == 3
+
+    def test_list_videos_with_unknown_order_by(self, api_client: APIClient) -> None:
+        response: Any = api_client.get("/api/videos/?order_by=categories")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
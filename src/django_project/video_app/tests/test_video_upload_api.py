@@ -1,10 +1,13 @@
+import hashlib
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 from rest_framework.test import APIClient
 
+from config import TMP_BUCKET
 from core.castmember.domain.castmember import CastMember
 from core.category.domain.category import Category
 from core.genre.domain.genre import Genre
@@ -21,17 +24,13 @@ from django_project.adapters.persistence.django.genre_repository import (
 from django_project.adapters.persistence.django.video_repository import (
     DjangoORMVideoRepository,
 )
+from django_project.adapters.storage.local_storage import LocalStorage
 
 
 @pytest.mark.django_db
 class TestVideoUploadAPI:
-    @patch(
-        "django_project.adapters.storage.file_checksum_service.FileChecksumService.compute",
-        return_value="test-checksum",
-    )
     def test_upload_video_media_via_api(
         self,
-        _mock_checksum,
         api_client: APIClient,
         category_movie: Category,
         genre_action: Genre,
@@ -79,6 +78,54 @@ class TestVideoUploadAPI:
         assert video is not None
         assert video.video is not None
         assert video.video.name == "sample.mp4"
-        assert video.video.checksum == "test-checksum"
+        assert (
+            video.video.checksum == hashlib.sha256(b"fake-video-content").hexdigest()
+        )
         assert video.video.status == MediaStatus.PENDING
         assert video.video.media_type == MediaType.VIDEO
+
+    def test_large_upload_is_streamed_to_storage(
+        self,
+        api_client: APIClient,
+        category_movie: Category,
+        genre_action: Genre,
+        cast_member_actor: CastMember,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_repository.save(genre_action)
+        cast_member_repository.save(cast_member_actor)
+        video_id = api_client.post(
+            "/api/videos/",
+            data={
+                "title": "Large Upload",
+                "description": "Bigger than the in-memory upload limit",
+                "launch_year": 2024,
+                "duration": "60.0",
+                "rating": "L",
+                "categories": [str(category_movie.id)],
+                "genres": [str(genre_action.id)],
+                "cast_members": [str(cast_member_actor.id)],
+            },
+        ).data["id"]
+        content = bytes(range(256)) * (12 * 1024)  # 3 MiB, spooled to disk
+
+        with patch.object(
+            LocalStorage, "store", autospec=True, side_effect=LocalStorage.store
+        ) as store:
+            upload_response = api_client.patch(
+                f"/api/videos/{video_id}/",
+                data={
+                    "video_file": SimpleUploadedFile("large.mp4", content, "video/mp4"),
+                    "media_type": "VIDEO",
+                },
+                format="multipart",
+            )
+
+        assert upload_response.status_code == HTTP_200_OK
+        # The view hands over the spooled file, not its bytes.
+        assert isinstance(store.call_args.kwargs["content"], TemporaryUploadedFile)
+        stored = Path(TMP_BUCKET) / "videos" / video_id / "large.mp4"
+        assert stored.read_bytes() == content
@@ -1,36 +1,85 @@
 from uuid import UUID
+from django.http.response import HttpResponseBase
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from core.video.application.use_cases.create_video_without_media import (
     CreateVideoWithoutMedia,
 )
 from core.video.application.exceptions import (
+    IncompleteMediaUpload,
+    InvalidMediaUpload,
     InvalidVideo,
+    MediaFileNotFound,
+    MediaUploadBusy,
+    MediaUploadClosed,
+    MediaUploadNotFound,
     RelatedEntitiesNotFound,
     VideoNotFound,
 )
+from core.video.application.use_cases.complete_media_upload import (
+    CompleteMediaUpload,
+)
+from core.video.application.use_cases.get_media_file import GetMediaFile
+from core.video.application.use_cases.get_media_upload import GetMediaUpload
 from core.video.application.use_cases.get_video import GetVideo
+from core.video.application.use_cases.initiate_media_upload import (
+    InitiateMediaUpload,
+)
+from core.video.application.use_cases.list_video import ListVideo
+from core.video.application.use_cases.upload_media_chunk import UploadMediaChunk
 from core.video.application.use_cases.upload_video import UploadVideo
 from core.video.domain.value_objects import MediaType
+from core._shared.domain.pagination import InvalidCursor
+from config import DEFAULT_PAGE_SIZE
 from django_project.adapters.composition.container import get_container
 from django_project.video_app.serializers import (
+    CompleteMediaUploadOutputSerializer,
     CreateVideoInputSerializer,
     CreateVideoOutputSerializer,
+    GetMediaUploadOutputSerializer,
     GetVideoInputSerializer,
     GetVideoOutputSerializer,
+    InitiateMediaUploadInputSerializer,
+    InitiateMediaUploadOutputSerializer,
+    ListVideoOutputSerializer,
 )
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
 )
+from django_project.ordering import OrderByMixin
 from django_project.permissions import IsAuthenticated, IsAdmin
+from django_project.video_app.media_response import (
+    PassthroughRenderer,
+    media_response,
+)
+
 
+def parse_uuid(value: str | None) -> UUID | None:
+    try:
+        return UUID(value)
+    except (TypeError, ValueError):
+        return None
 
-class VideoViewSet(viewsets.ViewSet):
+
+class VideoViewSet(OrderByMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated & IsAdmin]
+    order_by_fields = (
+        "title",
+        "description",
+        "launch_year",
+        "duration",
+        "published",
+        "rating",
+        "id",
+    )
 
     def create(self, request: Request) -> Response:
         serializer: CreateVideoInputSerializer = CreateVideoInputSerializer(
@@ -83,8 +132,8 @@ class VideoViewSet(viewsets.ViewSet):
         )
 
     def partial_update(self, request: Request, pk: UUID | None = None) -> Response:
+        # Passed through unread: storage streams it in chunks.
         file = request.FILES.get("video_file")
-        content = file.read()
         content_type = file.content_type
 
         media_type_str = request.data.get("media_type", "VIDEO")
@@ -103,7 +152,7 @@ class VideoViewSet(viewsets.ViewSet):
                 input=UploadVideo.Input(
                     video_id=pk,
                     file_name=file.name,
-                    content=content,
+                    content=file,
                     content_type=content_type,
                     media_type=media_type,
                 )
@@ -113,8 +162,191 @@ class VideoViewSet(viewsets.ViewSet):
 
         return Response(status=HTTP_200_OK)
 
+    @action(detail=True, methods=["post"], url_path="uploads")
+    def initiate_upload(self, request: Request, pk: str | None = None) -> Response:
+        serializer = InitiateMediaUploadInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        video_id: UUID | None = parse_uuid(pk)
+        if video_id is None:
+            return Response(status=HTTP_404_NOT_FOUND)
+        try:
+            output: InitiateMediaUpload.Output = (
+                get_container()
+                .initiate_media_upload()
+                .execute(
+                    input=InitiateMediaUpload.Input(
+                        video_id=video_id, **serializer.validated_data
+                    )
+                )
+            )
+        except VideoNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+        except InvalidMediaUpload as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=InitiateMediaUploadOutputSerializer(instance=output).data,
+        )
+
+    @action(detail=True, methods=["get"], url_path=r"uploads/(?P<upload_id>[^/.]+)")
+    def upload_status(
+        self, request: Request, pk: str | None = None, upload_id: str | None = None
+    ) -> Response:
+        video_id, upload_uuid = parse_uuid(pk), parse_uuid(upload_id)
+        if video_id is None or upload_uuid is None:
+            return Response(status=HTTP_404_NOT_FOUND)
+        try:
+            output: GetMediaUpload.Output = (
+                get_container()
+                .get_media_upload()
+                .execute(
+                    input=GetMediaUpload.Input(
+                        video_id=video_id, upload_id=upload_uuid
+                    )
+                )
+            )
+        except MediaUploadNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        return Response(
+            status=HTTP_200_OK,
+            data=GetMediaUploadOutputSerializer(instance=output).data,
+        )
+
+    @action(
+        detail=True,
+        methods=["put"],
+        url_path=r"uploads/(?P<upload_id>[^/.]+)/chunks/(?P<index>[0-9]+)",
+    )
+    def upload_chunk(
+        self,
+        request: Request,
+        pk: str | None = None,
+        upload_id: str | None = None,
+        index: str | None = None,
+    ) -> Response:
+        video_id, upload_uuid = parse_uuid(pk), parse_uuid(upload_id)
+        if video_id is None or upload_uuid is None:
+            return Response(status=HTTP_404_NOT_FOUND)
+        content_length: str = request.META.get("CONTENT_LENGTH") or ""
+        try:
+            # The raw body is streamed to its offset, never parsed or buffered.
+            get_container().upload_media_chunk().execute(
+                input=UploadMediaChunk.Input(
+                    video_id=video_id,
+                    upload_id=upload_uuid,
+                    index=int(index),
+                    content=request.stream or b"",
+                    size=int(content_length) if content_length.isdigit() else None,
+                )
+            )
+        except MediaUploadNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+        except InvalidMediaUpload as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
+        except MediaUploadClosed as e:
+            return Response(status=HTTP_409_CONFLICT, data={"error": str(e)})
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"uploads/(?P<upload_id>[^/.]+)/complete",
+    )
+    def complete_upload(
+        self, request: Request, pk: str | None = None, upload_id: str | None = None
+    ) -> Response:
+        video_id, upload_uuid = parse_uuid(pk), parse_uuid(upload_id)
+        if video_id is None or upload_uuid is None:
+            return Response(status=HTTP_404_NOT_FOUND)
+        try:
+            output: CompleteMediaUpload.Output = (
+                get_container()
+                .complete_media_upload()
+                .execute(
+                    input=CompleteMediaUpload.Input(
+                        video_id=video_id, upload_id=upload_uuid
+                    )
+                )
+            )
+        except (MediaUploadNotFound, VideoNotFound):
+            return Response(status=HTTP_404_NOT_FOUND)
+        except IncompleteMediaUpload as e:
+            return Response(
+                status=HTTP_409_CONFLICT,
+                data={"error": str(e), "missing_chunks": e.missing},
+            )
+        except MediaUploadBusy as e:
+            return Response(status=HTTP_409_CONFLICT, data={"error": str(e)})
+
+        return Response(
+            status=HTTP_200_OK,
+            data=CompleteMediaUploadOutputSerializer(instance=output).data,
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"media/(?P<media_type>[A-Za-z]+)",
+        renderer_classes=[JSONRenderer, PassthroughRenderer],
+    )
+    def media(
+        self, request: Request, pk: str | None = None, media_type: str | None = None
+    ) -> HttpResponseBase:
+        """Raw upload by default; ?variant=encoded&file=<name> serves a file
+        from the encoder output. Supports Range requests for seeking."""
+        video_id: UUID | None = parse_uuid(pk)
+        if video_id is None or media_type.upper() not in MediaType.__members__:
+            return Response(status=HTTP_404_NOT_FOUND)
+        variant: str = request.query_params.get("variant", "raw")
+        if variant not in ("raw", "encoded"):
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": f"Invalid variant: {variant}. Must be raw or encoded."},
+            )
+
+        try:
+            output: GetMediaFile.Output = (
+                get_container()
+                .get_media_file()
+                .execute(
+                    input=GetMediaFile.Input(
+                        video_id=video_id,
+                        media_type=MediaType[media_type.upper()],
+                        encoded=variant == "encoded",
+                        file_name=request.query_params.get("file", ""),
+                    )
+                )
+            )
+        except MediaFileNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        return media_response(request, output.file, output.name, output.etag)
+
     def list(self, request: Request) -> Response:
-        raise NotImplementedError("List method is not implemented.")
+        order_by: str = self.get_order_by(request)
+        current_page: int = int(request.query_params.get("current_page", 1))
+        page_size: int = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+        cursor: str | None = request.query_params.get("cursor")
+        input: ListVideo.Input = ListVideo.Input(
+            order_by=order_by,
+            current_page=current_page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+        try:
+            output = get_container().list_video().execute(input)
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
+
+        serializer: ListVideoOutputSerializer = ListVideoOutputSerializer(
+            instance=output
+        )
+
+        return Response(status=HTTP_200_OK, data=serializer.data)
 
     def destroy(self, request: Request, pk: str | None = None) -> Response:
         raise NotImplementedError("Destroy method is not implemented.")